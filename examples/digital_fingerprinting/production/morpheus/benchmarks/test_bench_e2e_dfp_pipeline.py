@@ -194,7 +194,7 @@ def dfp_inference_pipeline_stages(pipe_config: Config,
         FilterDetectionsStage(pipe_config, threshold=2.0, filter_source=FilterSource.DATAFRAME,
                               field_name='mean_abs_z'))
     pipeline.add_stage(DFPPostprocessingStage(pipe_config))
-    pipeline.add_stage(SerializeStage(pipe_config, exclude=['batch_count', 'origin_hash', '_row_hash', '_batch_id']))
+    pipeline.add_stage(SerializeStage(pipe_config, exclude=['batch_count', 'origin_hash', '_batch_id']))
     pipeline.add_stage(WriteToFileStage(pipe_config, filename=output_filepath, overwrite=True))
 
     pipeline.build()
@@ -273,7 +273,7 @@ def dfp_inference_pipe(builder: mrc.Builder):
     post_processing_defaults = {}  # placeholder for future defaults
     dfp_post_proc_conf = merge_dictionaries(post_processing_options, post_processing_defaults)
 
-    serialize_defaults = {"exclude": ['batch_count', 'origin_hash', '_row_hash', '_batch_id'], "use_cpp": True}
+    serialize_defaults = {"exclude": ['batch_count', 'origin_hash', '_batch_id'], "use_cpp": True}
     serialize_conf = merge_dictionaries(serialize_options, serialize_defaults)
 
     write_to_file_defaults = {
@@ -15,12 +15,10 @@
 import logging
 import os
 import typing
-from contextlib import contextmanager
 
 import mrc
-import pandas as pd
-from dfp.utils.cached_user_window import CachedUserWindow
 from dfp.utils.logging_timer import log_time
+from dfp.utils.user_window_store import UserWindowStore
 from mrc.core import operators as ops
 
 import cudf
@@ -58,6 +56,8 @@ def dfp_rolling_window(builder: mrc.Builder):
         Default: '60d'
         - cache_to_disk (bool): Whether to cache streaming data to disk; Example: false; Default: false
         - cache_dir (str): Directory to use for caching streaming data; Example: './.cache'; Default: './.cache'
+        - memory_budget_bytes (int): Maximum bytes of user windows held in memory, the least recently seen users are
+        spilled to `cache_dir` when exceeded; Example: 1073741824; Default: None
     """
 
     config = builder.get_current_module_config()
@@ -77,26 +77,12 @@ def dfp_rolling_window(builder: mrc.Builder):
 
     cache_dir = os.path.join(cache_dir, "rolling-user-data")
 
-    user_cache_map: typing.Dict[str, CachedUserWindow] = {}
-
-    @contextmanager
-    def get_user_cache(user_id: str):
-        # Determine cache location
-        cache_location = os.path.join(cache_dir, f"{user_id}.pkl") if cache_to_disk else None
-
-        user_cache = user_cache_map.get(user_id, None)
-
-        if (user_cache is None):
-            user_cache = CachedUserWindow(user_id=user_id,
-                                          cache_location=cache_location,
-                                          timestamp_column=timestamp_column_name)
-
-            user_cache_map[user_id] = user_cache
-
-        yield user_cache
+    user_windows = UserWindowStore(cache_dir,
+                                   timestamp_column=timestamp_column_name,
+                                   memory_budget_bytes=config.get("memory_budget_bytes", None))
 
     def try_build_window(message: MessageMeta, user_id: str) -> typing.Union[MessageMeta, None]:
-        with get_user_cache(user_id) as user_cache:
+        with user_windows.get_window(user_id) as user_cache:
 
             # incoming_df = message.get_df()
             with message.mutable_dataframe() as dfm:
@@ -129,19 +115,14 @@ def dfp_rolling_window(builder: mrc.Builder):
                 # Obtain a dataframe spanning the aggregation window
                 df_window = user_cache.get_spanning_df(max_history=aggregation_span)
 
-                # Hash the incoming data rows to find a match
-                incoming_hash = pd.util.hash_pandas_object(incoming_df.iloc[[0, -1]], index=False)
-
-                # Find the index of the first and last row
-                match = df_window[df_window["_row_hash"] == incoming_hash.iloc[0]]
+                # The window is indexed by row id, so the appended rows are located from their row id range
+                (first_row_idx, stop_row_idx) = user_cache.last_append_range
 
-                if (len(match) == 0):
+                if (first_row_idx == stop_row_idx or len(df_window) == 0 or df_window.index[0] > first_row_idx
+                        or df_window.index[-1] < stop_row_idx - 1):
                     raise RuntimeError("Invalid rolling window")
 
-                first_row_idx = match.index[0].item()
-                last_row_idx = df_window[df_window["_row_hash"] == incoming_hash.iloc[-1]].index[-1].item()
-
-                found_count = (last_row_idx - first_row_idx) + 1
+                found_count = stop_row_idx - first_row_idx
 
                 if (found_count != len(incoming_df)):
                     raise RuntimeError(("Overlapping rolling history detected. "
@@ -18,6 +18,7 @@ import typing
 import mrc
 import pandas as pd
 from dfp.utils.logging_timer import log_time
+from dfp.utils.user_splitter import UserSplitter
 from mrc.core import operators as ops
 
 import cudf
@@ -66,29 +67,20 @@ def dfp_split_users(builder: mrc.Builder):
     include_generic = config.get("include_generic", False)
     include_individual = config.get("include_individual", False)
 
-    if (include_generic):
-        # if not "fallback_username" in config:
-        #    raise ValueError("fallback_username must be specified if include_generic is True")
-        fallback_username = config.get("fallback_username", "generic_user")
+    fallback_username = config.get("fallback_username", "generic_user")
 
-    # Map of user ids to total number of messages. Keep indexes monotonic and increasing per user
-    user_index_map: typing.Dict[str, int] = {}
+    # Sorts each message by user once, keeping indexes monotonic and increasing per user
+    splitter = UserSplitter(userid_column_name=userid_column_name,
+                            fallback_username=fallback_username,
+                            include_generic=include_generic,
+                            include_individual=include_individual,
+                            skip_users=skip_users,
+                            only_users=only_users)
 
-    def generate_control_messages(control_message: ControlMessage, split_dataframes: typing.Dict[str, cudf.DataFrame]):
+    def generate_control_messages(control_message: ControlMessage, users_df: pd.DataFrame):
         output_messages: typing.List[ControlMessage] = []
 
-        for user_id in sorted(split_dataframes.keys()):
-            if (user_id in skip_users):
-                continue
-
-            user_df = split_dataframes[user_id]
-
-            current_user_count = user_index_map.get(user_id, 0)
-
-            # Reset the index so that users see monotonically increasing indexes
-            user_df.index = range(current_user_count, current_user_count + len(user_df))
-            user_index_map[user_id] = current_user_count + len(user_df)
-
+        for (user_id, user_df) in splitter.split(users_df):
             user_control_message = control_message.copy()
             user_control_message.set_metadata("user_id", user_id)
 
@@ -99,29 +91,6 @@ def dfp_split_users(builder: mrc.Builder):
 
         return output_messages
 
-    def generate_split_dataframes(users_df: pd.DataFrame):
-        split_dataframes: typing.Dict[str, cudf.DataFrame] = {}
-
-        # If we are skipping users, do that here
-        if (len(skip_users) > 0):
-            users_df = users_df[~users_df[userid_column_name].isin(skip_users)]
-
-        if (len(only_users) > 0):
-            users_df = users_df[users_df[userid_column_name].isin(only_users)]
-
-        # Split up the dataframes
-        if (include_generic):
-            split_dataframes[fallback_username] = users_df
-
-        if (include_individual):
-            # pylint: disable=unnecessary-comprehension
-            # List comprehension is necessary here to convert to a dictionary
-            split_dataframes.update(
-                {username: user_df
-                 for username, user_df in users_df.groupby(userid_column_name, sort=False)})
-
-        return split_dataframes
-
     def extract_users(control_message: ControlMessage):
         if (control_message is None):
             logger.debug("No message to extract users from")
@@ -139,8 +108,7 @@ def dfp_split_users(builder: mrc.Builder):
                     else:
                         users_df = dfm
 
-                    split_dataframes = generate_split_dataframes(users_df)
-                    control_messages = generate_control_messages(control_message, split_dataframes)
+                    control_messages = generate_control_messages(control_message, users_df)
 
             return control_messages
         except Exception as exec_info:
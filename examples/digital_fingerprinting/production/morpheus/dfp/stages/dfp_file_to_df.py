@@ -13,12 +13,14 @@
 # limitations under the License.
 """Stage for converting fsspec file objects to a DataFrame."""
 
+import dataclasses
 import hashlib
 import json
 import logging
 import os
 import time
 import typing
+from concurrent.futures import Future
 from functools import partial
 
 import fsspec
@@ -28,6 +30,7 @@ from mrc.core import operators as ops
 
 from morpheus.common import FileTypes
 from morpheus.config import Config
+from morpheus.io.dataframe_cache import DataFrameCache
 from morpheus.io.deserializers import read_file_to_df
 from morpheus.pipeline.preallocator_mixin import PreallocatorMixin
 from morpheus.pipeline.single_port_stage import SinglePortStage
@@ -69,6 +72,15 @@ def _single_object_to_dataframe(file_object: fsspec.core.OpenFile,
     return s3_df
 
 
+@dataclasses.dataclass
+class _PendingBatch:
+    """A batch which has either been read from the cache, or for which downloads have been started."""
+    batch_count: int
+    objects_hash_hex: str
+    output_df: pd.DataFrame = None
+    futures: typing.List[Future] = None
+
+
 class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
     """
     Stage for converting fsspec file objects to a DataFrame, pre-processing the DataFrame according to `schema`, and
@@ -91,6 +103,15 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
         Keyword arguments to pass to the DataFrame parser.
     cache_dir : str, optional
         Directory to use for caching.
+    cache_format : str, optional
+        Format of the cached batches, either "arrow" or "parquet".
+    cache_max_size_bytes : int, optional
+        Maximum size of the batch cache. Least recently used batches are evicted once exceeded. When None, the cache is
+        unbounded.
+    prefetch : bool, optional
+        When True, the downloads for each batch are started as soon as it is received and the batch is emitted once the
+        following batch has been received, allowing the next batch to be fetched while the current one is processed.
+        Only has an effect with the thread_pool and process_pool download methods.
     """
 
     def __init__(self,
@@ -99,7 +120,10 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
                  filter_null: bool = True,
                  file_type: FileTypes = FileTypes.Auto,
                  parser_kwargs: dict = None,
-                 cache_dir: str = "./.cache/dfp"):
+                 cache_dir: str = "./.cache/dfp",
+                 cache_format: str = "arrow",
+                 cache_max_size_bytes: int = None,
+                 prefetch: bool = False):
         super().__init__(c)
 
         self._schema = schema
@@ -108,8 +132,12 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
         self._filter_null = filter_null
         self._parser_kwargs = {} if parser_kwargs is None else parser_kwargs
         self._cache_dir = os.path.join(cache_dir, "file_cache")
+        self._batch_cache = DataFrameCache(os.path.join(self._cache_dir, "batches"),
+                                           file_format=cache_format,
+                                           max_size_bytes=cache_max_size_bytes)
 
         self._downloader = Downloader()
+        self._prefetch = prefetch
 
     @property
     def name(self) -> str:
@@ -124,8 +152,7 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
         """Accepted input types."""
         return (typing.Any, )
 
-    def _get_or_create_dataframe_from_s3_batch(
-            self, file_object_batch: typing.Tuple[fsspec.core.OpenFiles, int]) -> typing.Tuple[pd.DataFrame, bool]:
+    def _start_batch(self, file_object_batch: typing.Tuple[fsspec.core.OpenFiles, int]) -> _PendingBatch:
 
         if (not file_object_batch):
             raise RuntimeError("No file objects to process")
@@ -142,15 +169,10 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
         # Convert to base 64 encoding to remove - values
         objects_hash_hex = hashlib.md5(json.dumps(hash_data, sort_keys=True).encode()).hexdigest()
 
-        batch_cache_location = os.path.join(self._cache_dir, "batches", f"{objects_hash_hex}.pkl")
-
         # Return the cache if it exists
-        if (os.path.exists(batch_cache_location)):
-            output_df = pd.read_pickle(batch_cache_location)
-            output_df["batch_count"] = batch_count
-            output_df["origin_hash"] = objects_hash_hex
-
-            return (output_df, True)
+        output_df = self._batch_cache.get(objects_hash_hex)
+        if (output_df is not None):
+            return _PendingBatch(batch_count=batch_count, objects_hash_hex=objects_hash_hex, output_df=output_df)
 
         # Cache miss
         download_method = partial(_single_object_to_dataframe,
@@ -161,9 +183,26 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
 
         download_buckets = file_list
 
+        try:
+            futures = self._downloader.submit(download_buckets, download_method)
+        except Exception:
+            logger.exception("Failed to download logs. Error: ", exc_info=True)
+            raise
+
+        return _PendingBatch(batch_count=batch_count, objects_hash_hex=objects_hash_hex, futures=futures)
+
+    def _finish_batch(self, pending: _PendingBatch) -> typing.Tuple[pd.DataFrame, bool]:
+
+        if (pending.output_df is not None):
+            output_df = pending.output_df
+            output_df["batch_count"] = pending.batch_count
+            output_df["origin_hash"] = pending.objects_hash_hex
+
+            return (output_df, True)
+
         # Loop over dataframes and concat into one
         try:
-            dfs = self._downloader.download(download_buckets, download_method)
+            dfs = [future.result() for future in pending.futures]
         except Exception:
             logger.exception("Failed to download logs. Error: ", exc_info=True)
             raise
@@ -180,28 +219,21 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
         output_df.reset_index(drop=True, inplace=True)
 
         # Save dataframe to cache future runs
-        os.makedirs(os.path.dirname(batch_cache_location), exist_ok=True)
-
-        try:
-            output_df.to_pickle(batch_cache_location)
-        except Exception:
-            logger.warning("Failed to save batch cache. Skipping cache for this batch.", exc_info=True)
+        self._batch_cache.put(pending.objects_hash_hex, output_df)
 
-        output_df["batch_count"] = batch_count
-        output_df["origin_hash"] = objects_hash_hex
+        output_df["batch_count"] = pending.batch_count
+        output_df["origin_hash"] = pending.objects_hash_hex
 
         return (output_df, False)
 
-    def convert_to_dataframe(self, s3_object_batch: typing.Tuple[fsspec.core.OpenFiles, int]):
-        """Converts a batch of S3 objects to a DataFrame."""
-        if (not s3_object_batch):
-            return None
-
-        start_time = time.time()
+    def _get_or_create_dataframe_from_s3_batch(
+            self, file_object_batch: typing.Tuple[fsspec.core.OpenFiles, int]) -> typing.Tuple[pd.DataFrame, bool]:
+        return self._finish_batch(self._start_batch(file_object_batch))
 
+    def _convert_pending_to_dataframe(self, pending: _PendingBatch, start_time: float) -> pd.DataFrame:
         try:
 
-            output_df, cache_hit = self._get_or_create_dataframe_from_s3_batch(s3_object_batch)
+            output_df, cache_hit = self._finish_batch(pending)
 
             duration = (time.time() - start_time) * 1000.0
 
@@ -217,10 +249,56 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
             logger.exception("Error while converting S3 buckets to DF.")
             raise
 
+    def _start_conversion(self, s3_object_batch: typing.Tuple[fsspec.core.OpenFiles, int]) -> _PendingBatch:
+        try:
+            return self._start_batch(s3_object_batch)
+        except Exception:
+            logger.exception("Error while converting S3 buckets to DF.")
+            raise
+
+    def convert_to_dataframe(self, s3_object_batch: typing.Tuple[fsspec.core.OpenFiles, int]):
+        """Converts a batch of S3 objects to a DataFrame."""
+        if (not s3_object_batch):
+            return None
+
+        start_time = time.time()
+
+        return self._convert_pending_to_dataframe(self._start_conversion(s3_object_batch), start_time)
+
     def _build_single(self, builder: mrc.Builder, input_stream: StreamPair) -> StreamPair:
-        stream = builder.make_node(self.unique_name,
-                                   ops.map(self.convert_to_dataframe),
-                                   ops.on_completed(self._downloader.close))
+        if (self._prefetch):
+
+            def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
+                # Batches which have been started but not yet emitted, along with the time they were started
+                pending_batches: typing.List[typing.Tuple[_PendingBatch, float]] = []
+
+                def on_next(s3_object_batch: typing.Tuple[fsspec.core.OpenFiles, int]) -> typing.List[pd.DataFrame]:
+                    if (not s3_object_batch):
+                        return []
+
+                    start_time = time.time()
+                    pending_batches.append((self._start_conversion(s3_object_batch), start_time))
+
+                    # Emit the previous batch now that the downloads for this one are running
+                    if (len(pending_batches) > 1):
+                        return [self._convert_pending_to_dataframe(*pending_batches.pop(0))]
+
+                    return []
+
+                def on_completed() -> typing.List[pd.DataFrame]:
+                    output = [self._convert_pending_to_dataframe(*pending) for pending in pending_batches]
+                    pending_batches.clear()
+                    self._downloader.close()
+
+                    return output
+
+                obs.pipe(ops.map(on_next), ops.on_completed(on_completed), ops.flatten()).subscribe(sub)
+
+            stream = builder.make_node(self.unique_name, ops.build(node_fn))
+        else:
+            stream = builder.make_node(self.unique_name,
+                                       ops.map(self.convert_to_dataframe),
+                                       ops.on_completed(self._downloader.close))
         builder.make_edge(input_stream[0], stream)
 
         return stream, pd.DataFrame
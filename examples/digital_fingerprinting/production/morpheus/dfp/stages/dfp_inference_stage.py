@@ -29,6 +29,7 @@ from morpheus.pipeline.stream_pair import StreamPair
 from ..messages.multi_dfp_message import MultiDFPMessage
 from ..utils.model_cache import ModelCache
 from ..utils.model_cache import ModelManager
+from ..utils.model_registry import ModelRegistry
 
 logger = logging.getLogger("morpheus.{}".format(__name__))
 
@@ -44,9 +45,11 @@ class DFPInferenceStage(SinglePortStage):
     model_name_formatter : str, optional
         Format string to control the name of models stored in MLflow. Currently available field names are: `user_id`
         and `user_md5` which is an md5 hexadecimal digest as returned by `hash.hexdigest`.
+    model_registry : `dfp.utils.model_registry.ModelRegistry`, optional
+        Registry to load models from. When None, the MLflow model registry is used.
     """
 
-    def __init__(self, c: Config, model_name_formatter: str = "dfp-{user_id}"):
+    def __init__(self, c: Config, model_name_formatter: str = "dfp-{user_id}", model_registry: ModelRegistry = None):
         super().__init__(c)
 
         self._client = MlflowClient()
@@ -57,7 +60,7 @@ class DFPInferenceStage(SinglePortStage):
 
         self._cache_timeout_sec = 600
 
-        self._model_manager = ModelManager(model_name_formatter=model_name_formatter)
+        self._model_manager = ModelManager(model_name_formatter=model_name_formatter, registry=model_registry)
 
     @property
     def name(self) -> str:
@@ -79,6 +82,14 @@ class DFPInferenceStage(SinglePortStage):
         """
         return self._model_manager.load_user_model(self._client, user_id=user, fallback_user_ids=[self._fallback_user])
 
+    def prefetch_models(self, user_ids: typing.List[str]):
+        """
+        Download the models for the given users in the background, so that inference on their messages doesn't wait on
+        the model registry. Intended to be called by an upstream stage, such as `DFPSplitUsersStage`, as soon as the
+        users of a batch are known.
+        """
+        self._model_manager.prefetch(user_ids, fallback_user_ids=[self._fallback_user])
+
     def on_data(self, message: MultiDFPMessage) -> MultiDFPMessage:
         """Perform inference on the input data."""
         if (not message or message.mess_count == 0):
@@ -127,6 +138,10 @@ class DFPInferenceStage(SinglePortStage):
 
         return output_message
 
+    def stop(self):
+        """Stop the background refresh of the registered models and any pending prefetches."""
+        self._model_manager.close()
+
     def _build_single(self, builder: mrc.Builder, input_stream: StreamPair) -> StreamPair:
         node = builder.make_node(self.unique_name, ops.map(self.on_data))
         builder.make_edge(input_stream[0], node)
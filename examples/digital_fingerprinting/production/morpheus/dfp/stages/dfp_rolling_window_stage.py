@@ -19,7 +19,6 @@ import typing
 from contextlib import contextmanager
 
 import mrc
-import pandas as pd
 from mrc.core import operators as ops
 
 from morpheus.config import Config
@@ -30,6 +29,8 @@ from ..messages.multi_dfp_message import DFPMessageMeta
 from ..messages.multi_dfp_message import MultiDFPMessage
 from ..utils.cached_user_window import CachedUserWindow
 from ..utils.logging_timer import log_time
+from ..utils.user_window_store import UserWindowStore
+from ..utils.user_window_store import UserWindowStoreStats
 
 logger = logging.getLogger("morpheus.{}".format(__name__))
 
@@ -39,9 +40,8 @@ class DFPRollingWindowStage(SinglePortStage):
     This stage groups incomming messages into a rolling time window, emitting them only when the history requirements
     are met specified by the `min_history`, `min_increment` and `max_history` parameters.
 
-    Incoming data is cached to disk (`cache_dir`) to reduce memory ussage. This computes a row hash for the first and
-    last rows of the incoming `DataFrame` as such all data contained must be hashable, any non-hashable values such as
-    `lists` should be dropped or converted into hashable types in the `DFPFileToDataFrameStage`.
+    Incoming data is cached to disk (`cache_dir`) to reduce memory ussage. Each row in a user's window is assigned a
+    monotonically increasing row id, which is used to locate the rows of the incoming `DataFrame` within the window.
 
     Parameters
     ----------
@@ -60,6 +60,10 @@ class DFPRollingWindowStage(SinglePortStage):
     cache_dir : str
         Path to cache directory, cached items will be stored in a subdirectory under this directory named
         `rolling-user-data`. This directory, along with `cache_dir` will be created if it does not already exist.
+    memory_budget_bytes : int, optional
+        Maximum number of bytes of user windows to hold in memory. When exceeded, the windows of the least recently seen
+        users are spilled to `cache_dir` and transparently reloaded on the next batch for that user. When `None`, all
+        user windows are held in memory.
     """
 
     def __init__(self,
@@ -67,7 +71,8 @@ class DFPRollingWindowStage(SinglePortStage):
                  min_history: int,
                  min_increment: int,
                  max_history: typing.Union[int, str],
-                 cache_dir: str = "./.cache/dfp"):
+                 cache_dir: str = "./.cache/dfp",
+                 memory_budget_bytes: int = None):
         super().__init__(c)
 
         self._min_history = min_history
@@ -75,14 +80,21 @@ class DFPRollingWindowStage(SinglePortStage):
         self._max_history = max_history
         self._cache_dir = os.path.join(cache_dir, "rolling-user-data")
 
-        # Map of user ids to total number of messages. Keeps indexes monotonic and increasing per user
-        self._user_cache_map: typing.Dict[str, CachedUserWindow] = {}
+        # Rolling window of each user. Keeps indexes monotonic and increasing per user
+        self._user_windows = UserWindowStore(self._cache_dir,
+                                             timestamp_column=self._config.ae.timestamp_column_name,
+                                             memory_budget_bytes=memory_budget_bytes)
 
     @property
     def name(self) -> str:
         """Stage name."""
         return "dfp-rolling-window"
 
+    @property
+    def user_window_stats(self) -> UserWindowStoreStats:
+        """Memory and spill metrics of the user windows."""
+        return self._user_windows.stats
+
     def supports_cpp_node(self):
         """Whether this stage supports a C++ node."""
         return False
@@ -94,24 +106,9 @@ class DFPRollingWindowStage(SinglePortStage):
     @contextmanager
     def _get_user_cache(self, user_id: str) -> typing.Generator[CachedUserWindow, None, None]:
 
-        # Determine cache location
-        cache_location = os.path.join(self._cache_dir, f"{user_id}.pkl")
-
-        user_cache = None
-
-        user_cache = self._user_cache_map.get(user_id, None)
-
-        if (user_cache is None):
-            user_cache = CachedUserWindow(user_id=user_id,
-                                          cache_location=cache_location,
-                                          timestamp_column=self._config.ae.timestamp_column_name)
-
-            self._user_cache_map[user_id] = user_cache
-
-        yield user_cache
-
-        # # When it returns, make sure to save
-        # user_cache.save()
+        # Loads the window if it was spilled, and spills other windows if over budget once the window is released
+        with self._user_windows.get_window(user_id) as user_cache:
+            yield user_cache
 
     def _build_window(self, message: DFPMessageMeta) -> MultiDFPMessage:
 
@@ -139,19 +136,14 @@ class DFPRollingWindowStage(SinglePortStage):
             # Save the last train statistics
             train_df = user_cache.get_train_df(max_history=self._max_history)
 
-            # Hash the incoming data rows to find a match
-            incoming_hash = pd.util.hash_pandas_object(incoming_df.iloc[[0, -1]], index=False)
+            # The window is indexed by row id, so the appended rows are located from their row id range
+            (first_row_idx, stop_row_idx) = user_cache.last_append_range
 
-            # Find the index of the first and last row
-            match = train_df[train_df["_row_hash"] == incoming_hash.iloc[0]]
-
-            if (len(match) == 0):
+            if (first_row_idx == stop_row_idx or len(train_df) == 0 or train_df.index[0] > first_row_idx
+                    or train_df.index[-1] < stop_row_idx - 1):
                 raise RuntimeError("Invalid rolling window")
 
-            first_row_idx = match.index[0].item()
-            last_row_idx = train_df[train_df["_row_hash"] == incoming_hash.iloc[-1]].index[-1].item()
-
-            found_count = (last_row_idx - first_row_idx) + 1
+            found_count = stop_row_idx - first_row_idx
 
             if (found_count != len(incoming_df)):
                 raise RuntimeError(("Overlapping rolling history detected. "
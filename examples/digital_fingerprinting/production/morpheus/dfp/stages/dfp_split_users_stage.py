@@ -30,6 +30,7 @@ from morpheus.utils.type_aliases import DataFrameType
 
 from ..messages.multi_dfp_message import DFPMessageMeta
 from ..utils.logging_timer import log_time
+from ..utils.user_splitter import UserSplitter
 
 logger = logging.getLogger("morpheus.{}".format(__name__))
 
@@ -54,6 +55,9 @@ class DFPSplitUsersStage(SinglePortStage):
         List of user ids to skip.
     only_users : list of str
         List of user ids to include.
+    on_users_split : callable, optional
+        Function called with the user ids of each split message before the users are emitted, such as
+        `DFPInferenceStage.prefetch_models` to download the models of the users ahead of inference.
     """
 
     def __init__(self,
@@ -61,16 +65,23 @@ class DFPSplitUsersStage(SinglePortStage):
                  include_generic: bool,
                  include_individual: bool,
                  skip_users: typing.List[str] = None,
-                 only_users: typing.List[str] = None):
+                 only_users: typing.List[str] = None,
+                 on_users_split: typing.Callable[[typing.List[str]], None] = None):
         super().__init__(c)
 
         self._include_generic = include_generic
         self._include_individual = include_individual
         self._skip_users = skip_users if skip_users is not None else []
         self._only_users = only_users if only_users is not None else []
+        self._on_users_split = on_users_split
 
-        # Map of user ids to total number of messages. Keeps indexes monotonic and increasing per user
-        self._user_index_map: typing.Dict[str, int] = {}
+        # Sorts each message by user once, keeping indexes monotonic and increasing per user
+        self._splitter = UserSplitter(userid_column_name=c.ae.userid_column_name,
+                                      fallback_username=c.ae.fallback_username,
+                                      include_generic=include_generic,
+                                      include_individual=include_individual,
+                                      skip_users=self._skip_users,
+                                      only_users=self._only_users)
 
     @property
     def name(self) -> str:
@@ -99,51 +110,14 @@ class DFPSplitUsersStage(SinglePortStage):
                 # Convert to pandas because cudf is slow at this
                 message = message.to_pandas()
 
-            split_dataframes: typing.Dict[str, pd.DataFrame] = {}
+            output_messages: typing.List[DFPMessageMeta] = [
+                DFPMessageMeta(df=user_df, user_id=user_id) for (user_id, user_df) in self._splitter.split(message)
+            ]
 
-            # If we are skipping users, do that here
-            if (len(self._skip_users) > 0):
-                message = message[~message[self._config.ae.userid_column_name].isin(self._skip_users)]
+            if (self._on_users_split is not None and len(output_messages) > 0):
+                self._on_users_split([x.user_id for x in output_messages])
 
-            if (len(self._only_users) > 0):
-                message = message[message[self._config.ae.userid_column_name].isin(self._only_users)]
-
-            # Split up the dataframes
-            if (self._include_generic):
-                split_dataframes[self._config.ae.fallback_username] = message
-
-            if (self._include_individual):
-
-                split_dataframes.update({
-                    username: user_df
-                    for username,
-                    user_df in message.groupby(self._config.ae.userid_column_name, sort=False)
-                })
-
-            output_messages: typing.List[DFPMessageMeta] = []
-
-            for user_id in sorted(split_dataframes.keys()):
-
-                if (user_id in self._skip_users):
-                    continue
-
-                user_df = split_dataframes[user_id]
-
-                current_user_count = self._user_index_map.get(user_id, 0)
-
-                # Reset the index so that users see monotonically increasing indexes
-                user_df.index = range(current_user_count, current_user_count + len(user_df))
-                self._user_index_map[user_id] = current_user_count + len(user_df)
-
-                output_messages.append(DFPMessageMeta(df=user_df, user_id=user_id))
-
-                # logger.debug("Emitting dataframe for user '%s'. Start: %s, End: %s, Count: %s",
-                #              user,
-                #              df_user[self._config.ae.timestamp_column_name].min(),
-                #              df_user[self._config.ae.timestamp_column_name].max(),
-                #              df_user[self._config.ae.timestamp_column_name].count())
-
-            rows_per_user = [len(x.df) for x in output_messages]
+            rows_per_user = [x.count for x in output_messages]
 
             if (len(output_messages) > 0):
                 log_info.set_log(
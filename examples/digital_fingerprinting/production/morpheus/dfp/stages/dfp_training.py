@@ -14,6 +14,7 @@
 """Training stage for the DFP pipeline."""
 
 import logging
+import threading
 import typing
 
 import mrc
@@ -23,6 +24,9 @@ from sklearn.model_selection import train_test_split
 from morpheus.config import Config
 from morpheus.messages.multi_ae_message import MultiAEMessage
 from morpheus.models.dfencoder import AutoEncoder
+from morpheus.models.dfencoder import TrainingExecutor
+from morpheus.models.dfencoder import TrainingResult
+from morpheus.models.dfencoder import fit_autoencoder
 from morpheus.pipeline.single_port_stage import SinglePortStage
 from morpheus.pipeline.stream_pair import StreamPair
 
@@ -45,9 +49,21 @@ class DFPTraining(SinglePortStage):
         Number of epochs to train the model for.
     validation_size : float
         Fraction of the training data to use for validation. Must be in the (0, 1) range.
+    num_workers : int
+        Number of worker processes to train user models in. When 0, models are trained serially on the pipeline thread.
+        Otherwise messages are emitted in the order their models finish training.
+    max_in_flight : int
+        Maximum number of users queued or training in the worker processes at once, bounding memory usage. Ignored when
+        `num_workers` is 0, defaults to `2 * num_workers`.
     """
 
-    def __init__(self, c: Config, model_kwargs: dict = None, epochs=30, validation_size=0.0):
+    def __init__(self,
+                 c: Config,
+                 model_kwargs: dict = None,
+                 epochs=30,
+                 validation_size=0.0,
+                 num_workers: int = 0,
+                 max_in_flight: int = None):
         super().__init__(c)
 
         self._model_kwargs = {
@@ -76,6 +92,12 @@ class DFPTraining(SinglePortStage):
         else:
             raise ValueError(f"validation_size={validation_size} should be a positive float in the (0, 1) range")
 
+        if (num_workers < 0):
+            raise ValueError(f"num_workers={num_workers} should be a non-negative integer")
+
+        self._num_workers = num_workers
+        self._max_in_flight = max_in_flight
+
     @property
     def name(self) -> str:
         """Stage name."""
@@ -89,15 +111,7 @@ class DFPTraining(SinglePortStage):
         """Indicate which input message types this stage accepts."""
         return (MultiDFPMessage, )
 
-    def on_data(self, message: MultiDFPMessage) -> MultiAEMessage:
-        """Train the model and attach it to the output message."""
-        if (message is None or message.mess_count == 0):
-            return None
-
-        user_id = message.user_id
-
-        model = AutoEncoder(**self._model_kwargs)
-
+    def _get_training_data(self, message: MultiDFPMessage):
         train_df = message.get_meta_dataframe()
 
         # Only train on the feature columns
@@ -110,6 +124,19 @@ class DFPTraining(SinglePortStage):
             train_df, validation_df = train_test_split(train_df, test_size=self._validation_size, shuffle=False)
             run_validation = True
 
+        return train_df, validation_df, run_validation
+
+    def on_data(self, message: MultiDFPMessage) -> MultiAEMessage:
+        """Train the model and attach it to the output message."""
+        if (message is None or message.mess_count == 0):
+            return None
+
+        user_id = message.user_id
+
+        model = AutoEncoder(**self._model_kwargs)
+
+        train_df, validation_df, run_validation = self._get_training_data(message)
+
         logger.debug("Training AE model for user: '%s'...", user_id)
         model.fit(train_df, epochs=self._epochs, val_data=validation_df, run_validation=run_validation)
         logger.debug("Training AE model for user: '%s'... Complete.", user_id)
@@ -121,8 +148,81 @@ class DFPTraining(SinglePortStage):
 
         return output_message
 
+    def _build_output_message(self, executor: TrainingExecutor, result: TrainingResult) -> MultiAEMessage:
+        if not result.succeeded:
+            logger.error("Training AE model for user: '%s' failed, no model will be emitted for this batch",
+                         result.user_id,
+                         exc_info=result.error)
+            return None
+
+        message: MultiDFPMessage = result.context
+
+        logger.debug("Training AE model for user: '%s'... Complete. Took %.2f sec", result.user_id, result.train_time)
+        logger.debug("Training throughput: %.2f users/sec, queue depth: %d, completed: %d, failed: %d",
+                     executor.users_per_second,
+                     executor.queue_depth,
+                     executor.completed_count,
+                     executor.failed_count)
+
+        return MultiAEMessage(meta=message.meta,
+                              mess_offset=message.mess_offset,
+                              mess_count=message.mess_count,
+                              model=result.result)
+
+    def _build_pooled_node(self, builder: mrc.Builder):
+
+        def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
+
+            # Results arrive on a background thread of the executor as soon as each model finishes training
+            emit_lock = threading.Lock()
+
+            def on_result(result: TrainingResult):
+                output_message = self._build_output_message(executor, result)
+
+                if (output_message is not None):
+                    with emit_lock:
+                        sub.on_next(output_message)
+
+            executor = TrainingExecutor(max_workers=self._num_workers,
+                                        max_in_flight=self._max_in_flight,
+                                        on_result=on_result)
+
+            def on_next(message: MultiDFPMessage):
+                if (message is not None and message.mess_count > 0):
+                    train_df, validation_df, run_validation = self._get_training_data(message)
+
+                    logger.debug("Submitting AE model training for user: '%s'...", message.user_id)
+                    fit_kwargs = {"epochs": self._epochs, "val_data": validation_df, "run_validation": run_validation}
+
+                    executor.submit(message.user_id,
+                                    fit_autoencoder,
+                                    self._model_kwargs,
+                                    train_df,
+                                    fit_kwargs,
+                                    context=message)
+
+                # Models are emitted by `on_result`
+                return []
+
+            def on_completed():
+                # Wait for the remaining models to be emitted before completing
+                for _ in executor.wait_all():
+                    pass
+
+                return []
+
+            obs.pipe(ops.map(on_next), ops.on_completed(on_completed), ops.flatten()).subscribe(sub)
+
+            executor.shutdown()
+
+        return builder.make_node(self.unique_name, ops.build(node_fn))
+
     def _build_single(self, builder: mrc.Builder, input_stream: StreamPair) -> StreamPair:
-        stream = builder.make_node(self.unique_name, ops.map(self.on_data), ops.filter(lambda x: x is not None))
+        if (self._num_workers > 0):
+            stream = self._build_pooled_node(builder)
+        else:
+            stream = builder.make_node(self.unique_name, ops.map(self.on_data), ops.filter(lambda x: x is not None))
+
         builder.make_edge(input_stream[0], stream)
 
         return stream, MultiAEMessage
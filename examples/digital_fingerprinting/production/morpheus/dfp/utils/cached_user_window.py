@@ -13,8 +13,8 @@
 # limitations under the License.
 
 import dataclasses
+import json
 import os
-import pickle
 import typing
 from datetime import datetime
 from datetime import timedelta
@@ -22,10 +22,94 @@ from datetime import timezone
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+# Name of the file holding the window metadata, inside of the cache location directory
+WINDOW_METADATA_FILE = "window.json"
+
+# Column holding the row ids of a segment in its file. Rows trimmed by a duration aren't contiguous, so the row ids are
+# stored rather than derived from the first row id of the segment
+ROW_ID_COLUMN = "__row_id"
+
+
+@dataclasses.dataclass
+class WindowSegment:
+    """
+    An immutable chunk of the rows in a `CachedUserWindow`, holding the rows appended by one or more batches.
+
+    The index of `df` holds the absolute row ids of the rows, which increase monotonically across batches.
+    """
+    df: pd.DataFrame
+    batch_id: int
+    min_epoch: datetime
+    max_epoch: datetime
+
+    # Name of the file the segment is persisted to, None when the segment has not been saved. The file may hold
+    # additional rows around the segment, the rows of the segment start at position `file_offset` in the file
+    file_name: str = None
+    file_offset: int = None
+
+    _memory_bytes: int = dataclasses.field(init=False, repr=False, default=None)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.df)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Number of bytes of memory used by `df`, computed once since segments are immutable."""
+        if (self._memory_bytes is None):
+            self._memory_bytes = int(self.df.memory_usage(deep=True).sum())
+
+        return self._memory_bytes
+
+    @property
+    def start_row(self) -> int:
+        return int(self.df.index[0])
+
+    def slice(self, positions: np.ndarray, timestamp_column: str) -> "WindowSegment":
+        """
+        Returns a new segment containing the rows of this segment at the increasing `positions`. When the positions
+        are contiguous, the rows are also contiguous in the file of this segment and the new segment continues to use
+        that file.
+        """
+        df = self.df.iloc[positions]
+
+        segment = WindowSegment(df=df,
+                                batch_id=self.batch_id,
+                                min_epoch=df[timestamp_column].min(),
+                                max_epoch=df[timestamp_column].max())
+
+        if (self.file_name is not None and positions[-1] - positions[0] + 1 == len(positions)):
+            segment.file_name = self.file_name
+            segment.file_offset = self.file_offset + int(positions[0])
+
+        return segment
+
+    @staticmethod
+    def merge(segments: typing.List["WindowSegment"]) -> "WindowSegment":
+        """Returns a new, unsaved, segment containing the rows of consecutive `segments`."""
+        return WindowSegment(df=pd.concat([segment.df for segment in segments]),
+                             batch_id=max(segment.batch_id for segment in segments),
+                             min_epoch=min(segment.min_epoch for segment in segments),
+                             max_epoch=max(segment.max_epoch for segment in segments))
 
 
 @dataclasses.dataclass
 class CachedUserWindow:
+    """
+    The rolling window of rows for a single user.
+
+    Rows are held as a list of `WindowSegment`, one for each appended batch, along with the minimum and maximum
+    timestamps of each segment. Appending a batch only touches the rows of that batch, trimming the window to
+    `max_history` drops whole segments, and a contiguous DataFrame is only built by `get_train_df`. Once trained on,
+    segments are merged such that each segment is larger than the segments following it, keeping the number of
+    segments logarithmic in the size of the window.
+
+    When `save` is called, segments which have not been persisted are written to the `cache_location` directory in the
+    Arrow IPC format, and segments which have been trimmed from the window are removed.
+    """
     user_id: str
     cache_location: str
     timestamp_column: str = "timestamp"
@@ -39,8 +123,49 @@ class CachedUserWindow:
     last_train_epoch: datetime = None
     last_train_batch: int = 0
 
-    _trained_rows: pd.Series = dataclasses.field(init=False, repr=False, default_factory=pd.DataFrame)
-    _df: pd.DataFrame = dataclasses.field(init=False, repr=False, default_factory=pd.DataFrame)
+    _segments: typing.List[WindowSegment] = dataclasses.field(init=False, repr=False, default_factory=list)
+
+    # Files of segments which have been removed from the window since the last save
+    _stale_files: typing.List[str] = dataclasses.field(init=False, repr=False, default_factory=list)
+    _next_file_id: int = dataclasses.field(init=False, repr=False, default=0)
+
+    # Half open range of the row ids appended by the last call to `append_dataframe`
+    _last_append_range: typing.Tuple[int, int] = dataclasses.field(init=False, repr=False, default=(0, 0))
+
+    @property
+    def segments(self) -> typing.List[WindowSegment]:
+        return list(self._segments)
+
+    @property
+    def last_append_range(self) -> typing.Tuple[int, int]:
+        """
+        Half open range `(start, stop)` of the row ids of the rows appended by the last call to `append_dataframe`.
+        Since row ids are the index of the window, this locates the appended rows without searching the window.
+        """
+        return self._last_append_range
+
+    @property
+    def memory_bytes(self) -> int:
+        """Number of bytes of memory used by the rows in the window."""
+        return sum(segment.memory_bytes for segment in self._segments)
+
+    def _update_stats(self):
+        self.count = sum(segment.num_rows for segment in self._segments)
+
+        if (len(self._segments) > 0):
+            self.min_epoch = min(segment.min_epoch for segment in self._segments)
+            self.max_epoch = max(segment.max_epoch for segment in self._segments)
+
+    def _set_segments(self, segments: typing.List[WindowSegment]):
+        kept_files = set(segment.file_name for segment in segments)
+
+        for segment in self._segments:
+            if (segment.file_name is not None and segment.file_name not in kept_files):
+                self._stale_files.append(segment.file_name)
+                kept_files.add(segment.file_name)
+
+        self._segments = segments
+        self._update_stats()
 
     def append_dataframe(self, incoming_df: pd.DataFrame) -> bool:
 
@@ -48,6 +173,8 @@ class CachedUserWindow:
         filtered_df = incoming_df[incoming_df[self.timestamp_column] > np.datetime64(self.max_epoch)]
 
         if (len(filtered_df) == 0):
+            self._last_append_range = (self.total_count, self.total_count)
+
             # We have nothing new to add. Double check that we fit within the window
             before_history = incoming_df[incoming_df[self.timestamp_column] < np.datetime64(self.min_epoch)]
 
@@ -60,29 +187,25 @@ class CachedUserWindow:
         # Set the filtered index
         filtered_df.index = range(self.total_count, self.total_count + len(filtered_df))
 
-        # Save the row hash to make it easier to find later. Do this before the batch so it doesn't participate
-        filtered_df["_row_hash"] = pd.util.hash_pandas_object(filtered_df, index=False)
-
         # Use batch id to distinguish groups in the same dataframe
         filtered_df["_batch_id"] = self.batch_count
 
-        # Append just the new rows
-        self._df = pd.concat([self._df, filtered_df])
+        # Append just the new rows as a new segment
+        self._segments.append(
+            WindowSegment(df=filtered_df,
+                          batch_id=self.batch_count,
+                          min_epoch=filtered_df[self.timestamp_column].min(),
+                          max_epoch=filtered_df[self.timestamp_column].max()))
 
+        self._last_append_range = (self.total_count, self.total_count + len(filtered_df))
         self.total_count += len(filtered_df)
-        self.count = len(self._df)
-
-        if (len(self._df) > 0):
-            self.min_epoch = self._df[self.timestamp_column].min()
-            self.max_epoch = self._df[self.timestamp_column].max()
+        self._update_stats()
 
         return True
 
     def flush(self):
         self.batch_count = 0
-        self.count = 0
-        self._df = pd.DataFrame()
-        self._trained_rows = pd.Series()
+        self._set_segments([])
         self.last_train_batch = 0
         self.last_train_count = 0
         self.last_train_epoch = None
@@ -96,67 +219,190 @@ class CachedUserWindow:
 
     def get_train_df(self, max_history) -> pd.DataFrame:
 
-        new_df = self.trim_dataframe(self._df,
-                                     max_history=max_history,
-                                     last_batch=self.batch_count - self.pending_batch_count,
-                                     timestamp_column=self.timestamp_column)
+        segments = self.trim_segments(self._segments,
+                                      max_history=max_history,
+                                      last_batch=self.batch_count - self.pending_batch_count,
+                                      timestamp_column=self.timestamp_column)
 
         self.last_train_count = self.total_count
         self.last_train_epoch = datetime.now()
         self.last_train_batch = self.batch_count
         self.pending_batch_count = 0
 
-        self._df = new_df
+        # All of the segments have been trained on, and so batches no longer need to be kept separate
+        segments = self.merge_segments(segments)
+
+        self._set_segments(segments)
+
+        if (len(segments) == 0):
+            return pd.DataFrame()
+
+        if (len(segments) == 1):
+            # Copy so the caller can't modify the segment
+            return segments[0].df.copy()
 
-        if (len(self._df) > 0):
-            self.min_epoch = self._df[self.timestamp_column].min()
-            self.max_epoch = self._df[self.timestamp_column].max()
+        return pd.concat([segment.df for segment in segments])
 
-        return new_df
+    def _get_file_path(self, file_name: str) -> str:
+        return os.path.join(self.cache_location, file_name)
 
     def save(self):
         if (not self.cache_location):
             raise RuntimeError("No cache location set")
 
         # Make sure the directories exist
-        os.makedirs(os.path.dirname(self.cache_location), exist_ok=True)
-
-        with open(self.cache_location, "wb") as f:
-            pickle.dump(self, f)
+        os.makedirs(self.cache_location, exist_ok=True)
+
+        # Only segments appended or sliced since the last save need to be written
+        for segment in self._segments:
+            if (segment.file_name is None):
+                file_name = f"segment-{self._next_file_id:010d}.arrow"
+                self._next_file_id += 1
+
+                df = segment.df.rename_axis(ROW_ID_COLUMN).reset_index()
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                feather.write_feather(table, self._get_file_path(file_name), compression="uncompressed")
+
+                segment.file_name = file_name
+                segment.file_offset = 0
+
+        metadata = {field.name: getattr(self, field.name) for field in dataclasses.fields(self) if field.init}
+        metadata["next_file_id"] = self._next_file_id
+        metadata["segments"] = [{
+            "file_name": segment.file_name,
+            "file_offset": segment.file_offset,
+            "batch_id": segment.batch_id,
+            "start_row": segment.start_row,
+            "num_rows": segment.num_rows,
+            "min_epoch": segment.min_epoch,
+            "max_epoch": segment.max_epoch,
+        } for segment in self._segments]
+
+        # Write the metadata to a temporary file then rename, so a partially written file is never loaded
+        metadata_path = self._get_file_path(WINDOW_METADATA_FILE)
+        with open(metadata_path + ".tmp", "w", encoding="UTF-8") as f:
+            json.dump(metadata, f, default=lambda x: pd.Timestamp(x).isoformat())
+
+        os.replace(metadata_path + ".tmp", metadata_path)
+
+        # Only remove trimmed segments once the metadata no longer references them
+        for file_name in self._stale_files:
+            try:
+                os.remove(self._get_file_path(file_name))
+            except FileNotFoundError:
+                pass
+
+        self._stale_files = []
 
     @staticmethod
-    def trim_dataframe(df: pd.DataFrame,
-                       max_history: typing.Union[int, str],
-                       last_batch: int,
-                       timestamp_column: str = "timestamp") -> pd.DataFrame:
-        if (max_history is None):
-            return df
+    def trim_segments(segments: typing.List[WindowSegment],
+                      max_history: typing.Union[int, str],
+                      last_batch: int,
+                      timestamp_column: str = "timestamp") -> typing.List[WindowSegment]:
+        if (max_history is None or len(segments) == 0):
+            return segments
 
         # Want to ensure we always see data once. So any new data is preserved
-        new_batches = df[df["_batch_id"] > last_batch]
+        new_segments = [segment for segment in segments if segment.batch_id > last_batch]
 
         # See if max history is an int
         if (isinstance(max_history, int)):
-            return df.tail(max(max_history, len(new_batches)))
+            remaining = max(max_history, sum(segment.num_rows for segment in new_segments))
+            trimmed = []
+
+            # Keep the last `remaining` rows, only slicing the oldest segment which is kept
+            for segment in reversed(segments):
+                if (remaining <= 0):
+                    break
+
+                if (segment.num_rows > remaining):
+                    segment = segment.slice(np.arange(segment.num_rows - remaining, segment.num_rows), timestamp_column)
+
+                trimmed.append(segment)
+                remaining -= segment.num_rows
+
+            return trimmed[::-1]
 
         # If its a string, then its a duration
         if (isinstance(max_history, str)):
             # Get the latest timestamp
-            latest = df[timestamp_column].max()
+            latest = max(segment.max_epoch for segment in segments)
 
             time_delta = pd.Timedelta(max_history)
 
             # Calc the earliest
-            earliest = min(latest - time_delta, new_batches[timestamp_column].min())
+            earliest = latest - time_delta
+            if (len(new_segments) > 0):
+                earliest = min(earliest, min(segment.min_epoch for segment in new_segments))
+
+            trimmed = []
 
-            return df[df[timestamp_column] >= earliest]
+            for segment in segments:
+                if (segment.max_epoch < earliest):
+                    continue
+
+                if (segment.min_epoch < earliest):
+                    segment = segment.slice(np.flatnonzero(segment.df[timestamp_column] >= earliest), timestamp_column)
+
+                trimmed.append(segment)
+
+            return trimmed
 
         raise RuntimeError("Unsupported max_history")
 
+    @staticmethod
+    def merge_segments(segments: typing.List[WindowSegment]) -> typing.List[WindowSegment]:
+        """
+        Merges consecutive segments such that each segment is larger than the segments following it. As in a binary
+        counter, each row is only merged a logarithmic number of times as the window grows.
+        """
+        merged: typing.List[typing.List[WindowSegment]] = []
+        merged_rows: typing.List[int] = []
+
+        for segment in segments:
+            merged.append([segment])
+            merged_rows.append(segment.num_rows)
+
+            while (len(merged) > 1 and merged_rows[-2] <= merged_rows[-1]):
+                group = merged.pop()
+                group_rows = merged_rows.pop()
+
+                merged[-1].extend(group)
+                merged_rows[-1] += group_rows
+
+        return [group[0] if len(group) == 1 else WindowSegment.merge(group) for group in merged]
+
     @staticmethod
     def load(cache_location: str) -> "CachedUserWindow":
         if (cache_location is None):
             raise RuntimeError("No cache location set")
 
-        with open(cache_location, "rb") as f:
-            return pickle.load(f)
+        with open(os.path.join(cache_location, WINDOW_METADATA_FILE), "r", encoding="UTF-8") as f:
+            metadata = json.load(f)
+
+        segment_metadata = metadata.pop("segments")
+        next_file_id = metadata.pop("next_file_id")
+
+        for key in ("min_epoch", "max_epoch", "last_train_epoch"):
+            if (metadata[key] is not None):
+                metadata[key] = pd.Timestamp(metadata[key])
+
+        window = CachedUserWindow(**metadata)
+        window.cache_location = cache_location
+        window._next_file_id = next_file_id
+
+        for segment in segment_metadata:
+            table = feather.read_table(window._get_file_path(segment["file_name"]), memory_map=True)
+
+            df = table.slice(segment["file_offset"], segment["num_rows"]).to_pandas()
+            df = df.set_index(ROW_ID_COLUMN).rename_axis(None)
+
+            window._segments.append(
+                WindowSegment(df=df,
+                              batch_id=segment["batch_id"],
+                              min_epoch=pd.Timestamp(segment["min_epoch"]),
+                              max_epoch=pd.Timestamp(segment["max_epoch"]),
+                              file_name=segment["file_name"],
+                              file_offset=segment["file_offset"]))
+
+        return window
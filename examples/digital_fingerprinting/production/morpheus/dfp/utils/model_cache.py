@@ -16,38 +16,21 @@ import hashlib
 import logging
 import threading
 import typing
-from contextlib import contextmanager
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import mlflow
-from mlflow.entities.model_registry import RegisteredModel
-from mlflow.exceptions import MlflowException
-from mlflow.store.entities.paged_list import PagedList
-from mlflow.tracking.client import MlflowClient
-
 from morpheus.models.dfencoder import AutoEncoder
 
 from .logging_timer import log_time
+from .model_registry import MlflowModelRegistry
+from .model_registry import ModelRegistry
+from .model_registry import RegisteredModelVersion
 
 logger = logging.getLogger("morpheus.{}".format(__name__))
 
 
-@contextmanager
-def timed_acquire(lock: threading.Lock, timeout: float):
-    result = lock.acquire(timeout=timeout)
-
-    if (not result):
-        # Did not get the lock. Raise
-        raise TimeoutError()
-
-    # Got the lock
-    try:
-        yield
-
-    finally:
-        lock.release()
-
-
 def user_to_model_name(user_id: str, model_name_formatter: str):
 
     kwargs = {
@@ -60,11 +43,16 @@ def user_to_model_name(user_id: str, model_name_formatter: str):
 
 class ModelCache:
 
-    def __init__(self, reg_model_name: str, reg_model_version: str, model_uri: str) -> None:
+    def __init__(self,
+                 reg_model_name: str,
+                 reg_model_version: str,
+                 model_uri: str,
+                 registry: ModelRegistry = None) -> None:
 
-        self._reg_model_name = reg_model_name
-        self._reg_model_version = reg_model_version
-        self._model_uri = model_uri
+        self._model_version = RegisteredModelVersion(reg_model_name=reg_model_name,
+                                                     reg_model_version=reg_model_version,
+                                                     model_uri=model_uri)
+        self._registry = registry if registry is not None else MlflowModelRegistry()
 
         self._last_checked: datetime = datetime.now()
         self._last_used: datetime = self._last_checked
@@ -74,15 +62,15 @@ class ModelCache:
 
     @property
     def reg_model_name(self):
-        return self._reg_model_name
+        return self._model_version.reg_model_name
 
     @property
     def reg_model_version(self):
-        return self._reg_model_version
+        return self._model_version.reg_model_version
 
     @property
     def model_uri(self):
-        return self._model_uri
+        return self._model_version.model_uri
 
     @property
     def last_used(self):
@@ -92,7 +80,21 @@ class ModelCache:
     def last_checked(self):
         return self._last_checked
 
-    def load_model(self, client) -> AutoEncoder:
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model has been downloaded."""
+        return self._model is not None
+
+    def mark_checked(self):
+        """Records that this is still the latest version of the model."""
+        self._last_checked = datetime.now()
+
+    def load_model(self, client=None) -> AutoEncoder:
+        """
+        Returns the model, downloading it from the registry on first use. If the model is being downloaded by another
+        thread, such as a prefetch, waits for that download instead of starting another. The `client` argument is
+        unused and only kept for compatibility, the model is downloaded from the registry of this cache.
+        """
 
         now = datetime.now()
 
@@ -101,15 +103,14 @@ class ModelCache:
 
             if (self._model is None):
 
-                # Cache miss. Release the lock while we check
                 try:
                     with log_time(
                             logger.debug,
                             f"Downloaded model '{self.reg_model_name}:{self.reg_model_version}' in {{duration}} ms"):
-                        self._model = mlflow.pytorch.load_model(model_uri=self._model_uri)
+                        self._model = self._registry.load_model(self._model_version)
 
-                except MlflowException:
-                    logger.error("Error downloading model for URI: %s", self._model_uri, exc_info=True)
+                except Exception:
+                    logger.error("Error downloading model for URI: %s", self.model_uri, exc_info=True)
                     raise
 
             # Update the last time this was used
@@ -118,219 +119,272 @@ class ModelCache:
             return self._model
 
 
-class UserModelMap:
-
-    def __init__(self, manager: "ModelManager", user_id: str, fallback_user_ids: typing.List[str]):
-
-        self._manager = manager
-        self._user_id = user_id
-        self._fallback_user_ids = fallback_user_ids
-        self._reg_model_name = manager.user_id_to_model(user_id)
-        self._last_checked = None
-
-        self._lock = threading.RLock()
-        self._child_user_model_cache: UserModelMap = None
-
-    def load_model_cache(self, client) -> ModelCache:
-
-        now = datetime.now()
-
-        # Lock to prevent additional access
-        try:
-            with timed_acquire(self._lock, timeout=1.0):
-
-                # Check if we have checked before or if we need to check again
-                if (self._last_checked is None or (now - self._last_checked).seconds < self._manager.cache_timeout_sec):
-
-                    # Save the last checked time
-                    self._last_checked = now
-
-                    # Try to load from the manager
-                    model_cache = self._manager.load_model_cache(client=client, reg_model_name=self._reg_model_name)
-
-                    # If we have a hit, there is nothing else to do
-                    if (model_cache is None and len(self._fallback_user_ids) > 0):
-                        # Our model does not exist, use fallback
-                        self._child_user_model_cache = self._manager.load_user_model_cache(
-                            self._fallback_user_ids[0], fallback_user_ids=self._fallback_user_ids[1:])
-                    else:
-                        return model_cache
-
-                # See if we have a child cache and use that
-                if (self._child_user_model_cache is not None):
-                    return self._child_user_model_cache.load_model_cache(client=client)
-
-                # Otherwise load the model
-                model_cache = self._manager.load_model_cache(client=client, reg_model_name=self._reg_model_name)
-
-                if (model_cache is None):
-                    raise RuntimeError("Model was found but now no longer exists. Model: {}".format(
-                        self._reg_model_name))
-
-                return model_cache
-        except TimeoutError:
-            logger.error("Deadlock detected while loading model cache. Please report this to the developers.")
-            raise RuntimeError("Deadlock detected while loading model cache")
-
-
 class ModelManager:
+    """
+    Looks up and caches the latest model of each user from a model registry.
+
+    The cache is safe to use from multiple threads without serializing users behind each other. Registry lookups and
+    downloads for a model only hold one of `num_lock_stripes` locks, chosen by the model name. The least recently used
+    models are evicted once more than `cache_size_max` are cached. The list of registered models, used to fall back to
+    another user's model without querying the registry, is refreshed on a background thread every
+    `cache_timeout_sec`. Models can be downloaded ahead of time on a pool of `num_prefetch_workers` threads with
+    `prefetch`, with at most `prefetch_size_max` users being prefetched at once so that prefetched models aren't evicted
+    from the cache before they are used.
+
+    Parameters
+    ----------
+    model_name_formatter : str
+        Format string to control the name of models in the registry. Currently available field names are: `user_id`
+        and `user_md5` which is an md5 hexadecimal digest as returned by `hash.hexdigest`.
+    registry : `dfp.utils.model_registry.ModelRegistry`, optional
+        Registry to load models from. When None, the MLflow model registry is used.
+    cache_size_max : int, default = 100
+        Maximum number of models to cache.
+    cache_timeout_sec : int, default = 600
+        Number of seconds after which to check for a newer version of a cached model, and the interval at which the
+        list of registered models is refreshed.
+    num_lock_stripes : int, default = 64
+        Number of locks the models are distributed over.
+    num_prefetch_workers : int, default = 4
+        Number of threads downloading models for `prefetch`.
+    prefetch_size_max : int, optional
+        Maximum number of users being prefetched at once, must be less than `cache_size_max`. When None, half of
+        `cache_size_max` is used. A value of 0 disables prefetching.
+    """
+
+    def __init__(self,
+                 model_name_formatter: str,
+                 registry: ModelRegistry = None,
+                 cache_size_max: int = 100,
+                 cache_timeout_sec: int = 600,
+                 num_lock_stripes: int = 64,
+                 num_prefetch_workers: int = 4,
+                 prefetch_size_max: int = None) -> None:
+        if (prefetch_size_max is None):
+            prefetch_size_max = cache_size_max // 2
+
+        if (prefetch_size_max < 0 or prefetch_size_max >= cache_size_max):
+            raise ValueError(f"prefetch_size_max must be at least 0 and less than cache_size_max ({cache_size_max}), "
+                             f"got {prefetch_size_max}")
 
-    def __init__(self, model_name_formatter: str) -> None:
         self._model_name_formatter = model_name_formatter
+        self._registry = registry if registry is not None else MlflowModelRegistry()
 
-        self._user_model_cache: typing.Dict[str, UserModelMap] = {}
+        self._cache_size_max = cache_size_max
+        self._cache_timeout_sec = cache_timeout_sec
 
-        self._model_cache: typing.Dict[str, ModelCache] = {}
-        self._model_cache_size_max = 100
+        # Least recently used models first. The lock is only held to update the dictionary
+        self._model_cache: typing.OrderedDict[str, ModelCache] = OrderedDict()
+        self._model_cache_lock = threading.Lock()
 
-        self._cache_timeout_sec = 600
+        self._lock_stripes = [threading.Lock() for _ in range(num_lock_stripes)]
 
-        self._user_model_cache_lock = threading.RLock()
-        self._model_cache_lock = threading.RLock()
-
-        self._existing_models: typing.Set[str] = set()
+        self._existing_models: typing.FrozenSet[str] = frozenset()
         self._existing_models_updated = datetime(1970, 1, 1)
 
-        # Force an update of the existing models
-        self._model_exists("")
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=num_prefetch_workers,
+                                                     thread_name_prefix="dfp-model-prefetch")
+        self._prefetching: typing.Dict[str, Future] = {}
+        self._prefetching_lock = threading.Lock()
+        self._prefetch_size_max = prefetch_size_max
+
+        # Set by `close`, stops the background refresh and any further prefetches
+        self._stop_event = threading.Event()
+
+        # Force an update of the existing models, afterwards these are updated in the background
+        self.refresh_models()
+
+        self._refresh_thread = threading.Thread(target=self._refresh_models_loop,
+                                                name="dfp-model-registry-refresh",
+                                                daemon=True)
+        self._refresh_thread.start()
 
     @property
     def cache_timeout_sec(self):
         return self._cache_timeout_sec
 
-    def _model_exists(self, reg_model_name: str) -> bool:
+    @property
+    def registry(self) -> ModelRegistry:
+        return self._registry
 
-        now = datetime.now()
+    @property
+    def existing_models_updated(self) -> datetime:
+        return self._existing_models_updated
 
-        # See if the list of models needs to be updated
-        if ((now - self._existing_models_updated).seconds > self._cache_timeout_sec):
+    def refresh_models(self):
+        """Updates the list of registered models."""
+        now = datetime.now()
 
+        try:
+            with log_time(logger.debug, "Updated list of available models in {duration} ms"):
+                existing_models = frozenset(self._registry.list_models())
+        except Exception:
+            logger.exception("Exception occurred when querying the list of available models", exc_info=True)
+            raise
+
+        # Replacing the set, rather than updating it, lets readers use it without a lock
+        self._existing_models = existing_models
+        self._existing_models_updated = now
+
+    def _refresh_models_loop(self):
+        while (not self._stop_event.wait(self._cache_timeout_sec)):
             try:
-                with timed_acquire(self._model_cache_lock, timeout=1.0):
-
-                    logger.debug("Updating list of available models...")
-                    client = MlflowClient()
-
-                    results: PagedList[RegisteredModel] = PagedList([], token=None)
+                self.refresh_models()
+            except Exception:
+                # Already logged, keep using the previous list until the next refresh
+                pass
 
-                    # clear the set to hanfle the case where a model has been removed
-                    self._existing_models.clear()
+    def close(self):
+        """
+        Stops the background refresh of the registered models and cancels any pending prefetches. Later calls to
+        `prefetch` don't prefetch any models.
+        """
+        with self._prefetching_lock:
+            self._stop_event.set()
 
-                    # Loop over the registered models with the pagination
-                    while ((results := client.search_registered_models(max_results=1000, page_token=results.token))
-                           is not None):
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
 
-                        self._existing_models.update(model.name for model in results)
+    def _model_exists(self, reg_model_name: str) -> bool:
+        return reg_model_name in self._existing_models
 
-                        if (len(results.token) == 0):
-                            break
+    def _get_lock(self, reg_model_name: str) -> threading.Lock:
+        return self._lock_stripes[hash(reg_model_name) % len(self._lock_stripes)]
 
-                    logger.debug("Updating list of available models... Done.")
+    def _get_cached(self, reg_model_name: str, now: datetime) -> typing.Optional[ModelCache]:
+        with self._model_cache_lock:
+            model_cache = self._model_cache.get(reg_model_name, None)
 
-                    # Save the update time
-                    self._existing_models_updated = now
+            # Make sure it hasnt been too long since we checked
+            if (model_cache is not None and (now - model_cache.last_checked).total_seconds() < self._cache_timeout_sec):
+                self._model_cache.move_to_end(reg_model_name)
 
-            except TimeoutError:
-                logger.error("Deadlock detected checking for new models. Please report this to the developers.")
-                raise RuntimeError("Deadlock detected checking for new models")
-            except Exception:
-                logger.exception("Exception occurred when querying the list of available models", exc_info=True)
-                raise
+                return model_cache
 
-        return reg_model_name in self._existing_models
+        return None
 
     def user_id_to_model(self, user_id: str):
         return user_to_model_name(user_id=user_id, model_name_formatter=self._model_name_formatter)
 
     def load_user_model(self, client, user_id: str, fallback_user_ids: typing.List[str] = []) -> ModelCache:
+        """
+        Returns the model cache of `user_id`, or of the first of `fallback_user_ids` with a model when `user_id`
+        doesn't have one. Returns None if none of the users have a model. The `client` argument is unused and only
+        kept for compatibility, models are looked up in the registry of this manager.
+        """
+        for candidate_user_id in [user_id] + list(fallback_user_ids):
+            model_cache = self.load_model_cache(client=client, reg_model_name=self.user_id_to_model(candidate_user_id))
+
+            if (model_cache is not None):
+                return model_cache
 
-        # First get the UserModel
-        user_model_cache = self.load_user_model_cache(user_id=user_id, fallback_user_ids=fallback_user_ids)
-
-        return user_model_cache.load_model_cache(client=client)
+        return None
 
-    def load_model_cache(self, client: MlflowClient, reg_model_name: str) -> ModelCache:
+    def load_model_cache(self, client, reg_model_name: str) -> ModelCache:
+        """
+        Returns the model cache of the latest version of `reg_model_name`, or None if the model doesn't exist. The
+        `client` argument is unused and only kept for compatibility.
+        """
 
         now = datetime.now()
 
-        try:
-            with timed_acquire(self._model_cache_lock, timeout=1.0):
-
-                model_cache = self._model_cache.get(reg_model_name, None)
-
-                # Make sure it hasnt been too long since we checked
-                if (model_cache is not None and (now - model_cache.last_checked).seconds < self._cache_timeout_sec):
-
-                    return model_cache
-
-                # Cache miss. Try to check for a model
-                try:
-                    if (not self._model_exists(reg_model_name)):
-                        # Break early
-                        return None
+        model_cache = self._get_cached(reg_model_name, now)
 
-                    latest_versions = client.get_latest_versions(reg_model_name)
+        if (model_cache is not None):
+            return model_cache
 
-                    if (len(latest_versions) == 0):
-                        # Databricks doesn't like the `get_latest_versions` method for some reason. Before failing, try
-                        # to just get the model and then use latest versions
-                        reg_model_obj = client.get_registered_model(reg_model_name)
+        if (not self._model_exists(reg_model_name)):
+            # Break early
+            return None
 
-                        latest_versions = None if reg_model_obj is None else reg_model_obj.latest_versions
+        # Only threads looking up the same model, or a model sharing the same lock, wait on each other here
+        with self._get_lock(reg_model_name):
 
-                        if (len(latest_versions) == 0):
-                            logger.warning(
-                                ("Registered model with no versions detected. Consider deleting this registered model."
-                                 "Using fallback model. Model: %s, "),
-                                reg_model_name)
-                            return None
+            # Another thread may have updated the model while waiting for the lock
+            model_cache = self._get_cached(reg_model_name, now)
 
-                    # Default to the first returned one
-                    latest_model_version = latest_versions[0]
+            if (model_cache is not None):
+                return model_cache
 
-                    if (len(latest_versions) > 1):
-                        logger.warning(("Multiple models in different stages detected. "
-                                        "Defaulting to first returned. Model: %s, Version: %s, Stage: %s"),
-                                       reg_model_name,
-                                       latest_model_version.version,
-                                       latest_model_version.current_stage)
+            with self._model_cache_lock:
+                model_cache = self._model_cache.get(reg_model_name, None)
 
-                    model_cache = ModelCache(reg_model_name=reg_model_name,
-                                             reg_model_version=latest_model_version.version,
-                                             model_uri=latest_model_version.source)
+            latest_version = self._registry.get_latest_version(reg_model_name)
 
-                except MlflowException as e:
-                    if e.error_code == 'RESOURCE_DOES_NOT_EXIST':
-                        # No user found
-                        return None
+            if (latest_version is None):
+                return None
 
-                    raise
+            if (model_cache is not None and model_cache.reg_model_version == latest_version.reg_model_version):
+                # The model hasn't changed, keep using the already downloaded model
+                model_cache.mark_checked()
+            else:
+                model_cache = ModelCache(reg_model_name=reg_model_name,
+                                         reg_model_version=latest_version.reg_model_version,
+                                         model_uri=latest_version.model_uri,
+                                         registry=self._registry)
 
-                # Save the cache
+            # Save the cache, pushing out the least recently used entries if needed
+            with self._model_cache_lock:
                 self._model_cache[reg_model_name] = model_cache
+                self._model_cache.move_to_end(reg_model_name)
 
-                # Check if we need to push out a cache entry
-                if (len(self._model_cache) > self._model_cache_size_max):
-                    time_sorted = sorted([(k, v) for k, v in self._model_cache.items()], key=lambda x: x[1].last_used)
-                    to_delete = time_sorted[0][0]
-                    self._model_cache.pop(to_delete)
+                while (len(self._model_cache) > self._cache_size_max):
+                    self._model_cache.popitem(last=False)
 
-                return model_cache
+            return model_cache
 
-        except TimeoutError:
-            logger.error("Deadlock when trying to acquire model cache lock")
-            raise RuntimeError("Deadlock when trying to acquire model cache lock")
-
-    def load_user_model_cache(self, user_id: str, fallback_user_ids: typing.List[str] = []) -> UserModelMap:
+    def _prefetch_user_model(self, user_id: str, fallback_user_ids: typing.List[str]) -> typing.Optional[ModelCache]:
         try:
-            with timed_acquire(self._user_model_cache_lock, timeout=1.0):
-
-                if (user_id not in self._user_model_cache):
-                    self._user_model_cache[user_id] = UserModelMap(manager=self,
-                                                                   user_id=user_id,
-                                                                   fallback_user_ids=fallback_user_ids)
-
-                return self._user_model_cache[user_id]
-        except TimeoutError:
-            logger.error("Deadlock when trying to acquire user model cache lock")
-            raise RuntimeError("Deadlock when trying to acquire user model cache lock")
+            model_cache = self.load_user_model(None, user_id=user_id, fallback_user_ids=fallback_user_ids)
+
+            if (model_cache is not None):
+                model_cache.load_model()
+
+            return model_cache
+        except Exception:
+            logger.exception("Error prefetching model for user %s", user_id)
+            return None
+        finally:
+            with self._prefetching_lock:
+                self._prefetching.pop(user_id, None)
+
+    def prefetch(self, user_ids: typing.Iterable[str], fallback_user_ids: typing.List[str] = []) -> typing.List[Future]:
+        """
+        Looks up and downloads the models of `user_ids` in the background, so that subsequent calls to
+        `load_user_model` and `ModelCache.load_model` for these users don't wait on the registry. Users which are
+        already being prefetched are not submitted again. Once `prefetch_size_max` users are being prefetched, the
+        remaining users are skipped and their models are downloaded when they are used. Nothing is prefetched after
+        `close` has been called.
+
+        Returns
+        -------
+        typing.List[concurrent.futures.Future]
+            A future resolving to the model cache, or None, of each user which is being prefetched.
+        """
+        futures = []
+        num_skipped = 0
+
+        with self._prefetching_lock:
+            # Checked while holding the lock, so `close` can't shut down the executor before the users are submitted
+            if (self._stop_event.is_set()):
+                return []
+
+            for user_id in user_ids:
+                future = self._prefetching.get(user_id, None)
+
+                if (future is None or future.done()):
+                    # Prefetching more models than fit in the cache would evict them before they are used
+                    if (len(self._prefetching) >= self._prefetch_size_max):
+                        num_skipped += 1
+                        continue
+
+                    future = self._prefetch_executor.submit(self._prefetch_user_model, user_id, fallback_user_ids)
+                    self._prefetching[user_id] = future
+
+                futures.append(future)
+
+        if (num_skipped > 0):
+            logger.debug("Skipped prefetching the models of %d users, %d users are already being prefetched",
+                         num_skipped,
+                         self._prefetch_size_max)
+
+        return futures
@@ -0,0 +1,212 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import logging
+import os
+import tempfile
+import typing
+from abc import ABC
+from abc import abstractmethod
+
+import mlflow
+import torch
+from mlflow.entities.model_registry import RegisteredModel
+from mlflow.exceptions import MlflowException
+from mlflow.store.entities.paged_list import PagedList
+from mlflow.tracking.client import MlflowClient
+
+from morpheus.models.dfencoder import AutoEncoder
+
+logger = logging.getLogger("morpheus.{}".format(__name__))
+
+
+@dataclasses.dataclass(frozen=True)
+class RegisteredModelVersion:
+    """A version of a model in a `ModelRegistry`."""
+
+    reg_model_name: str
+    reg_model_version: str
+    model_uri: str
+
+
+class ModelRegistry(ABC):
+    """
+    Interface to the registry of trained models used by `ModelManager`. Implementations must be safe to call from
+    multiple threads.
+    """
+
+    @abstractmethod
+    def list_models(self) -> typing.Set[str]:
+        """Returns the names of all registered models."""
+        pass
+
+    @abstractmethod
+    def get_latest_version(self, reg_model_name: str) -> typing.Optional[RegisteredModelVersion]:
+        """Returns the latest version of `reg_model_name`, or None if the model has no versions or doesn't exist."""
+        pass
+
+    @abstractmethod
+    def load_model(self, model_version: RegisteredModelVersion) -> AutoEncoder:
+        """Downloads and returns the model of `model_version`."""
+        pass
+
+
+class MlflowModelRegistry(ModelRegistry):
+    """
+    Model registry backed by the MLflow model registry.
+
+    Parameters
+    ----------
+    client : `mlflow.tracking.client.MlflowClient`, optional
+        MLflow client, when None a client is created for the current tracking URI.
+    """
+
+    def __init__(self, client: MlflowClient = None):
+        self._client = client if client is not None else MlflowClient()
+
+    def list_models(self) -> typing.Set[str]:
+        models: typing.Set[str] = set()
+
+        results: PagedList[RegisteredModel] = PagedList([], token=None)
+
+        # Loop over the registered models with the pagination
+        while ((results := self._client.search_registered_models(max_results=1000, page_token=results.token))
+               is not None):
+
+            models.update(model.name for model in results)
+
+            if (results.token is None or len(results.token) == 0):
+                break
+
+        return models
+
+    def get_latest_version(self, reg_model_name: str) -> typing.Optional[RegisteredModelVersion]:
+        try:
+            latest_versions = self._client.get_latest_versions(reg_model_name)
+
+            if (len(latest_versions) == 0):
+                # Databricks doesn't like the `get_latest_versions` method for some reason. Before failing, try to just
+                # get the model and then use latest versions
+                reg_model_obj = self._client.get_registered_model(reg_model_name)
+
+                latest_versions = [] if reg_model_obj is None else reg_model_obj.latest_versions
+
+                if (len(latest_versions) == 0):
+                    logger.warning(("Registered model with no versions detected. Consider deleting this registered "
+                                    "model. Using fallback model. Model: %s, "),
+                                   reg_model_name)
+                    return None
+
+        except MlflowException as e:
+            if e.error_code == 'RESOURCE_DOES_NOT_EXIST':
+                # No user found
+                return None
+
+            raise
+
+        # Default to the first returned one
+        latest_model_version = latest_versions[0]
+
+        if (len(latest_versions) > 1):
+            logger.warning(("Multiple models in different stages detected. "
+                            "Defaulting to first returned. Model: %s, Version: %s, Stage: %s"),
+                           reg_model_name,
+                           latest_model_version.version,
+                           latest_model_version.current_stage)
+
+        return RegisteredModelVersion(reg_model_name=reg_model_name,
+                                      reg_model_version=latest_model_version.version,
+                                      model_uri=latest_model_version.source)
+
+    def load_model(self, model_version: RegisteredModelVersion) -> AutoEncoder:
+        return mlflow.pytorch.load_model(model_uri=model_version.model_uri)
+
+
+class FileModelRegistry(ModelRegistry):
+    """
+    Model registry stored in a local directory, allowing models to be registered and loaded without an MLflow server.
+
+    Each version of a model is saved with `torch.save` to `<root_dir>/<reg_model_name>/<version>/model.pt`, where
+    versions are consecutive integers starting at 1.
+
+    Parameters
+    ----------
+    root_dir : str
+        Directory containing the registered models.
+    """
+
+    MODEL_FILE_NAME = "model.pt"
+
+    def __init__(self, root_dir: str):
+        self._root_dir = root_dir
+
+    @property
+    def root_dir(self) -> str:
+        return self._root_dir
+
+    def _list_versions(self, reg_model_name: str) -> typing.List[int]:
+        model_dir = os.path.join(self._root_dir, reg_model_name)
+
+        if (not os.path.isdir(model_dir)):
+            return []
+
+        return sorted(
+            int(version) for version in os.listdir(model_dir)
+            if version.isdigit() and os.path.exists(os.path.join(model_dir, version, self.MODEL_FILE_NAME)))
+
+    def list_models(self) -> typing.Set[str]:
+        if (not os.path.isdir(self._root_dir)):
+            return set()
+
+        return {name for name in os.listdir(self._root_dir) if os.path.isdir(os.path.join(self._root_dir, name))}
+
+    def get_latest_version(self, reg_model_name: str) -> typing.Optional[RegisteredModelVersion]:
+        versions = self._list_versions(reg_model_name)
+
+        if (len(versions) == 0):
+            return None
+
+        return RegisteredModelVersion(reg_model_name=reg_model_name,
+                                      reg_model_version=str(versions[-1]),
+                                      model_uri=os.path.join(self._root_dir,
+                                                             reg_model_name,
+                                                             str(versions[-1]),
+                                                             self.MODEL_FILE_NAME))
+
+    def load_model(self, model_version: RegisteredModelVersion) -> AutoEncoder:
+        return torch.load(model_version.model_uri, weights_only=False)
+
+    def register_model(self, reg_model_name: str, model: AutoEncoder) -> RegisteredModelVersion:
+        """Saves `model` as a new version of `reg_model_name`, returning the new version."""
+        versions = self._list_versions(reg_model_name)
+        version = str(versions[-1] + 1 if len(versions) > 0 else 1)
+
+        version_dir = os.path.join(self._root_dir, reg_model_name, version)
+        os.makedirs(version_dir, exist_ok=True)
+
+        # Write to a temporary file first so the model is never visible partially written
+        (fd, tmp_path) = tempfile.mkstemp(dir=version_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                torch.save(model, f)
+
+            os.replace(tmp_path, os.path.join(version_dir, self.MODEL_FILE_NAME))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        return RegisteredModelVersion(reg_model_name=reg_model_name,
+                                      reg_model_version=version,
+                                      model_uri=os.path.join(version_dir, self.MODEL_FILE_NAME))
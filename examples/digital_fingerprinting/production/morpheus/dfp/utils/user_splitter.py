@@ -0,0 +1,194 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+class UserSplitter:
+    """
+    Splits DataFrames into per-user DataFrames, keeping the index of each user monotonically increasing across calls.
+
+    Rather than grouping the rows, which copies the rows of every user into a new DataFrame, the rows are sorted by
+    user id once with a stable sort and each user's DataFrame is a slice over the sorted rows. The number of rows seen
+    so far for each user, which provides the starting index of the user's next DataFrame, is kept in an array
+    addressed by the position of the user id in an index of known users.
+
+    Parameters
+    ----------
+    userid_column_name : str
+        Name of the column containing the user ids.
+    fallback_username : str, default = "generic_user"
+        User id of the DataFrame containing the rows of all users.
+    include_generic : bool, default = False
+        Whether to include a DataFrame containing the rows of all users.
+    include_individual : bool, default = True
+        Whether to include a DataFrame for each user.
+    skip_users : list of str, optional
+        List of user ids to skip.
+    only_users : list of str, optional
+        List of user ids to include, when empty all users are included.
+    """
+
+    def __init__(self,
+                 userid_column_name: str,
+                 fallback_username: str = "generic_user",
+                 include_generic: bool = False,
+                 include_individual: bool = True,
+                 skip_users: typing.List[str] = None,
+                 only_users: typing.List[str] = None):
+        self._userid_column_name = userid_column_name
+        self._fallback_username = fallback_username
+        self._include_generic = include_generic
+        self._include_individual = include_individual
+        self._skip_users = skip_users if skip_users is not None else []
+        self._only_users = only_users if only_users is not None else []
+
+        # Known user ids, and the total number of rows of each user stored at the position of the user id
+        self._user_ids = pd.Index([], dtype=object)
+        self._user_counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def num_users(self) -> int:
+        """Number of user ids seen so far."""
+        return len(self._user_ids)
+
+    def get_user_count(self, user_id: str) -> int:
+        """Total number of rows split for `user_id` so far."""
+        position = self._user_ids.get_indexer([user_id])[0]
+
+        return int(self._user_counts[position]) if position >= 0 else 0
+
+    def _reserve_offsets(self, user_ids: pd.Index, counts: np.ndarray) -> np.ndarray:
+        """
+        Returns the starting index of the next rows of each of the unique `user_ids`, advancing the total number of
+        rows of each user by `counts`.
+        """
+        positions = self._user_ids.get_indexer(user_ids)
+
+        new_users = positions < 0
+
+        if (new_users.any()):
+            num_known = len(self._user_ids)
+            num_new = int(np.count_nonzero(new_users))
+
+            positions[new_users] = np.arange(num_known, num_known + num_new)
+            self._user_ids = self._user_ids.append(pd.Index(user_ids[new_users], dtype=object))
+
+            # Grow the counts geometrically to avoid a reallocation every time a new user is seen
+            if (num_known + num_new > len(self._user_counts)):
+                user_counts = np.zeros(max(num_known + num_new, 2 * len(self._user_counts)), dtype=np.int64)
+                user_counts[:num_known] = self._user_counts[:num_known]
+                self._user_counts = user_counts
+
+        offsets = self._user_counts[positions]
+        self._user_counts[positions] += counts
+
+        return offsets
+
+    def _sort_by_user(self, df: pd.DataFrame) -> typing.Tuple[pd.Index, np.ndarray, pd.DataFrame]:
+        """Returns the sorted unique user ids, the number of rows of each user and the rows sorted by user id."""
+        (codes, user_ids) = pd.factorize(df[self._userid_column_name], sort=True)
+
+        # Shift the codes so that rows without a user id, which have a code of -1, are sorted first. Numpy uses a radix
+        # sort for a stable sort of 8 and 16 bit integers, which is considerably faster than the default merge sort
+        codes = codes + 1
+        if (len(user_ids) <= np.iinfo(np.uint8).max):
+            codes = codes.astype(np.uint8)
+        elif (len(user_ids) <= np.iinfo(np.uint16).max):
+            codes = codes.astype(np.uint16)
+
+        counts = np.bincount(codes, minlength=len(user_ids) + 1)
+
+        # Rows without a user id are dropped, matching `groupby`
+        order = np.argsort(codes, kind="stable")[counts[0]:]
+
+        # Taking the rows in sorted order is the only copy, all per-user DataFrames are slices of this
+        sorted_df = df.take(order)
+
+        return (pd.Index(user_ids, dtype=object), counts[1:], sorted_df)
+
+    def split(self, df: pd.DataFrame) -> typing.List[typing.Tuple[str, pd.DataFrame]]:
+        """
+        Splits `df` into a DataFrame for each user sorted by user id, with the generic DataFrame sorted among them by
+        `fallback_username`. Each DataFrame's index continues from the total number of rows previously split for the
+        same user. The DataFrames of individual users are slices of a single DataFrame and share its memory.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame to split.
+
+        Returns
+        -------
+        typing.List[typing.Tuple[str, pd.DataFrame]]
+            List of user ids and the DataFrame for each user.
+        """
+        # If we are skipping users, do that here
+        if (len(self._skip_users) > 0):
+            df = df[~df[self._userid_column_name].isin(self._skip_users)]
+
+        if (len(self._only_users) > 0):
+            df = df[df[self._userid_column_name].isin(self._only_users)]
+
+        user_ids = pd.Index([], dtype=object)
+        counts = np.zeros(0, dtype=np.int64)
+        sorted_df = None
+
+        if (self._include_individual):
+            (user_ids, counts, sorted_df) = self._sort_by_user(df)
+
+        include_generic = self._include_generic and self._fallback_username not in self._skip_users
+        generic_position = -1
+
+        # A user with the same id as the generic user takes its place
+        if (include_generic and self._fallback_username not in user_ids):
+            generic_position = bisect.bisect_left(user_ids, self._fallback_username)
+
+            user_ids = user_ids.insert(generic_position, self._fallback_username)
+            counts = np.insert(counts, generic_position, len(df))
+
+        offsets = self._reserve_offsets(user_ids, counts)
+
+        individual = np.ones(len(user_ids), dtype=bool)
+        if (generic_position >= 0):
+            individual[generic_position] = False
+
+        if (sorted_df is not None):
+            # Reset the index of all users at once so that users see monotonically increasing indexes. Each row's index
+            # is the offset of its user plus its position within the user's rows
+            individual_counts = counts[individual]
+            boundaries = np.cumsum(individual_counts) - individual_counts
+            sorted_df.index = np.repeat(offsets[individual] - boundaries, individual_counts) + np.arange(len(sorted_df))
+
+        output: typing.List[typing.Tuple[str, pd.DataFrame]] = []
+        start = 0
+
+        for (i, user_id) in enumerate(user_ids):
+            count = int(counts[i])
+
+            if (i == generic_position):
+                # Shallow copy to avoid modifying the index of the caller's DataFrame
+                user_df = df.copy(deep=False)
+                user_df.index = pd.RangeIndex(offsets[i], offsets[i] + count)
+            else:
+                user_df = sorted_df.iloc[start:start + count]
+                start += count
+
+            output.append((user_id, user_df))
+
+        return output
@@ -0,0 +1,198 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import logging
+import os
+import threading
+import typing
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from .cached_user_window import CachedUserWindow
+
+logger = logging.getLogger("morpheus.{}".format(__name__))
+
+
+@dataclasses.dataclass
+class UserWindowStoreStats:
+    """Memory and spill metrics of a `UserWindowStore`."""
+
+    memory_budget_bytes: typing.Optional[int] = None
+    memory_bytes: int = 0
+    resident_users: int = 0
+    spilled_users: int = 0
+    spills: int = 0
+    bytes_spilled: int = 0
+    reloads: int = 0
+    bytes_reloaded: int = 0
+
+
+class UserWindowStore:
+    """
+    Holds the `CachedUserWindow` of each user, bounding the memory used by the windows held in memory.
+
+    Whenever the windows held in memory exceed `memory_budget_bytes`, the least recently used windows are saved to a
+    directory under `cache_dir` named by the user id and released. A spilled window is transparently loaded back into
+    memory the next time it is requested. Since windows are saved incrementally, spilling a window which was previously
+    spilled only writes the rows appended since.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory to spill windows to.
+    timestamp_column : str, default = "timestamp"
+        Name of the timestamp column of new windows.
+    memory_budget_bytes : int, optional
+        Maximum number of bytes of windows to hold in memory. When None, windows are never spilled.
+    """
+
+    def __init__(self, cache_dir: str, timestamp_column: str = "timestamp", memory_budget_bytes: int = None):
+        if (memory_budget_bytes is not None and memory_budget_bytes < 0):
+            raise ValueError("memory_budget_bytes must be non-negative")
+
+        self._cache_dir = cache_dir
+        self._timestamp_column = timestamp_column
+        self._memory_budget_bytes = memory_budget_bytes
+        self._lock = threading.RLock()
+
+        # Windows held in memory along with their size, ordered from least to most recently used
+        self._resident: typing.OrderedDict[str, typing.Tuple[CachedUserWindow, int]] = OrderedDict()
+        self._spilled: typing.Set[str] = set()
+        self._stats = UserWindowStoreStats(memory_budget_bytes=memory_budget_bytes)
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @property
+    def memory_budget_bytes(self) -> typing.Optional[int]:
+        return self._memory_budget_bytes
+
+    @property
+    def stats(self) -> UserWindowStoreStats:
+        """A copy of the current metrics."""
+        with self._lock:
+            return dataclasses.replace(self._stats,
+                                       resident_users=len(self._resident),
+                                       spilled_users=len(self._spilled))
+
+    def __contains__(self, user_id: str) -> bool:
+        with self._lock:
+            return user_id in self._resident or user_id in self._spilled
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._resident) + len(self._spilled)
+
+    def get_cache_location(self, user_id: str) -> str:
+        """Directory the window of `user_id` is saved to."""
+        return os.path.join(self._cache_dir, user_id)
+
+    def _set_resident(self, user_id: str, window: CachedUserWindow):
+        (_, old_bytes) = self._resident.pop(user_id, (None, 0))
+        memory_bytes = window.memory_bytes
+
+        self._resident[user_id] = (window, memory_bytes)
+        self._stats.memory_bytes += memory_bytes - old_bytes
+
+    def _spill(self, user_id: str):
+        (window, memory_bytes) = self._resident.pop(user_id)
+
+        window.save()
+
+        self._spilled.add(user_id)
+        self._stats.memory_bytes -= memory_bytes
+        self._stats.spills += 1
+        self._stats.bytes_spilled += memory_bytes
+
+        logger.debug("Spilled rolling window for %s (%d bytes)", user_id, memory_bytes)
+
+    def _enforce_budget(self, keep: str):
+        if (self._memory_budget_bytes is None):
+            return
+
+        # Spill the least recently used windows first, only spilling `keep` when it exceeds the budget on its own
+        for user_id in list(self._resident.keys()) + [keep]:
+            if (self._stats.memory_bytes <= self._memory_budget_bytes):
+                break
+
+            if (user_id == keep and len(self._resident) > 1):
+                continue
+
+            if (user_id in self._resident):
+                self._spill(user_id)
+
+    def add(self, window: CachedUserWindow):
+        """Adds an existing window, replacing any window already stored for the same user."""
+        with self._lock:
+            self._spilled.discard(window.user_id)
+            self._set_resident(window.user_id, window)
+            self._enforce_budget(keep=window.user_id)
+
+    def get(self, user_id: str) -> CachedUserWindow:
+        """
+        Returns the window of `user_id`, loading it back into memory if it was spilled, or creating a new window if the
+        user has not been seen before. The window is marked as the most recently used.
+        """
+        with self._lock:
+            entry = self._resident.get(user_id, None)
+
+            if (entry is not None):
+                self._resident.move_to_end(user_id)
+                return entry[0]
+
+            if (user_id in self._spilled):
+                window = CachedUserWindow.load(self.get_cache_location(user_id))
+                self._spilled.remove(user_id)
+
+                self._set_resident(user_id, window)
+                self._stats.reloads += 1
+                self._stats.bytes_reloaded += self._resident[user_id][1]
+            else:
+                window = CachedUserWindow(user_id=user_id,
+                                          cache_location=self.get_cache_location(user_id),
+                                          timestamp_column=self._timestamp_column)
+                self._set_resident(user_id, window)
+
+            return window
+
+    def update(self, user_id: str):
+        """
+        Updates the memory used by the window of `user_id` after it has been modified, spilling the least recently used
+        windows if over the memory budget.
+        """
+        with self._lock:
+            entry = self._resident.get(user_id, None)
+
+            if (entry is not None):
+                self._set_resident(user_id, entry[0])
+                self._enforce_budget(keep=user_id)
+
+    @contextmanager
+    def get_window(self, user_id: str) -> typing.Generator[CachedUserWindow, None, None]:
+        """Context manager which returns the window of `user_id`, calling `update` once the window is released."""
+        window = self.get(user_id)
+
+        try:
+            yield window
+        finally:
+            self.update(user_id)
+
+    def remove(self, user_id: str):
+        """Removes the window of `user_id` from the store, keeping any saved copy of the window on disk."""
+        with self._lock:
+            (_, memory_bytes) = self._resident.pop(user_id, (None, 0))
+            self._stats.memory_bytes -= memory_bytes
+            self._spilled.discard(user_id)
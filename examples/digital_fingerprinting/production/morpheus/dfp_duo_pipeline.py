@@ -285,13 +285,20 @@ def run_pipeline(train_users,
 
     pipeline.add_stage(MonitorStage(config, description="Input data rate"))
 
+    model_name_formatter = "DFP-duo-{user_id}"
+    experiment_name_formatter = "dfp/duo/training/{reg_model_name}"
+
+    # Created ahead of the other stages so models can be downloaded as soon as the users of each batch are known
+    inference_stage = None if is_training else DFPInferenceStage(config, model_name_formatter=model_name_formatter)
+
     # This will split users or just use one single user
     pipeline.add_stage(
         DFPSplitUsersStage(config,
                            include_generic=include_generic,
                            include_individual=include_individual,
                            skip_users=skip_users,
-                           only_users=only_users))
+                           only_users=only_users,
+                           on_users_split=None if is_training else inference_stage.prefetch_models))
 
     # Next, have a stage that will create rolling windows
     pipeline.add_stage(
@@ -306,9 +313,6 @@ def run_pipeline(train_users,
     # Output is UserMessageMeta -- Cached frame set
     pipeline.add_stage(DFPPreprocessingStage(config, input_schema=preprocess_schema))
 
-    model_name_formatter = "DFP-duo-{user_id}"
-    experiment_name_formatter = "dfp/duo/training/{reg_model_name}"
-
     if (is_training):
 
         # Finally, perform training which will output a model
@@ -322,7 +326,7 @@ def run_pipeline(train_users,
                                       model_name_formatter=model_name_formatter,
                                       experiment_name_formatter=experiment_name_formatter))
     else:
-        pipeline.add_stage(DFPInferenceStage(config, model_name_formatter=model_name_formatter))
+        pipeline.add_stage(inference_stage)
 
         pipeline.add_stage(MonitorStage(config, description="Inference rate", smoothing=0.001))
 
@@ -334,7 +338,7 @@ def run_pipeline(train_users,
         pipeline.add_stage(DFPPostprocessingStage(config))
 
         # Exclude the columns we don't want in our output
-        pipeline.add_stage(SerializeStage(config, exclude=['batch_count', 'origin_hash', '_row_hash', '_batch_id']))
+        pipeline.add_stage(SerializeStage(config, exclude=['batch_count', 'origin_hash', '_batch_id']))
 
         pipeline.add_stage(WriteToFileStage(config, filename="dfp_detections_duo.csv", overwrite=True))
 
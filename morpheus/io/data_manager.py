@@ -20,8 +20,14 @@ import os
 import shutil
 import tempfile
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import fsspec
@@ -30,23 +36,35 @@ import pandas as pd
 import cudf
 
 from morpheus.io.data_record import DataRecord
+from morpheus.io.data_storage import SpillManager
+from morpheus.io.data_storage import SpillStats
 
 
 class DataManager():
     """
     DataManager class to manage the storage and retrieval of files
-    using either in-memory or filesystem storage.
+    using either in-memory, filesystem or hybrid storage.
+
+    Hybrid storage holds records in memory up to `memory_budget_bytes`, spilling the least recently used records to
+    files in a temporary directory once the budget is exceeded. Spilled records are reloaded into memory when they are
+    loaded again, except for loads of a subset of columns which are read directly from the spilled file.
     """
 
-    VALID_STORAGE_TYPES = ('in_memory', 'filesystem')
-    VALID_FILE_FORMATS = ('parquet', 'csv')
+    VALID_STORAGE_TYPES = ('in_memory', 'filesystem', 'hybrid')
+    VALID_FILE_FORMATS = ('parquet', 'csv', 'arrow')
 
-    def __init__(self, storage_type: str = 'in_memory', file_format: str = 'parquet'):
+    def __init__(self,
+                 storage_type: str = 'in_memory',
+                 file_format: str = 'parquet',
+                 memory_budget_bytes: Optional[int] = None):
         """
         Initialize the DataManager instance.
 
-        :param storage_type: Specifies the storage type to be used. Can be either 'in_memory' or 'filesystem'.
-        :param file_format: Specifies the file format to be used. Can be either 'parquet' or 'csv'.
+        :param storage_type: Specifies the storage type to be used. Can be 'in_memory', 'filesystem' or 'hybrid'.
+        :param file_format: Specifies the file format to be used. Can be 'parquet', 'csv' or 'arrow'. Records stored
+            as 'arrow' are memory-mapped when loaded.
+        :param memory_budget_bytes: Maximum number of bytes of records held in memory when the storage type is
+            'hybrid'. When None, records are never spilled to disk.
         """
 
         if (storage_type not in self.VALID_STORAGE_TYPES):
@@ -55,23 +73,32 @@ class DataManager():
         if (file_format not in self.VALID_FILE_FORMATS):
             raise ValueError(f"Invalid file_format '{file_format}'")
 
+        if (memory_budget_bytes is not None and storage_type != 'hybrid'):
+            raise ValueError("memory_budget_bytes is only supported by the 'hybrid' storage_type")
+
         self._dirty = True
         self._file_format = file_format
         self._fs = fsspec.filesystem('file')
         self._manifest = {}
         self._records = {}
+        self._spill_manager = None
         self._storage_dir = None
         self._storage_type = storage_type
         self._total_rows = 0
 
-        if (storage_type == 'filesystem'):
+        if (storage_type in ('filesystem', 'hybrid')):
             self._storage_dir = tempfile.mkdtemp()
 
+        if (storage_type == 'hybrid'):
+            self._spill_manager = SpillManager(memory_budget_bytes=memory_budget_bytes)
+
     def __contains__(self, item: Any) -> bool:
         return item in self._records
 
     def __del__(self):
-        if (self._storage_type == 'filesystem'):
+        if (getattr(self, '_storage_dir', None) is not None):
+            # Release the records first, so hybrid records don't attempt to spill into the removed directory
+            self._records.clear()
             shutil.rmtree(self._storage_dir)
 
     def __len__(self) -> int:
@@ -113,6 +140,19 @@ class DataManager():
     def records(self):
         return self._records
 
+    @property
+    def spill_stats(self) -> Optional[SpillStats]:
+        """
+        Get the memory usage and spill metrics of the records when using 'hybrid' storage.
+
+        :return: SpillStats instance, or None for other storage types.
+        """
+
+        if (self._spill_manager is None):
+            return None
+
+        return self._spill_manager.stats
+
     @property
     def storage_type(self) -> str:
         """
@@ -136,12 +176,19 @@ class DataManager():
 
         return self._records[source_id]
 
-    def load(self, source_id: uuid.UUID) -> cudf.DataFrame:
+    def load(self,
+             source_id: uuid.UUID,
+             columns: Optional[List[str]] = None,
+             row_range: Optional[Tuple[int, Optional[int]]] = None) -> cudf.DataFrame:
         """
         Load a cuDF DataFrame given a source ID.
 
         :param source_id: UUID of the source to be loaded.
-        :return: Loaded cuDF DataFrame.
+        :param columns: Optional subset of columns to load, by default all columns are loaded.
+        :param row_range: Optional half open range of rows `(start, stop)` to load, a stop of None loads to the end of
+            the source. By default all rows are loaded.
+        :return: Loaded cuDF DataFrame. Sources stored as 'arrow' are loaded without copying, the columns which allow it
+            are read-only views of the source and must be copied, for example with `df.copy()`, before being modified.
         """
 
         if source_id not in self._records:
@@ -149,7 +196,129 @@ class DataManager():
 
         data_record = self._records[source_id]
 
-        return data_record.load()
+        return data_record.load(columns=columns, row_range=row_range)
+
+    def _plan_loads(self, source_ids: Iterable[uuid.UUID],
+                    row_range: Optional[Tuple[int, Optional[int]]]) -> List[Tuple[DataRecord, Optional[Tuple]]]:
+        """
+        Map a row range over the concatenation of the sources to the range of rows to load from each source, skipping
+        sources which fall entirely outside of the range.
+        """
+
+        records = []
+        for source_id in source_ids:
+            if source_id not in self._records:
+                raise KeyError(f"Source ID '{source_id}' not found.")
+
+            records.append(self._records[source_id])
+
+        if (row_range is None):
+            return [(record, None) for record in records]
+
+        (start, stop) = row_range
+        if (start < 0 or (stop is not None and stop < start)):
+            raise ValueError(f"Invalid row_range {row_range}")
+
+        loads = []
+        offset = 0
+        for record in records:
+            if (stop is not None and offset >= stop):
+                break
+
+            num_rows = record.num_rows
+
+            if (offset + num_rows > start):
+                record_start = max(start - offset, 0)
+                record_stop = stop - offset if (stop is not None and stop < offset + num_rows) else None
+
+                if (record_start == 0 and record_stop is None):
+                    loads.append((record, None))
+                else:
+                    loads.append((record, (record_start, record_stop)))
+
+            offset += num_rows
+
+        return loads
+
+    def _iter_loads(self,
+                    loads: List[Tuple[DataRecord, Optional[Tuple]]],
+                    columns: Optional[List[str]],
+                    max_workers: Optional[int]) -> Iterator[pd.DataFrame]:
+        if (max_workers is None):
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+        # Records held in memory are decoded on the calling thread, reads of files are overlapped using a thread pool
+        if (self._storage_type == 'in_memory' or max_workers <= 1 or len(loads) <= 1):
+            for (record, record_range) in loads:
+                yield record.load(columns=columns, row_range=record_range)
+
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Keep at most `max_workers` loads in flight, so a lazy consumer bounds the number of frames held in memory
+            pending = deque()
+            for (record, record_range) in loads:
+                pending.append(executor.submit(record.load, columns=columns, row_range=record_range))
+
+                if (len(pending) >= max_workers):
+                    yield pending.popleft().result()
+
+            while (len(pending) > 0):
+                yield pending.popleft().result()
+
+    def load_many(self,
+                  source_ids: Iterable[uuid.UUID],
+                  columns: Optional[List[str]] = None,
+                  row_range: Optional[Tuple[int, Optional[int]]] = None,
+                  lazy: bool = False,
+                  max_workers: Optional[int] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Load multiple sources, concatenated in the order of `source_ids`.
+
+        :param source_ids: UUIDs of the sources to be loaded.
+        :param columns: Optional subset of columns to load, by default all columns are loaded.
+        :param row_range: Optional half open range of rows `(start, stop)` of the concatenated sources to load, a stop
+            of None loads to the end of the last source. Sources outside of the range are not read, and only the row
+            groups of Parquet files overlapping the range are read.
+        :param lazy: When True, return an iterator yielding the DataFrame of each source in order instead of a single
+            concatenated DataFrame.
+        :param max_workers: Maximum number of sources to read in parallel when using 'filesystem' or 'hybrid'
+            storage, defaults to the `ThreadPoolExecutor` default.
+        :return: Concatenated DataFrame with an index starting at 0, or an iterator of DataFrames when `lazy` is True.
+            When `lazy` is True and the sources are stored as 'arrow', the columns which allow it are read-only views of
+            the sources and must be copied before being modified.
+        """
+
+        # Resolve the sources up front, so that unknown source IDs are reported immediately even when lazy
+        loads = self._plan_loads(source_ids, row_range)
+        chunks = self._iter_loads(loads, columns, max_workers)
+
+        if (lazy):
+            return chunks
+
+        frames = list(chunks)
+        if (len(frames) == 0):
+            return pd.DataFrame(columns=columns)
+
+        return pd.concat(frames, ignore_index=True)
+
+    def load_all(self,
+                 columns: Optional[List[str]] = None,
+                 row_range: Optional[Tuple[int, Optional[int]]] = None,
+                 lazy: bool = False,
+                 max_workers: Optional[int] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Load all sources, concatenated in the order they were stored. See `load_many` for a description of the
+        parameters.
+
+        :return: Concatenated DataFrame with an index starting at 0, or an iterator of DataFrames when `lazy` is True.
+        """
+
+        return self.load_many(list(self._records.keys()),
+                              columns=columns,
+                              row_range=row_range,
+                              lazy=lazy,
+                              max_workers=max_workers)
 
     def store(self,
               data_source: Union[cudf.DataFrame, pd.DataFrame, str],
@@ -170,7 +339,7 @@ class DataManager():
             # Ensure that the tracking ID is unique.
             tracking_id = uuid.uuid4()
 
-        if (self._storage_type == 'filesystem'):
+        if (self._storage_type in ('filesystem', 'hybrid')):
             data_label = os.path.join(self._storage_dir, f"{tracking_id}.{self._file_format}")
         else:
             data_label = data_label or f'dataframe_{tracking_id}'
@@ -179,7 +348,8 @@ class DataManager():
                                  data_label=data_label,
                                  storage_type=self.storage_type,
                                  file_format=self._file_format,
-                                 copy_from_source=copy_from_source)
+                                 copy_from_source=copy_from_source,
+                                 spill_manager=self._spill_manager)
 
         self._total_rows += len(data_record)
         self._records[tracking_id] = data_record
@@ -14,6 +14,9 @@
 # limitations under the License.
 
 import typing
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import pandas as pd
@@ -21,7 +24,9 @@ import pandas as pd
 import cudf
 
 from morpheus.io.data_storage import FileSystemStorage
+from morpheus.io.data_storage import HybridStorage
 from morpheus.io.data_storage import InMemoryStorage
+from morpheus.io.data_storage import SpillManager
 
 
 class DataRecord:
@@ -32,23 +37,26 @@ class DataRecord:
         VALID_FILE_FORMATS (tuple): Allowed file formats.
     """
 
-    VALID_STORAGE_TYPES = ('in_memory', 'filesystem')
-    VALID_FILE_FORMATS = ('parquet', 'csv')
+    VALID_STORAGE_TYPES = ('in_memory', 'filesystem', 'hybrid')
+    VALID_FILE_FORMATS = ('parquet', 'csv', 'arrow')
 
     def __init__(self,
                  data_source: Union[pd.DataFrame, cudf.DataFrame, str],
                  data_label: str,
                  storage_type: str,
                  file_format: str = "parquet",
-                 copy_from_source: bool = False):
+                 copy_from_source: bool = False,
+                 spill_manager: Optional[SpillManager] = None):
         """Initialize a DataRecord instance.
 
         Args:
             data_source (Union[io.BytesIO, str]): Data source, either a file path or Dataframe.
             data_label (str): Label for the data record.
-            storage_type (str): Storage type, either 'in_memory' or 'filesystem'.
-            file_format (str): File format, either 'parquet' or 'csv'.
+            storage_type (str): Storage type, either 'in_memory', 'filesystem' or 'hybrid'.
+            file_format (str): File format, either 'parquet', 'csv' or 'arrow'.
             copy_from_source (bool, optional): If True, copy data from the source. Defaults to False.
+            spill_manager (SpillManager, optional): Memory budget shared by 'hybrid' records. When None, the record
+                is given its own unbounded budget. Defaults to None.
         """
 
         self._copy_from_source = copy_from_source
@@ -61,6 +69,10 @@ class DataRecord:
             self._storage = InMemoryStorage(file_format=self._file_format)
         elif (self._storage_type == 'filesystem'):
             self._storage = FileSystemStorage(file_path=self._data_label, file_format=self._file_format)
+        elif (self._storage_type == 'hybrid'):
+            self._storage = HybridStorage(file_path=self._data_label,
+                                          file_format=self._file_format,
+                                          spill_manager=spill_manager or SpillManager())
         else:
             raise ValueError(f"Invalid storage_type'{storage_type}'")
 
@@ -94,14 +106,22 @@ class DataRecord:
                 f"file format: {self._file_format}, "
                 f"number of rows: {self.num_rows}")
 
-    def load(self) -> cudf.DataFrame:
+    def load(self,
+             columns: Optional[List[str]] = None,
+             row_range: Optional[Tuple[int, Optional[int]]] = None) -> cudf.DataFrame:
         """Load a cuDF DataFrame from the DataRecord.
 
+        Args:
+            columns (List[str], optional): Subset of columns to load. Defaults to None, loading all columns.
+            row_range (Tuple[int, Optional[int]], optional): Half open range of rows `(start, stop)` to load, a stop
+                of None loads to the end of the record. Defaults to None, loading all rows.
+
         Returns:
-            cudf.DataFrame: Loaded cuDF DataFrame.
+            cudf.DataFrame: Loaded cuDF DataFrame. Records stored as 'arrow' are loaded without copying, the columns
+            which allow it are read-only views of the record and must be copied before being modified.
         """
 
-        return self._storage.load()
+        return self._storage.load(columns=columns, row_range=row_range)
 
     @property
     def data_label(self) -> str:
@@ -14,4 +14,7 @@
 # limitations under the License.
 
 from .file_system import FileSystemStorage
+from .hybrid import HybridStorage
+from .hybrid import SpillManager
+from .hybrid import SpillStats
 from .in_memory import InMemoryStorage
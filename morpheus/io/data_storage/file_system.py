@@ -13,21 +13,65 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import typing
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import fsspec
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 import cudf
 
 from morpheus.io.data_storage_interface import RecordStorageInterface
 
+# Schema metadata key used to record the number of rows in Arrow IPC files, allowing it to be read from the footer
+_ARROW_NUM_ROWS_KEY = b"morpheus.num_rows"
+
+
+def write_arrow(df: Union[pd.DataFrame, cudf.DataFrame], dest: Union[str, typing.BinaryIO]) -> None:
+    """
+    Write a DataFrame to an uncompressed Arrow IPC (Feather v2) file, or buffer. The index of `df` is not written.
+
+    :param df: The DataFrame to write.
+    :type df: Union[pd.DataFrame, cudf.DataFrame]
+    :param dest: The path of the file, or a buffer to write to.
+    :type dest: Union[str, typing.BinaryIO]
+    """
+
+    if (isinstance(df, cudf.DataFrame)):
+        table = df.to_arrow(preserve_index=False)
+    else:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+    metadata = dict(table.schema.metadata or {})
+    metadata[_ARROW_NUM_ROWS_KEY] = str(table.num_rows).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    with pa.ipc.new_file(dest, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _open_arrow(source: Union[str, typing.BinaryIO]) -> pa.ipc.RecordBatchFileReader:
+    if (isinstance(source, str)):
+        # Memory-map files, so only the pages of the columns and rows which are used are read
+        return pa.ipc.open_file(pa.memory_map(source))
+
+    if (isinstance(source, io.BytesIO)):
+        # Read the buffer in place rather than copying it, the loaded columns are views of the buffer
+        return pa.ipc.open_file(pa.py_buffer(source.getbuffer()))
+
+    return pa.ipc.open_file(source)
+
 
 def row_count_from_file(file_path: str, file_format_hint: Optional[str] = None) -> int:
     """
-    Compute the number of rows in a Parquet or CSV file using pandas.
+    Compute the number of rows in a Parquet, Arrow IPC or CSV file. The row count of Parquet and Arrow IPC files is
+    read from the file metadata, CSV files are parsed using pandas.
 
     :param file_path: The path to the input file.
     :type file_path: str
@@ -43,6 +87,15 @@ def row_count_from_file(file_path: str, file_format_hint: Optional[str] = None)
         # For Parquet files, use PyArrow to read the row count directly.
         par_file = pq.ParquetFile(file_path)
         row_count = par_file.metadata.num_rows
+    elif (_file_format == 'arrow'):
+        reader = _open_arrow(file_path)
+        metadata = reader.schema.metadata or {}
+
+        if (_ARROW_NUM_ROWS_KEY in metadata):
+            row_count = int(metadata[_ARROW_NUM_ROWS_KEY])
+        else:
+            # Written by another library, sum the lengths of the memory-mapped record batches without reading them
+            row_count = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
     elif (_file_format == 'csv'):
         # For CSV files, use pandas to read the file and count the rows.
         with pd.read_csv(file_path, chunksize=10**6) as reader:
@@ -53,6 +106,88 @@ def row_count_from_file(file_path: str, file_format_hint: Optional[str] = None)
     return row_count
 
 
+def read_dataframe(source: Union[str, typing.BinaryIO],
+                   file_format: str,
+                   columns: Optional[List[str]] = None,
+                   row_range: Optional[Tuple[int, Optional[int]]] = None) -> pd.DataFrame:
+    """
+    Read a Parquet, Arrow IPC or CSV file, or buffer, into a pandas DataFrame, optionally limited to a subset of the
+    columns and rows.
+
+    For Parquet files only the row groups overlapping `row_range` are read, for CSV files the rows before the range are
+    skipped without being parsed. Arrow IPC files are memory-mapped, and converted to pandas without copying columns
+    whose type allows it. The arrays of these columns are read-only views of the file.
+
+    :param source: The path of the file, or a buffer holding its contents.
+    :type source: Union[str, typing.BinaryIO]
+    :param file_format: File format, either 'parquet', 'arrow' or 'csv'.
+    :type file_format: str
+    :param columns: Subset of columns to read. Defaults to None, reading all columns.
+    :type columns: List[str], optional
+    :param row_range: Half open range of rows `(start, stop)` to read, a stop of None reads to the end of the file.
+        Defaults to None, reading all rows.
+    :type row_range: Tuple[int, Optional[int]], optional
+    :return: The data as a pandas DataFrame, with an index starting at 0.
+    :rtype: pd.DataFrame
+    """
+
+    (start, stop) = row_range if row_range is not None else (0, None)
+
+    if (start < 0 or (stop is not None and stop < start)):
+        raise ValueError(f"Invalid row_range {row_range}")
+
+    if (file_format == 'parquet'):
+        if (row_range is None):
+            return pd.read_parquet(source, columns=columns)
+
+        par_file = pq.ParquetFile(source)
+        metadata = par_file.metadata
+
+        if (stop is None or stop > metadata.num_rows):
+            stop = metadata.num_rows
+
+        # Only read the row groups which overlap the requested rows
+        row_groups = []
+        first_row = None
+        offset = 0
+        for i in range(metadata.num_row_groups):
+            group_rows = metadata.row_group(i).num_rows
+
+            if (offset < stop and offset + group_rows > start):
+                row_groups.append(i)
+                first_row = offset if first_row is None else first_row
+
+            offset += group_rows
+
+        if (len(row_groups) > 0):
+            table = par_file.read_row_groups(row_groups, columns=columns).slice(start - first_row, stop - start)
+        else:
+            table = par_file.schema_arrow.empty_table()
+            if (columns is not None):
+                table = table.select(columns)
+
+        return table.to_pandas()
+
+    if (file_format == 'arrow'):
+        table = _open_arrow(source).read_all()
+
+        if (columns is not None):
+            table = table.select(columns)
+
+        if (row_range is not None):
+            table = table.slice(start, stop - start if stop is not None else None)
+
+        return table.to_pandas(split_blocks=True)
+
+    if (file_format == 'csv'):
+        return pd.read_csv(source,
+                           usecols=columns,
+                           skiprows=range(1, start + 1) if start > 0 else None,
+                           nrows=stop - start if stop is not None else None)
+
+    raise ValueError(f"Unknown file format '{file_format}'")
+
+
 class FileSystemStorage(RecordStorageInterface):
     """
     A class to manage storage of data in various file formats.
@@ -64,7 +199,7 @@ class FileSystemStorage(RecordStorageInterface):
 
         :param file_path: The label for the data.
         :type file_path: str
-        :param file_format: The format of the file ('csv' or 'parquet').
+        :param file_format: The format of the file ('csv', 'parquet' or 'arrow').
         :type file_format: str
         """
 
@@ -75,11 +210,11 @@ class FileSystemStorage(RecordStorageInterface):
         self._num_rows = 0
 
         if (self._file_format == 'csv'):
-            self._data_reader = pd.read_csv
             self._data_writer = lambda df, path: df.to_csv(path, index=False, header=True)
         elif (self._file_format == 'parquet'):
-            self._data_reader = pd.read_parquet
             self._data_writer = lambda df, path: df.to_parquet(path, index=False)
+        elif (self._file_format == 'arrow'):
+            self._data_writer = write_arrow
         else:
             raise NotImplementedError(f"File format {self._file_format} is not supported.")
 
@@ -89,14 +224,20 @@ class FileSystemStorage(RecordStorageInterface):
         if (self._owner and self._backing_source is not None and self._fs.exists(self._backing_source)):
             self._fs.rm(self._backing_source)
 
-    def load(self) -> cudf.DataFrame:
+    def load(self,
+             columns: Optional[List[str]] = None,
+             row_range: Optional[Tuple[int, Optional[int]]] = None) -> cudf.DataFrame:
         """Load data from the backing source file.
 
+        Args:
+            columns: Subset of columns to load, by default all columns are loaded.
+            row_range: Half open range of rows `(start, stop)` to load, by default all rows are loaded.
+
         Returns:
             The loaded data as a cudf.DataFrame.
         """
 
-        return self._data_reader(self._backing_source)
+        return read_dataframe(self._backing_source, self._file_format, columns=columns, row_range=row_range)
 
     def store(self, data_source: Union[pd.DataFrame, cudf.DataFrame, str], copy_from_source: bool = False) -> None:
         """
@@ -116,7 +257,7 @@ class FileSystemStorage(RecordStorageInterface):
             self._owner = True
         elif (isinstance(data_source, str)):
             if (copy_from_source):
-                data_source = self._data_reader(data_source)
+                data_source = read_dataframe(data_source, self._file_format)
                 self._data_writer(data_source, self._backing_source)
                 self._num_rows = len(data_source)
                 self._owner = True
@@ -0,0 +1,333 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import os
+import threading
+from collections import OrderedDict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import pandas as pd
+
+import cudf
+
+from morpheus.io.data_storage.file_system import read_dataframe
+from morpheus.io.data_storage.file_system import row_count_from_file
+from morpheus.io.data_storage.file_system import write_arrow
+from morpheus.io.data_storage_interface import RecordStorageInterface
+
+
+@dataclasses.dataclass
+class SpillStats:
+    """Memory and spill metrics of the records managed by a `SpillManager`."""
+
+    memory_budget_bytes: Optional[int] = None
+    memory_bytes: int = 0
+    num_in_memory: int = 0
+    num_spilled: int = 0
+    spills: int = 0
+    bytes_spilled: int = 0
+    reloads: int = 0
+    bytes_reloaded: int = 0
+
+
+class SpillManager:
+    """
+    Tracks the memory used by a set of `HybridStorage` records, spilling the least recently used records to disk
+    whenever the total exceeds the memory budget.
+
+    Args:
+        memory_budget_bytes: Maximum number of bytes of records to hold in memory. When None, records are never
+            spilled.
+    """
+
+    def __init__(self, memory_budget_bytes: Optional[int] = None):
+        if (memory_budget_bytes is not None and memory_budget_bytes < 0):
+            raise ValueError("memory_budget_bytes must be non-negative")
+
+        self._memory_budget_bytes = memory_budget_bytes
+        self._lock = threading.RLock()
+
+        # In memory records, ordered from least to most recently used
+        self._in_memory: "OrderedDict[int, HybridStorage]" = OrderedDict()
+        self._num_spilled = 0
+        self._stats = SpillStats(memory_budget_bytes=memory_budget_bytes)
+
+    @property
+    def memory_budget_bytes(self) -> Optional[int]:
+        return self._memory_budget_bytes
+
+    @property
+    def stats(self) -> SpillStats:
+        """A copy of the current metrics."""
+        with self._lock:
+            return dataclasses.replace(self._stats, num_in_memory=len(self._in_memory), num_spilled=self._num_spilled)
+
+    def _enforce_budget(self, keep: "HybridStorage"):
+        if (self._memory_budget_bytes is None):
+            return
+
+        # Spill the least recently used records first, only spilling `keep` when it exceeds the budget on its own
+        for storage in list(self._in_memory.values()) + [keep]:
+            if (self._stats.memory_bytes <= self._memory_budget_bytes):
+                break
+
+            if (storage is keep and len(self._in_memory) > 1):
+                continue
+
+            if (id(storage) in self._in_memory):
+                self._spill(storage)
+
+    def _spill(self, storage: "HybridStorage"):
+        nbytes = storage._spill()
+
+        del self._in_memory[id(storage)]
+        self._stats.memory_bytes -= nbytes
+        self._stats.spills += 1
+        self._stats.bytes_spilled += nbytes
+        self._num_spilled += 1
+
+    def add(self, storage: "HybridStorage"):
+        """Adds a record which has been loaded into memory, spilling other records if needed."""
+        with self._lock:
+            self._in_memory[id(storage)] = storage
+            self._stats.memory_bytes += storage.memory_bytes
+            self._enforce_budget(keep=storage)
+
+    def add_spilled(self):
+        """Counts a record which was stored directly on disk."""
+        with self._lock:
+            self._num_spilled += 1
+
+    def touch(self, storage: "HybridStorage"):
+        """Marks an in memory record as the most recently used."""
+        with self._lock:
+            if (id(storage) in self._in_memory):
+                self._in_memory.move_to_end(id(storage))
+
+    def reloaded(self, storage: "HybridStorage", nbytes: int):
+        """Records that a spilled record was loaded back into memory."""
+        with self._lock:
+            self._num_spilled -= 1
+            self._stats.reloads += 1
+            self._stats.bytes_reloaded += nbytes
+            self.add(storage)
+
+    def remove(self, storage: "HybridStorage", in_memory: bool):
+        """Stops tracking a deleted record."""
+        with self._lock:
+            if (in_memory):
+                if (self._in_memory.pop(id(storage), None) is not None):
+                    self._stats.memory_bytes -= storage.memory_bytes
+            else:
+                self._num_spilled -= 1
+
+
+class HybridStorage(RecordStorageInterface):
+    """
+    A class to manage storage of data in memory, which is spilled to a file when the `SpillManager` is over budget.
+
+    Records are held in memory as pandas DataFrames. Spilled records are reloaded into memory when fully loaded, while
+    loads of a subset of columns are read directly from the spilled file.
+
+    Args:
+        file_path: The path to spill the data to.
+        file_format: The format of the spilled file ('csv', 'parquet' or 'arrow').
+        spill_manager: Tracks memory usage across all records sharing a memory budget.
+    """
+
+    def __init__(self, file_path: str, file_format: str, spill_manager: SpillManager):
+        super().__init__(file_format)
+
+        self._backing_source = file_path
+        self._spill_manager = spill_manager
+        self._df: Optional[pd.DataFrame] = None
+        self._memory_bytes = 0
+        self._num_rows = 0
+        self._deleted = False
+        self._lock = threading.Lock()
+
+        if (self._file_format == 'csv'):
+            self._data_writer = lambda df, path: df.to_csv(path, index=False, header=True)
+        elif (self._file_format == 'parquet'):
+            self._data_writer = lambda df, path: df.to_parquet(path, index=False)
+        elif (self._file_format == 'arrow'):
+            self._data_writer = write_arrow
+        else:
+            raise NotImplementedError(f"File format {self._file_format} is not supported.")
+
+    def _set_df(self, df: pd.DataFrame):
+        self._df = df.reset_index(drop=True)
+        self._memory_bytes = int(self._df.memory_usage(deep=True).sum())
+
+    def _spill(self) -> int:
+        """Writes the in memory data to the backing file and releases it, returning the number of bytes released."""
+        with self._lock:
+            if (self._owner and not os.path.exists(self._backing_source)):
+                self._data_writer(self._df, self._backing_source)
+
+            nbytes = self._memory_bytes
+            self._df = None
+            self._memory_bytes = 0
+
+            return nbytes
+
+    def load(self,
+             columns: Optional[List[str]] = None,
+             row_range: Optional[Tuple[int, Optional[int]]] = None) -> pd.DataFrame:
+        """Load data from memory, or from the spilled file.
+
+        Args:
+            columns: Subset of columns to load, by default all columns are loaded.
+            row_range: Half open range of rows `(start, stop)` to load, by default all rows are loaded.
+
+        Returns:
+            The loaded data as a pandas DataFrame.
+        """
+
+        with self._lock:
+            if (self._deleted):
+                raise ValueError("Cannot load a deleted record.")
+
+            df = self._df
+            if (df is None):
+                if (columns is not None or row_range is not None or not self._owner):
+                    # Partial loads and wrapped source files are read directly, without promoting back into memory
+                    return read_dataframe(self._backing_source, self._file_format, columns=columns, row_range=row_range)
+
+                df = read_dataframe(self._backing_source, self._file_format)
+
+                self._set_df(df)
+                reloaded = True
+            else:
+                reloaded = False
+
+        if (reloaded):
+            self._spill_manager.reloaded(self, self._memory_bytes)
+        else:
+            self._spill_manager.touch(self)
+
+        if (row_range is not None):
+            (start, stop) = row_range
+            if (start < 0 or (stop is not None and stop < start)):
+                raise ValueError(f"Invalid row_range {row_range}")
+
+            df = df.iloc[start:stop].reset_index(drop=True)
+
+        if (columns is not None):
+            df = df[columns]
+
+        return df.copy(deep=True)
+
+    def delete(self) -> None:
+        """Release the data held in memory, and delete the spilled file if this instance is the owner."""
+
+        with self._lock:
+            if (self._deleted):
+                return
+
+            self._deleted = True
+            in_memory = self._df is not None
+
+        self._spill_manager.remove(self, in_memory=in_memory)
+
+        with self._lock:
+            self._df = None
+            self._memory_bytes = 0
+
+            if (self._owner and os.path.exists(self._backing_source)):
+                os.remove(self._backing_source)
+
+    def store(self, data_source: Union[pd.DataFrame, cudf.DataFrame, str], copy_from_source: bool = False) -> None:
+        """Store data in memory, spilling the least recently used records if over the memory budget.
+
+        Args:
+            data_source: The data to store. Can be a pandas.DataFrame, cudf.DataFrame, or a file path.
+            copy_from_source: If True and data_source is a file path, the data is read from the file and stored. If
+                False, the record is backed by data_source directly and is never held in memory.
+        """
+
+        if (isinstance(data_source, str) and not copy_from_source):
+            # Wrap a source file, no copy
+            self._backing_source = data_source
+            self._num_rows = row_count_from_file(self._backing_source, self._file_format)
+            self._owner = False
+            self._spill_manager.add_spilled()
+            return
+
+        if (isinstance(data_source, str)):
+            data_source = read_dataframe(data_source, self._file_format)
+        elif (isinstance(data_source, cudf.DataFrame)):
+            data_source = data_source.to_pandas()
+
+        with self._lock:
+            self._set_df(data_source)
+            self._num_rows = len(data_source)
+            self._owner = True
+
+        self._spill_manager.add(self)
+
+    @property
+    def backing_source(self) -> str:
+        """Get the backing source, the spill file path.
+
+        Returns:
+            The path of the file the data is spilled to.
+        """
+
+        return self._backing_source
+
+    @property
+    def in_memory(self) -> bool:
+        """Get whether the data is currently held in memory.
+
+        Returns:
+            True if the data is held in memory, False if it has been spilled.
+        """
+
+        return self._df is not None
+
+    @property
+    def memory_bytes(self) -> int:
+        """Get the number of bytes of memory used by the data.
+
+        Returns:
+            The number of bytes used, 0 when spilled.
+        """
+
+        return self._memory_bytes
+
+    @property
+    def num_rows(self) -> int:
+        """Get the number of rows in the data.
+
+        Returns:
+            The number of rows in the data.
+        """
+
+        return self._num_rows
+
+    @property
+    def owner(self) -> bool:
+        """Get whether this instance is the owner of the data and the spilled file.
+
+        Returns:
+            True if this instance is the owner of the data, False otherwise.
+        """
+
+        return self._owner
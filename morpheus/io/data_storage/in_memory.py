@@ -14,12 +14,17 @@
 # limitations under the License.
 
 import io
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import pandas as pd
 
 import cudf
 
+from morpheus.io.data_storage.file_system import read_dataframe
+from morpheus.io.data_storage.file_system import write_arrow
 from morpheus.io.data_storage_interface import RecordStorageInterface
 
 
@@ -31,7 +36,7 @@ class InMemoryStorage(RecordStorageInterface):
 
         Args:
             data_label: The label for the data.
-            file_format: The format of the file ('csv' or 'parquet').
+            file_format: The format of the file ('csv', 'parquet' or 'arrow').
         """
 
         super().__init__(file_format)
@@ -42,29 +47,41 @@ class InMemoryStorage(RecordStorageInterface):
         self._owner = True
 
         if self._file_format == 'csv':
-            self._data_reader = pd.read_csv
             self._data_writer = lambda df, buffer: df.to_csv(buffer, index=False, header=True)
         elif self._file_format == 'parquet':
-            self._data_reader = pd.read_parquet
             self._data_writer = lambda df, buffer: df.to_parquet(buffer, index=False)
+        elif self._file_format == 'arrow':
+            self._data_writer = write_arrow
         else:
             raise NotImplementedError(f"File format {self._file_format} is not supported.")
 
-    def load(self) -> pd.DataFrame:
+    def load(self,
+             columns: Optional[List[str]] = None,
+             row_range: Optional[Tuple[int, Optional[int]]] = None) -> pd.DataFrame:
         """Load data from the buffer.
 
+        Args:
+            columns: Subset of columns to load, by default all columns are loaded.
+            row_range: Half open range of rows `(start, stop)` to load, by default all rows are loaded.
+
         Returns:
             The loaded data as a pandas DataFrame.
         """
 
         self._data.seek(0)
-        return self._data_reader(self._data)
+        return read_dataframe(self._data, self._file_format, columns=columns, row_range=row_range)
 
     def delete(self) -> None:
         """Delete the data in the buffer if this instance is the owner."""
 
         if self._owner:
-            self._data.close()
+            try:
+                self._data.close()
+            except BufferError:
+                # DataFrames loaded from the Arrow IPC format are views of the buffer, which is released along with
+                # them. Replace it with a closed buffer so that further loads fail the same way
+                self._data = io.BytesIO()
+                self._data.close()
 
     # yapf: disable -- yapf wants to put 'store' on a single line, flake8 says this is an error
     def store(self, data_source: Union[pd.DataFrame, cudf.DataFrame, str],
@@ -82,7 +99,7 @@ class InMemoryStorage(RecordStorageInterface):
         self._data = io.BytesIO()
 
         if isinstance(data_source, str):
-            data_source = self._data_reader(data_source)
+            data_source = read_dataframe(data_source, self._file_format)
 
         self._data_writer(data_source, self._data)
         self._num_rows = len(data_source)
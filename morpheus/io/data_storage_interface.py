@@ -15,6 +15,9 @@
 
 from abc import ABC
 from abc import abstractmethod
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import pandas as pd
@@ -34,7 +37,9 @@ class RecordStorageInterface(ABC):
         pass
 
     @abstractmethod
-    def load(self) -> cudf.DataFrame:
+    def load(self,
+             columns: Optional[List[str]] = None,
+             row_range: Optional[Tuple[int, Optional[int]]] = None) -> cudf.DataFrame:
         pass
 
     @abstractmethod
@@ -0,0 +1,297 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""On-disk cache of DataFrames stored in a columnar format."""
+
+import dataclasses
+import logging
+import os
+import tempfile
+import threading
+import typing
+from collections import OrderedDict
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import feather
+
+logger = logging.getLogger(__name__)
+
+_FILE_EXTENSIONS = {"arrow": ".arrow", "parquet": ".parquet"}
+
+
+@dataclasses.dataclass
+class DataFrameCacheStats:
+    """Counters describing the activity of a `DataFrameCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    evictions: int = 0
+    bytes_evicted: int = 0
+
+
+class DataFrameCache:
+    """
+    Caches DataFrames on disk keyed by a string, such as a hash of the files used to build the DataFrame.
+
+    Entries are written in a columnar format to a temporary file which is atomically renamed into place, ensuring that
+    readers never observe a partially written entry. Reads can be limited to a subset of columns, and entries using the
+    Arrow IPC format are memory-mapped. When `max_size_bytes` is set, the least recently used entries are evicted once
+    the total size of the cache directory exceeds the limit. Any other files found in the cache directory, such as
+    entries written in a different format by an earlier version, are also candidates for eviction.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory to store the cache entries in. Created when the first entry is written.
+    file_format : str, default = "arrow"
+        Format to store entries in. Either "arrow" for the uncompressed Arrow IPC format, which supports memory-mapped
+        reads, or "parquet" for smaller, compressed entries.
+    max_size_bytes : int, optional
+        Maximum total size of the cache directory. When None, entries are never evicted.
+    """
+
+    def __init__(self, cache_dir: str, file_format: str = "arrow", max_size_bytes: int = None):
+        if (file_format not in _FILE_EXTENSIONS):
+            raise ValueError(f"Unsupported cache file format '{file_format}'. "
+                             f"Available formats are: {list(_FILE_EXTENSIONS.keys())}")
+
+        if (max_size_bytes is not None and max_size_bytes < 0):
+            raise ValueError("max_size_bytes must be non-negative")
+
+        self._cache_dir = cache_dir
+        self._file_format = file_format
+        self._max_size_bytes = max_size_bytes
+
+        self._stats = DataFrameCacheStats()
+        self._lock = threading.Lock()
+
+        # Maps the path of each file in the cache directory to its size, ordered from least to most recently used. The
+        # directory is scanned on first use, and only created once an entry is written
+        self._entries: typing.OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._scanned = False
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @property
+    def file_format(self) -> str:
+        return self._file_format
+
+    @property
+    def max_size_bytes(self) -> typing.Optional[int]:
+        return self._max_size_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the files currently in the cache directory."""
+        with self._lock:
+            self._scan()
+            return self._total_bytes
+
+    @property
+    def stats(self) -> DataFrameCacheStats:
+        """A copy of the current cache counters."""
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def _scan(self):
+        if (self._scanned or not os.path.isdir(self._cache_dir)):
+            return
+
+        self._scanned = True
+
+        # Seed the LRU order from the modification times of any existing files. Hits update the modification time so
+        # the order is maintained across restarts
+        files = []
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if (entry.is_file() and not entry.name.startswith(".")):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.path, stat.st_size))
+
+        for (_, path, size) in sorted(files):
+            self._entries[path] = size
+            self._total_bytes += size
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{key}{_FILE_EXTENSIONS[self._file_format]}")
+
+    def _remove_entry(self, path: str):
+        size = self._entries.pop(path, 0)
+        self._total_bytes -= size
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+        return size
+
+    def _evict(self, keep_path: str = None):
+        if (self._max_size_bytes is None):
+            return
+
+        for path in list(self._entries.keys()):
+            if (self._total_bytes <= self._max_size_bytes):
+                break
+
+            if (path == keep_path):
+                continue
+
+            size = self._remove_entry(path)
+            self._stats.evictions += 1
+            self._stats.bytes_evicted += size
+
+            logger.debug("Evicted cache entry '%s' (%d bytes)", path, size)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._get_path(key))
+
+    def get(self, key: str, columns: typing.List[str] = None) -> typing.Optional[pd.DataFrame]:
+        """
+        Returns the DataFrame stored for `key`, or None if there is no entry. Entries which can not be read, for example
+        due to being truncated by a full disk, are removed and treated as a miss.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+        columns : typing.List[str], optional
+            Subset of columns to read, by default all columns are read.
+
+        Returns
+        -------
+        typing.Optional[pd.DataFrame]
+            The cached DataFrame, or None on a miss.
+        """
+        path = self._get_path(key)
+
+        try:
+            if (self._file_format == "arrow"):
+                table = feather.read_table(path, columns=columns, memory_map=True)
+            else:
+                table = pq.read_table(path, columns=columns)
+
+            df = table.to_pandas()
+            bytes_read = table.nbytes
+        except FileNotFoundError:
+            with self._lock:
+                self._stats.misses += 1
+            return None
+        except Exception:
+            logger.warning("Failed to read cache entry '%s'. Removing the entry.", path, exc_info=True)
+            with self._lock:
+                self._scan()
+                self._remove_entry(path)
+                self._stats.misses += 1
+            return None
+
+        with self._lock:
+            self._scan()
+            self._stats.hits += 1
+            self._stats.bytes_read += bytes_read
+
+            if (path not in self._entries):
+                # Written by another process since this cache was created
+                self._entries[path] = os.path.getsize(path)
+                self._total_bytes += self._entries[path]
+
+            self._entries.move_to_end(path)
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """
+        Stores `df` for `key`, replacing any existing entry, then evicts entries if the cache exceeds `max_size_bytes`.
+        The index of `df` is not stored.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+        df : pd.DataFrame
+            DataFrame to store.
+
+        Returns
+        -------
+        bool
+            True if the entry was written, False if `df` could not be serialized or written.
+        """
+        path = self._get_path(key)
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+
+            # Write to a temporary file in the same directory, then rename, so readers never see a partial entry
+            (fd, tmp_path) = tempfile.mkstemp(dir=self._cache_dir, prefix=".", suffix=".tmp")
+            os.close(fd)
+        except OSError:
+            logger.warning("Failed to create cache directory '%s'. Skipping cache for this entry.",
+                           self._cache_dir,
+                           exc_info=True)
+            return False
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+
+            if (self._file_format == "arrow"):
+                feather.write_feather(table, tmp_path, compression="uncompressed")
+            else:
+                pq.write_table(table, tmp_path)
+
+            os.replace(tmp_path, path)
+        except Exception:
+            logger.warning("Failed to write cache entry '%s'. Skipping cache for this entry.", path, exc_info=True)
+
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+
+            return False
+
+        size = os.path.getsize(path)
+
+        with self._lock:
+            self._scan()
+            self._total_bytes += size - self._entries.pop(path, 0)
+            self._entries[path] = size
+            self._stats.bytes_written += size
+
+            self._evict(keep_path=path)
+
+        return True
+
+    def remove(self, key: str):
+        """Removes the entry for `key` if it exists."""
+        with self._lock:
+            self._scan()
+            self._remove_entry(self._get_path(key))
+
+    def clear(self):
+        """Removes all entries from the cache directory."""
+        with self._lock:
+            self._scan()
+            for path in list(self._entries.keys()):
+                self._remove_entry(path)
@@ -14,10 +14,18 @@
 # limitations under the License.
 """DataFrame deserializers."""
 
+import contextlib
+import glob
 import io
+import os
+import queue
+import threading
 import typing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
+import pyarrow.parquet as pq
 
 import cudf
 
@@ -28,12 +36,76 @@ from morpheus.config import CppConfig
 from morpheus.io.utils import filter_null_data
 from morpheus.utils.type_aliases import DataFrameType
 
+FileNamesType = typing.Union[str, os.PathLike, typing.Iterable[typing.Union[str, os.PathLike]]]
+
+
+def _get_file_type(file_name: typing.Union[str, io.IOBase], file_type: FileTypes) -> FileTypes:
+    if (file_type != FileTypes.Auto):
+        return file_type
+
+    # The DFPFileToDataFrameStage passes an instance of an fsspec file opener instead of a filename to this method.
+    # The opener objects are subclasses of io.IOBase, which avoids introducing fsspec to this part of the API
+    if (isinstance(file_name, io.IOBase)):
+        if (hasattr(file_name, 'path')):  # This attr is not in the base
+            fp = file_name.path
+        else:
+            raise ValueError("Unable to determine file type from instance of io.IOBase,"
+                             " set `file_type` to a value other than Auto")
+    else:
+        fp = file_name
+
+    return determine_file_type(fp)
+
+
+def _get_parser_kwargs(mode: FileTypes,
+                       parser_kwargs: typing.Optional[dict],
+                       columns: typing.Optional[typing.List[str]],
+                       dtypes: typing.Optional[dict]) -> dict:
+    kwargs = {}
+
+    # Special args for JSON
+    if (mode == FileTypes.JSON):
+        kwargs["lines"] = True
+
+    # Push the projection and types into the parsers which support them
+    if (columns is not None):
+        if (mode == FileTypes.CSV):
+            kwargs["usecols"] = columns
+        elif (mode == FileTypes.PARQUET):
+            kwargs["columns"] = columns
+
+    if (dtypes is not None and mode in (FileTypes.CSV, FileTypes.JSON)):
+        kwargs["dtype"] = dtypes
+
+    # Update with any args set by the user. User values overwrite defaults
+    kwargs.update(parser_kwargs or {})
+
+    return kwargs
+
+
+def _apply_columns_and_dtypes(df: DataFrameType,
+                              columns: typing.Optional[typing.List[str]],
+                              dtypes: typing.Optional[dict]) -> DataFrameType:
+    """Applies any projection or types which could not be pushed into the parser."""
+
+    if (columns is not None and list(df.columns) != list(columns)):
+        df = df[columns]
+
+    if (dtypes is not None):
+        dtypes = {col: dtype for (col, dtype) in dtypes.items() if col in df.columns and df[col].dtype != dtype}
+        if (len(dtypes) > 0):
+            df = df.astype(dtypes)
+
+    return df
+
 
 def read_file_to_df(file_name: typing.Union[str, io.IOBase],
                     file_type: FileTypes = FileTypes.Auto,
                     parser_kwargs: dict = None,
                     filter_nulls: bool = True,
-                    df_type: typing.Literal["cudf", "pandas"] = "pandas") -> DataFrameType:
+                    df_type: typing.Literal["cudf", "pandas"] = "pandas",
+                    columns: typing.List[str] = None,
+                    dtypes: dict = None) -> DataFrameType:
     """
     Reads a file into a dataframe and performs any of the necessary cleanup.
 
@@ -49,6 +121,11 @@ def read_file_to_df(file_name: typing.Union[str, io.IOBase],
         Whether to filter null rows after loading, by default True.
     df_type : typing.Literal[, optional
         What type of parser to use. Options are 'cudf' and 'pandas', by default "pandas".
+    columns : typing.List[str], optional
+        Subset of columns to read, by default all columns are read. Passed to the CSV and Parquet parsers, JSON files
+        are projected after parsing.
+    dtypes : dict, optional
+        Mapping of column names to types. Passed to the CSV and JSON parsers, Parquet columns are cast after reading.
 
     Returns
     -------
@@ -59,35 +136,13 @@ def read_file_to_df(file_name: typing.Union[str, io.IOBase],
     # The C++ reader only supports cudf dataframes
     if (CppConfig.get_should_use_cpp() and df_type == "cudf"):
         df = read_file_to_df_cpp(file_name, file_type)
+        df = _apply_columns_and_dtypes(df, columns, dtypes)
         if (filter_nulls):
             df = filter_null_data(df)
         return df
 
-    if (parser_kwargs is None):
-        parser_kwargs = {}
-
-    mode = file_type
-
-    if (mode == FileTypes.Auto):
-        # The DFPFileToDataFrameStage passes an instance of an fsspec file opener instead of a filename to this method.
-        # The opener objects are subclasses of io.IOBase, which avoids introducing fsspec to this part of the API
-        if (isinstance(file_name, io.IOBase)):
-            if (hasattr(file_name, 'path')):  # This attr is not in the base
-                fp = file_name.path
-            else:
-                raise ValueError("Unable to determine file type from instance of io.IOBase,"
-                                 " set `file_type` to a value other than Auto")
-        else:
-            fp = file_name
-        mode = determine_file_type(fp)
-
-    # Special args for JSON
-    kwargs = {}
-    if (mode == FileTypes.JSON):
-        kwargs["lines"] = True
-
-    # Update with any args set by the user. User values overwrite defaults
-    kwargs.update(parser_kwargs)
+    mode = _get_file_type(file_name, file_type)
+    kwargs = _get_parser_kwargs(mode, parser_kwargs, columns, dtypes)
 
     df_class = cudf if df_type == "cudf" else pd
 
@@ -111,7 +166,255 @@ def read_file_to_df(file_name: typing.Union[str, io.IOBase],
 
     assert df is not None
 
+    df = _apply_columns_and_dtypes(df, columns, dtypes)
+
     if (filter_nulls):
         df = filter_null_data(df)
 
     return df
+
+
+def _expand_file_names(file_names: FileNamesType) -> typing.List[str]:
+    if (isinstance(file_names, (str, os.PathLike))):
+        file_names = [file_names]
+
+    expanded = []
+    for file_name in file_names:
+        file_name = os.fspath(file_name)
+
+        if (glob.has_magic(file_name)):
+            matches = sorted(glob.glob(file_name))
+            if (len(matches) == 0):
+                raise FileNotFoundError(f"No files match the pattern '{file_name}'")
+
+            expanded.extend(matches)
+        else:
+            expanded.append(file_name)
+
+    if (len(expanded) == 0):
+        raise ValueError("At least one file must be provided")
+
+    return expanded
+
+
+def _iter_file_chunks(file_name: str,
+                      file_type: FileTypes,
+                      parser_kwargs: typing.Optional[dict],
+                      filter_nulls: bool,
+                      df_type: typing.Literal["cudf", "pandas"],
+                      columns: typing.Optional[typing.List[str]],
+                      dtypes: typing.Optional[dict],
+                      chunk_rows: typing.Optional[int]) -> typing.Iterator[DataFrameType]:
+    if (chunk_rows is None):
+        yield read_file_to_df(file_name,
+                              file_type,
+                              parser_kwargs=parser_kwargs,
+                              filter_nulls=filter_nulls,
+                              df_type=df_type,
+                              columns=columns,
+                              dtypes=dtypes)
+        return
+
+    # Incremental reads use the pandas parsers, chunks are converted to cudf after parsing
+    mode = _get_file_type(file_name, file_type)
+    kwargs = _get_parser_kwargs(mode, parser_kwargs, columns, dtypes)
+
+    if (mode == FileTypes.JSON):
+        if (not kwargs.get("lines", False)):
+            raise ValueError("Reading JSON files in chunks requires the JSON lines format")
+
+        # Unlike `cudf.read_json`, pandas converts columns which look like dates, such as `timestamp`, to datetimes
+        kwargs = {"convert_dates": False, "keep_default_dates": False, **kwargs}
+
+        reader = pd.read_json(file_name, chunksize=chunk_rows, **kwargs)
+    elif (mode == FileTypes.CSV):
+        reader = pd.read_csv(file_name, chunksize=chunk_rows, **kwargs)
+    elif (mode == FileTypes.PARQUET):
+        reader = (batch.to_pandas()
+                  for batch in pq.ParquetFile(file_name).iter_batches(batch_size=chunk_rows, **kwargs))
+    else:
+        assert False, "Unsupported file type mode: {}".format(mode)
+
+    with contextlib.closing(reader) if hasattr(reader, "close") else contextlib.nullcontext():
+        for df in reader:
+            # The index written by `write_df_to_file` is replaced by the running row count
+            if (mode == FileTypes.CSV and len(df.columns) > 1 and df.columns[0] == "Unnamed: 0"):
+                df = df.drop(columns=["Unnamed: 0"])
+
+            df = _apply_columns_and_dtypes(df, columns, dtypes)
+
+            if (filter_nulls):
+                df = filter_null_data(df)
+
+            if (df_type == "cudf"):
+                df = cudf.from_pandas(df)
+
+            yield df
+
+
+# Marks the end of the chunks of a file in the queue shared with the thread reading the file
+_END_OF_FILE = object()
+
+# Number of chunks of each file which are read ahead of the consumer
+_PREFETCH_CHUNKS = 2
+
+
+def _put_until_cancelled(out_queue: queue.Queue, item: typing.Any, cancelled: threading.Event) -> bool:
+    while (not cancelled.is_set()):
+        try:
+            out_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+
+    return False
+
+
+def _read_file_chunks(chunk_iter: typing.Iterator[DataFrameType], out_queue: queue.Queue, cancelled: threading.Event):
+    try:
+        for chunk in chunk_iter:
+            if (not _put_until_cancelled(out_queue, chunk, cancelled)):
+                return
+
+        item = _END_OF_FILE
+    except Exception as exc:  # pylint: disable=broad-except
+        item = exc
+
+    _put_until_cancelled(out_queue, item, cancelled)
+
+
+def iter_files_to_df(file_names: FileNamesType,
+                     file_type: FileTypes = FileTypes.Auto,
+                     parser_kwargs: dict = None,
+                     filter_nulls: bool = True,
+                     df_type: typing.Literal["cudf", "pandas"] = "pandas",
+                     columns: typing.List[str] = None,
+                     dtypes: dict = None,
+                     chunk_rows: int = None,
+                     max_workers: int = None) -> typing.Iterator[DataFrameType]:
+    """
+    Reads multiple files, yielding DataFrames in the order of the files.
+
+    Files are read concurrently on a thread pool, with at most `max_workers` files being read ahead of the consumer.
+    When `chunk_rows` is set, each file is parsed incrementally, allowing the first rows to be yielded before the rest
+    of the file has been parsed.
+
+    Parameters
+    ----------
+    file_names : FileNamesType
+        File, or files, to read. Glob patterns are expanded, matching files are read in sorted order.
+    file_type : `morpheus.common.FileTypes`
+        Type of the files. Leave as Auto to determine from the extension of each file.
+    parser_kwargs : dict, optional
+        Any argument to pass onto the parser, by default {}.
+    filter_nulls : bool, optional
+        Whether to filter null rows after loading, by default True.
+    df_type : typing.Literal["cudf", "pandas"], optional
+        What type of DataFrame to return, by default "pandas". Chunks are parsed with pandas then converted to cudf.
+    columns : typing.List[str], optional
+        Subset of columns to read, by default all columns are read.
+    dtypes : dict, optional
+        Mapping of column names to types.
+    chunk_rows : int, optional
+        Maximum number of rows in each DataFrame, by default each file is returned as a single DataFrame. Reading JSON
+        files in chunks requires the JSON lines format.
+    max_workers : int, optional
+        Maximum number of files to read concurrently, defaults to the `ThreadPoolExecutor` default.
+
+    Returns
+    -------
+    typing.Iterator[DataFrameType]
+        DataFrames with an index continuing from the previous DataFrame, starting at 0.
+    """
+    file_names = _expand_file_names(file_names)
+
+    if (chunk_rows is not None and chunk_rows < 1):
+        raise ValueError("chunk_rows must be at least 1")
+
+    if (max_workers is None):
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    return _iter_files_to_df(file_names,
+                             max_workers,
+                             file_type=file_type,
+                             parser_kwargs=parser_kwargs,
+                             filter_nulls=filter_nulls,
+                             df_type=df_type,
+                             columns=columns,
+                             dtypes=dtypes,
+                             chunk_rows=chunk_rows)
+
+
+def _iter_files_to_df(file_names: typing.List[str], max_workers: int, **kwargs) -> typing.Iterator[DataFrameType]:
+    cancelled = threading.Event()
+    pending_files = iter(file_names)
+    queues: typing.Deque[queue.Queue] = deque()
+    num_rows = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def read_next_file():
+            file_name = next(pending_files, None)
+            if (file_name is not None):
+                out_queue = queue.Queue(maxsize=_PREFETCH_CHUNKS)
+                executor.submit(_read_file_chunks, _iter_file_chunks(file_name, **kwargs), out_queue, cancelled)
+                queues.append(out_queue)
+
+        try:
+            for _ in range(max_workers):
+                read_next_file()
+
+            while (len(queues) > 0):
+                item = queues[0].get()
+
+                if (item is _END_OF_FILE):
+                    queues.popleft()
+                    read_next_file()
+                    continue
+
+                if (isinstance(item, Exception)):
+                    raise item
+
+                df = item.reset_index(drop=True)
+                df.index += num_rows
+                num_rows += len(df)
+
+                yield df
+        finally:
+            # Stop the threads reading ahead when the consumer stops early, or an error occurs
+            cancelled.set()
+
+
+def read_files_to_df(file_names: FileNamesType,
+                     file_type: FileTypes = FileTypes.Auto,
+                     parser_kwargs: dict = None,
+                     filter_nulls: bool = True,
+                     df_type: typing.Literal["cudf", "pandas"] = "pandas",
+                     columns: typing.List[str] = None,
+                     dtypes: dict = None,
+                     max_workers: int = None) -> DataFrameType:
+    """
+    Reads multiple files concurrently, and concatenates them into a single DataFrame in the order of the files. See
+    `iter_files_to_df` for a description of the parameters.
+
+    Returns
+    -------
+    DataFrameType
+        The concatenated DataFrame, with an index starting at 0.
+    """
+    dfs = list(
+        iter_files_to_df(file_names,
+                         file_type=file_type,
+                         parser_kwargs=parser_kwargs,
+                         filter_nulls=filter_nulls,
+                         df_type=df_type,
+                         columns=columns,
+                         dtypes=dtypes,
+                         max_workers=max_workers))
+
+    if (len(dfs) == 1):
+        return dfs[0]
+
+    df_class = cudf if df_type == "cudf" else pd
+
+    return df_class.concat(dfs)
@@ -0,0 +1,342 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Buffered writer of DataFrames which serializes, compresses and writes on a background thread."""
+
+import gzip
+import logging
+import os
+import queue
+import threading
+import time
+import typing
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import cudf
+
+from morpheus.common import FileTypes
+from morpheus.io import serializers
+from morpheus.utils.type_aliases import DataFrameType
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+# Marks the end of the input in the queue of the writer thread
+_CLOSE = object()
+
+
+def strip_compression_extension(filename: str) -> str:
+    """Removes the extension of a supported compression type from `filename`, if present."""
+    for extension in COMPRESSION_EXTENSIONS.values():
+        if (filename.endswith(extension)):
+            return filename[:-len(extension)]
+
+    return filename
+
+
+def _open_compressed(path: str, compression: typing.Optional[str]) -> typing.BinaryIO:
+    if (compression is None):
+        return open(path, "wb")
+
+    if (compression == "gzip"):
+        return gzip.open(path, "wb", compresslevel=6)
+
+    try:
+        import zstandard
+    except ImportError as ex:
+        raise ImportError("The 'zstandard' package is required for zstd compression") from ex
+
+    return zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+
+
+class RotatingFileWriter:
+    """
+    Writes DataFrames to files on a background thread, rotating the output file by size or age.
+
+    DataFrames passed to `write` are placed on a bounded queue. Serialization, compression and writes to disk are
+    performed by the writer thread, only blocking the caller when the queue is full. CSV and JSON lines output is
+    compressed as a stream, while Parquet output accumulates DataFrames until `row_group_rows` rows are buffered before
+    writing them as a single row group, using the Parquet compression codec.
+
+    When rotation is enabled, output files are named by inserting a sequence number before the extension of
+    `filename`, for example `output.00000.jsonlines.gz`, and each CSV file starts with its own header.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the output file. The extension of the compression type is added when not already present.
+    file_type : `morpheus.common.FileTypes`
+        Type of file to write, one of `FileTypes.CSV`, `FileTypes.JSON` or `FileTypes.PARQUET`.
+    include_index_col : bool, default = True
+        Write out the index as a column. Ignored for Parquet output.
+    compression : str, optional
+        Compression to apply, either "gzip" or "zstd". The "zstd" option for CSV and JSON output requires the
+        `zstandard` package.
+    max_file_bytes : int, optional
+        Rotate to a new file once this many bytes have been written to the current file, before compression.
+    max_file_age_sec : float, optional
+        Rotate to a new file once the current file has been open for this many seconds.
+    queue_size : int, default = 64
+        Maximum number of DataFrames waiting to be written.
+    row_group_rows : int, default = 100000
+        Minimum number of rows in each Parquet row group, except for the last row group of each file.
+    flush : bool, default = False
+        Flush the output file after writing each DataFrame.
+    """
+
+    def __init__(self,
+                 filename: str,
+                 file_type: FileTypes,
+                 include_index_col: bool = True,
+                 compression: str = None,
+                 max_file_bytes: int = None,
+                 max_file_age_sec: float = None,
+                 queue_size: int = 64,
+                 row_group_rows: int = 100000,
+                 flush: bool = False):
+
+        if (file_type not in (FileTypes.CSV, FileTypes.JSON, FileTypes.PARQUET)):
+            raise NotImplementedError(f"Unsupported file type: {file_type}")
+
+        if (compression is not None and compression not in COMPRESSION_EXTENSIONS):
+            raise ValueError(f"Unsupported compression '{compression}'. "
+                             f"Available options are: {list(COMPRESSION_EXTENSIONS.keys())}")
+
+        if (max_file_bytes is not None and max_file_bytes < 1):
+            raise ValueError("max_file_bytes must be at least 1")
+
+        if (max_file_age_sec is not None and max_file_age_sec <= 0):
+            raise ValueError("max_file_age_sec must be positive")
+
+        if (queue_size < 1 or row_group_rows < 1):
+            raise ValueError("queue_size and row_group_rows must be at least 1")
+
+        self._file_type = file_type
+        self._include_index_col = include_index_col
+        self._compression = compression
+        self._max_file_bytes = max_file_bytes
+        self._max_file_age_sec = max_file_age_sec
+        self._row_group_rows = row_group_rows
+        self._flush = flush
+
+        # Parquet files are compressed internally, instead of compressing the whole file
+        if (compression is not None and file_type != FileTypes.PARQUET):
+            filename = strip_compression_extension(filename) + COMPRESSION_EXTENSIONS[compression]
+
+        self._filename = filename
+        self._rotate = (max_file_bytes is not None or max_file_age_sec is not None)
+        self._file_paths: typing.List[str] = []
+
+        # State owned by the writer thread
+        self._file: typing.Optional[typing.BinaryIO] = None
+        self._parquet_writer: typing.Optional[pq.ParquetWriter] = None
+        self._pending_tables: typing.List[pa.Table] = []
+        self._pending_rows = 0
+        self._file_bytes = 0
+        self._file_opened_at = 0.0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._error: typing.Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="RotatingFileWriter", daemon=True)
+        self._thread.start()
+
+    @property
+    def file_paths(self) -> typing.List[str]:
+        """Paths of the files which have been created, in order."""
+        return list(self._file_paths)
+
+    def __enter__(self) -> "RotatingFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _raise_error(self):
+        if (self._error is not None):
+            raise RuntimeError("Error writing to the output file") from self._error
+
+    def write(self, df: DataFrameType):
+        """
+        Queues `df` to be written, blocking while the queue is full. Raises any error which occurred while writing a
+        previous DataFrame.
+
+        The writer thread reads `df` after this method returns, and so the caller should not modify it.
+        """
+        if (self._closed):
+            raise RuntimeError("Cannot write to a closed RotatingFileWriter")
+
+        while (True):
+            self._raise_error()
+
+            try:
+                self._queue.put(df, timeout=0.1)
+                return
+            except queue.Full:
+                if (not self._thread.is_alive()):
+                    self._raise_error()
+                    raise RuntimeError("The writer thread has stopped") from None
+
+    def close(self):
+        """Writes all queued DataFrames and closes the output file. Raises any error which occurred while writing."""
+        if (not self._closed):
+            self._closed = True
+
+            while (self._thread.is_alive()):
+                try:
+                    self._queue.put(_CLOSE, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+            self._thread.join()
+
+        self._raise_error()
+
+    def _get_path(self) -> str:
+        if (not self._rotate):
+            return self._filename
+
+        # Insert the sequence number before all of the extensions, keeping the file type and compression extensions
+        (directory, name) = os.path.split(self._filename)
+        (stem, dot, extensions) = name.partition(".")
+
+        return os.path.join(directory, f"{stem}.{len(self._file_paths):05d}{dot}{extensions}")
+
+    def _open_file(self):
+        path = self._get_path()
+
+        directory = os.path.dirname(path)
+        if (len(directory) > 0):
+            os.makedirs(directory, exist_ok=True)
+
+        if (self._file_type != FileTypes.PARQUET):
+            self._file = _open_compressed(path, self._compression)
+
+        self._file_paths.append(path)
+        self._file_bytes = 0
+        self._file_opened_at = time.monotonic()
+
+        logger.debug("Opened output file '%s'", path)
+
+    def _close_file(self):
+        if (self._file_type == FileTypes.PARQUET):
+            self._write_row_group()
+
+            if (self._parquet_writer is not None):
+                self._parquet_writer.close()
+                self._parquet_writer = None
+        elif (self._file is not None):
+            self._file.close()
+            self._file = None
+
+        self._file_opened_at = 0.0
+
+    def _is_file_open(self) -> bool:
+        return self._file_opened_at > 0.0
+
+    def _should_rotate(self) -> bool:
+        if (not self._rotate or not self._is_file_open()):
+            return False
+
+        if (self._max_file_bytes is not None and self._file_bytes >= self._max_file_bytes):
+            return True
+
+        return (self._max_file_age_sec is not None
+                and time.monotonic() - self._file_opened_at >= self._max_file_age_sec)
+
+    def _write_row_group(self):
+        if (self._pending_rows == 0):
+            return
+
+        table = pa.concat_tables(self._pending_tables)
+        self._pending_tables = []
+        self._pending_rows = 0
+
+        if (self._parquet_writer is None):
+            self._parquet_writer = pq.ParquetWriter(self._file_paths[-1],
+                                                    table.schema,
+                                                    compression=self._compression or "snappy")
+
+        self._parquet_writer.write_table(table, row_group_size=table.num_rows)
+        self._file_bytes += table.nbytes
+
+    def _write_df(self, df: DataFrameType):
+        if (self._file_type == FileTypes.PARQUET):
+            if (isinstance(df, cudf.DataFrame)):
+                table = df.to_arrow(preserve_index=False)
+            else:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+
+            # Keep the schema of the first table, so the buffered tables can be concatenated
+            if (len(self._pending_tables) > 0 and table.schema != self._pending_tables[0].schema):
+                table = table.cast(self._pending_tables[0].schema)
+
+            self._pending_tables.append(table)
+            self._pending_rows += table.num_rows
+
+            if (self._pending_rows >= self._row_group_rows):
+                self._write_row_group()
+
+            return
+
+        if (self._file_type == FileTypes.JSON):
+            records = serializers.df_to_json_bytes(df, include_index_col=self._include_index_col)
+        else:
+            records = serializers.df_to_csv_bytes(df,
+                                                  include_header=self._file_bytes == 0,
+                                                  include_index_col=self._include_index_col)
+
+        buffer = records.buffer
+        self._file.write(buffer)
+        self._file_bytes += len(buffer)
+
+        if (self._flush):
+            self._file.flush()
+
+    def _run(self):
+        # Wake periodically to rotate files by age, even when no data is arriving
+        timeout = min(self._max_file_age_sec, 1.0) if self._max_file_age_sec is not None else None
+
+        try:
+            while (True):
+                try:
+                    df = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    df = None
+
+                if (self._should_rotate()):
+                    self._close_file()
+
+                if (df is None):
+                    continue
+
+                if (df is _CLOSE):
+                    break
+
+                if (not self._is_file_open()):
+                    self._open_file()
+
+                self._write_df(df)
+        except BaseException as ex:  # pylint: disable=broad-except
+            logger.exception("Error writing to the output file")
+            self._error = ex
+        finally:
+            try:
+                self._close_file()
+            except BaseException as ex:  # pylint: disable=broad-except
+                if (self._error is None):
+                    self._error = ex
@@ -14,10 +14,14 @@
 # limitations under the License.
 """DataFrame serializers."""
 
+import dataclasses
 import typing
+from io import BytesIO
 from io import IOBase
 from io import StringIO
 
+import numpy as np
+
 import cudf
 
 from morpheus.common import FileTypes
@@ -153,34 +157,229 @@ def df_to_json(df: DataFrameType, strip_newlines=False, include_index_col=True)
     return results
 
 
-def df_to_parquet(df: DataFrameType, strip_newlines=False) -> typing.List[str]:
+def df_to_parquet(df: DataFrameType, strip_newlines=False) -> bytes:  # pylint: disable=unused-argument
     """
-    Serializes a DataFrame into Parquet and returns the serialized output seperated by lines.
+    Serializes a DataFrame into Parquet and returns the serialized output.
 
     Parameters
     ----------
     df : DataFrameType
         Input DataFrame to serialize.
     strip_newlines : bool, optional
-        Whether or not to strip the newline characters from each string, by default False.
+        Unused, Parquet is a binary format which is not separated into lines.
     Returns
     -------
-    typing.List[str]
-        List of strings for each line.
+    bytes
+        The Parquet file contents.
     """
-    str_buf = StringIO()
+    bytes_buf = BytesIO()
 
-    df_to_stream_parquet(df=df, stream=str_buf)
+    df_to_stream_parquet(df=df, stream=bytes_buf)
 
-    # Start from beginning
-    str_buf.seek(0)
+    return bytes_buf.getvalue()
 
-    # Return list of strs to write out
-    results = str_buf.readlines()
-    if strip_newlines:
-        results = [line.rstrip("\n") for line in results]
 
-    return results
+@dataclasses.dataclass
+class SerializedRecords:
+    """
+    Rows of a DataFrame serialized into a single contiguous buffer, along with the offset of each record in the buffer.
+    Each record includes its trailing newline.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized output, including the header when there is one.
+    offsets : np.ndarray
+        Offsets of the records in `data`, record `i` spans `data[offsets[i]:offsets[i + 1]]`. The first offset is the
+        length of the header.
+    """
+
+    data: bytes
+    offsets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> memoryview:
+        """Returns a view of record `index` without copying it."""
+        if (index < 0):
+            index += len(self)
+
+        if (index < 0 or index >= len(self)):
+            raise IndexError("record index out of range")
+
+        return memoryview(self.data)[self.offsets[index]:self.offsets[index + 1]]
+
+    def __iter__(self) -> typing.Iterator[memoryview]:
+        view = memoryview(self.data)
+        offsets = self.offsets.tolist()
+
+        for (start, stop) in zip(offsets[:-1], offsets[1:]):
+            yield view[start:stop]
+
+    @property
+    def header(self) -> memoryview:
+        """View of the header, empty when the output does not include a header."""
+        return memoryview(self.data)[:self.offsets[0]]
+
+    @property
+    def buffer(self) -> memoryview:
+        """View of the header and all of the records, suitable for writing to a file with a single call."""
+        return memoryview(self.data)[:self.offsets[-1]]
+
+    def to_list(self, strip_newlines: bool = False) -> typing.List[bytes]:
+        """
+        Copies each record into a separate bytes object.
+
+        Parameters
+        ----------
+        strip_newlines : bool, optional
+            Whether or not to strip the trailing newline from each record, by default False.
+
+        Returns
+        -------
+        typing.List[bytes]
+            List of the records.
+        """
+        offsets = self.offsets.tolist()
+
+        if (not strip_newlines or len(offsets) < 2):
+            return [self.data[start:stop] for (start, stop) in zip(offsets[:-1], offsets[1:])]
+
+        # Every record ends with a newline, except possibly the last
+        stops = [stop - 1 for stop in offsets[1:]]
+        if (self.data[offsets[-1] - 1:offsets[-1]] != b"\n"):
+            stops[-1] += 1
+
+        return [self.data[start:stop] for (start, stop) in zip(offsets[:-1], stops)]
+
+
+def _find_records(data: bytes, start: int, quoted: bool) -> np.ndarray:
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == ord("\n"))
+
+    if (quoted and b'"' in data):
+        # Quoted CSV fields can contain newlines. Quotes inside of a field are escaped by doubling them, so a newline
+        # ends a record only when it is preceded by an even number of quotes
+        num_quotes = np.cumsum(buf == ord('"'))
+        newlines = newlines[num_quotes[newlines] % 2 == 0]
+
+    newlines = newlines[newlines >= start]
+
+    offsets = np.empty(len(newlines) + 2, dtype=np.int64)
+    offsets[0] = start
+    offsets[1:-1] = newlines + 1
+    offsets[-1] = len(data)
+
+    # Drop the empty record following the final newline. Records containing only whitespace are kept
+    if (len(offsets) > 1 and offsets[-2] == offsets[-1]):
+        offsets = offsets[:-1]
+
+    return offsets
+
+
+def df_to_csv_bytes(df: DataFrameType, include_header=False, include_index_col=True) -> SerializedRecords:
+    """
+    Serializes a DataFrame into UTF-8 encoded CSV, returning a single buffer along with the offset of each row.
+
+    Parameters
+    ----------
+    df : DataFrameType
+        Input DataFrame to serialize.
+    include_header : bool, optional
+        Whether or not to include the header, by default False.
+    include_index_col: bool, optional
+        Write out the index as a column, by default True.
+
+    Returns
+    -------
+    SerializedRecords
+        The serialized rows.
+    """
+    data = df.to_csv(header=include_header, index=include_index_col).encode("utf-8")
+
+    header_len = 0
+    if (include_header):
+        header = df.iloc[:0].to_csv(header=True, index=include_index_col).encode("utf-8")
+        header_len = len(header) if data.startswith(header) else 0
+
+    return SerializedRecords(data=data, offsets=_find_records(data, header_len, quoted=True))
+
+
+def df_to_json_bytes(df: DataFrameType, include_index_col=True) -> SerializedRecords:
+    """
+    Serializes a DataFrame into UTF-8 encoded JSON lines, returning a single buffer along with the offset of each row.
+
+    Parameters
+    ----------
+    df : DataFrameType
+        Input DataFrame to serialize.
+    include_index_col: bool, optional
+        Write out the index as a column, by default True.
+        Note: This value is currently being ignored due to a known issue in Pandas:
+        https://github.com/pandas-dev/pandas/issues/37600
+
+    Returns
+    -------
+    SerializedRecords
+        The serialized rows.
+    """
+    data = df.to_json(orient="records", lines=True, index=include_index_col).encode("utf-8")
+
+    if (len(df) == 0):
+        # pandas writes a single newline for an empty DataFrame, which isn't a record
+        return SerializedRecords(data=data, offsets=np.zeros(1, dtype=np.int64))
+
+    # Newlines can not appear inside of a JSON encoded record
+    return SerializedRecords(data=data, offsets=_find_records(data, 0, quoted=False))
+
+
+def df_to_stream_chunks(df: DataFrameType,
+                        stream: typing.BinaryIO,
+                        file_type: FileTypes,
+                        include_header=False,
+                        include_index_col=True,
+                        chunk_rows: int = 100000) -> typing.BinaryIO:
+    """
+    Serializes a DataFrame into CSV or JSON lines, writing UTF-8 encoded output to the binary stream `chunk_rows`
+    rows at a time. This bounds the size of the intermediate buffers when serializing large DataFrames.
+
+    Parameters
+    ----------
+    df : DataFrameType
+        Input DataFrame to serialize.
+    stream : typing.BinaryIO
+        The binary stream where the serialized DataFrame will be written to.
+    file_type : `morpheus.common.FileTypes`
+        The type of serialization to use, either `FileTypes.CSV` or `FileTypes.JSON`.
+    include_header : bool, optional
+        Whether or not to include the CSV header, by default False.
+    include_index_col: bool, optional
+        Write out the index as a column, by default True.
+    chunk_rows : int, optional
+        Maximum number of rows to serialize at a time, by default 100000.
+    """
+    if (chunk_rows < 1):
+        raise ValueError("chunk_rows must be at least 1")
+
+    for start in range(0, max(len(df), 1), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+
+        if (file_type == FileTypes.JSON):
+            if (len(chunk) == 0):
+                break
+
+            records = df_to_json_bytes(chunk, include_index_col=include_index_col)
+        elif (file_type == FileTypes.CSV):
+            records = df_to_csv_bytes(chunk,
+                                      include_header=include_header and start == 0,
+                                      include_index_col=include_index_col)
+        else:
+            raise NotImplementedError(f"Unsupported file type: {file_type}")
+
+        stream.write(records.buffer)
+
+    return stream
 
 
 def write_df_to_file(df: DataFrameType, file_name: str, file_type: FileTypes = FileTypes.Auto, **kwargs):
@@ -198,7 +397,7 @@ def write_df_to_file(df: DataFrameType, file_name: str, file_type: FileTypes = F
         filename extension
     **kwargs : dict
         Additional arguments forwarded to the underlying serialization function. Where the underlying serialization
-        function is one of `write_df_to_file_cpp`, `df_to_stream_csv`, or `df_to_stream_json`.
+        function is one of `write_df_to_file_cpp` or `df_to_stream_chunks`.
     """
     if (CppConfig.get_should_use_cpp() and isinstance(df, cudf.DataFrame)):
         # Use the C++ implementation
@@ -209,11 +408,11 @@ def write_df_to_file(df: DataFrameType, file_name: str, file_type: FileTypes = F
     if (mode == FileTypes.Auto):
         mode = determine_file_type(file_name)
 
-    with open(file_name, mode="w", encoding='UTF-8') as f:
+    with open(file_name, mode="wb") as f:
 
-        if (mode == FileTypes.JSON):
-            df_to_stream_json(df=df, stream=f, **kwargs)
-        elif (mode == FileTypes.CSV):
-            df_to_stream_csv(df=df, stream=f, **kwargs)
+        if (mode in (FileTypes.JSON, FileTypes.CSV)):
+            df_to_stream_chunks(df=df, stream=f, file_type=mode, **kwargs)
+        elif (mode == FileTypes.PARQUET):
+            df_to_stream_parquet(df=df, stream=f)
         else:
             assert False, "Unsupported filetype"
@@ -30,6 +30,7 @@ import cudf
 
 from morpheus._lib.common import FileTypes
 from morpheus.cli.utils import str_to_file_type
+from morpheus.io.dataframe_cache import DataFrameCache
 from morpheus.io.deserializers import read_file_to_df
 from morpheus.messages import ControlMessage
 from morpheus.messages.message_meta import MessageMeta
@@ -40,6 +41,33 @@ from morpheus.utils.loader_utils import register_loader
 
 logger = logging.getLogger(__name__)
 
+# Batch caches are reused between calls to avoid rescanning the cache directory for each control message
+_BATCH_CACHES: typing.Dict[typing.Tuple[str, str, typing.Optional[int]], DataFrameCache] = {}
+
+
+def _get_batch_cache(cache_dir: str, file_format: str, max_size_bytes: typing.Optional[int]) -> DataFrameCache:
+    key = (os.path.abspath(cache_dir), file_format, max_size_bytes)
+
+    if (key not in _BATCH_CACHES):
+        _BATCH_CACHES[key] = DataFrameCache(cache_dir, file_format=file_format, max_size_bytes=max_size_bytes)
+
+    return _BATCH_CACHES[key]
+
+
+# Downloaders are shared between calls so that the executor used by the thread_pool and process_pool download methods is
+# only created once per process
+_DOWNLOADERS: typing.Dict[typing.Optional[str], Downloader] = {}
+
+
+def _get_downloader() -> Downloader:
+    # The download method is read from the environment by the Downloader
+    key = os.environ.get("MORPHEUS_FILE_DOWNLOAD_TYPE")
+
+    if (key not in _DOWNLOADERS):
+        _DOWNLOADERS[key] = Downloader()
+
+    return _DOWNLOADERS[key]
+
 
 @register_loader(FILE_TO_DF_LOADER)
 def file_to_df_loader(control_message: ControlMessage, task: dict):
@@ -88,7 +116,7 @@ def file_to_df_loader(control_message: ControlMessage, task: dict):
     parser_kwargs = config.get("parser_kwargs", None)
     cache_dir = config.get("cache_dir", None)
 
-    downloader = Downloader()
+    downloader = _get_downloader()
 
     if (cache_dir is None):
         cache_dir = "./.cache"
@@ -96,6 +124,10 @@ def file_to_df_loader(control_message: ControlMessage, task: dict):
 
     cache_dir = os.path.join(cache_dir, "file_cache")
 
+    batch_cache = _get_batch_cache(os.path.join(cache_dir, "batches"),
+                                   config.get("cache_format", "arrow"),
+                                   config.get("cache_max_size_bytes", None))
+
     # Load input schema
     schema = pickle.loads(bytes(schema_str, encoding))
 
@@ -154,11 +186,9 @@ def file_to_df_loader(control_message: ControlMessage, task: dict):
         # Convert to base 64 encoding to remove - values
         objects_hash_hex = hashlib.md5(json.dumps(hash_data, sort_keys=True).encode()).hexdigest()
 
-        batch_cache_location = os.path.join(cache_dir, "batches", f"{objects_hash_hex}.pkl")
-
         # Return the cache if it exists
-        if (os.path.exists(batch_cache_location)):
-            output_df = pd.read_pickle(batch_cache_location)
+        output_df = batch_cache.get(objects_hash_hex)
+        if (output_df is not None):
             output_df["origin_hash"] = objects_hash_hex
             # output_df["batch_count"] = batch_count
 
@@ -191,12 +221,7 @@ def file_to_df_loader(control_message: ControlMessage, task: dict):
         output_df.reset_index(drop=True, inplace=True)
 
         # Save dataframe to cache future runs
-        os.makedirs(os.path.dirname(batch_cache_location), exist_ok=True)
-
-        try:
-            output_df.to_pickle(batch_cache_location)
-        except Exception:
-            logger.warning("Failed to save batch cache. Skipping cache for this batch.", exc_info=True)
+        batch_cache.put(objects_hash_hex, output_df)
 
         # output_df["batch_count"] = batch_count
         output_df["origin_hash"] = objects_hash_hex
@@ -57,8 +57,10 @@ from .ae_module import AEModule
 from .ae_module import CompleteLayer
 from .autoencoder import AutoEncoder
 from .dataframe import EncoderDataFrame
+from .dataframe import SwapNoise
 from .dataloader import DatasetFromDataframe
 from .dataloader import DatasetFromPath
+from .dataloader import DatasetFromTensors
 from .dataloader import DFEncoderDataLoader
 from .distributed_ae import DistributedAutoEncoder
 from .logging import BasicLogger
@@ -68,14 +70,19 @@ from .scalers import GaussRankScaler
 from .scalers import ModifiedScaler
 from .scalers import NullScaler
 from .scalers import StandardScaler
+from .training_executor import TrainingExecutor
+from .training_executor import TrainingResult
+from .training_executor import fit_autoencoder
 
 __all__ = [
     "AEModule",
     "CompleteLayer",
     "AutoEncoder",
     "EncoderDataFrame",
+    "SwapNoise",
     "DatasetFromDataframe",
     "DatasetFromPath",
+    "DatasetFromTensors",
     "DFEncoderDataLoader",
     "DistributedAutoEncoder",
     "BasicLogger",
@@ -85,4 +92,7 @@ __all__ = [
     "ModifiedScaler",
     "NullScaler",
     "StandardScaler",
+    "TrainingExecutor",
+    "TrainingResult",
+    "fit_autoencoder",
 ]
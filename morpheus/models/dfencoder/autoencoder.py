@@ -60,7 +60,9 @@ import tqdm
 
 from .ae_module import AEModule
 from .dataframe import EncoderDataFrame
+from .dataframe import SwapNoise
 from .dataloader import DatasetFromDataframe
+from .dataloader import DatasetFromTensors
 from .distributed_ae import DistributedAutoEncoder
 from .logging import BasicLogger
 from .logging import IpynbLogger
@@ -142,6 +144,8 @@ class AutoEncoder(torch.nn.Module):
             preset_numerical_scaler_params=None,
             binary_feature_list=None,
             loss_scaler='standard',  # scaler for the losses (z score)
+            preencode_data=False,  # encode the training data into tensors once, instead of once per batch
+            preencode_dir=None,  # optional directory to memory-map the pre-encoded training tensors from
             **kwargs):
         super().__init__(**kwargs)
 
@@ -180,6 +184,8 @@ class AutoEncoder(torch.nn.Module):
         self.preset_numerical_scaler_params = preset_numerical_scaler_params
 
         self.swap_p = swap_p
+        # Re-used across batches and epochs to avoid re-allocating the swap buffers
+        self.swap_noise = SwapNoise(likelihood=swap_p)
         self.batch_size = batch_size
         self.eval_batch_size = eval_batch_size
 
@@ -222,6 +228,9 @@ class AutoEncoder(torch.nn.Module):
 
         self.n_megabatches = n_megabatches
 
+        self.preencode_data = preencode_data
+        self.preencode_dir = preencode_dir
+
     def get_scaler(self, name):
         scalers = {
             'standard': StandardScaler,
@@ -542,6 +551,13 @@ class AutoEncoder(torch.nn.Module):
         Passes categories through embedding layers.
         """
         num, bin, codes = self.compute_targets(df)
+        return self.encode_targets(num, bin, codes)
+
+    def encode_targets(self, num, bin, codes):
+        """
+        Handles already encoded inputs, as returned by `compute_targets`.
+        Passes categories through embedding layers.
+        """
         embeddings = []
         for i, embedding_layer in enumerate(self.model.categorical_embedding.values()):
             emb = embedding_layer(codes[i])
@@ -553,6 +569,11 @@ class AutoEncoder(torch.nn.Module):
         x = torch.cat(num + bin + embeddings, dim=1)
         return x
 
+    def build_input_tensor_from_targets(self, num, bin, codes):
+        num, bin, embeddings = self.encode_targets(num, bin, codes)
+        x = torch.cat(num + bin + embeddings, dim=1)
+        return x
+
     def preprocess_train_data(self, df, shuffle_rows_in_batch=True):
         """ Wrapper function round `self.preprocess_data` feeding in the args suitable for a training set."""
         return self.preprocess_data(
@@ -602,7 +623,7 @@ class AutoEncoder(torch.nn.Module):
         if shuffle_rows_in_batch:
             df = df.sample(frac=1.0)
         df = EncoderDataFrame(df)
-        swapped_df = df.swap(likelihood=self.swap_p)
+        swapped_df = df.swap(likelihood=self.swap_p, swap_noise=self.swap_noise)
         swapped_input_tensor = self.build_input_tensor(swapped_df)
         num_target, bin_target, codes = self.compute_targets(df)
 
@@ -844,12 +865,16 @@ class AutoEncoder(torch.nn.Module):
         if self.optim is None:
             self._build_model(df)
 
-        if self.n_megabatches == 1:
+        train_dataset = None
+        if self.preencode_data:
+            # scale and encode the training data once, batches are then shuffled and swapped purely on tensors
+            train_dataset = DatasetFromTensors.get_train_dataset(self, df, mmap_dir=self.preencode_dir)
+        elif self.n_megabatches == 1:
             df = self.prepare_df(df)
 
         if run_validation and val is not None:
             val_df = self.prepare_df(val)
-            val_in = val_df.swap(likelihood=self.swap_p)
+            val_in = val_df.swap(likelihood=self.swap_p, swap_noise=self.swap_noise)
             msg = "Validating during training.\n"
             msg += "Computing baseline performance..."
             baseline = self.compute_baseline_performance(val_in, val_df)
@@ -865,13 +890,16 @@ class AutoEncoder(torch.nn.Module):
             self.train()
 
             LOG.debug(f'training epoch {i + 1}...')
-            df = df.sample(frac=1.0)
-            df = EncoderDataFrame(df)
-            if self.n_megabatches > 1:
-                self.train_megabatch_epoch(n_updates, df)
+            if train_dataset is not None:
+                self.train_dataset_epoch(n_updates, train_dataset)
             else:
-                input_df = df.swap(likelihood=self.swap_p)
-                self.train_epoch(n_updates, input_df, df)
+                df = df.sample(frac=1.0)
+                df = EncoderDataFrame(df)
+                if self.n_megabatches > 1:
+                    self.train_megabatch_epoch(n_updates, df)
+                else:
+                    input_df = df.swap(likelihood=self.swap_p, swap_noise=self.swap_noise)
+                    self.train_epoch(n_updates, input_df, df)
 
             if self.lr_decay is not None:
                 self.lr_decay.step()
@@ -1441,6 +1469,23 @@ class AutoEncoder(torch.nn.Module):
         if close:
             pbar.close()
 
+    def train_dataset_epoch(self, n_updates, dataset, pbar=None):
+        """Run an epoch over a pre-encoded `DatasetFromTensors`."""
+
+        if pbar is None and self.progress_bar:
+            close = True
+            pbar = tqdm.tqdm(total=n_updates)
+        else:
+            close = False
+
+        for data_d in dataset:
+            self._fit_batch(**data_d['data'])
+
+            if self.progress_bar:
+                pbar.update(1)
+        if close:
+            pbar.close()
+
     def train_megabatch_epoch(self, n_updates, df):
         """
         Run epoch doing 'megabatch' updates, preprocessing data in large
@@ -1464,7 +1509,7 @@ class AutoEncoder(torch.nn.Module):
             megabatch_stop = int((i + 1) * megabatch_size)
             megabatch = df.iloc[megabatch_start:megabatch_stop]
             megabatch = self.prepare_df(megabatch)
-            input_df = megabatch.swap(self.swap_p)
+            input_df = megabatch.swap(self.swap_p, swap_noise=self.swap_noise)
             if i == (n_megabatches - 1):
                 n_updates = int(final_batch_size // batch_size)
                 if final_batch_size % batch_size > 0:
@@ -48,47 +48,171 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import typing
+
 import numpy as np
 import pandas as pd
 
 
-class EncoderDataFrame(pd.DataFrame):
+class SwapNoise(object):
+    """Column-wise swap-noise engine.
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    Columns are grouped into per-dtype NumPy blocks (categorical columns are swapped on their integer codes) and values
+    are gathered/scattered with flat `np.take`/`np.put` calls, avoiding the object-array round trip and the `astype` of
+    every column that a `DataFrame.values` based implementation requires. Working blocks and index buffers are kept
+    between calls and reused whenever a frame with the same shape and dtypes is swapped again, which is the common case
+    when the same training frame is swapped every epoch, or when fixed size batches are swapped.
+
+    Parameters
+    ----------
+    likelihood : float, optional
+        Default probability of a value being randomly replaced with a value from a different row, by default .15
+    seed : int, optional
+        Seed for a private random number generator. When `None` the global NumPy random state is used, which preserves
+        the behavior of `np.random.seed` for reproducibility, by default None
+    """
+
+    def __init__(self, likelihood: float = .15, seed: int = None):
+        self.likelihood = likelihood
+        self.seed = seed
+        self._random_state = np.random.RandomState(seed) if seed is not None else None
+        self._buffers = {}
+
+    def __getstate__(self):
+        # Don't pickle the working buffers, they are simply re-allocated on the next call to `swap`
+        state = self.__dict__.copy()
+        state['_buffers'] = {}
+        return state
+
+    def _randint(self, high: int, size: typing.Tuple[int, int]) -> np.ndarray:
+        if self._random_state is None:
+            return np.random.randint(0, high, size=size)
+
+        return self._random_state.randint(0, high, size=size)
+
+    def _get_buffer(self, key: typing.Hashable, shape: typing.Tuple[int, ...], dtype, order: str = 'C') -> np.ndarray:
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype, order=order)
+            self._buffers[key] = buffer
+
+        return buffer
+
+    @staticmethod
+    def _group_columns(df: pd.DataFrame) -> typing.Dict[np.dtype, typing.List[int]]:
+        """Groups the column positions of `df` by the dtype of the NumPy block their values will be swapped in."""
+        groups = {}
+        for (i, dtype) in enumerate(df.dtypes):
+            if isinstance(dtype, pd.CategoricalDtype):
+                block_dtype = df.iloc[:, i].cat.codes.dtype
+            elif isinstance(dtype, np.dtype):
+                block_dtype = dtype
+            else:
+                # Extension types other than categorical are swapped as python objects and converted back afterwards
+                block_dtype = np.dtype(object)
 
-    def swap(self, likelihood=.15):
+            groups.setdefault(block_dtype, []).append(i)
+
+        return groups
+
+    @staticmethod
+    def _column_values(col: pd.Series, block_dtype: np.dtype) -> np.ndarray:
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            return col.cat.codes.to_numpy()
+
+        return col.to_numpy(dtype=block_dtype)
+
+    def swap(self, df: pd.DataFrame, likelihood: float = None) -> "EncoderDataFrame":
         """Performs random swapping of data.
 
         Parameters
         ----------
+        df : pandas.DataFrame
+            The dataframe to swap values in. `df` is not modified.
         likelihood : float, optional
-            The probability of a value being randomly replaced with a value from a different row. By default .15
+            The probability of a value being randomly replaced with a value from a different row. When `None`, the
+            `likelihood` the engine was constructed with is used, by default None
 
         Returns
         -------
-        pandas.DataFrame
-            A copy of the dataframe with equal size.
+        EncoderDataFrame
+            A copy of the dataframe with equal size and dtypes.
         """
-        #select values to swap
-        tot_rows = self.__len__()
+        if likelihood is None:
+            likelihood = self.likelihood
+
+        tot_rows = len(df)
         n_rows = int(round(tot_rows * likelihood))
-        n_cols = len(self.columns)
+        n_cols = len(df.columns)
+
+        # Draw the random rows for every column at once, in the same order as the original dfencoder implementation
+        src_rows = self._randint(tot_rows, (n_rows, n_cols))
+        dst_rows = self._randint(tot_rows, (n_rows, n_cols))
+
+        swapped_cols = [None] * n_cols
+
+        for (block_dtype, positions) in self._group_columns(df).items():
+            n_block_cols = len(positions)
+
+            # Fortran ordered so that each column is contiguous and the block can be addressed as a flat array where
+            # element (row, col) lives at `row + col * tot_rows`
+            block = self._get_buffer(('block', block_dtype), (tot_rows, n_block_cols), block_dtype, order='F')
+            for (j, pos) in enumerate(positions):
+                block[:, j] = self._column_values(df.iloc[:, pos], block_dtype)
 
-        def gen_indices():
-            column = np.repeat(np.arange(n_cols).reshape(1, -1), repeats=n_rows, axis=0)
-            row = np.random.randint(0, tot_rows, size=(n_rows, n_cols))
-            return row, column
+            flat_block = block.ravel(order='F')
 
-        row, column = gen_indices()
-        new_mat = self.values
-        to_place = new_mat[row, column]
+            col_offsets = np.arange(n_block_cols, dtype=np.int64) * tot_rows
+            flat_idx = self._get_buffer(('flat_idx', block_dtype), (n_rows, n_block_cols), np.int64)
+            to_place = self._get_buffer(('to_place', block_dtype), (n_rows, n_block_cols), block_dtype)
 
-        row, column = gen_indices()
-        new_mat[row, column] = to_place
+            np.add(src_rows[:, positions], col_offsets, out=flat_idx)
+            np.take(flat_block, flat_idx, out=to_place, mode='clip')
 
-        dtypes = {col: typ for col, typ in zip(self.columns, self.dtypes)}
-        result = EncoderDataFrame(columns=self.columns, data=new_mat)
-        result = result.astype(dtypes, copy=False)
+            # `np.put` assigns sequentially, so repeated destinations keep the last value, just like fancy assignment.
+            # All indices are in range, the 'clip' mode just avoids the buffering performed by the default 'raise' mode
+            np.add(dst_rows[:, positions], col_offsets, out=flat_idx)
+            np.put(flat_block, flat_idx, to_place, mode='clip')
+
+            for (j, pos) in enumerate(positions):
+                dtype = df.dtypes.iat[pos]
+                values = block[:, j]
+                if isinstance(dtype, pd.CategoricalDtype):
+                    # Copy the codes since the block is re-used on the next call
+                    values = pd.Categorical.from_codes(values.copy(), dtype=dtype)
+                elif not isinstance(dtype, np.dtype):
+                    values = pd.array(values, dtype=dtype)
+
+                swapped_cols[pos] = values
+
+        result = EncoderDataFrame(dict(enumerate(swapped_cols)), index=df.index, copy=True)
+        result.columns = df.columns
 
         return result
+
+
+class EncoderDataFrame(pd.DataFrame):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def swap(self, likelihood=.15, swap_noise: SwapNoise = None):
+        """Performs random swapping of data.
+
+        Parameters
+        ----------
+        likelihood : float, optional
+            The probability of a value being randomly replaced with a value from a different row. By default .15
+        swap_noise : SwapNoise, optional
+            Engine used to perform the swap, allowing working buffers and random state to be reused across calls. When
+            `None` a new engine using the global NumPy random state is used, by default None
+
+        Returns
+        -------
+        pandas.DataFrame
+            A copy of the dataframe with equal size.
+        """
+        if swap_noise is None:
+            swap_noise = SwapNoise()
+
+        return swap_noise.swap(self, likelihood=likelihood)
@@ -17,6 +17,7 @@ import os
 
 import numpy as np
 import pandas as pd
+import torch
 from torch.utils.data import DataLoader
 from torch.utils.data import Dataset
 from torch.utils.data.distributed import DistributedSampler
@@ -607,3 +608,280 @@ class DatasetFromDataframe(Dataset):
         self._batch_size = model.eval_batch_size
         self._shuffle_rows_in_batch = False
         self._shuffle_batch_indices = False
+
+
+def swap_tensor(x, likelihood):
+    """Tensor equivalent of `EncoderDataFrame.swap`, randomly replaces values in each column of the 2-d tensor `x` with
+    values from other rows of the same column.
+
+    Parameters
+    ----------
+    x : torch.Tensor
+        2-d tensor of shape (rows, columns).
+    likelihood : float
+        The probability of a value being randomly replaced with a value from a different row.
+
+    Returns
+    -------
+    torch.Tensor
+        A copy of `x` with swapped values.
+    """
+    (n_rows, n_cols) = x.shape
+    n_swap = int(round(n_rows * likelihood))
+    result = x.clone()
+    if n_swap == 0 or n_cols == 0:
+        return result
+
+    columns = torch.arange(n_cols, device=x.device).expand(n_swap, n_cols)
+    src_rows = torch.randint(n_rows, (n_swap, n_cols), device=x.device)
+    dst_rows = torch.randint(n_rows, (n_swap, n_cols), device=x.device)
+    result[dst_rows, columns] = x[src_rows, columns]
+
+    return result
+
+
+class DatasetFromTensors(Dataset):
+
+    def __init__(
+        self,
+        num,
+        bin,
+        codes,
+        batch_size,
+        build_input_fn,
+        swap_p=.15,
+        shuffle_rows=True,
+        shuffle_batch_indices=False,
+        include_original_input_tensor=False,
+        include_swapped_input_by_feature_type=False,
+        device=None,
+    ):
+        """A dataset over a dataframe which has already been scaled and encoded into contiguous tensors, see
+        `DatasetFromTensors.get_train_dataset`. Batches are sliced, shuffled and swapped purely on tensors, avoiding the
+        per-batch pandas processing performed by `AutoEncoder.preprocess_data`.
+        * Like `DatasetFromDataframe`, this class returns one batch at a time when `__getitem__` is called. Swap noise
+          is applied within each batch, the same as it is for `DatasetFromDataframe`.
+
+        Parameters
+        ----------
+        num : torch.Tensor
+            Scaled numerical features, tensor of shape (rows, numerical feature count).
+        bin : torch.Tensor
+            Binary features as floats, tensor of shape (rows, binary feature count).
+        codes : torch.Tensor
+            Categorical codes, tensor of shape (rows, categorical feature count).
+        batch_size : int
+            The size of the batches to slice the data in.
+        build_input_fn : function
+            A function taking numerical, binary and categorical tensors and returning the model input tensor, typically
+            `AutoEncoder.build_input_tensor_from_targets`.
+        swap_p : float, optional
+            The probability of a value being randomly swapped, by default .15
+        shuffle_rows : bool, optional
+            Whether to shuffle the order of the rows at the start of every iteration through the dataset (or when
+            `shuffle` is called), by default True.
+        shuffle_batch_indices : bool, optional
+            Whether to shuffle the order when iterating through the dataset (affects the __iter__ functionality)
+            Should not matter when the dataset is fed into a dataloader and not used directly in the training loop.
+        include_original_input_tensor : bool, optional
+            Whether to include the input tensor without swapping in the returned data dict, by default False.
+        include_swapped_input_by_feature_type : bool, optional
+            Whether to include the swapped num/bin/cat feature tensors in the returned data dict, by default False.
+        device : torch.device, optional
+            Device the batches are moved to, by default the device of `num`.
+        """
+        self._num = num
+        self._bin = bin
+        self._codes = codes
+        self._build_input_fn = build_input_fn
+        self._swap_p = swap_p
+
+        self._count = len(self._num)
+        self._batch_size = batch_size
+        self._shuffle_rows = shuffle_rows
+        self._shuffle_batch_indices = shuffle_batch_indices
+        self._include_original_input_tensor = include_original_input_tensor
+        self._include_swapped_input_by_feature_type = include_swapped_input_by_feature_type
+        self._device = device if device is not None else num.device
+
+        self._row_order = None
+
+    @property
+    def num_samples(self):
+        """Returns the number of samples in the dataset. """
+        return self._count
+
+    def __len__(self):
+        """Returns the number of batches in the dataset.
+
+        Returns
+        -------
+        int
+            Number of batches in the dataset.
+        """
+        return int(np.ceil(self._count / self._batch_size))
+
+    def shuffle(self):
+        """Draws a new random order of the rows, this is called at the start of every iteration through the dataset if
+        `shuffle_rows` is True."""
+        self._row_order = torch.randperm(self._count, device=self._num.device)
+
+    def __iter__(self):
+        """Iterates through the whole dataset and yeild one batch at a time. The iteration order depends on
+        self.shuffle_batch_indices. Iterate in order if False, random order otherwise.
+
+        Yields
+        ------
+        Dict[str, Union[int, Dict[str, torch.Tensor]]]
+            A dictionary containing the preprocessed data for the current batch.
+            Example: {"batch_index": 0, "data": {"data1": tensor1, "data2": tensor2}}
+        """
+        if self._shuffle_rows:
+            self.shuffle()
+
+        indices = range(len(self))
+        if self._shuffle_batch_indices:
+            indices = np.arange(len(self))
+            np.random.shuffle(indices)
+
+        for i in indices:
+            yield self[i]
+
+    def __getitem__(self, idx):
+        """Gets the item (batch) at the given index in the dataset.
+
+        Parameters
+        ----------
+        idx : int
+            The index of the item to get.
+
+        Returns
+        -------
+        Dict[str, Union[int, Dict[str, torch.Tensor]]]
+            A dictionary containing the preprocessed data for the current batch.
+            Example: {"batch_index": 0, "data": {"data1": tensor1, "data2": tensor2}}
+        """
+        start = idx * self._batch_size
+        end = (idx + 1) * self._batch_size
+
+        if self._row_order is None:
+            rows = slice(start, end)
+        else:
+            rows = self._row_order[start:end]
+
+        num_target = self._num[rows].to(self._device)
+        bin_target = self._bin[rows].to(self._device)
+        codes = self._codes[rows].to(self._device)
+
+        num_swapped = swap_tensor(num_target, self._swap_p)
+        bin_swapped = swap_tensor(bin_target, self._swap_p)
+        codes_swapped = list(swap_tensor(codes, self._swap_p).unbind(dim=1))
+        cat_target = list(codes.unbind(dim=1))
+
+        data = {
+            'input_swapped': self._build_input_fn(num_swapped, bin_swapped, codes_swapped),
+            'num_target': num_target,
+            'bin_target': bin_target,
+            'cat_target': cat_target,
+            'size': len(num_target),
+        }
+
+        if self._include_original_input_tensor:
+            data['input_original'] = self._build_input_fn(num_target, bin_target, cat_target)
+
+        if self._include_swapped_input_by_feature_type:
+            data['num_swapped'] = num_swapped
+            data['bin_swapped'] = bin_swapped
+            data['cat_swapped'] = codes_swapped
+
+        return {"batch_index": idx, "data": data}
+
+    @staticmethod
+    def encode_df(model, df, mmap_dir=None):
+        """Scales and encodes `df` once into contiguous numerical, binary and categorical code tensors.
+
+        Parameters
+        ----------
+        model : AutoEncoder
+            A built autoencoder model, used for its feature definitions and `prepare_df` function.
+        df : pandas.DataFrame
+            The raw (unprepared) dataframe to encode.
+        mmap_dir : str, optional
+            When provided the tensors are backed by memory-mapped `.npy` files written to this directory rather than
+            held in memory, by default None.
+
+        Returns
+        -------
+        Tuple[torch.Tensor, torch.Tensor, torch.Tensor]
+            The numerical, binary and categorical code tensors.
+        """
+        prepared_df = model.prepare_df(df)
+        num_rows = len(prepared_df)
+
+        blocks = {
+            "num": (list(model.num_names), np.float32),
+            "bin": (list(model.bin_names), np.float32),
+            "codes": (list(model.categorical_fts.keys()), np.int64),
+        }
+
+        tensors = []
+        for (name, (columns, dtype)) in blocks.items():
+            shape = (num_rows, len(columns))
+            if mmap_dir is not None:
+                os.makedirs(mmap_dir, exist_ok=True)
+                arr = np.lib.format.open_memmap(os.path.join(mmap_dir, f"{name}.npy"),
+                                                mode="w+",
+                                                dtype=dtype,
+                                                shape=shape)
+            else:
+                arr = np.empty(shape, dtype=dtype)
+
+            for (i, col) in enumerate(columns):
+                values = prepared_df[col]
+                if name == "codes":
+                    values = values.cat.codes
+                arr[:, i] = values.to_numpy(dtype=dtype)
+
+            if mmap_dir is not None:
+                arr.flush()
+
+            tensors.append(torch.from_numpy(arr))
+
+        return tuple(tensors)
+
+    @staticmethod
+    def get_train_dataset(model, df, mmap_dir=None, shuffle_rows=True):
+        """A helper function to get a train dataset from a raw dataframe, encoding it once with `encode_df`.
+
+        Parameters
+        ----------
+        model : AutoEncoder
+            A built autoencoder model, used to get relevant params, feature definitions and the input building func.
+        df : pandas.DataFrame
+            Input dataframe used for the dataset.
+        mmap_dir : str, optional
+            When provided the encoded tensors are memory-mapped from this directory, by default None.
+        shuffle_rows : bool, optional
+            Whether to shuffle the rows at the start of every iteration, by default True.
+
+        Returns
+        -------
+        DatasetFromTensors
+            Training Dataset set up to load from the encoded tensors.
+        """
+        (num, bin, codes) = DatasetFromTensors.encode_df(model, df, mmap_dir=mmap_dir)
+
+        if mmap_dir is None:
+            # Keep everything on the model device to avoid a host to device copy per batch
+            (num, bin, codes) = (num.to(model.device), bin.to(model.device), codes.to(model.device))
+
+        return DatasetFromTensors(
+            num=num,
+            bin=bin,
+            codes=codes,
+            batch_size=model.batch_size,
+            build_input_fn=model.build_input_tensor_from_targets,
+            swap_p=model.swap_p,
+            shuffle_rows=shuffle_rows,
+            device=model.device,
+        )
@@ -18,13 +18,21 @@ import signal
 import sys
 
 
-def _wrap(fn, i, args, error_queue):
-
+def init_process():
+    """
+    Ensures the current (child) process is interrupted when its parent exits and that it is running with the correct
+    version of libstdc++. Suitable as the `initializer` of a `concurrent.futures.ProcessPoolExecutor`
+    """
     libc = ctypes.CDLL("libc.so.6")
     libc.prctl(1, signal.SIGINT)
 
     # Force import of libstdc++.so
-    libstdcpp = ctypes.CDLL("libstdc++.so.6")
+    ctypes.CDLL("libstdc++.so.6")
+
+
+def _wrap(fn, i, args, error_queue):
+
+    init_process()
 
     try:
         fn(i, *args)
@@ -0,0 +1,300 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import typing
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .multiprocessing import init_process
+
+LOG = logging.getLogger(__name__)
+
+
+def fit_autoencoder(model_kwargs: dict, train_df: pd.DataFrame, fit_kwargs: dict = None):
+    """Constructs and fits an `AutoEncoder`, suitable for submitting to a `TrainingExecutor`.
+
+    Parameters
+    ----------
+    model_kwargs : dict
+        Keyword arguments passed to the `AutoEncoder` constructor.
+    train_df : pandas.DataFrame
+        Training data.
+    fit_kwargs : dict, optional
+        Keyword arguments passed to `AutoEncoder.fit`, such as `epochs`, by default None.
+
+    Returns
+    -------
+    AutoEncoder
+        The trained model.
+    """
+    from .autoencoder import AutoEncoder
+
+    model = AutoEncoder(**model_kwargs)
+    model.fit(train_df, **(fit_kwargs or {}))
+
+    return model
+
+
+def _timed_call(fn: typing.Callable, args: tuple, kwargs: dict):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+@dataclasses.dataclass
+class TrainingResult:
+    """Outcome of a single job submitted to a `TrainingExecutor`."""
+
+    user_id: str
+    result: typing.Any = None
+    context: typing.Any = None
+    train_time: float = 0.0
+    error: BaseException = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class TrainingExecutor:
+    """
+    Fans per-user model training jobs out to a persistent pool of worker processes.
+
+    The number of jobs which are queued or training is bounded by `max_in_flight`, limiting the amount of training data
+    held in memory at once. Results are returned in the order they complete, or passed to `on_result` as they complete,
+    allowing callers to forward models for users which finished training without waiting on slower users.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of worker processes, by default `os.cpu_count()`.
+    max_in_flight : int, optional
+        Maximum number of submitted jobs which are either queued or training. Calls to `submit` block until a job
+        completes once this is reached, by default `2 * max_workers`.
+    mp_start_method : str, optional
+        Multiprocessing start method used for the worker processes. The default of 'spawn' is required when the workers
+        make use of CUDA, by default 'spawn'.
+    on_result : typing.Callable[[TrainingResult], None], optional
+        Called with the result of each job as soon as it completes, from a background thread of the pool. When set,
+        results are passed to `on_result` instead of being returned by `completed` and `wait_all`, by default None.
+    """
+
+    def __init__(self,
+                 max_workers: int = None,
+                 max_in_flight: int = None,
+                 mp_start_method: str = 'spawn',
+                 on_result: typing.Callable[[TrainingResult], None] = None):
+        self._max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self._max_in_flight = max_in_flight if max_in_flight is not None else 2 * self._max_workers
+
+        if (self._max_workers < 1):
+            raise ValueError(f"max_workers must be at least 1, got {self._max_workers}")
+
+        if (self._max_in_flight < 1):
+            raise ValueError(f"max_in_flight must be at least 1, got {self._max_in_flight}")
+
+        self._mp_context = multiprocessing.get_context(mp_start_method)
+        self._on_result = on_result
+
+        # Jobs complete on a background thread of the pool, guards the state below and signals completed jobs
+        self._cond = threading.Condition()
+
+        # The pool is created on first use and lives until `shutdown` is called
+        self._pool: ProcessPoolExecutor = None
+
+        self._pending: typing.Dict[Future, typing.Tuple[str, typing.Any]] = {}
+        self._done: typing.Deque[TrainingResult] = deque()
+
+        # Number of results currently being passed to `on_result`
+        self._num_handling = 0
+
+        self._start_time: float = None
+        self._completed_count = 0
+        self._failed_count = 0
+        self._total_train_time = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(cancel_futures=exc_type is not None)
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted jobs which are either queued or currently training."""
+        return len(self._pending)
+
+    @property
+    def completed_count(self) -> int:
+        return self._completed_count
+
+    @property
+    def failed_count(self) -> int:
+        return self._failed_count
+
+    @property
+    def users_per_second(self) -> float:
+        """Throughput of completed jobs since the first job was submitted."""
+        if self._start_time is None or self._completed_count == 0:
+            return 0.0
+
+        return self._completed_count / (time.perf_counter() - self._start_time)
+
+    @property
+    def mean_train_time(self) -> float:
+        """Average time in seconds spent by a worker on each successfully completed job."""
+        num_succeeded = self._completed_count - self._failed_count
+        if num_succeeded == 0:
+            return 0.0
+
+        return self._total_train_time / num_succeeded
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._max_workers,
+                                             mp_context=self._mp_context,
+                                             initializer=init_process)
+
+        return self._pool
+
+    def _is_idle(self) -> bool:
+        return len(self._pending) == 0 and self._num_handling == 0
+
+    def _on_done(self, future: Future):
+        with self._cond:
+            entry = self._pending.pop(future, None)
+
+            if entry is None:
+                # Discarded by `shutdown`
+                return
+
+            (user_id, context) = entry
+
+            try:
+                (result, train_time) = future.result()
+                training_result = TrainingResult(user_id=user_id, result=result, context=context, train_time=train_time)
+                self._total_train_time += train_time
+            except Exception as e:
+                # Failures are reported to the caller with the result
+                LOG.debug("Training job for user '%s' failed", user_id, exc_info=True)
+                training_result = TrainingResult(user_id=user_id, context=context, error=e)
+                self._failed_count += 1
+
+            self._completed_count += 1
+
+            if self._on_result is None:
+                self._done.append(training_result)
+            else:
+                self._num_handling += 1
+
+        if self._on_result is not None:
+            try:
+                self._on_result(training_result)
+            except Exception:
+                LOG.exception("Error handling the training result for user '%s'", user_id)
+
+        with self._cond:
+            # Only counted as handled once `on_result` returns, so `wait_all` waits on results being handled
+            if self._on_result is not None:
+                self._num_handling -= 1
+
+            self._cond.notify_all()
+
+    def submit(self, user_id: str, fn: typing.Callable, *args, context: typing.Any = None, **kwargs):
+        """
+        Submits `fn(*args, **kwargs)` to be run in a worker process. `fn` and its arguments must be picklable.
+
+        Blocks until a slot is available when `max_in_flight` jobs are already queued or training.
+
+        Parameters
+        ----------
+        user_id : str
+            Identifier for the job, returned with the `TrainingResult`.
+        fn : typing.Callable
+            Function to run in the worker process, such as `fit_autoencoder`.
+        *args
+            Positional arguments for `fn`.
+        context : typing.Any, optional
+            Arbitrary object returned with the `TrainingResult`. The context stays in the current process and is not
+            sent to the worker, by default None.
+        **kwargs
+            Keyword arguments for `fn`.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._pending) < self._max_in_flight)
+
+            if self._start_time is None:
+                self._start_time = time.perf_counter()
+
+            future = self._get_pool().submit(_timed_call, fn, args, kwargs)
+            self._pending[future] = (user_id, context)
+
+        # Added once the lock is released, since the callback runs immediately if the job has already completed
+        future.add_done_callback(self._on_done)
+
+    def completed(self) -> typing.Iterator[TrainingResult]:
+        """
+        Yields the results of jobs which have already completed, without blocking.
+        """
+        while True:
+            with self._cond:
+                if len(self._done) == 0:
+                    return
+
+                result = self._done.popleft()
+
+            yield result
+
+    def wait_all(self) -> typing.Iterator[TrainingResult]:
+        """
+        Yields the results of all outstanding jobs in the order they complete, blocking until every submitted job has
+        completed. When `on_result` is set, only blocks until every result has been passed to `on_result`.
+        """
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._done) > 0 or self._is_idle())
+
+                if len(self._done) == 0:
+                    return
+
+                result = self._done.popleft()
+
+            yield result
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """
+        Shuts down the worker processes. Any results which have not been read are discarded.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+            self._pool = None
+
+        with self._cond:
+            self._pending.clear()
+            self._done.clear()
+            self._cond.notify_all()
@@ -32,6 +32,7 @@ import cudf
 
 from morpheus.cli.utils import str_to_file_type
 from morpheus.common import FileTypes
+from morpheus.io.dataframe_cache import DataFrameCache
 from morpheus.io.deserializers import read_file_to_df
 from morpheus.utils.column_info import process_dataframe
 from morpheus.utils.downloader import Downloader
@@ -57,6 +58,9 @@ def file_to_df(builder: mrc.Builder):
     -----
     Configurable parameters:
         - cache_dir (str): Directory to cache the rolling window data.
+        - cache_format (str): Format of the cached batches, either "arrow" or "parquet". Default: "arrow".
+        - cache_max_size_bytes (int): Maximum size of the batch cache. Least recently used batches are evicted once
+            exceeded. Default: None (unbounded).
         - file_type (str): Type of the input file.
         - filter_null (bool): Whether to filter out null values.
         - parser_kwargs (dict): Keyword arguments to pass to the parser.
@@ -88,6 +92,10 @@ def file_to_df(builder: mrc.Builder):
 
     cache_dir = os.path.join(cache_dir, "file_cache")
 
+    batch_cache = DataFrameCache(os.path.join(cache_dir, "batches"),
+                                 file_format=config.get("cache_format", "arrow"),
+                                 max_size_bytes=config.get("cache_max_size_bytes", None))
+
     # Load input schema
     schema = pickle.loads(bytes(schema_str, encoding))
 
@@ -149,11 +157,9 @@ def file_to_df(builder: mrc.Builder):
         # Convert to base 64 encoding to remove - values
         objects_hash_hex = hashlib.md5(json.dumps(hash_data, sort_keys=True).encode()).hexdigest()
 
-        batch_cache_location = os.path.join(cache_dir, "batches", f"{objects_hash_hex}.pkl")
-
         # Return the cache if it exists
-        if (os.path.exists(batch_cache_location)):
-            output_df = pd.read_pickle(batch_cache_location)
+        output_df = batch_cache.get(objects_hash_hex)
+        if (output_df is not None):
             output_df["origin_hash"] = objects_hash_hex
             output_df["batch_count"] = batch_count
 
@@ -187,12 +193,7 @@ def file_to_df(builder: mrc.Builder):
         output_df.reset_index(drop=True, inplace=True)
 
         # Save dataframe to cache future runs
-        os.makedirs(os.path.dirname(batch_cache_location), exist_ok=True)
-
-        try:
-            output_df.to_pickle(batch_cache_location)
-        except Exception:
-            logger.warning("Failed to save batch cache. Skipping cache for this batch.", exc_info=True)
+        batch_cache.put(objects_hash_hex, output_df)
 
         output_df["batch_count"] = batch_count
         output_df["origin_hash"] = objects_hash_hex
@@ -222,8 +223,12 @@ def file_to_df(builder: mrc.Builder):
             logger.exception("Error while converting S3 buckets to DF.")
             raise
 
+    def on_completed():
+        logger.debug("Batch cache stats: %s", batch_cache.stats)
+        downloader.close()
+
     def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
-        obs.pipe(ops.map(convert_to_dataframe), ops.on_completed(downloader.close)).subscribe(sub)
+        obs.pipe(ops.map(convert_to_dataframe), ops.on_completed(on_completed)).subscribe(sub)
 
     node = builder.make_node(FILE_TO_DF, mrc.core.operators.build(node_fn))
 
@@ -26,6 +26,8 @@ import cudf
 from morpheus.common import FileTypes
 from morpheus.common import determine_file_type
 from morpheus.io import serializers
+from morpheus.io.rotating_file_writer import RotatingFileWriter
+from morpheus.io.rotating_file_writer import strip_compression_extension
 from morpheus.messages.message_meta import MessageMeta
 from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
 from morpheus.utils.module_ids import WRITE_TO_FILE
@@ -52,6 +54,13 @@ def write_to_file(builder: mrc.Builder):
             - flush (bool): If true, flush the file after each write; Example: `false`; Default: false
             - include_index_col (bool): If true, include the index column; Example: `false`; Default: true
             - overwrite (bool): If true, overwrite the file if it exists; Example: `true`; Default: false
+            - background_writer (bool): If true, write on a background thread; Example: `true`; Default: false
+            - queue_size (int): Maximum number of messages waiting for the background writer; Example: `128`;
+                Default: 64
+            - compression (str): Compress the output with `gzip` or `zstd`; Example: `gzip`; Default: None
+            - max_file_bytes (int): Rotate the output file after this many bytes; Example: `1073741824`; Default: None
+            - max_file_age_sec (float): Rotate the output file after this many seconds; Example: `3600`; Default: None
+            - parquet_row_group_rows (int): Rows per Parquet row group; Example: `500000`; Default: 100000
     """
     config = builder.get_current_module_config()
 
@@ -60,6 +69,14 @@ def write_to_file(builder: mrc.Builder):
     flush = config.get("flush", False)
     file_type = config.get("file_type", FileTypes.Auto)
     include_index_col = config.get("include_index_col", True)
+    background_writer = config.get("background_writer", False)
+    writer_kwargs = {
+        "compression": config.get("compression", None),
+        "max_file_bytes": config.get("max_file_bytes", None),
+        "max_file_age_sec": config.get("max_file_age_sec", None),
+        "queue_size": config.get("queue_size", 64),
+        "row_group_rows": config.get("parquet_row_group_rows", 100000),
+    }
 
     is_first = True
 
@@ -71,40 +88,57 @@ def write_to_file(builder: mrc.Builder):
                 f"Cannot output classifications to '{output_file}'. File exists and overwrite = False")
 
     if (file_type == FileTypes.Auto):
-        file_type = determine_file_type(output_file)
+        file_type = determine_file_type(strip_compression_extension(output_file))
 
-    def convert_to_strings(df: typing.Union[pd.DataFrame, cudf.DataFrame]):
+    use_writer = (background_writer or file_type == FileTypes.PARQUET
+                  or any(writer_kwargs[key] is not None
+                         for key in ("compression", "max_file_bytes", "max_file_age_sec")))
+
+    def convert_to_bytes(df: typing.Union[pd.DataFrame, cudf.DataFrame]) -> memoryview:
         nonlocal is_first
 
         if (file_type == FileTypes.JSON):
-            output_strs = serializers.df_to_json(df, include_index_col=include_index_col)
+            records = serializers.df_to_json_bytes(df, include_index_col=include_index_col)
         elif (file_type == FileTypes.CSV):
-            output_strs = serializers.df_to_csv(df, include_header=is_first, include_index_col=include_index_col)
+            records = serializers.df_to_csv_bytes(df, include_header=is_first, include_index_col=include_index_col)
         else:
             raise NotImplementedError(f"Unknown file type: {file_type}")
 
         is_first = False
 
-        # Remove any trailing whitespace
-        if (len(output_strs[-1].strip()) == 0):
-            output_strs = output_strs[:-1]
-
-        return output_strs
+        # Excludes any trailing whitespace
+        return records.buffer
 
     # Sink to file
 
+    def writer_node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
+
+        with RotatingFileWriter(output_file,
+                                file_type,
+                                include_index_col=include_index_col,
+                                flush=flush,
+                                **writer_kwargs) as writer:
+
+            def _write_to_file(x: MessageMeta):
+                # Downstream modules may modify the message before the writer thread has serialized it
+                writer.write(x.copy_dataframe())
+
+                return x
+
+            obs.pipe(ops.map(_write_to_file)).subscribe(sub)
+
+        # All queued messages have been written and the file closed by here
+
     def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
 
         # Ensure our directory exists
         os.makedirs(os.path.realpath(os.path.dirname(output_file)), exist_ok=True)
 
         # Open up the file handle
-        with open(output_file, "a", encoding='UTF-8') as out_file:
+        with open(output_file, "ab") as out_file:
 
             def _write_to_file(x: MessageMeta):
-                lines = convert_to_strings(x.df)
-
-                out_file.writelines(lines)
+                out_file.write(convert_to_bytes(x.df))
 
                 if flush:
                     out_file.flush()
@@ -115,7 +149,7 @@ def write_to_file(builder: mrc.Builder):
 
         # File should be closed by here
 
-    node = builder.make_node(WRITE_TO_FILE, mrc.core.operators.build(node_fn))
+    node = builder.make_node(WRITE_TO_FILE, mrc.core.operators.build(writer_node_fn if use_writer else node_fn))
 
     # Register input and output port for a module.
     builder.register_module_input("input", node)
@@ -14,17 +14,67 @@
 """Abstract class for all event log parsers."""
 
 import logging
+import re
 import typing
 from abc import ABC
 from abc import abstractmethod
 
+import pandas as pd
 import yaml
 
 import cudf
 
+from morpheus.utils.type_aliases import DataFrameType
+from morpheus.utils.type_aliases import SeriesType
+
 log = logging.getLogger(__name__)
 
 
+class _CompiledEventRegex:
+    """
+    The regular expressions for every column of an event type, compiled once and applied to each record in a single
+    pass over the text.
+
+    Parameters
+    ----------
+    event_regex: typing.Dict[str, any]
+        Regular expressions keyed by output column, the first group of each expression is the value of the column.
+    """
+
+    def __init__(self, event_regex: typing.Dict[str, any]):
+        self.columns = list(event_regex.keys())
+        self._searches = []
+
+        for (col, regex_pattern) in event_regex.items():
+            compiled = re.compile(regex_pattern)
+            if (compiled.groups == 0):
+                raise ValueError(f"Regex for column '{col}' does not contain a capture group: {regex_pattern}")
+
+            self._searches.append(compiled.search)
+
+    def extract(self, text: pd.Series) -> typing.Dict[str, list]:
+        """
+        Returns the values of each column for every record in `text`, None where a column's expression does not match.
+        """
+        searches = self._searches
+        rows = []
+        for value in text.tolist():
+            if (not isinstance(value, str)):
+                rows.append((None, ) * len(searches))
+                continue
+
+            row = []
+            for search in searches:
+                match = search(value)
+                row.append(match.group(1) if match is not None else None)
+
+            rows.append(row)
+
+        values = list(zip(*rows)) if len(rows) > 0 else [() for _ in searches]
+
+        return dict(zip(self.columns, values))
+
+
 class EventParser(ABC):
     """
     This is an abstract class for all event log parsers.
@@ -40,6 +90,7 @@ class EventParser(ABC):
     def __init__(self, columns: typing.Set[str], event_name: str):
         self._columns = columns
         self._event_name = event_name
+        self._compiled_regex: typing.Dict[tuple, _CompiledEventRegex] = {}
 
     @property
     def columns(self):
@@ -74,24 +125,28 @@ class EventParser(ABC):
         log.info("Begin parsing of dataframe")
         pass
 
-    def parse_raw_event(self, text: cudf.Series, event_regex: typing.Dict[str, any]) -> cudf.DataFrame:
+    def parse_raw_event(self, text: SeriesType, event_regex: typing.Dict[str, any]) -> DataFrameType:
         """
         Processes parsing of a specific type of raw event records received as a dataframe.
 
         Parameters
         ----------
-        text : cudf.Series
-            Raw event log text to be parsed.
+        text : typing.Union[pd.Series, cudf.Series]
+            Raw event log text to be parsed. pandas Series are parsed on the CPU, extracting every column in a single
+            pass over the records.
         event_regex: typing.Dict[str, any]
             Required regular expressions for a given event type.
 
         Returns
         -------
-        cudf.DataFrame
-            Parsed logs dataframe
+        typing.Union[pd.DataFrame, cudf.DataFrame]
+            Parsed logs dataframe, of the same library as `text`
         """
         log.debug("Parsing raw events. Event type: %s", self.event_name)
 
+        if (isinstance(text, pd.Series)):
+            return self._parse_raw_event_pandas(text, event_regex)
+
         parsed_gdf = cudf.DataFrame({col: [""] for col in self.columns})
         parsed_gdf = parsed_gdf[:0]
         event_specific_columns = event_regex.keys()
@@ -109,6 +164,66 @@ class EventParser(ABC):
 
         return parsed_gdf
 
+    def _get_compiled_regex(self, event_regex: typing.Dict[str, any]) -> _CompiledEventRegex:
+        key = tuple(event_regex.items())
+
+        compiled = self._compiled_regex.get(key)
+        if (compiled is None):
+            compiled = _CompiledEventRegex(event_regex)
+            self._compiled_regex[key] = compiled
+
+        return compiled
+
+    def _parse_raw_event_pandas(self, text: pd.Series, event_regex: typing.Dict[str, any]) -> pd.DataFrame:
+        extracted = self._get_compiled_regex(event_regex).extract(text)
+
+        parsed = {col: extracted.get(col, "") for col in self.columns}
+
+        return pd.DataFrame(parsed, index=text.index, columns=list(self.columns), dtype=object)
+
+    def parse_events(self,
+                     text: SeriesType,
+                     events_regex: typing.Dict[str, typing.Dict[str, any]],
+                     event_type_regex: str) -> DataFrameType:
+        """
+        Parses raw event records containing several types of events. Each record is routed to its event type with a
+        single pass of `event_type_regex` over the text, then parsed with the regular expressions of that type.
+
+        Parameters
+        ----------
+        text : typing.Union[pd.Series, cudf.Series]
+            Raw event log text to be parsed.
+        events_regex: typing.Dict[str, typing.Dict[str, any]]
+            Required regular expressions for each event type, keyed by event type.
+        event_type_regex: str
+            Regular expression whose first group extracts the event type of a record. Records with an event type not
+            contained in `events_regex` are dropped.
+
+        Returns
+        -------
+        typing.Union[pd.DataFrame, cudf.DataFrame]
+            Parsed logs dataframe, of the same library as `text`, grouped by event type in the order of `events_regex`
+        """
+        event_types = text.str.extract(event_type_regex, expand=True)[0]
+
+        output_chunks = []
+        for (event_type, event_regex) in events_regex.items():
+            input_chunk = text[event_types == str(event_type)]
+            if not input_chunk.empty:
+                temp = self.parse_raw_event(input_chunk, event_regex)
+                if not temp.empty:
+                    output_chunks.append(temp)
+
+        return self._concat(text, output_chunks)
+
+    def _concat(self, text: SeriesType, dfs: typing.List[DataFrameType]) -> DataFrameType:
+        df_lib = pd if isinstance(text, pd.Series) else cudf
+
+        if (len(dfs) == 0):
+            return df_lib.DataFrame({col: [] for col in self.columns}, dtype=str)
+
+        return df_lib.concat(dfs)
+
     def _load_regex_yaml(self, yaml_file) -> typing.Dict[str, any]:
         """Returns a dictionary of event regexes contained in the given yaml file."""
         with open(yaml_file, encoding='UTF-8') as yaml_file_h:
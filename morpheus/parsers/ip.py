@@ -13,9 +13,20 @@
 # limitations under the License.
 
 import numpy as np
+import pandas as pd
 
 import cudf
 
+from morpheus.parsers import ip_pandas
+
+
+def _is_pandas(values) -> bool:
+    """
+    Inputs which are pandas Series, or have already been parsed by `ip_pandas.parse_ips`, are processed on the CPU by
+    `morpheus.parsers.ip_pandas`, which also supports IPv6 addresses.
+    """
+    return isinstance(values, (pd.Series, ip_pandas.ParsedIPs))
+
 
 def ip_to_int(values):
     """
@@ -41,6 +52,9 @@ def ip_to_int(values):
     1    167772161
     dtype: int64
     """
+    if (_is_pandas(values)):
+        return ip_pandas.ip_to_int(values)
+
     return cudf.Series(values.str.ip2int())
 
 
@@ -68,6 +82,9 @@ def int_to_ip(values):
     1    10.0.0.1
     dtype: object
     """
+    if (_is_pandas(values)):
+        return ip_pandas.int_to_ip(values)
+
     return cudf.Series(values._column.int2ip())
 
 
@@ -95,6 +112,9 @@ def is_ip(ips: str):
     1    False
     dtype: bool
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.is_ip(ips)
+
     is_ip_regex = r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
     return ips.str.match(is_ip_regex)
 
@@ -123,6 +143,9 @@ def is_reserved(ips):
     1    False
     dtype: bool
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.is_reserved(ips)
+
     reserved_ipv4_regex = (
         r"^(2(4[0-9]|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])"
         r"|2([0-4][0-9]|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))$")
@@ -153,6 +176,9 @@ def is_loopback(ips):
     1    False
     dtype: bool
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.is_loopback(ips)
+
     loopback_ipv4_regex = (
         r"^127\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]"
         r"|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))$")
@@ -183,6 +209,9 @@ def is_link_local(ips):
     1    True
     dtype: bool
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.is_link_local(ips)
+
     link_local_ipv4_regex = (
         r"^169\.254\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4]"
         r"[0-9]|5[0-5]))$")
@@ -213,6 +242,9 @@ def is_unspecified(ips):
     1    False
     dtype: bool
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.is_unspecified(ips)
+
     unspecified_regex = r"^0\.0\.0\.0$"
     return ips.str.match(unspecified_regex)
 
@@ -241,6 +273,9 @@ def is_multicast(ips):
     1    True
     dtype: bool
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.is_multicast(ips)
+
     is_multicast_ipv4_regex = (
         r"^(2(2[4-9]|3[0-9]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])"
         r"|2([0-4][0-9]|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))$")
@@ -271,6 +306,9 @@ def is_private(ips):
     1    False
     dtype: bool
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.is_private(ips)
+
     private_regex = (
         r"((^0\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]"
         r"|5[0-5]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))$)|(^10\.([0-9]|[1-9][0-9]|1([0-9][0-9])|"
@@ -314,6 +352,9 @@ def is_global(ips):
     1    True
     dtype: bool
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.is_global(ips)
+
     is_global_regex = (
         r"^(100\.(6[4-9]|[7-9][0-9]|1([0-1][0-9]|2[0-7]))\.([0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))\.("
         r"[0-9]|[1-9][0-9]|1([0-9][0-9])|2([0-4][0-9]|5[0-5]))$)")
@@ -358,6 +399,9 @@ def netmask(ips, prefixlen=16):
     1    255.255.0.0
     Name: net_mask, dtype: object
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.netmask(ips, prefixlen=prefixlen)
+
     all_ones = (2**32) - 1
     mask_int = all_ones ^ (all_ones >> prefixlen)
     df = cudf.DataFrame()
@@ -413,6 +457,9 @@ def hostmask(ips, prefixlen=16):
     1    0.0.255.255
     Name: hostmask, dtype: object
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.hostmask(ips, prefixlen=prefixlen)
+
     all_ones = (2**32) - 1
     host_mask_int = int(all_ones ^ (all_ones >> prefixlen)) ^ all_ones
     df = cudf.DataFrame()
@@ -468,6 +515,9 @@ def mask(ips, masks):
     1       10.0.0.0
     Name: mask, dtype: object
     """
+    if (_is_pandas(ips)):
+        return ip_pandas.mask(ips, masks)
+
     df = cudf.DataFrame()
     df["int_mask"] = masks.str.ip2int()
     df["int_ip"] = ips.str.ip2int()
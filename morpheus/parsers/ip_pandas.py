@@ -0,0 +1,774 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+CPU implementation of `morpheus.parsers.ip` for pandas, supporting both IPv4 and IPv6 addresses.
+
+Addresses are parsed once into integers, IPv4 addresses into a uint32 and IPv6 addresses into a pair of uint64 values
+holding the high and low 64 bits. Every predicate is then evaluated as a set of vectorized CIDR checks against the
+parsed integers. Functions accept either a `pd.Series` of address strings or the result of `parse_ips`, allowing the
+same addresses to be checked multiple times without parsing them again. The address ranges follow the IANA special
+purpose address registries, IPv4-mapped IPv6 addresses are classified as IPv6 addresses.
+"""
+
+import dataclasses
+import ipaddress
+import typing
+
+import numpy as np
+import pandas as pd
+
+# Longest possible IPv4 address in dotted decimal notation
+_IPV4_MAX_LEN = 15
+
+_UINT64_MASK = (1 << 64) - 1
+
+
+@dataclasses.dataclass
+class ParsedIPs:
+    """
+    Integer representation of a series of IP addresses, as returned by `parse_ips`.
+
+    Attributes
+    ----------
+    version : np.ndarray
+        IP version of each address, 4 or 6. Entries which are not valid addresses are 0.
+    ipv4 : np.ndarray
+        uint32 value of each IPv4 address, 0 for any other entry.
+    ipv6_hi : np.ndarray
+        uint64 value of the high 64 bits of each IPv6 address, 0 for any other entry.
+    ipv6_lo : np.ndarray
+        uint64 value of the low 64 bits of each IPv6 address, 0 for any other entry.
+    index : pd.Index
+        Index of the parsed series.
+    """
+    version: np.ndarray
+    ipv4: np.ndarray
+    ipv6_hi: np.ndarray
+    ipv6_lo: np.ndarray
+    index: pd.Index
+
+    @property
+    def is_ipv4(self) -> np.ndarray:
+        return self.version == 4
+
+    @property
+    def is_ipv6(self) -> np.ndarray:
+        return self.version == 6
+
+
+IPType = typing.Union[pd.Series, ParsedIPs]
+
+
+def _parse_ipv4(values: pd.Series) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses dotted decimal IPv4 addresses, accepting the same strings as the regular expression used by
+    `morpheus.parsers.ip.is_ip`. Each character position is processed for all addresses at once.
+    """
+    num_values = len(values)
+    valid = np.zeros(num_values, dtype=bool)
+    result = np.zeros(num_values, dtype=np.uint32)
+
+    lengths = values.str.len().to_numpy(dtype=np.float64, na_value=np.nan)
+    candidates = np.flatnonzero((lengths >= 7) & (lengths <= _IPV4_MAX_LEN))
+
+    if (len(candidates) == 0):
+        return (valid, result)
+
+    encoded = values.iloc[candidates].str.encode("ascii", errors="replace").tolist()
+    chars = np.frombuffer(np.array(encoded, dtype=f"S{_IPV4_MAX_LEN}").tobytes(),
+                          dtype=np.uint8).reshape(-1, _IPV4_MAX_LEN)
+
+    num_candidates = len(candidates)
+    octets = np.zeros((num_candidates, 4), dtype=np.int64)
+    segment = np.zeros(num_candidates, dtype=np.int64)
+    current = np.zeros(num_candidates, dtype=np.int64)
+    num_digits = np.zeros(num_candidates, dtype=np.int64)
+    is_valid = np.ones(num_candidates, dtype=bool)
+    done = np.zeros(num_candidates, dtype=bool)
+    rows = np.arange(num_candidates)
+
+    # The extra iteration reads a null terminator for addresses using every character
+    for pos in range(_IPV4_MAX_LEN + 1):
+        char = chars[:, pos] if pos < _IPV4_MAX_LEN else np.zeros(num_candidates, dtype=np.uint8)
+
+        active = ~done
+        is_end = active & (char == 0)
+        is_dot = active & (char == ord("."))
+        is_digit = active & (char >= ord("0")) & (char <= ord("9"))
+        is_valid &= ~(active & ~(is_end | is_dot | is_digit))
+
+        current = np.where(is_digit, current * 10 + (char.astype(np.int64) - ord("0")), current)
+        num_digits += is_digit
+
+        # Each octet has between one and three digits, with a value no larger than 255
+        is_sep = is_end | is_dot
+        is_valid &= ~(is_sep & ((num_digits == 0) | (num_digits > 3) | (current > 255)))
+        is_valid &= ~(is_dot & (segment >= 3))
+        is_valid &= ~(is_end & (segment != 3))
+
+        write = is_sep & (segment <= 3)
+        octets[rows[write], segment[write]] = current[write]
+
+        segment += is_dot
+        current[is_sep] = 0
+        num_digits[is_sep] = 0
+        done |= is_end
+
+    ints = (octets[:, 0] << 24) | (octets[:, 1] << 16) | (octets[:, 2] << 8) | octets[:, 3]
+
+    valid[candidates] = is_valid
+    result[candidates] = np.where(is_valid, ints, 0).astype(np.uint32)
+
+    return (valid, result)
+
+
+def _parse_ipv6(values: pd.Series) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    num_values = len(values)
+    valid = np.zeros(num_values, dtype=bool)
+    hi = np.zeros(num_values, dtype=np.uint64)
+    lo = np.zeros(num_values, dtype=np.uint64)
+
+    candidates = np.flatnonzero(values.str.contains(":", regex=False).fillna(False).to_numpy(dtype=bool))
+
+    # Only called with unique values, and IPv6 addresses are expected to be a minority, the standard library parser
+    # handles the many valid textual forms
+    for i in candidates:
+        try:
+            address = int(ipaddress.IPv6Address(values.iat[i]))
+        except ValueError:
+            continue
+
+        valid[i] = True
+        hi[i] = address >> 64
+        lo[i] = address & _UINT64_MASK
+
+    return (valid, hi, lo)
+
+
+def parse_ips(ips: pd.Series) -> ParsedIPs:
+    """
+    Parses a series of IPv4 and IPv6 address strings into integers. Each distinct value is only parsed once.
+
+    Parameters
+    ----------
+    ips : pd.Series
+        IP addresses to be parsed. Entries which are not valid addresses, including nulls, are marked as version 0.
+
+    Returns
+    -------
+    ParsedIPs
+        Integer representation of the addresses.
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> parsed = ip_pandas.parse_ips(pd.Series(["192.168.0.1", "::1", "abc"]))
+    >>> parsed.version
+    array([4, 6, 0], dtype=int8)
+    """
+    if isinstance(ips, ParsedIPs):
+        return ips
+
+    (codes, uniques) = pd.factorize(ips)
+    uniques = pd.Series(uniques, dtype=object).where(lambda s: s.map(type) == str)
+
+    (v4_valid, v4_values) = _parse_ipv4(uniques)
+    (v6_valid, v6_hi, v6_lo) = _parse_ipv6(uniques)
+
+    version = np.where(v4_valid, 4, np.where(v6_valid, 6, 0)).astype(np.int8)
+
+    # Nulls are coded as -1, point them at an extra invalid entry
+    codes = np.where(codes < 0, len(uniques), codes)
+    version = np.append(version, np.int8(0))
+
+    return ParsedIPs(version=version[codes],
+                     ipv4=np.append(v4_values, np.uint32(0))[codes],
+                     ipv6_hi=np.append(v6_hi, np.uint64(0))[codes],
+                     ipv6_lo=np.append(v6_lo, np.uint64(0))[codes],
+                     index=ips.index)
+
+
+def _compile_networks(networks: typing.List[str]) -> typing.List[typing.Tuple[int, int, int]]:
+    """Converts CIDR strings into tuples of the IP version, network address and netmask as integers."""
+    compiled = []
+    for network in networks:
+        net = ipaddress.ip_network(network)
+        compiled.append((net.version, int(net.network_address), int(net.netmask)))
+
+    return compiled
+
+
+_RESERVED_NETWORKS = _compile_networks([
+    "240.0.0.0/4",
+    "::/8",
+    "100::/8",
+    "200::/7",
+    "400::/6",
+    "800::/5",
+    "1000::/4",
+    "4000::/3",
+    "6000::/3",
+    "8000::/3",
+    "a000::/3",
+    "c000::/3",
+    "e000::/4",
+    "f000::/5",
+    "f800::/6",
+    "fe00::/9",
+])
+_LOOPBACK_NETWORKS = _compile_networks(["127.0.0.0/8", "::1/128"])
+_LINK_LOCAL_NETWORKS = _compile_networks(["169.254.0.0/16", "fe80::/10"])
+_UNSPECIFIED_NETWORKS = _compile_networks(["0.0.0.0/32", "::/128"])
+_MULTICAST_NETWORKS = _compile_networks(["224.0.0.0/4", "ff00::/8"])
+_PRIVATE_NETWORKS = _compile_networks([
+    "0.0.0.0/8",
+    "10.0.0.0/8",
+    "127.0.0.0/8",
+    "169.254.0.0/16",
+    "172.16.0.0/12",
+    "192.0.0.0/29",
+    "192.0.0.170/31",
+    "192.0.2.0/24",
+    "192.168.0.0/16",
+    "198.18.0.0/15",
+    "198.51.100.0/24",
+    "203.0.113.0/24",
+    "240.0.0.0/4",
+    "255.255.255.255/32",
+    "::1/128",
+    "::/128",
+    "::ffff:0:0/96",
+    "100::/64",
+    "2001::/23",
+    "2001:2::/48",
+    "2001:db8::/32",
+    "2001:10::/28",
+    "fc00::/7",
+    "fe80::/10",
+])
+_SHARED_ADDRESS_NETWORKS = _compile_networks(["100.64.0.0/10"])
+
+
+def _in_networks(parsed: ParsedIPs, networks: typing.List[typing.Tuple[int, int, int]]) -> np.ndarray:
+    is_v4 = parsed.is_ipv4
+    is_v6 = parsed.is_ipv6
+    result = np.zeros(len(parsed.version), dtype=bool)
+
+    for (version, network, netmask_int) in networks:
+        if (version == 4):
+            result |= is_v4 & ((parsed.ipv4 & np.uint32(netmask_int)) == np.uint32(network))
+        else:
+            mask_hi = np.uint64(netmask_int >> 64)
+            mask_lo = np.uint64(netmask_int & _UINT64_MASK)
+            match = is_v6 & ((parsed.ipv6_hi & mask_hi) == np.uint64(network >> 64))
+
+            if (mask_lo != 0):
+                match &= (parsed.ipv6_lo & mask_lo) == np.uint64(network & _UINT64_MASK)
+
+            result |= match
+
+    return result
+
+
+def _to_series(parsed: ParsedIPs, values: np.ndarray, name=None) -> pd.Series:
+    return pd.Series(values, index=parsed.index, name=name)
+
+
+_OCTET_STRS = np.array([str(i) for i in range(256)], dtype=object)
+
+
+def _format_ipv4(values: np.ndarray) -> np.ndarray:
+    """Formats uint32 values as dotted decimal strings, formatting each distinct value once."""
+    (codes, uniques) = pd.factorize(values)
+    uniques = uniques.astype(np.uint32)
+
+    formatted = (_OCTET_STRS[uniques >> 24] + "." + _OCTET_STRS[(uniques >> 16) & 0xFF] + "." +
+                 _OCTET_STRS[(uniques >> 8) & 0xFF] + "." + _OCTET_STRS[uniques & 0xFF])
+
+    return formatted[codes]
+
+
+def _format_ipv6(hi: np.ndarray, lo: np.ndarray) -> np.ndarray:
+    return np.array([str(ipaddress.IPv6Address((int(h) << 64) | int(l))) for (h, l) in zip(hi, lo)], dtype=object)
+
+
+def ip_to_int(values: IPType) -> pd.Series:
+    """
+    Convert a series of IPv4 addresses to integer values. Entries which are not IPv4 addresses are converted to 0.
+
+    Parameters
+    ----------
+    values : typing.Union[pd.Series, ParsedIPs]
+        IPv4 addresses to be converted
+
+    Returns
+    -------
+    pd.Series
+        Integer representations of IP addresses
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.ip_to_int(pd.Series(["192.168.0.1","10.0.0.1"]))
+    0    3232235521
+    1     167772161
+    dtype: int64
+    """
+    parsed = parse_ips(values)
+    return _to_series(parsed, parsed.ipv4.astype(np.int64))
+
+
+def int_to_ip(values: pd.Series) -> pd.Series:
+    """
+    Convert a series of integers to IPv4 addresses.
+
+    Parameters
+    ----------
+    values : pd.Series
+        Integer representations of IPv4 addresses
+
+    Returns
+    -------
+    pd.Series
+        IPv4 addresses
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.int_to_ip(pd.Series([3232235521, 167772161]))
+    0    192.168.0.1
+    1       10.0.0.1
+    dtype: object
+    """
+    return pd.Series(_format_ipv4(values.to_numpy(dtype=np.int64).astype(np.uint32)), index=values.index)
+
+
+def is_ip(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each entry is a valid IPv4 or IPv6 address.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.is_ip(pd.Series(["192.168.0.1", "10.123.0", "2001:db8::1"]))
+    0     True
+    1    False
+    2     True
+    dtype: bool
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, parsed.version != 0)
+
+
+def is_ipv4(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each entry is a valid IPv4 address.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, parsed.is_ipv4)
+
+
+def is_ipv6(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each entry is a valid IPv6 address.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, parsed.is_ipv6)
+
+
+def is_reserved(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each address is reserved.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.is_reserved(pd.Series(["127.0.0.1","10.0.0.1"]))
+    0    False
+    1    False
+    dtype: bool
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, _in_networks(parsed, _RESERVED_NETWORKS))
+
+
+def is_loopback(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each address is loopback.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.is_loopback(pd.Series(["127.0.0.1","10.0.0.1"]))
+    0     True
+    1    False
+    dtype: bool
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, _in_networks(parsed, _LOOPBACK_NETWORKS))
+
+
+def is_link_local(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each address is link local.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.is_link_local(pd.Series(["127.0.0.1","169.254.123.123"]))
+    0    False
+    1     True
+    dtype: bool
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, _in_networks(parsed, _LINK_LOCAL_NETWORKS))
+
+
+def is_unspecified(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each address is unspecified.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.is_unspecified(pd.Series(["127.0.0.1","0.0.0.0"]))
+    0    False
+    1     True
+    dtype: bool
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, _in_networks(parsed, _UNSPECIFIED_NETWORKS))
+
+
+def is_multicast(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each address is multicast.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.is_multicast(pd.Series(["127.0.0.1","224.0.0.0"]))
+    0    False
+    1     True
+    dtype: bool
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, _in_networks(parsed, _MULTICAST_NETWORKS))
+
+
+def is_private(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each address is private.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.is_private(pd.Series(["127.0.0.1","207.46.13.151"]))
+    0     True
+    1    False
+    dtype: bool
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, _in_networks(parsed, _PRIVATE_NETWORKS))
+
+
+def is_global(ips: IPType) -> pd.Series:
+    """
+    Indicates whether each address is global.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean values true or false
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.is_global(pd.Series(["127.0.0.1","207.46.13.151"]))
+    0    False
+    1     True
+    dtype: bool
+    """
+    parsed = parse_ips(ips)
+    return _to_series(parsed, _is_global(parsed))
+
+
+def _is_global(parsed: ParsedIPs, private: np.ndarray = None) -> np.ndarray:
+    if private is None:
+        private = _in_networks(parsed, _PRIVATE_NETWORKS)
+
+    return (parsed.version != 0) & ~private & ~_in_networks(parsed, _SHARED_ADDRESS_NETWORKS)
+
+
+def classify_all(ips: IPType) -> pd.DataFrame:
+    """
+    Evaluates every predicate in this module, parsing the addresses only once.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+
+    Returns
+    -------
+    pd.DataFrame
+        Boolean columns `is_ip`, `is_ipv4`, `is_ipv6`, `is_reserved`, `is_loopback`, `is_link_local`,
+        `is_unspecified`, `is_multicast`, `is_private` and `is_global`, with the same index as `ips`.
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.classify_all(pd.Series(["127.0.0.1", "ff02::1"]))[["is_ipv6", "is_loopback", "is_multicast"]]
+       is_ipv6  is_loopback  is_multicast
+    0    False         True         False
+    1     True        False          True
+    """
+    parsed = parse_ips(ips)
+    private = _in_networks(parsed, _PRIVATE_NETWORKS)
+
+    return pd.DataFrame(
+        {
+            "is_ip": parsed.version != 0,
+            "is_ipv4": parsed.is_ipv4,
+            "is_ipv6": parsed.is_ipv6,
+            "is_reserved": _in_networks(parsed, _RESERVED_NETWORKS),
+            "is_loopback": _in_networks(parsed, _LOOPBACK_NETWORKS),
+            "is_link_local": _in_networks(parsed, _LINK_LOCAL_NETWORKS),
+            "is_unspecified": _in_networks(parsed, _UNSPECIFIED_NETWORKS),
+            "is_multicast": _in_networks(parsed, _MULTICAST_NETWORKS),
+            "is_private": private,
+            "is_global": _is_global(parsed, private),
+        },
+        index=parsed.index)
+
+
+def _prefix_mask(prefixlen: int, num_bits: int) -> int:
+    all_ones = (1 << num_bits) - 1
+    return all_ones ^ (all_ones >> prefixlen)
+
+
+def _constant_mask(parsed: ParsedIPs, ipv4_mask: int, ipv6_mask: int, name: str) -> pd.Series:
+    values = np.full(len(parsed.version), str(ipaddress.IPv4Address(ipv4_mask)), dtype=object)
+    values[parsed.is_ipv6] = str(ipaddress.IPv6Address(ipv6_mask))
+
+    return _to_series(parsed, values, name=name)
+
+
+def netmask(ips: IPType, prefixlen: int = 16) -> pd.Series:
+    """
+    Compute a column of netmasks for a column of IP addresses.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+    prefixlen: int
+        Length of the network prefix, in bits
+
+    Returns
+    -------
+    pd.Series
+        Netmask ouput from set of IP address, IPv6 addresses receive an IPv6 netmask
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.netmask(pd.Series(["192.168.0.1","10.0.0.1"]), prefixlen=16)
+    0    255.255.0.0
+    1    255.255.0.0
+    Name: net_mask, dtype: object
+    """
+    parsed = parse_ips(ips)
+    return _constant_mask(parsed, _prefix_mask(min(prefixlen, 32), 32), _prefix_mask(prefixlen, 128), "net_mask")
+
+
+def hostmask(ips: IPType, prefixlen: int = 16) -> pd.Series:
+    """
+    Compute a column of hostmasks for a column of IP addresses.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+    prefixlen: int
+        Length of the network prefix, in bits
+
+    Returns
+    -------
+    pd.Series
+        Hostmask ouput from set of IP address, IPv6 addresses receive an IPv6 hostmask
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> ip_pandas.hostmask(pd.Series(["192.168.0.1","10.0.0.1"]), prefixlen=16)
+    0    0.0.255.255
+    1    0.0.255.255
+    Name: hostmask, dtype: object
+    """
+    parsed = parse_ips(ips)
+    return _constant_mask(parsed,
+                          _prefix_mask(min(prefixlen, 32), 32) ^ ((1 << 32) - 1),
+                          _prefix_mask(prefixlen, 128) ^ ((1 << 128) - 1),
+                          "hostmask")
+
+
+def mask(ips: IPType, masks: IPType) -> pd.Series:
+    """
+    Apply a mask to a column of IP addresses. IPv6 masks are applied to IPv6 addresses, for any other combination the
+    IPv4 values are used, with entries which are not IPv4 addresses treated as 0.
+
+    Parameters
+    ----------
+    ips : typing.Union[pd.Series, ParsedIPs]
+        IP addresses to be checked
+    masks: typing.Union[pd.Series, ParsedIPs]
+        The host or subnet masks to be applied
+
+    Returns
+    -------
+    pd.Series
+        Masked IP address from list of IPs
+
+    Examples
+    --------
+    >>> import morpheus.parsers.ip_pandas as ip_pandas
+    >>> import pandas as pd
+    >>> input_ips = pd.Series(["192.168.0.1","10.0.0.1"])
+    >>> input_masks = pd.Series(["255.255.0.0", "255.255.0.0"])
+    >>> ip_pandas.mask(input_ips, input_masks)
+    0    192.168.0.0
+    1       10.0.0.0
+    Name: mask, dtype: object
+    """
+    parsed = parse_ips(ips)
+    parsed_masks = parse_ips(masks)
+
+    values = _format_ipv4(parsed.ipv4 & parsed_masks.ipv4)
+
+    is_v6 = parsed.is_ipv6 & parsed_masks.is_ipv6
+    if (is_v6.any()):
+        values[is_v6] = _format_ipv6(parsed.ipv6_hi[is_v6] & parsed_masks.ipv6_hi[is_v6],
+                                     parsed.ipv6_lo[is_v6] & parsed_masks.ipv6_lo[is_v6])
+
+    return _to_series(parsed, values, name="mask")
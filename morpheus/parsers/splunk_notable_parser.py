@@ -15,10 +15,14 @@
 import logging
 import os
 
+import pandas as pd
+
 import cudf
 
 import morpheus
 from morpheus.parsers.event_parser import EventParser
+from morpheus.utils.type_aliases import DataFrameType
+from morpheus.utils.type_aliases import SeriesType
 
 log = logging.getLogger(__name__)
 
@@ -34,22 +38,22 @@ class SplunkNotableParser(EventParser):
         self._event_regex = self._load_regex_yaml(regex_filepath)
         EventParser.__init__(self, self._event_regex.keys(), self.EVENT_NAME)
 
-    def parse(self, text: cudf.Series) -> cudf.Series:
+    def parse(self, text: SeriesType) -> DataFrameType:
         """
         Parses the Splunk notable raw events.
 
         Parameters
         ----------
-        text : cudf.Series
+        text : typing.Union[pd.Series, cudf.Series]
             Raw event log text to be parsed.
 
         Returns
         -------
-        cudf.DataFrame
+        typing.Union[pd.DataFrame, cudf.DataFrame]
             Parsed logs dataframe
         """
         # Cleaning raw data to be consistent.
-        text = text.str.replace("\\\\", "")
+        text = text.str.replace("\\\\", "", regex=True)
         parsed_dataframe = self.parse_raw_event(text, self._event_regex)
         # Replace null values of all columns with empty.
         parsed_dataframe = parsed_dataframe.fillna("")
@@ -57,10 +61,11 @@ class SplunkNotableParser(EventParser):
         parsed_dataframe = self._process_ip_fields(parsed_dataframe)
         return parsed_dataframe
 
-    def _process_ip_fields(self, parsed_dataframe: cudf.DataFrame) -> cudf.DataFrame:
+    def _process_ip_fields(self, parsed_dataframe: DataFrameType) -> DataFrameType:
         """
         This function replaces src_ip column with src_ip2, if scr_ip is empty and does the same way for dest_ip column.
         """
+        df_lib = pd if isinstance(parsed_dataframe, pd.DataFrame) else cudf
         for ip in ["src_ip", "dest_ip"]:
             log.debug("******* Processing %s *******" % (ip))
             ip2 = ip + "2"
@@ -68,7 +73,7 @@ class SplunkNotableParser(EventParser):
             # Calculate ip column value length.
             parsed_dataframe[ip_len] = parsed_dataframe[ip].str.len()
             # Retrieve empty ip column records.
-            tmp_dataframe = parsed_dataframe[parsed_dataframe[ip_len] == 0]
+            tmp_dataframe = parsed_dataframe[parsed_dataframe[ip_len] == 0].copy()
             # Retrieve non empty ip column records.
             parsed_dataframe = parsed_dataframe[parsed_dataframe[ip_len] != 0]
 
@@ -79,7 +84,7 @@ class SplunkNotableParser(EventParser):
                 if not parsed_dataframe.empty:
                     log.debug("parsed_dataframe is not empty %s" % (str(parsed_dataframe.shape)))
                     # Concat, if both parsed_dataframe and tmp_df are not empty.
-                    parsed_dataframe = cudf.concat([parsed_dataframe, tmp_dataframe])
+                    parsed_dataframe = df_lib.concat([parsed_dataframe, tmp_dataframe])
                 else:
                     # If parsed_dataframe is empty assign tmp_df.
                     parsed_dataframe = tmp_dataframe
@@ -12,106 +12,122 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
+import typing
+
+import numpy as np
+import pandas as pd
 
 import cudf
 
 import morpheus
+from morpheus.utils.type_aliases import DataFrameType
+from morpheus.utils.type_aliases import SeriesType
+
+# Maximum number of distinct hostnames whose parsed parts are kept between calls to `parse`
+_HOSTNAME_CACHE_SIZE = 2**16
+
+
+class _SuffixTrie:
+    """
+    Trie of public suffixes keyed by their labels in reverse order, allowing the longest public suffix of a hostname
+    to be found with one lookup per label. Suffixes are matched literally, wildcard and exception rules are not
+    expanded.
+
+    Parameters
+    ----------
+    suffixes : typing.Iterable[str]
+        Public suffixes such as "com" or "co.uk".
+    """
+
+    # Marks a node which ends a suffix, labels are never empty so this can not collide with a child label
+    _TERMINAL = ""
 
+    def __init__(self, suffixes: typing.Iterable[str]):
+        self._root = {}
 
-def _load_suffix_file():
+        for suffix in suffixes:
+            node = self._root
+            for label in reversed(suffix.split(".")):
+                node = node.setdefault(label, {})
+
+            node[self._TERMINAL] = True
+
+    def longest_suffix_len(self, labels: typing.List[str]) -> int:
+        """
+        Returns the number of trailing `labels` making up the longest public suffix, 0 if none match. At least one
+        label is always left for the domain.
+        """
+        node = self._root
+        suffix_len = 0
+
+        for depth in range(1, len(labels)):
+            node = node.get(labels[-depth])
+            if (node is None):
+                break
+
+            if (self._TERMINAL in node):
+                suffix_len = depth
+
+        return suffix_len
+
+
+def _load_suffix_trie() -> _SuffixTrie:
     suffix_list_path = os.path.join(morpheus.DATA_DIR, "public_suffix_list.dat")
-    # Read suffix list csv file
-    suffix_df = cudf.io.csv.read_csv(suffix_list_path, names=["suffix"], header=None, dtype=["str"])
-    suffix_df = suffix_df[suffix_df["suffix"].str.contains("^[^//]+$")]
-    return suffix_df
+
+    with open(suffix_list_path, encoding="UTF-8") as suffix_file:
+        # Skip blank lines and comments, comments are the only lines containing a slash
+        suffixes = [line.strip() for line in suffix_file if line.strip() and "/" not in line]
+
+    return _SuffixTrie(suffixes)
 
 
-_SUFFIX_DF = _load_suffix_file()
+_SUFFIX_TRIE = _load_suffix_trie()
 _ALLOWED_OUTPUT_COLS = {
     "hostname",
     "subdomain",
     "domain",
     "suffix",
 }
+_OUTPUT_COL_ORDER = ["hostname", "subdomain", "domain", "suffix"]
 
 
-def _handle_unknown_suffix(unknown_suffix_df, col_dict):
-    if col_dict["hostname"]:
-        unknown_suffix_df = unknown_suffix_df[["idx", "tld0"]]
-        unknown_suffix_df = unknown_suffix_df.rename(columns={"tld0": "hostname"})
-    else:
-        unknown_suffix_df = unknown_suffix_df[["idx"]]
-
-    if col_dict["subdomain"]:
-        unknown_suffix_df["subdomain"] = ""
-    if col_dict["domain"]:
-        unknown_suffix_df["domain"] = ""
-    if col_dict["suffix"]:
-        unknown_suffix_df["suffix"] = ""
-
-    return unknown_suffix_df
-
-
-def _extract_tld(input_df, suffix_df, col_len, col_dict):
-    tmp_dfs = []
-    # Left join on single column dataframe does not provide expected results hence adding dummy column.
-    suffix_df["dummy"] = ""
-    # Iterating over each tld column starting from tld0 until it finds a match.
-    for i in range(col_len + 1):
-        # Add index to sort the parsed information with respect to input records order.
-        cols_keep = ["idx"]
-        tld_col = "tld" + str(i)
-        suffix_df = suffix_df.rename(columns={suffix_df.columns[0]: tld_col})
-        # Left join input_df with suffix_df on tld column for each iteration.
-        merged_df = input_df.merge(suffix_df, on=tld_col, how="left")
-        if i > 0:
-            col_pos = i - 1
-            # Retrieve records which satisfies join clause.
-            joined_recs_df = merged_df[~merged_df["dummy"].isna()]
-            if not joined_recs_df.empty:
-                if col_dict["hostname"]:
-                    joined_recs_df = joined_recs_df.rename(columns={"tld0": "hostname"})
-                    cols_keep.append("hostname")
-                if col_dict["subdomain"]:
-                    cols_keep.append("subdomain")
-                    joined_recs_df["subdomain"] = ""
-                    if col_pos > 0:
-                        for idx in range(0, col_pos):
-                            joined_recs_df["subdomain"] = joined_recs_df["subdomain"].str.cat(joined_recs_df[idx],
-                                                                                              sep=".")
-                        joined_recs_df["subdomain"] = (joined_recs_df["subdomain"].str.replace(".^",
-                                                                                               "").str.lstrip("."))
-                if col_dict["domain"]:
-                    joined_recs_df = joined_recs_df.rename(columns={col_pos: "domain"})
-                    cols_keep.append("domain")
-                if col_dict["suffix"]:
-                    joined_recs_df = joined_recs_df.rename(columns={tld_col: "suffix"})
-                    cols_keep.append("suffix")
-                joined_recs_df = joined_recs_df[cols_keep]
-                # Concat current iteration result to previous iteration result.
-                tmp_dfs.append(joined_recs_df)
-                # delete not required variable.
-                del joined_recs_df
-                # Assigning unprocessed records to input_df for next stage of processing.
-                if i < col_len:
-                    input_df = merged_df[merged_df["dummy"].isna()]
-                    # Drop unwanted columns.
-                    input_df = input_df.drop(["dummy", tld_col], axis=1)
-                # Handles scenario when some records with last tld column matches to suffix list but not all.
-                else:
-                    merged_df = merged_df[merged_df["dummy"].isna()]
-                    unknown_suffix_df = _handle_unknown_suffix(merged_df, col_dict)
-                    tmp_dfs.append(unknown_suffix_df)
-            # Handles scenario when all records with last tld column doesn't match to suffix list.
-            elif i == col_len and not merged_df.empty:
-                unknown_suffix_df = _handle_unknown_suffix(merged_df, col_dict)
-                tmp_dfs.append(unknown_suffix_df)
-            else:
-                continue
-    # Concat all temporary output dataframes
-    output_df = cudf.concat(tmp_dfs)
-    return output_df
+@functools.lru_cache(maxsize=_HOSTNAME_CACHE_SIZE)
+def _split_hostname(hostname: str) -> typing.Tuple[str, str, str]:
+    """
+    Splits `hostname` into its subdomain, domain and suffix. All three are empty when the hostname does not end with a
+    known public suffix.
+    """
+    labels = [label for label in hostname.split(".") if label]
+    suffix_len = _SUFFIX_TRIE.longest_suffix_len(labels)
+
+    if (suffix_len == 0):
+        return ("", "", "")
+
+    domain_pos = len(labels) - suffix_len - 1
+
+    return (".".join(labels[:domain_pos]), labels[domain_pos], ".".join(labels[domain_pos + 1:]))
+
+
+def _parse_hostnames(hostnames: pd.Series, col_dict: typing.Dict[str, bool]) -> pd.DataFrame:
+    # Each distinct hostname is only split once per batch, with repeats across batches served by `_split_hostname`
+    (codes, uniques) = pd.factorize(hostnames)
+    parts = [_split_hostname(hostname) for hostname in uniques]
+
+    # Nulls are coded as -1, point them at an extra entry with empty parts
+    parts.append(("", "", ""))
+    codes = np.where(codes < 0, len(uniques), codes)
+
+    (subdomains, domains, suffixes) = (np.array(values, dtype=object)[codes] for values in zip(*parts))
+    parsed = {
+        "hostname": hostnames.to_numpy(dtype=object),
+        "subdomain": subdomains,
+        "domain": domains,
+        "suffix": suffixes,
+    }
+
+    return pd.DataFrame({col: parsed[col] for col in _OUTPUT_COL_ORDER if col_dict[col]})
 
 
 def _create_col_dict(allowed_output_cols, req_cols):
@@ -135,38 +151,30 @@ def _verify_req_cols(req_cols, allowed_output_cols):
     return req_cols
 
 
-def _generate_tld_cols(hostname_split_df, hostnames, col_len):
-    hostname_split_df = hostname_split_df.fillna("")
-    hostname_split_df["tld" + str(col_len)] = hostname_split_df[col_len]
-    # Add all other elements of hostname_split_df
-    for j in range(col_len - 1, 0, -1):
-        hostname_split_df["tld" + str(j)] = (hostname_split_df[j].str.cat(hostname_split_df["tld" + str(j + 1)],
-                                                                          sep=".").str.rstrip("."))
-    # Assign hostname to tld0, to handle received input is just domain name.
-    hostname_split_df["tld0"] = hostnames
-    return hostname_split_df
-
-
 def _extract_hostnames(urls):
     hostnames = urls.str.extract("([\\w]+[\\.].*[^/]|[\\-\\w]+[\\.].*[^/])")[0].str.extract("([\\w\\.\\-]+)")[0]
     return hostnames
 
 
-def parse(urls, req_cols=None):
+def parse(urls: SeriesType, req_cols: typing.Set[str] = None) -> DataFrameType:
     """
     Extract hostname, domain, subdomain and suffix from URLs.
 
+    The suffix of each hostname is the longest matching entry of the public suffix list. Hostnames are extracted with
+    the library of `urls`, then the suffix of each distinct hostname is looked up on the CPU. Recently seen hostnames
+    are cached between calls, which makes parsing repetitive logs such as proxy logs cheap.
+
     Parameters
     ----------
-    urls : cudf.Series
+    urls : typing.Union[pd.Series, cudf.Series]
         URLs to be parsed.
     req_cols : typing.Set[str]
         Selected columns to extract. Can be subset of (hostname, domain, subdomain and suffix).
 
     Returns
     -------
-    cudf.DataFrame
-        Parsed dataframe with selected columns to extract.
+    typing.Union[pd.DataFrame, cudf.DataFrame]
+        Parsed dataframe with selected columns to extract, of the same library as `urls`.
 
     Examples
     --------
@@ -184,11 +192,11 @@ def parse(urls, req_cols=None):
     ...     }
     ... )
     >>> url_parser.parse(input_df["url"])
-                hostname  domain suffix subdomain
-    0     www.google.com  google    com       www
-    1          gmail.com   gmail    com
-    2         github.com  github    com
-    3  pandas.pydata.org  pydata    org    pandas
+                hostname subdomain  domain suffix
+    0     www.google.com       www  google    com
+    1          gmail.com            gmail    com
+    2         github.com           github    com
+    3  pandas.pydata.org    pandas  pydata    org
     >>> url_parser.parse(input_df["url"], req_cols={'domain', 'suffix'})
        domain suffix
     0  google    com
@@ -198,23 +206,17 @@ def parse(urls, req_cols=None):
     """
     req_cols = _verify_req_cols(req_cols, _ALLOWED_OUTPUT_COLS)
     col_dict = _create_col_dict(req_cols, _ALLOWED_OUTPUT_COLS)
+
+    if (isinstance(urls, pd.Series)):
+        # Hostnames are extracted from each distinct URL once, then expanded back to one row per URL
+        (codes, unique_urls) = pd.factorize(urls)
+        unique_urls = np.append(unique_urls.astype(object), None)
+        codes = np.where(codes < 0, len(unique_urls) - 1, codes)
+
+        unique_df = _parse_hostnames(_extract_hostnames(pd.Series(unique_urls, dtype=object)), col_dict)
+
+        return unique_df.take(codes).reset_index(drop=True)
+
     hostnames = _extract_hostnames(urls)
-    url_index = urls.index
-    del urls
-    hostname_split_ser = hostnames.str.findall("([^.]+)")
-    hostname_split_df = hostname_split_ser.to_frame()
-    hostname_split_df = cudf.DataFrame(hostname_split_df[0].to_arrow().to_pylist())
-    col_len = len(hostname_split_df.columns) - 1
-    hostname_split_df = _generate_tld_cols(hostname_split_df, hostnames, col_len)
-    # remove hostnames since they are available in hostname_split_df
-    del hostnames
-    # Assign input index to idx column.
-    hostname_split_df["idx"] = url_index
-    output_df = _extract_tld(hostname_split_df, _SUFFIX_DF, col_len, col_dict)
-    # Sort index based on given input index order.
-    output_df = output_df.sort_values("idx", ascending=True)
-    # Drop temp columns.
-    output_df = output_df.drop("idx", axis=1)
-    # Reset the index.
-    output_df = output_df.reset_index(drop=True)
-    return output_df
+
+    return cudf.from_pandas(_parse_hostnames(hostnames.to_pandas(), col_dict))
@@ -16,10 +16,10 @@ import logging
 import os
 import typing
 
-import cudf
-
 import morpheus
 from morpheus.parsers.event_parser import EventParser
+from morpheus.utils.type_aliases import DataFrameType
+from morpheus.utils.type_aliases import SeriesType
 
 log = logging.getLogger(__name__)
 
@@ -34,6 +34,7 @@ class WindowsEventParser(EventParser):
         Set of interested codes to parse
     """
     EVENT_NAME = "windows-event"
+    EVENTCODE_REGEX = "eventcode=([0-9]+)"
 
     def __init__(self, interested_eventcodes=None):
         regex_filepath = os.path.join(morpheus.DATA_DIR, "windows_event_regex.yaml")
@@ -41,50 +42,45 @@ class WindowsEventParser(EventParser):
         self._event_regex = self._load_regex_yaml(regex_filepath)
         EventParser.__init__(self, self.get_columns(), self.EVENT_NAME)
 
-    def parse(self, text: cudf.Series) -> cudf.Series:
+    def parse(self, text: SeriesType) -> DataFrameType:
         """Parses the Windows raw event.
 
         Parameters
         ----------
-        text : cudf.Series
+        text : typing.Union[pd.Series, cudf.Series]
             Raw event log text to be parsed
 
         Returns
         -------
-        cudf.DataFrame
+        typing.Union[pd.DataFrame, cudf.DataFrame]
             Parsed logs dataframe
         """
         # Clean raw data to be consistent.
         text = self.clean_raw_data(text)
-        output_chunks = []
-        for eventcode in self._event_regex.keys():
-            pattern = f"eventcode={eventcode}"
-            # input_chunk = self.filter_by_pattern(dataframe, raw_column, pattern)
-            input_chunk = text[text.str.contains(pattern)]
-            if not input_chunk.empty:
-                temp = self.parse_raw_event(input_chunk, self._event_regex[eventcode])
-                if not temp.empty:
-                    output_chunks.append(temp)
-        parsed_dataframe = cudf.concat(output_chunks)
+        # Each record is routed to the regexes of its event code, based on the first eventcode in the record
+        parsed_dataframe = self.parse_events(text, self._event_regex, self.EVENTCODE_REGEX)
         # Replace null values with empty.
         parsed_dataframe = parsed_dataframe.fillna("")
         return parsed_dataframe
 
-    def clean_raw_data(self, text: cudf.Series) -> cudf.Series:
+    def clean_raw_data(self, text: SeriesType) -> SeriesType:
         """
         Lower casing and replacing escape characters.
 
         Parameters
         ----------
-        text : cudf.Series
+        text : typing.Union[pd.Series, cudf.Series]
             Raw event log text to be clean
 
         Returns
         -------
-        cudf.Series
+        typing.Union[pd.Series, cudf.Series]
             Clean raw event log text
         """
-        text = (text.str.lower().str.replace("\\\\t", "").str.replace("\\\\r", "").str.replace("\\\\n", "|"))
+        text = text.str.lower()
+        text = text.str.replace("\\\\t", "", regex=True)
+        text = text.str.replace("\\\\r", "", regex=True)
+        text = text.str.replace("\\\\n", "|", regex=True)
         return text
 
     def _load_regex_yaml(self, yaml_file):
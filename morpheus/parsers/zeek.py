@@ -12,8 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import codecs
+import csv
+import dataclasses
+import gzip
+import io
+import typing
+
+import pandas as pd
+
 import cudf
 
+from morpheus.utils.type_aliases import DataFrameType
+
 TYPE_DICT = {
     "bool": "bool",
     "count": "int64",
@@ -35,35 +46,248 @@ TYPE_DICT = {
     "any": "str",
 }
 
+# pandas equivalents of `TYPE_DICT`, using nullable types since any field can be unset
+_PANDAS_TYPE_DICT = {
+    "bool": "boolean",
+    "int64": "Int64",
+    "float64": "float64",
+    "str": "object",
+}
+
+_GZIP_MAGIC = b"\x1f\x8b"
 
-def parse(filepath: str) -> cudf.DataFrame:
+
+@dataclasses.dataclass
+class ZeekHeader:
+    """
+    Header of a Zeek log file, parsed from the comment lines at the start of the file.
+
+    Attributes
+    ----------
+    separator : str
+        Separator between fields.
+    set_separator : str
+        Separator between the elements of set and vector fields.
+    empty_field : str
+        Value of empty fields.
+    unset_field : str
+        Value of unset fields, these are read as nulls.
+    path : str
+        Name of the log, such as "conn".
+    fields : typing.List[str]
+        Field names.
+    types : typing.List[str]
+        Zeek types of the fields.
+    """
+    separator: str = "\t"
+    set_separator: str = ","
+    empty_field: str = "(empty)"
+    unset_field: str = "-"
+    path: str = None
+    fields: typing.List[str] = dataclasses.field(default_factory=list)
+    types: typing.List[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def dtypes(self) -> typing.Dict[str, str]:
+        """cuDF data types of the fields."""
+        return {name: TYPE_DICT.get(zeek_type, "str") for (name, zeek_type) in zip(self.fields, self.types)}
+
+    def update(self, line: str):
+        """Updates the header from a single comment line, such as `#fields ts uid`."""
+        parts = line.strip().lstrip("#").split(maxsplit=1)
+        if (len(parts) == 0):
+            return
+
+        directive = parts[0]
+        value = parts[1] if len(parts) > 1 else ""
+
+        if (directive == "separator"):
+            self.separator = codecs.decode(value.strip(), "unicode_escape")
+        elif (directive == "set_separator"):
+            self.set_separator = value.strip()
+        elif (directive == "empty_field"):
+            self.empty_field = value.strip()
+        elif (directive == "unset_field"):
+            self.unset_field = value.strip()
+        elif (directive == "path"):
+            self.path = value.strip()
+        elif (directive == "fields"):
+            self.fields = value.split()
+        elif (directive == "types"):
+            self.types = value.split()
+
+
+def _open_log(filepath: str) -> typing.BinaryIO:
+    """Opens a Zeek log for reading, decompressing it when gzip compressed regardless of the file extension."""
+    fh = open(filepath, "rb")  # pylint: disable=consider-using-with
+
+    if (fh.read(2) == _GZIP_MAGIC):
+        fh.close()
+        return gzip.open(filepath, "rb")
+
+    fh.seek(0)
+    return fh
+
+
+class ZeekLogReader:
+    """
+    Reads a Zeek log file as a sequence of DataFrames with at most `chunk_rows` rows each, without loading the whole
+    file into memory.
+
+    The header comments are parsed once and used to name and type the columns. Comment lines found after the data, such
+    as the `#close` footer, end the current chunk. A new header, as found in concatenated rotated logs, replaces the
+    previous header for the rows that follow it. Unset fields are read as nulls, and gzip compressed files are
+    decompressed while reading.
+
+    Parameters
+    ----------
+    filepath : str
+        File path of Zeek log file
+    chunk_rows : int, default = 100000
+        Maximum number of rows in each DataFrame. When None, each header section is read as a single DataFrame.
+    df_type : str, default = "cudf"
+        Type of DataFrame to return, either "cudf" or "pandas".
+    """
+
+    def __init__(self, filepath: str, chunk_rows: int = 100000, df_type: typing.Literal["cudf", "pandas"] = "cudf"):
+        if (chunk_rows is not None and chunk_rows < 1):
+            raise ValueError("chunk_rows must be at least 1")
+
+        if (df_type not in ("cudf", "pandas")):
+            raise ValueError(f"Unsupported df_type '{df_type}', must be one of 'cudf' or 'pandas'")
+
+        self._filepath = filepath
+        self._chunk_rows = chunk_rows
+        self._df_type = df_type
+        self._header: ZeekHeader = None
+
+    @property
+    def header(self) -> typing.Optional[ZeekHeader]:
+        """The most recently read header, None until reading has started."""
+        return self._header
+
+    def _to_df(self, header: ZeekHeader, lines: typing.List[bytes], start_index: int) -> DataFrameType:
+        read_kwargs = {
+            "sep": header.separator,
+            "names": header.fields,
+            "header": None,
+            "na_values": [header.unset_field],
+            "keep_default_na": False,
+            "true_values": ["T"],
+            "false_values": ["F"],
+            "quoting": csv.QUOTE_NONE,
+        }
+
+        buffer = io.BytesIO(b"".join(lines))
+
+        if (self._df_type == "cudf"):
+            df = cudf.read_csv(buffer, dtype=header.dtypes, **read_kwargs)
+            df.index = cudf.RangeIndex(start_index, start_index + len(df))
+        else:
+            dtypes = {name: _PANDAS_TYPE_DICT[dtype] for (name, dtype) in header.dtypes.items()}
+            df = pd.read_csv(buffer, dtype=dtypes, **read_kwargs)
+            df.index = pd.RangeIndex(start_index, start_index + len(df))
+
+        return df
+
+    def __iter__(self) -> typing.Iterator[DataFrameType]:
+        header = ZeekHeader()
+        lines = []
+        num_rows = 0
+        in_header = True
+
+        with _open_log(self._filepath) as fh:
+            for line in fh:
+                if (line.lstrip()[:1] == b"#"):
+                    if (len(lines) > 0):
+                        yield self._to_df(header, lines, num_rows)
+                        num_rows += len(lines)
+                        lines = []
+
+                    decoded = line.decode("utf-8")
+
+                    # A separator directive after the data starts a new header
+                    if (not in_header and decoded.lstrip().startswith("#separator")):
+                        header = ZeekHeader()
+
+                    header.update(decoded)
+                    self._header = header
+                    in_header = True
+                    continue
+
+                if (in_header):
+                    in_header = False
+                    if (len(header.fields) == 0):
+                        raise ValueError(f"Zeek log '{self._filepath}' does not contain a #fields header")
+
+                if (len(line.strip()) == 0):
+                    continue
+
+                lines.append(line)
+
+                if (self._chunk_rows is not None and len(lines) >= self._chunk_rows):
+                    yield self._to_df(header, lines, num_rows)
+                    num_rows += len(lines)
+                    lines = []
+
+            if (len(lines) > 0):
+                yield self._to_df(header, lines, num_rows)
+
+
+def iter_chunks(filepath: str,
+                chunk_rows: int = 100000,
+                df_type: typing.Literal["cudf", "pandas"] = "cudf") -> typing.Iterator[DataFrameType]:
+    """
+    Parse a Zeek log file into a sequence of DataFrames, reading the file incrementally. See `ZeekLogReader` for
+    details.
+
+    Parameters
+    ----------
+    filepath : str
+        File path of Zeek log file
+    chunk_rows : int, default = 100000
+        Maximum number of rows in each DataFrame.
+    df_type : str, default = "cudf"
+        Type of DataFrame to return, either "cudf" or "pandas".
+
+    Returns
+    -------
+    typing.Iterator[typing.Union[cudf.DataFrame, pd.DataFrame]]
+        Parsed Zeek log dataframes, indexed by the row number within the file
+    """
+    return iter(ZeekLogReader(filepath, chunk_rows=chunk_rows, df_type=df_type))
+
+
+def parse(filepath: str, df_type: typing.Literal["cudf", "pandas"] = "cudf") -> DataFrameType:
     """
     Parse Zeek log file and return cuDF dataframe. Uses header comments to get column names/types
     and configure parser.
 
+    Unset fields, written as the `#unset_field` value (`-` by default), are read as nulls in every column. Previously
+    unset fields of string columns were read as the literal string `-`.
+
     Parameters
     ----------
     filepath : str
         File path of Zeek log file
+    df_type : str, default = "cudf"
+        Type of DataFrame to return, either "cudf" or "pandas".
 
     Returns
     -------
-    cudf.DataFrame
+    typing.Union[cudf.DataFrame, pd.DataFrame]
         Parsed Zeek log dataframe
     """
-    header_gdf = cudf.read_csv(filepath, names=["line"], nrows=8)
-    lines_gdf = header_gdf["line"].str.split()
-
-    column_names = lines_gdf.iloc[6][1:]
-    column_types = lines_gdf.iloc[7][1:]
-    column_dtypes = list(map(lambda x: TYPE_DICT.get(x, "str"), column_types))
-
-    log_gdf = cudf.read_csv(
-        filepath,
-        delimiter="\t",
-        dtype=column_dtypes,
-        names=column_names,
-        skiprows=8,
-        skipfooter=1,
-    )
-    return log_gdf
+    reader = ZeekLogReader(filepath, chunk_rows=None, df_type=df_type)
+    dfs = list(reader)
+
+    if (len(dfs) == 1):
+        return dfs[0]
+
+    df_lib = cudf if df_type == "cudf" else pd
+
+    if (len(dfs) == 0):
+        fields = reader.header.fields if reader.header is not None else []
+        return df_lib.DataFrame({name: [] for name in fields})
+
+    return df_lib.concat(dfs)
@@ -23,6 +23,7 @@ from morpheus.cli import register_stage
 from morpheus.common import FileTypes
 from morpheus.config import Config
 from morpheus.config import PipelineModes
+from morpheus.io.deserializers import iter_files_to_df
 from morpheus.io.deserializers import read_file_to_df
 from morpheus.messages import MessageMeta
 from morpheus.pipeline.preallocator_mixin import PreallocatorMixin
@@ -57,6 +58,10 @@ class FileSourceStage(PreallocatorMixin, SingleOutputSource):
     filter_null : bool, default = True
         Whether or not to filter rows with null 'data' column. Null values in the 'data' column can cause issues down
         the line with processing. Setting this to True is recommended.
+    chunk_rows : int, default = None
+        When set, the file is parsed incrementally and emitted in messages of at most `chunk_rows` rows, allowing
+        downstream stages to begin processing before the whole file has been parsed. JSON files must use the JSON lines
+        format. Not supported by the C++ implementation of this stage.
     """
 
     def __init__(self,
@@ -65,7 +70,8 @@ class FileSourceStage(PreallocatorMixin, SingleOutputSource):
                  iterative: bool = False,
                  file_type: FileTypes = FileTypes.Auto,
                  repeat: int = 1,
-                 filter_null: bool = True):
+                 filter_null: bool = True,
+                 chunk_rows: int = None):
 
         super().__init__(c)
 
@@ -74,6 +80,10 @@ class FileSourceStage(PreallocatorMixin, SingleOutputSource):
         self._filename = filename
         self._file_type = file_type
         self._filter_null = filter_null
+        self._chunk_rows = chunk_rows
+
+        if (self._chunk_rows is not None and self._chunk_rows < 1):
+            raise ValueError("chunk_rows must be at least 1")
 
         self._input_count = None
         self._max_concurrent = c.num_threads
@@ -95,7 +105,7 @@ class FileSourceStage(PreallocatorMixin, SingleOutputSource):
 
     def supports_cpp_node(self) -> bool:
         """Indicates whether or not this stage supports a C++ node"""
-        return True
+        return self._chunk_rows is None
 
     def _build_source(self, builder: mrc.Builder) -> StreamPair:
 
@@ -109,8 +119,32 @@ class FileSourceStage(PreallocatorMixin, SingleOutputSource):
 
         return out_stream, out_type
 
+    def _generate_chunked_frames(self) -> typing.Iterable[MessageMeta]:
+        num_rows = 0
+
+        for _ in range(self._repeat_count):
+            rows_in_pass = 0
+
+            for df in iter_files_to_df(self._filename,
+                                       self._file_type,
+                                       filter_nulls=self._filter_null,
+                                       df_type="cudf",
+                                       chunk_rows=self._chunk_rows,
+                                       max_workers=1):
+                # Offset the index so rows remain unique when repeating the file
+                df.index += num_rows
+                rows_in_pass += len(df)
+
+                yield MessageMeta(df)
+
+            num_rows += rows_in_pass
+
     def _generate_frames(self) -> typing.Iterable[MessageMeta]:
 
+        if (self._chunk_rows is not None):
+            yield from self._generate_chunked_frames()
+            return
+
         df = read_file_to_df(
             self._filename,
             self._file_type,
@@ -15,12 +15,16 @@
 import logging
 import time
 import typing
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from io import StringIO
+from io import BytesIO
 
 import confluent_kafka as ck
 import mrc
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json
 
 import cudf
 
@@ -43,6 +47,13 @@ class AutoOffsetReset(Enum):
     NONE = "none"
 
 
+class JsonEngine(Enum):
+    """The supported JSON readers for parsing messages in the Python implementation of `KafkaSourceStage`"""
+    CUDF = "cudf"
+    PANDAS = "pandas"
+    PYARROW = "pyarrow"
+
+
 @register_stage("from-kafka", modes=[PipelineModes.FIL, PipelineModes.NLP, PipelineModes.OTHER])
 class KafkaSourceStage(PreallocatorMixin, SingleOutputSource):
     """
@@ -77,6 +88,13 @@ class KafkaSourceStage(PreallocatorMixin, SingleOutputSource):
         Stops ingesting after emitting `stop_after` records (rows in the dataframe). Useful for testing. Disabled if `0`
     async_commits: bool, default = True
         Enable commits to be performed asynchronously. Ignored if `disable_commit` is `True`.
+    json_engine : `JsonEngine`, default = "cudf", case_sensitive = False
+        Reader used to parse batches of messages. The "pandas" and "pyarrow" readers parse on the CPU, with the result
+        converted to a cuDF DataFrame. Only used by the Python implementation.
+    async_parse : bool, default = False
+        Parse each batch on a worker thread while the next batch is being polled. A batch is emitted, and its offsets
+        committed, once the following batch has been received or polling becomes idle. Only used by the Python
+        implementation.
     """
 
     def __init__(self,
@@ -90,12 +108,17 @@ class KafkaSourceStage(PreallocatorMixin, SingleOutputSource):
                  disable_pre_filtering: bool = False,
                  auto_offset_reset: AutoOffsetReset = AutoOffsetReset.LATEST,
                  stop_after: int = 0,
-                 async_commits: bool = True):
+                 async_commits: bool = True,
+                 json_engine: JsonEngine = JsonEngine.CUDF,
+                 async_parse: bool = False):
         super().__init__(c)
 
         if isinstance(auto_offset_reset, AutoOffsetReset):
             auto_offset_reset = auto_offset_reset.value
 
+        if isinstance(json_engine, str):
+            json_engine = JsonEngine(json_engine.lower())
+
         self._consumer_params = {
             'bootstrap.servers': bootstrap_servers,
             'group.id': group_id,
@@ -116,6 +139,8 @@ class KafkaSourceStage(PreallocatorMixin, SingleOutputSource):
         self._disable_pre_filtering = disable_pre_filtering
         self._stop_after = stop_after
         self._async_commits = async_commits
+        self._json_engine = json_engine
+        self._async_parse = async_parse
         self._client = None
 
         # Flag to indicate whether or not we should stop
@@ -144,49 +169,119 @@ class KafkaSourceStage(PreallocatorMixin, SingleOutputSource):
 
         return super().stop()
 
+    def _assemble_batch(self, batch) -> typing.Tuple[bytes, typing.List[ck.TopicPartition]]:
+        """
+        Joins the payloads in `batch` into a single newline delimited buffer, and determines the offsets to commit. Only
+        the offset following the last message for each partition needs to be committed.
+        """
+        payloads = []
+        last_offsets = {}
+
+        for msg in batch:
+            payload = msg.value()
+            if payload is not None:
+                payloads.append(payload)
+
+            last_offsets[(msg.topic(), msg.partition())] = msg.offset()
+
+        # `bytes.join` sizes the output up front, copying each payload once into a single allocation without decoding
+        buffer = b"\n".join(payloads)
+
+        offsets = [
+            ck.TopicPartition(topic, partition, offset + 1) for ((topic, partition), offset) in last_offsets.items()
+        ]
+
+        return (buffer, offsets)
+
+    def _parse_batch(self, buffer: bytes) -> typing.Optional[cudf.DataFrame]:
+        if (len(buffer) == 0):
+            return None
+
+        try:
+            if (self._json_engine == JsonEngine.PANDAS):
+                return cudf.from_pandas(pd.read_json(BytesIO(buffer), lines=True, orient='records',
+                                                     convert_dates=False))
+
+            if (self._json_engine == JsonEngine.PYARROW):
+                return cudf.DataFrame.from_arrow(pyarrow.json.read_json(pa.BufferReader(buffer)))
+
+            return cudf.io.read_json(BytesIO(buffer), engine='cudf', lines=True, orient='records')
+        except Exception as e:
+            logger.error("Error parsing payload into a dataframe : {}".format(e))
+
+        return None
+
+    def _commit(self, consumer, offsets: typing.List[ck.TopicPartition]):
+        if (not self._disable_commit and len(offsets) > 0):
+            consumer.commit(offsets=offsets, asynchronous=self._async_commits)
+
+    def _create_message_meta(self, df: typing.Optional[cudf.DataFrame]) -> typing.Optional[MessageMeta]:
+        if df is None:
+            return None
+
+        num_records = len(df)
+        message_meta = MessageMeta(df)
+        self._records_emitted += num_records
+        self._num_messages += 1
+
+        if self._stop_after > 0 and self._records_emitted >= self._stop_after:
+            self._stop_requested = True
+
+        return message_meta
+
     def _process_batch(self, consumer, batch):
         message_meta = None
         if len(batch):
-            buffer = StringIO()
-
-            for msg in batch:
-                payload = msg.value()
-                if payload is not None:
-                    buffer.write(payload.decode("utf-8"))
-                    buffer.write("\n")
+            (buffer, offsets) = self._assemble_batch(batch)
 
             df = None
             try:
-                buffer.seek(0)
-                df = cudf.io.read_json(buffer, engine='cudf', lines=True, orient='records')
-            except Exception as e:
-                logger.error("Error parsing payload into a dataframe : {}".format(e))
+                df = self._parse_batch(buffer)
             finally:
-                if (not self._disable_commit):
-                    for msg in batch:
-                        consumer.commit(message=msg, asynchronous=self._async_commits)
-
-            if df is not None:
-                num_records = len(df)
-                message_meta = MessageMeta(df)
-                self._records_emitted += num_records
-                self._num_messages += 1
+                self._commit(consumer, offsets)
 
-                if self._stop_after > 0 and self._records_emitted >= self._stop_after:
-                    self._stop_requested = True
+            message_meta = self._create_message_meta(df)
 
             batch.clear()
 
         return message_meta
 
+    def _submit_batch(self, executor: ThreadPoolExecutor,
+                      batch) -> typing.Optional[typing.Tuple[Future, typing.List[ck.TopicPartition]]]:
+        if not len(batch):
+            return None
+
+        (buffer, offsets) = self._assemble_batch(batch)
+        batch.clear()
+
+        return (executor.submit(self._parse_batch, buffer), offsets)
+
+    def _complete_batch(self, consumer, pending: typing.Tuple[Future, typing.List[ck.TopicPartition]]):
+        (future, offsets) = pending
+
+        df = None
+        try:
+            df = future.result()
+        finally:
+            self._commit(consumer, offsets)
+
+        return self._create_message_meta(df)
+
     def _source_generator(self):
         consumer = None
+        executor = None
         try:
             consumer = ck.Consumer(self._consumer_params)
             consumer.subscribe(self._topics)
 
+            if (self._async_parse):
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.unique_name)
+
             batch = []
 
+            # Batch being parsed by the executor when `async_parse` is enabled
+            pending = None
+
             while not self._stop_requested:
                 do_process_batch = False
                 do_sleep = False
@@ -210,18 +305,40 @@ class KafkaSourceStage(PreallocatorMixin, SingleOutputSource):
                         raise ck.KafkaException(msg_error)
 
                 if do_process_batch:
-                    message_meta = self._process_batch(consumer, batch)
-                    if message_meta is not None:
-                        yield message_meta
+                    if executor is None:
+                        message_meta = self._process_batch(consumer, batch)
+                        if message_meta is not None:
+                            yield message_meta
+                    else:
+                        # Start parsing this batch before emitting the previous one, when polling is idle there is no
+                        # new batch and the previous one is emitted right away
+                        next_pending = self._submit_batch(executor, batch)
+
+                        if pending is not None:
+                            message_meta = self._complete_batch(consumer, pending)
+                            if message_meta is not None:
+                                yield message_meta
+
+                        pending = next_pending
 
                 if do_sleep and not self._stop_requested:
                     time.sleep(self._poll_interval)
 
-            message_meta = self._process_batch(consumer, batch)
-            if message_meta is not None:
-                yield message_meta
+            if executor is None:
+                message_meta = self._process_batch(consumer, batch)
+                if message_meta is not None:
+                    yield message_meta
+            else:
+                for remaining in (pending, self._submit_batch(executor, batch)):
+                    if remaining is not None:
+                        message_meta = self._complete_batch(consumer, remaining)
+                        if message_meta is not None:
+                            yield message_meta
 
         finally:
+            if (executor is not None):
+                executor.shutdown(wait=True)
+
             # Close the consumer and call on_completed
             if (consumer):
                 consumer.close()
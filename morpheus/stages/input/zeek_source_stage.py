@@ -0,0 +1,91 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Zeek log source stage."""
+
+import logging
+import typing
+
+import mrc
+
+from morpheus.cli import register_stage
+from morpheus.config import Config
+from morpheus.config import PipelineModes
+from morpheus.messages import MessageMeta
+from morpheus.parsers.zeek import ZeekLogReader
+from morpheus.pipeline.preallocator_mixin import PreallocatorMixin
+from morpheus.pipeline.single_output_source import SingleOutputSource
+from morpheus.pipeline.stream_pair import StreamPair
+
+logger = logging.getLogger(__name__)
+
+
+@register_stage("from-zeek", modes=[PipelineModes.FIL, PipelineModes.NLP, PipelineModes.OTHER])
+class ZeekSourceStage(PreallocatorMixin, SingleOutputSource):
+    """
+    Load messages from Zeek log files.
+
+    Each file is read incrementally, emitting a message for every `chunk_rows` rows, allowing downstream stages to
+    begin processing before the whole file has been read. Column names and types are taken from the header of each
+    log, and gzip compressed logs, such as rotated logs, are decompressed while reading.
+
+    Parameters
+    ----------
+    c : `morpheus.config.Config`
+        Pipeline configuration instance.
+    filenames : List[str]
+        Zeek log files to read, in order.
+    chunk_rows : int, default = None
+        Maximum number of rows in each emitted message. When None, `c.pipeline_batch_size` is used.
+    """
+
+    def __init__(self, c: Config, filenames: typing.List[str], chunk_rows: int = None):
+        super().__init__(c)
+
+        if (isinstance(filenames, str)):
+            filenames = [filenames]
+
+        self._filenames = list(filenames)
+        self._chunk_rows = chunk_rows if chunk_rows is not None else c.pipeline_batch_size
+
+        if (self._chunk_rows < 1):
+            raise ValueError("chunk_rows must be at least 1")
+
+    @property
+    def name(self) -> str:
+        """Return the name of the stage"""
+        return "from-zeek"
+
+    def supports_cpp_node(self) -> bool:
+        """Indicates whether or not this stage supports a C++ node"""
+        return False
+
+    def _generate_frames(self) -> typing.Iterator[MessageMeta]:
+        num_rows = 0
+
+        for filename in self._filenames:
+            logger.debug("Reading Zeek log '%s'", filename)
+
+            # Each chunk is already indexed by its row number within the file, offset it by the rows of previous files
+            # so rows remain unique across files
+            file_offset = num_rows
+
+            for df in ZeekLogReader(filename, chunk_rows=self._chunk_rows, df_type="cudf"):
+                df.index += file_offset
+                num_rows += len(df)
+
+                yield MessageMeta(df)
+
+    def _build_source(self, builder: mrc.Builder) -> StreamPair:
+        node = builder.make_source(self.unique_name, self._generate_frames())
+        return node, MessageMeta
@@ -25,6 +25,8 @@ from morpheus.common import FileTypes
 from morpheus.common import determine_file_type
 from morpheus.config import Config
 from morpheus.io import serializers
+from morpheus.io.rotating_file_writer import RotatingFileWriter
+from morpheus.io.rotating_file_writer import strip_compression_extension
 from morpheus.messages import MessageMeta
 from morpheus.pipeline.single_port_stage import SinglePortStage
 from morpheus.pipeline.stream_pair import StreamPair
@@ -36,7 +38,10 @@ class WriteToFileStage(SinglePortStage):
     """
     Write all messages to a file.
 
-    This class writes messages to a file.
+    This class writes messages to a file. By default each message is written synchronously to a single file. Setting
+    `background_writer`, `compression`, `max_file_bytes` or `max_file_age_sec`, or writing Parquet, instead queues the
+    messages for a `morpheus.io.rotating_file_writer.RotatingFileWriter`, which serializes, compresses and writes them
+    on a background thread, rotating the output file by size or age.
 
     Parameters
     ----------
@@ -48,11 +53,23 @@ class WriteToFileStage(SinglePortStage):
         Overwrite file if exists. Will generate an error otherwise.
     file_type : `morpheus.common.FileTypes`, optional, case_sensitive = False
         Indicates what type of file to write. Specifying 'auto' will determine the file type from the extension.
-        Supported extensions: 'csv', 'json' and 'jsonlines'
+        Supported extensions: 'csv', 'json', 'jsonlines' and 'parquet', optionally followed by a compression extension.
     include_index_col : bool, default = True
         Write out the index as a column, by default True.
     flush : bool, default = False, is_flag = True
         When `True` flush the output buffer to disk on each message.
+    background_writer : bool, default = False, is_flag = True
+        Write messages on a background thread, fed by a bounded queue.
+    queue_size : int, default = 64
+        Maximum number of messages waiting to be written by the background writer.
+    compression : str, optional
+        Compress the output with either 'gzip' or 'zstd'. Parquet files use the compression codec of the same name.
+    max_file_bytes : int, optional
+        Rotate to a new output file once this many bytes have been written to the current file.
+    max_file_age_sec : float, optional
+        Rotate to a new output file once the current file has been open for this many seconds.
+    parquet_row_group_rows : int, default = 100000
+        Number of rows to accumulate from consecutive messages before writing a Parquet row group.
     """
 
     def __init__(self,
@@ -61,7 +78,13 @@ class WriteToFileStage(SinglePortStage):
                  overwrite: bool = False,
                  file_type: FileTypes = FileTypes.Auto,
                  include_index_col: bool = True,
-                 flush: bool = False):
+                 flush: bool = False,
+                 background_writer: bool = False,
+                 queue_size: int = 64,
+                 compression: str = None,
+                 max_file_bytes: int = None,
+                 max_file_age_sec: float = None,
+                 parquet_row_group_rows: int = 100000):
 
         super().__init__(c)
 
@@ -78,12 +101,22 @@ class WriteToFileStage(SinglePortStage):
         self._file_type = file_type
 
         if (self._file_type == FileTypes.Auto):
-            self._file_type = determine_file_type(self._output_file)
+            self._file_type = determine_file_type(strip_compression_extension(self._output_file))
 
         self._is_first = True
         self._include_index_col = include_index_col
         self._flush = flush
 
+        self._use_writer = (background_writer or compression is not None or max_file_bytes is not None
+                            or max_file_age_sec is not None or self._file_type == FileTypes.PARQUET)
+        self._writer_kwargs = {
+            "compression": compression,
+            "max_file_bytes": max_file_bytes,
+            "max_file_age_sec": max_file_age_sec,
+            "queue_size": queue_size,
+            "row_group_rows": parquet_row_group_rows,
+        }
+
     @property
     def name(self) -> str:
         """Returns the name of this stage."""
@@ -103,24 +136,21 @@ class WriteToFileStage(SinglePortStage):
 
     def supports_cpp_node(self):
         """Indicates whether this stage supports a C++ node."""
-        return True
+        return not self._use_writer
 
-    def _convert_to_strings(self, df: DataFrameType):
+    def _convert_to_bytes(self, df: DataFrameType) -> memoryview:
         if (self._file_type == FileTypes.JSON):
-            output_strs = serializers.df_to_json(df, include_index_col=self._include_index_col)
+            records = serializers.df_to_json_bytes(df, include_index_col=self._include_index_col)
         elif (self._file_type == FileTypes.CSV):
-            output_strs = serializers.df_to_csv(df,
-                                                include_header=self._is_first,
-                                                include_index_col=self._include_index_col)
+            records = serializers.df_to_csv_bytes(df,
+                                                  include_header=self._is_first,
+                                                  include_index_col=self._include_index_col)
             self._is_first = False
         else:
             raise NotImplementedError(f"Unknown file type: {self._file_type}")
 
-        # Remove any trailing whitespace
-        if (len(output_strs[-1].strip()) == 0):
-            output_strs = output_strs[:-1]
-
-        return output_strs
+        # Excludes any trailing whitespace
+        return records.buffer
 
     def _build_single(self, builder: mrc.Builder, input_stream: StreamPair) -> StreamPair:
 
@@ -135,6 +165,28 @@ class WriteToFileStage(SinglePortStage):
                                                self._file_type,
                                                self._include_index_col,
                                                self._flush)
+        elif (self._use_writer):
+
+            def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
+
+                with RotatingFileWriter(self._output_file,
+                                        self._file_type,
+                                        include_index_col=self._include_index_col,
+                                        flush=self._flush,
+                                        **self._writer_kwargs) as writer:
+
+                    def write_to_file(x: MessageMeta):
+
+                        # Downstream stages may modify the message before the writer thread has serialized it
+                        writer.write(x.copy_dataframe())
+
+                        return x
+
+                    obs.pipe(ops.map(write_to_file)).subscribe(sub)
+
+                # All queued messages have been written and the file closed by here
+
+            to_file = builder.make_node(self.unique_name, ops.build(node_fn))
         else:
 
             def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
@@ -143,13 +195,11 @@ class WriteToFileStage(SinglePortStage):
                 os.makedirs(os.path.realpath(os.path.dirname(self._output_file)), exist_ok=True)
 
                 # Open up the file handle
-                with open(self._output_file, "a", encoding='UTF-8') as out_file:
+                with open(self._output_file, "ab") as out_file:
 
                     def write_to_file(x: MessageMeta):
 
-                        lines = self._convert_to_strings(x.df)
-
-                        out_file.writelines(lines)
+                        out_file.write(self._convert_to_bytes(x.df))
 
                         if self._flush:
                             out_file.flush()
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 import logging
 import time
 import typing
+from functools import partial
 
 import confluent_kafka as ck
 import mrc
@@ -30,6 +32,36 @@ from morpheus.pipeline.stream_pair import StreamPair
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass
+class KafkaProducerStats:
+    """Delivery statistics collected by `WriteToKafkaStage`."""
+
+    messages_produced: int = 0
+    bytes_produced: int = 0
+    messages_delivered: int = 0
+    bytes_delivered: int = 0
+    delivery_errors: int = 0
+    total_latency_sec: float = 0.0
+    max_latency_sec: float = 0.0
+    elapsed_sec: float = 0.0
+
+    @property
+    def mean_latency_sec(self) -> float:
+        """Mean time between producing a message and receiving its delivery report."""
+        if (self.messages_delivered == 0):
+            return 0.0
+
+        return self.total_latency_sec / self.messages_delivered
+
+    @property
+    def throughput_bytes_per_sec(self) -> float:
+        """Delivered bytes per second since the first message was produced."""
+        if (self.elapsed_sec == 0.0):
+            return 0.0
+
+        return self.bytes_delivered / self.elapsed_sec
+
+
 @register_stage("to-kafka")
 class WriteToKafkaStage(SinglePortStage):
     """
@@ -43,10 +75,24 @@ class WriteToKafkaStage(SinglePortStage):
         Kafka cluster bootstrap servers separated by comma.
     output_topic : str
         Output kafka topic.
-
+    client_id : str, default = None
+        An optional identifier of the producer.
+    pipelined : bool, default = False
+        When False, each message is passed downstream only once all of its records have been delivered. When True,
+        records are produced without waiting for delivery, and delivery reports are handled once per message, allowing
+        the pipeline to continue while the producer is sending. All records are delivered before the stage completes.
+    max_outstanding_bytes : int, default = None
+        Limits the number of bytes which have been produced but not yet delivered. When the limit is reached, producing
+        waits for delivery reports. Unbounded when None, other than by the queue limits of the producer.
     """
 
-    def __init__(self, c: Config, bootstrap_servers: str, output_topic: str, client_id: str = None):
+    def __init__(self,
+                 c: Config,
+                 bootstrap_servers: str,
+                 output_topic: str,
+                 client_id: str = None,
+                 pipelined: bool = False,
+                 max_outstanding_bytes: int = None):
         super().__init__(c)
 
         self._kafka_conf = {'bootstrap.servers': bootstrap_servers}
@@ -56,11 +102,20 @@ class WriteToKafkaStage(SinglePortStage):
         self._output_topic = output_topic
         self._poll_time = 0.2
         self._max_concurrent = c.num_threads
+        self._pipelined = pipelined
+        self._max_outstanding_bytes = max_outstanding_bytes
+
+        self._stats = KafkaProducerStats()
 
     @property
     def name(self) -> str:
         return "to-kafka"
 
+    @property
+    def stats(self) -> KafkaProducerStats:
+        """A copy of the delivery statistics of the stage."""
+        return dataclasses.replace(self._stats)
+
     def accepted_types(self) -> typing.Tuple:
         """
         Returns accepted input types for this stage.
@@ -85,46 +140,85 @@ class WriteToKafkaStage(SinglePortStage):
 
             producer = ck.Producer(self._kafka_conf)
 
-            outstanding_requests = 0
+            stats = self._stats
+            start_time = None
+            outstanding_bytes = 0
+
+            def cb(produce_time: float, num_bytes: int, err, msg):
+                nonlocal outstanding_bytes
+
+                outstanding_bytes -= num_bytes
+
+                if err is None and msg is not None and msg.value() is not None:
+                    latency = time.perf_counter() - produce_time
+                    stats.messages_delivered += 1
+                    stats.bytes_delivered += num_bytes
+                    stats.total_latency_sec += latency
+                    stats.max_latency_sec = max(stats.max_latency_sec, latency)
+                else:
+                    stats.delivery_errors += 1
+                    error = err if err is not None else msg.error()
+
+                    # fut.set_exception(err or msg.error())
+                    logger.error(("Error occurred in `to-kafka` stage with broker '%s' "
+                                  "while committing message:\n%s\nError:\n%s"),
+                                 self._kafka_conf["bootstrap.servers"],
+                                 msg.value() if msg is not None else None,
+                                 error)
+                    sub.on_error(error)
+
+            def produce(m: bytes):
+                nonlocal outstanding_bytes
+
+                # Wait for delivery reports to free up room. A record larger than the limit is sent on its own
+                if self._max_outstanding_bytes is not None:
+                    while outstanding_bytes > 0 and outstanding_bytes + len(m) > self._max_outstanding_bytes:
+                        producer.poll(self._poll_time)
+
+                # Push all of the messages
+                while True:
+                    try:
+                        # this runs asynchronously, in C-K's thread
+                        producer.produce(self._output_topic, m, callback=partial(cb, time.perf_counter(), len(m)))
+                        outstanding_bytes += len(m)
+                        stats.messages_produced += 1
+                        stats.bytes_produced += len(m)
+                        break
+                    except BufferError:
+                        producer.poll(self._poll_time)
+                    except Exception:
+                        logger.exception(("Error occurred in `to-kafka` stage with broker '%s' "
+                                          "while committing message:\n%s"),
+                                         self._kafka_conf["bootstrap.servers"],
+                                         m)
+                        break
+                    finally:
+                        if not self._pipelined:
+                            # Try and process some
+                            producer.poll(0)
 
             def on_next(x: MessageMeta):
-                nonlocal outstanding_requests
-
-                def cb(_, msg):
-                    if msg is not None and msg.value() is not None:
-                        pass
-                    else:
-                        # fut.set_exception(err or msg.error())
-                        logger.error(("Error occurred in `to-kafka` stage with broker '%s' "
-                                      "while committing message:\n%s\nError:\n%s"),
-                                     self._kafka_conf["bootstrap.servers"],
-                                     msg.value(),
-                                     msg.error())
-                        sub.on_error(msg.error())
-
-                records = serializers.df_to_json(x.df, strip_newlines=True)
-                for m in records:
+                nonlocal start_time
 
-                    # Push all of the messages
-                    while True:
-                        try:
-                            # this runs asynchronously, in C-K's thread
-                            producer.produce(self._output_topic, m, callback=cb)
-                            break
-                        except BufferError:
-                            time.sleep(self._poll_time)
-                        except Exception:
-                            logger.exception(("Error occurred in `to-kafka` stage with broker '%s' "
-                                              "while committing message:\n%s"),
-                                             self._kafka_conf["bootstrap.servers"],
-                                             m)
-                            break
-                        finally:
-                            # Try and process some
-                            producer.poll(0)
+                if start_time is None:
+                    start_time = time.perf_counter()
+
+                with x.mutable_dataframe() as df:
+                    # Newlines can not appear inside of a JSON encoded record, so the records are split from a
+                    # single buffer rather than serializing each row separately
+                    records = serializers.df_to_json_bytes(df).to_list(strip_newlines=True)
 
-                while len(producer) > 0:
+                for m in records:
+                    produce(m)
+
+                if self._pipelined:
+                    # Handle any delivery reports which have arrived without waiting for the rest
                     producer.poll(0)
+                else:
+                    while len(producer) > 0:
+                        producer.poll(0)
+
+                stats.elapsed_sec = time.perf_counter() - start_time
 
                 return x
 
@@ -132,9 +226,18 @@ class WriteToKafkaStage(SinglePortStage):
 
                 producer.flush(-1)
 
-            obs.pipe(ops.map(on_next), ops.on_completed(on_completed)).subscribe(sub)
+                if start_time is not None:
+                    stats.elapsed_sec = time.perf_counter() - start_time
+
+                logger.debug(
+                    "Kafka producer stats for topic '%s': %s, mean latency: %.6f sec, "
+                    "throughput: %.0f bytes/sec",
+                    self._output_topic,
+                    stats,
+                    stats.mean_latency_sec,
+                    stats.throughput_bytes_per_sec)
 
-            assert outstanding_requests == 0, "Not all inference requests were completed"
+            obs.pipe(ops.map(on_next), ops.on_completed(on_completed)).subscribe(sub)
 
         # Write to kafka
         node = builder.make_node(self.unique_name, ops.build(node_fn))
@@ -29,6 +29,7 @@ from morpheus.config import PipelineModes
 from morpheus.messages.message_meta import UserMessageMeta
 from morpheus.messages.multi_ae_message import MultiAEMessage
 from morpheus.models.dfencoder import AutoEncoder
+from morpheus.models.dfencoder import TrainingExecutor
 from morpheus.pipeline.multi_message_stage import MultiMessageStage
 from morpheus.pipeline.stream_pair import StreamPair
 from morpheus.utils.seed import manual_seed
@@ -36,6 +37,37 @@ from morpheus.utils.seed import manual_seed
 logger = logging.getLogger(__name__)
 
 
+def _fit_user_model(user_id: str, train_df: pd.DataFrame, feature_scaler: str, epochs: int, seed: int = None):
+    # If the seed is set, enforce that here
+    if (seed is not None):
+        manual_seed(seed)
+
+    model = AutoEncoder(
+        encoder_layers=[512, 500],  # layers of the encoding part
+        decoder_layers=[512],  # layers of the decoding part
+        activation='relu',  # activation function
+        swap_p=0.2,  # noise parameter
+        lr=0.01,  # learning rate
+        lr_decay=.99,  # learning decay
+        batch_size=512,
+        # logger='ipynb',
+        verbose=False,
+        optimizer='sgd',  # SGD optimizer is selected(Stochastic gradient descent)
+        scaler=feature_scaler,  # feature scaling method
+        min_cats=1,  # cut off for minority categories
+        progress_bar=False)
+
+    logger.debug("Training AE model for user: '%s'...", user_id)
+    model.fit(train_df, epochs=epochs)
+    train_loss_scores = model.get_anomaly_score(train_df)
+    scores_mean = train_loss_scores.mean()
+    scores_std = train_loss_scores.std()
+
+    logger.debug("Training AE model for user: '%s'... Complete.", user_id)
+
+    return model, scores_mean, scores_std
+
+
 class _UserModelManager(object):
 
     def __init__(self,
@@ -72,7 +104,7 @@ class _UserModelManager(object):
     def train_scores_std(self):
         return self._train_scores_std
 
-    def train(self, df: pd.DataFrame) -> AutoEncoder:
+    def build_train_df(self, df: pd.DataFrame) -> pd.DataFrame:
 
         # Determine how much history to save
         if (self._history is not None):
@@ -84,32 +116,34 @@ class _UserModelManager(object):
         else:
             train_df = df
 
-        # If the seed is set, enforce that here
-        if (self._seed is not None):
-            manual_seed(self._seed)
-
-        model = AutoEncoder(
-            encoder_layers=[512, 500],  # layers of the encoding part
-            decoder_layers=[512],  # layers of the decoding part
-            activation='relu',  # activation function
-            swap_p=0.2,  # noise parameter
-            lr=0.01,  # learning rate
-            lr_decay=.99,  # learning decay
-            batch_size=512,
-            # logger='ipynb',
-            verbose=False,
-            optimizer='sgd',  # SGD optimizer is selected(Stochastic gradient descent)
-            scaler=self._feature_scaler,  # feature scaling method
-            min_cats=1,  # cut off for minority categories
-            progress_bar=False)
-
-        logger.debug("Training AE model for user: '%s'...", self._user_id)
-        model.fit(train_df, epochs=self._epochs)
-        train_loss_scores = model.get_anomaly_score(train_df)
-        scores_mean = train_loss_scores.mean()
-        scores_std = train_loss_scores.std()
-
-        logger.debug("Training AE model for user: '%s'... Complete.", self._user_id)
+        return train_df
+
+    def submit(self, executor: TrainingExecutor, df: pd.DataFrame):
+        """
+        Submits training on `df` to `executor`. Once the job completes, `on_trained` should be called with its result.
+        """
+        train_df = self.build_train_df(df)
+        executor.submit(self._user_id,
+                        _fit_user_model,
+                        self._user_id,
+                        train_df,
+                        self._feature_scaler,
+                        self._epochs,
+                        self._seed,
+                        context=train_df)
+
+    def train(self, df: pd.DataFrame) -> AutoEncoder:
+        train_df = self.build_train_df(df)
+
+        model, scores_mean, scores_std = _fit_user_model(self._user_id,
+                                                         train_df,
+                                                         self._feature_scaler,
+                                                         self._epochs,
+                                                         self._seed)
+
+        return self.on_trained(train_df, model, scores_mean, scores_std)
+
+    def on_trained(self, train_df: pd.DataFrame, model: AutoEncoder, scores_mean, scores_std):
 
         if (self._save_model):
             self._model = model
@@ -156,6 +190,9 @@ class TrainAEStage(MultiMessageStage):
         If true the list of files matching `input_glob` will be processed in sorted order.
     models_output_filename : pathlib.Path, default = None, writable = True
         The location to write trained models to.
+    train_workers : int, default = 0, min = 0
+        When `train_data_glob` is provided, the number of worker processes used to train the per-user models in
+        parallel. When 0, user models are trained serially.
     """
 
     def __init__(self,
@@ -168,7 +205,8 @@ class TrainAEStage(MultiMessageStage):
                  train_max_history: int = 1000,
                  seed: int = None,
                  sort_glob: bool = False,
-                 models_output_filename: pathlib.Path = None):
+                 models_output_filename: pathlib.Path = None,
+                 train_workers: int = 0):
         super().__init__(c)
 
         self._config = c
@@ -183,6 +221,7 @@ class TrainAEStage(MultiMessageStage):
         self._seed = seed
         self._sort_glob = sort_glob
         self._models_output_filename = models_output_filename
+        self._train_workers = train_workers
 
         self._source_stage_class = source_stage_class
         if self._source_stage_class is not None:
@@ -243,6 +282,28 @@ class TrainAEStage(MultiMessageStage):
 
         return self._user_models[x.user_id].train(x.df)
 
+    def _train_user_models(self, user_to_df: typing.Dict[str, pd.DataFrame]):
+        """
+        Trains the models in `self._user_models` for each user in `user_to_df`, either serially or in worker processes.
+        """
+        if (self._train_workers == 0):
+            for user_id, df in user_to_df.items():
+                self._user_models[user_id].train(df)
+
+            return
+
+        with TrainingExecutor(max_workers=self._train_workers) as executor:
+            for user_id, df in user_to_df.items():
+                self._user_models[user_id].submit(executor, df)
+
+            for result in executor.wait_all():
+                if not result.succeeded:
+                    raise RuntimeError(f"Training failed for user '{result.user_id}'") from result.error
+
+                self._user_models[result.user_id].on_trained(result.context, *result.result)
+
+            logger.debug("Trained %d user models, %.2f users/sec", executor.completed_count, executor.users_per_second)
+
     def _build_single(self, builder: mrc.Builder, input_stream: StreamPair) -> StreamPair:
         stream = input_stream[0]
 
@@ -273,6 +334,8 @@ class TrainAEStage(MultiMessageStage):
                                                                         self._feature_columns,
                                                                         self._config.ae.userid_filter)
 
+            train_dfs: typing.Dict[str, pd.DataFrame] = {}
+
             if self._use_generic_model:
                 self._user_models["generic"] = _UserModelManager(self._config,
                                                                  "generic",
@@ -284,7 +347,7 @@ class TrainAEStage(MultiMessageStage):
                 all_users_df = pd.concat(user_to_df.values(), ignore_index=True)
                 all_users_df = self._source_stage_class.derive_features(all_users_df, self._feature_columns)
                 all_users_df = all_users_df.fillna("nan")
-                self._user_models["generic"].train(all_users_df)
+                train_dfs["generic"] = all_users_df
 
             for user_id, df in user_to_df.items():
                 if len(df.index) >= self._train_min_history:
@@ -299,7 +362,9 @@ class TrainAEStage(MultiMessageStage):
                     # print(df)
                     df = self._source_stage_class.derive_features(df, self._feature_columns)
                     df = df.fillna("nan")
-                    self._user_models[user_id].train(df)
+                    train_dfs[user_id] = df
+
+            self._train_user_models(train_dfs)
 
             # Save trained user models
             if self._models_output_filename is not None:
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import dataclasses
 import json
 import logging
@@ -20,15 +21,24 @@ import typing
 from datetime import datetime
 from functools import partial
 
+import numpy as np
 import nvtabular as nvt
 import pandas as pd
 
 import cudf
 
+if typing.TYPE_CHECKING:
+    from morpheus.utils.schema_plan import SchemaPlan
+
 logger = logging.getLogger(f"morpheus.{__name__}")
 
 DEFAULT_DATE = '1970-01-01T00:00:00.000000+00:00'
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # Note(Devin): Proxying this for backwards compatibility. Had to move the primary definition to avoid circular imports.
 def process_dataframe(df_in: typing.Union[pd.DataFrame, cudf.DataFrame], input_schema) -> pd.DataFrame:
@@ -53,11 +63,111 @@ def process_dataframe(df_in: typing.Union[pd.DataFrame, cudf.DataFrame], input_s
     return schema_transforms.process_dataframe(df_in, input_schema)
 
 
+class DistinctIncrementState:
+    """
+    Carries the distinct values seen for each group and period across batches, allowing distinct increment columns to
+    be computed for a stream of batches without reprocessing previous batches.
+
+    Memory grows with the number of distinct values for each group and period. Call `clear` to release the state once
+    older periods are no longer needed.
+    """
+
+    def __init__(self):
+        self._seen: typing.Dict[typing.Tuple[typing.Any, typing.Any], typing.Set[typing.Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def clear(self):
+        """Removes all state."""
+        self._seen.clear()
+
+    def get_seen(self, period: typing.Any, group: typing.Any) -> typing.Set[typing.Any]:
+        """Returns the set of values previously seen for `group` during `period`."""
+        return self._seen.setdefault((period, group), set())
+
+
+def _distinct_increment(per_period: pd.Series,
+                        groups: pd.Series,
+                        values: pd.Series,
+                        state: DistinctIncrementState = None) -> pd.Series:
+    """
+    Counts the distinct `values` seen so far, in row order, within each combination of `per_period` and `groups`.
+
+    Each key is factorized to integer codes once. First occurrences are then found on the combined codes, and rows are
+    stably sorted by group so the counts can be computed with a single cumulative sum rather than a Python callback per
+    group.
+    """
+    (period_codes, period_uniques) = pd.factorize(per_period)
+    (group_codes, group_uniques) = pd.factorize(groups)
+    (value_codes, value_uniques) = pd.factorize(values)
+
+    # Missing values are counted as the string "nan"
+    if ((value_codes < 0).any()):
+        (value_codes, value_uniques) = pd.factorize(values.fillna("nan"))
+
+    valid = (period_codes >= 0) & (group_codes >= 0)
+
+    (_, group_first_rows, group_ids) = np.unique(period_codes.astype(np.int64) * (len(group_uniques) + 1) + group_codes,
+                                                 return_index=True,
+                                                 return_inverse=True)
+    num_groups = len(group_first_rows)
+
+    # Index of the first row containing each (group, value) pair
+    (_, first_rows) = np.unique(group_ids.astype(np.int64) * (len(value_uniques) + 1) + value_codes, return_index=True)
+
+    is_first = np.zeros(len(group_ids), dtype=bool)
+    is_first[first_rows] = True
+    is_first &= valid
+
+    offsets = None
+    if (state is not None):
+        offsets = np.zeros(num_groups, dtype=np.int64)
+        for (group_id, row) in enumerate(group_first_rows):
+            if (valid[row]):
+                seen = state.get_seen(period_uniques[period_codes[row]], group_uniques[group_codes[row]])
+                offsets[group_id] = len(seen)
+
+        # Values seen in a previous batch do not increment the count
+        for row in np.flatnonzero(is_first):
+            seen = state.get_seen(period_uniques[period_codes[row]], group_uniques[group_codes[row]])
+            value = value_uniques[value_codes[row]]
+
+            if (value in seen):
+                is_first[row] = False
+            else:
+                seen.add(value)
+
+    order = np.argsort(group_ids, kind="stable")
+    sorted_ids = group_ids[order]
+    counts_sorted = np.cumsum(is_first[order], dtype=np.int64)
+
+    # Subtract the running total from before the start of each group
+    group_starts = np.flatnonzero(np.concatenate(([True], sorted_ids[1:] != sorted_ids[:-1])))
+    start_totals = counts_sorted[group_starts] - is_first[order][group_starts]
+    counts_sorted -= np.repeat(start_totals, np.diff(np.append(group_starts, len(sorted_ids))))
+
+    counts = np.empty_like(counts_sorted)
+    counts[order] = counts_sorted
+
+    if (offsets is not None):
+        counts += offsets[group_ids]
+
+    increment_col = pd.Series(counts, index=per_period.index)
+
+    # Match the groupby behavior of skipping rows with a missing key
+    if (not valid.all()):
+        increment_col = increment_col[valid]
+
+    return increment_col
+
+
 def create_increment_col(df: pd.DataFrame,
                          column_name: str,
                          groupby_column: str = "username",
                          timestamp_column: str = "timestamp",
-                         period: str = "D") -> pd.Series:
+                         period: str = "D",
+                         state: DistinctIncrementState = None) -> pd.Series:
     """
     Create a new integer column counting unique occurrences of values in `column_name` grouped per-day using the
     timestamp values in `timestamp_column` and then grouping by `groupby_column` returning incrementing values starting
@@ -75,6 +185,8 @@ def create_increment_col(df: pd.DataFrame,
         The column containing timestamp values.
     period: str, default "D"
         The period to group by.
+    state : DistinctIncrementState, optional
+        When provided, counting continues from the values seen in previous calls using the same state, by default None.
 
     Returns
     -------
@@ -91,12 +203,7 @@ def create_increment_col(df: pd.DataFrame,
 
     per_day = time_col.dt.to_period(period)
 
-    cat_col: pd.Series = df.groupby([per_day, groupby_column
-                                     ])[column_name].transform(lambda x: pd.factorize(x.fillna("nan"))[0] + 1)
-
-    increment_col = pd.concat([cat_col, df[groupby_column]],
-                              axis=1).groupby([per_day, groupby_column
-                                               ])[column_name].expanding(1).max().droplevel(0).droplevel(0)
+    increment_col = _distinct_increment(per_day, df[groupby_column], df[column_name], state=state)
 
     return increment_col.astype("int")
 
@@ -537,12 +644,16 @@ class DistinctIncrementColumn(RenameColumn):
         The period to use when grouping.
     timestamp_column : str
         The column to use for determining the period.
+    state : DistinctIncrementState
+        Optional state carrying the values seen in previous batches. When set, each batch continues counting from the
+        previous batches rather than requiring the whole window to be reprocessed.
 
     """
 
     groupby_column: str = "username"
     period: str = "D"
     timestamp_column: str = "timestamp"
+    state: DistinctIncrementState = dataclasses.field(default=None, repr=False, compare=False)
 
     def get_input_column_types(self) -> dict[str, str]:
         """
@@ -572,24 +683,93 @@ class DistinctIncrementColumn(RenameColumn):
 
         per_period = df[self.timestamp_column].dt.to_period(self.period)
 
-        cat_col: pd.Series = df.groupby([per_period, self.groupby_column
-                                         ])[self.input_name].transform(lambda x: pd.factorize(x.fillna("nan"))[0] + 1)
-
-        increment_col = pd.concat([cat_col, df[self.groupby_column]],
-                                  axis=1).groupby([per_period, self.groupby_column
-                                                   ])[self.input_name].expanding(1).max().droplevel(0).droplevel(0)
+        increment_col = _distinct_increment(per_period, df[self.groupby_column], df[self.input_name], state=self.state)
 
         return increment_col.astype(self.get_pandas_dtype())
 
 
+def _get_json_path(value: dict, path: typing.Tuple[str, ...]) -> typing.Any:
+    """
+    Returns the value at `path` in the nested dictionary `value`, matching the naming used by `pandas.json_normalize`.
+    Keys which themselves contain a `.` are matched by trying the longest joined key first. Returns `numpy.nan` when the
+    path does not exist or refers to a nested dictionary, since `pandas.json_normalize` would not produce that column.
+    """
+    for i in range(len(path), 0, -1):
+        key = path[0] if i == 1 else ".".join(path[:i])
+
+        if (key not in value):
+            continue
+
+        child = value[key]
+
+        if (i == len(path)):
+            return np.nan if isinstance(child, dict) else child
+
+        if (isinstance(child, dict)):
+            return _get_json_path(child, path[i:])
+
+    return np.nan
+
+
+def _extract_json_paths(values: typing.List[typing.Any],
+                        paths: typing.List[typing.Tuple[str, ...]]) -> typing.List[typing.List[typing.Any]]:
+    """
+    Parses each JSON value in `values`, returning one list of extracted values for each entry in `paths`.
+    """
+    columns = [[] for _ in paths]
+
+    for value in values:
+        if (not isinstance(value, dict)):
+            value = _json_loads(value)
+
+        for (path, column) in zip(paths, columns):
+            column.append(_get_json_path(value, path))
+
+    return columns
+
+
+def _resolve_json_paths(json_cols: typing.Iterable[str],
+                        input_columns: typing.Iterable[str],
+                        existing_columns: typing.Iterable[str]) -> dict[str, dict[str, typing.Tuple[str, ...]]]:
+    """
+    Determines the paths which need to be extracted from each JSON column in `json_cols` to produce the columns in
+    `input_columns`. Columns which already exist in `existing_columns` are not extracted.
+
+    Returns
+    -------
+    dict[str, dict[str, typing.Tuple[str, ...]]]
+        Mapping of JSON column name to a mapping of output column name to the path within the JSON object.
+    """
+    existing_columns = set(existing_columns)
+
+    json_paths = {col: {} for col in json_cols}
+
+    for name in input_columns:
+        if (name in existing_columns):
+            continue
+
+        for col in json_cols:
+            prefix = col + "."
+            if (name.startswith(prefix) and len(name) > len(prefix)):
+                json_paths[col][name] = tuple(name[len(prefix):].split('.'))
+                break
+
+    return json_paths
+
+
 def _json_flatten(df_input: typing.Union[pd.DataFrame, cudf.DataFrame],
                   input_columns: dict[str, str],
                   json_cols: list[str],
-                  preserve_re: re.Pattern = None):
+                  preserve_re: re.Pattern = None,
+                  chunk_size: int = 10000,
+                  executor: concurrent.futures.Executor = None):
     """
     Prepares a DataFrame for processing by flattening JSON columns and converting to Pandas if necessary. Will remove
     all columns that are not specified in `input_columns` or matched by `preserve_re`.
 
+    Only the JSON paths referenced by `input_columns` are extracted, avoiding building flattened columns which would
+    immediately be removed.
+
     Parameters
     ----------
     df_input : typing.Union[pd.DataFrame, cudf.DataFrame]
@@ -600,6 +780,10 @@ def _json_flatten(df_input: typing.Union[pd.DataFrame, cudf.DataFrame],
         List of JSON columns to flatten.
     preserve_re : re.Pattern, optional
         A RegEx where matching column names will be preserved, by default None
+    chunk_size : int, optional
+        Number of rows parsed at a time, by default 10000
+    executor : concurrent.futures.Executor, optional
+        When provided, chunks are parsed in parallel using this executor, by default None
 
     Returns
     -------
@@ -612,42 +796,51 @@ def _json_flatten(df_input: typing.Union[pd.DataFrame, cudf.DataFrame],
         return df_input
 
     # Check if we even have any JSON columns to flatten
-    if (not df_input.columns.intersection(json_cols).empty):
-        convert_to_cudf = False
+    present_json_cols = [col for col in json_cols if col in df_input.columns]
 
-        if (isinstance(df_input, cudf.DataFrame)):
-            convert_to_cudf = True
-            df_input = df_input.to_pandas()
+    if (len(present_json_cols) > 0):
+        is_cudf = isinstance(df_input, cudf.DataFrame)
 
-        json_normalized = []
-        cols_to_keep = list(df_input.columns)
-        for col in json_cols:
-            if (col not in cols_to_keep):
+        json_paths = _resolve_json_paths(present_json_cols, input_columns.keys(), df_input.columns)
+
+        flattened = {}
+        for col in present_json_cols:
+            paths = json_paths[col]
+
+            if (len(paths) == 0):
                 continue
 
-            pd_series = df_input[col]
+            # Only the JSON column itself needs to be moved to the host
+            values = (df_input[col].to_pandas() if is_cudf else df_input[col]).tolist()
 
-            # Get the flattened columns
-            pd_series = pd_series.apply(lambda x: x if isinstance(x, dict) else json.loads(x))
-            pdf_norm = pd.json_normalize(pd_series)
+            chunk_size = max(chunk_size, 1)
+            chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+            extract_fn = partial(_extract_json_paths, paths=list(paths.values()))
 
-            # Prefix column names with the JSON column name
-            pdf_norm.rename(columns=lambda x, col=col: col + "." + x, inplace=True)
+            if (executor is not None and len(chunks) > 1):
+                chunk_results = list(executor.map(extract_fn, chunks))
+            else:
+                chunk_results = [extract_fn(chunk) for chunk in chunks]
 
-            # Reset the index otherwise there is a conflict
-            pdf_norm.set_index(df_input.index, inplace=True)
+            for (i, name) in enumerate(paths.keys()):
+                flattened[name] = [v for chunk_result in chunk_results for v in chunk_result[i]]
 
-            json_normalized.append(pdf_norm)
+        # Keep only the existing columns which will survive the reindex below
+        cols_to_keep = []
+        for col in input_columns.keys():
+            if (col not in df_input.columns or col in flattened):
+                continue
 
-            # Remove from the list of remaining columns
-            if (preserve_re is None or not preserve_re.match(col)):
-                cols_to_keep.remove(col)
+            if (col not in present_json_cols or (preserve_re is not None and preserve_re.match(col))):
+                cols_to_keep.append(col)
 
-        # Combine the original DataFrame with the normalized JSON columns
-        df_input = pd.concat([df_input[cols_to_keep]] + json_normalized, axis=1)
+        if (is_cudf):
+            df_input = df_input[cols_to_keep].reset_index(drop=True)
 
-        if (convert_to_cudf):
-            df_input = cudf.from_pandas(df_input).reset_index(drop=True)
+            if (len(flattened) > 0):
+                df_input = cudf.concat([df_input, cudf.from_pandas(pd.DataFrame(flattened))], axis=1)
+        else:
+            df_input = pd.concat([df_input[cols_to_keep], pd.DataFrame(flattened, index=df_input.index)], axis=1)
 
     # Remove all columns that are not in the input columns list. Ensure the correct types
     df_input = df_input.reindex(columns=input_columns.keys(), fill_value=None)
@@ -699,6 +892,14 @@ class DataFrameInputSchema:
         The columns to preserve.
     row_filter : Callable[[pandas.DataFrame], pandas.DataFrame]
         A function to filter the rows of the DataFrame.
+    json_chunk_size : int
+        The number of rows parsed at a time when flattening the `json_columns`.
+    json_executor : concurrent.futures.Executor
+        Optional executor used to parse chunks of the `json_columns` in parallel. The lifetime of the executor is owned
+        by the caller.
+    use_schema_plan : bool
+        When `True`, `process_dataframe` executes a compiled pandas `SchemaPlan` for this schema instead of an NVTabular
+        workflow.
 
     Methods
     -------
@@ -711,12 +912,16 @@ class DataFrameInputSchema:
     column_info: typing.List[ColumnInfo] = dataclasses.field(default_factory=list)
     preserve_columns: typing.Pattern[str] = dataclasses.field(default_factory=list)
     row_filter: typing.Callable[[pd.DataFrame], pd.DataFrame] = None
+    json_chunk_size: int = 10000
+    json_executor: concurrent.futures.Executor = dataclasses.field(default=None, repr=False, compare=False)
+    use_schema_plan: bool = False
 
     json_output_columns: typing.List[tuple[str, str]] = dataclasses.field(init=False, repr=False)
     input_columns: typing.Dict[str, str] = dataclasses.field(init=False, repr=False)
     output_columns: typing.List[tuple[str, str]] = dataclasses.field(init=False, repr=False)
 
     nvt_workflow: nvt.Workflow = dataclasses.field(init=False, repr=False)
+    schema_plan: "SchemaPlan" = dataclasses.field(init=False, repr=False, compare=False)
     prep_dataframe: typing.Callable[[pd.DataFrame], typing.List[str]] = dataclasses.field(init=False, repr=False)
 
     def __post_init__(self):
@@ -762,6 +967,9 @@ class DataFrameInputSchema:
         self.prep_dataframe = partial(_json_flatten,
                                       input_columns=self.input_columns,
                                       json_cols=self.json_columns,
-                                      preserve_re=self.preserve_columns)
+                                      preserve_re=self.preserve_columns,
+                                      chunk_size=self.json_chunk_size,
+                                      executor=self.json_executor)
 
         self.nvt_workflow = None
+        self.schema_plan = None
@@ -16,10 +16,12 @@ Downloader utility class for fetching files, potentially from a remote file serv
 by the `DownloadMethods` enum.
 """
 
+import concurrent.futures
 import logging
 import multiprocessing as mp
 import os
 import typing
+from concurrent.futures import Future
 from enum import Enum
 
 import fsspec
@@ -36,15 +38,20 @@ class DownloadMethods(str, Enum):
     MULTIPROCESSING = "multiprocessing"
     DASK = "dask"
     DASK_THREAD = "dask_thread"
+    THREAD_POOL = "thread_pool"
+    PROCESS_POOL = "process_pool"
 
 
 DOWNLOAD_METHODS_MAP = {dl.value: dl for dl in DownloadMethods}
 
+# Download methods which use a persistent `concurrent.futures` executor
+POOL_DOWNLOAD_METHODS = (DownloadMethods.THREAD_POOL, DownloadMethods.PROCESS_POOL)
+
 
 class Downloader:
     """
     Downloads a list of `fsspec.core.OpenFiles` files using one of the following methods:
-        single_thread, multiprocess, dask or dask_thread
+        single_thread, multiprocess, dask, dask_thread, thread_pool or process_pool
 
     The download method can be passed in via the `download_method` parameter or via the `MORPHEUS_FILE_DOWNLOAD_TYPE`
     environment variable. If both are set, the environment variable takes precedence, by default `dask_thread` is used.
@@ -53,6 +60,11 @@ class Downloader:
 
     For compatibility reasons "multiprocessing" is an alias for "multiprocess".
 
+    The thread_pool and process_pool methods create an executor on first use which is reused for every call until
+    `close` is called, avoiding the cost of starting a new pool for each batch. A thread pool suits fetches which are
+    bound by I/O, while a process pool suits files which are expensive to parse. Work can be submitted ahead of time
+    with `submit`, allowing the next batch to be fetched while the current one is being processed.
+
     Parameters
     ----------
     download_method : typing.Union[DownloadMethods, str], optional, default = DownloadMethods.DASK_THREAD
@@ -60,15 +72,28 @@ class Downloader:
         presedence.
     dask_heartbeat_interval : str, optional, default = "30s"
         The heartbeat interval to use when using dask or dask_thread.
+    max_workers : int, optional
+        The number of workers to use with thread_pool or process_pool. When None, the `MORPHEUS_FILE_DOWNLOAD_WORKERS`
+        environment variable is used if set, otherwise the number of CPUs.
     """
 
     def __init__(self,
                  download_method: typing.Union[DownloadMethods, str] = DownloadMethods.DASK_THREAD,
-                 dask_heartbeat_interval: str = "30s"):
+                 dask_heartbeat_interval: str = "30s",
+                 max_workers: int = None):
 
         self._merlin_distributed = None
         self._dask_cluster = None
         self._dask_heartbeat_interval = dask_heartbeat_interval
+        self._executor: concurrent.futures.Executor = None
+
+        if (max_workers is None and "MORPHEUS_FILE_DOWNLOAD_WORKERS" in os.environ):
+            max_workers = int(os.environ["MORPHEUS_FILE_DOWNLOAD_WORKERS"])
+
+        if (max_workers is not None and max_workers < 1):
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self._max_workers = max_workers if max_workers is not None else mp.cpu_count()
 
         download_method = os.environ.get("MORPHEUS_FILE_DOWNLOAD_TYPE", download_method)
 
@@ -87,6 +112,35 @@ class Downloader:
         """Return the download method."""
         return self._download_method
 
+    @property
+    def max_workers(self) -> int:
+        """Return the number of workers used by the thread_pool and process_pool methods."""
+        return self._max_workers
+
+    def get_executor(self) -> concurrent.futures.Executor:
+        """
+        Get the executor used by the thread_pool and process_pool methods. If the executor does not exist, it is
+        created.
+
+        Returns
+        -------
+        concurrent.futures.Executor
+        """
+        if (self._download_method not in POOL_DOWNLOAD_METHODS):
+            raise RuntimeError(f"Download method {self._download_method} does not use an executor")
+
+        if (self._executor is None):
+            logger.debug("Creating %s executor with %d workers", self._download_method.value, self._max_workers)
+
+            if (self._download_method == DownloadMethods.THREAD_POOL):
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers,
+                                                                       thread_name_prefix="downloader")
+            else:
+                self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self._max_workers,
+                                                                        mp_context=mp.get_context("spawn"))
+
+        return self._executor
+
     def get_dask_cluster(self):
         """
         Get the dask cluster used by this downloader. If the cluster does not exist, it is created.
@@ -130,8 +184,74 @@ class Downloader:
         return self._merlin_distributed
 
     def close(self):
-        """Cluster management is handled by Merlin.Distributed"""
-        pass
+        """
+        Shuts down the executor used by the thread_pool and process_pool methods, if it was created. Dask cluster
+        management is handled by Merlin.Distributed.
+        """
+        if (self._executor is not None):
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def submit(self,
+               download_buckets: fsspec.core.OpenFiles,
+               download_fn: typing.Callable[[fsspec.core.OpenFile], pd.DataFrame]) -> typing.List[Future]:
+        """
+        Start downloading the files in `download_buckets` without waiting for them to complete. With the thread_pool and
+        process_pool methods, the downloads run in the background. The other methods download the files before
+        returning, and the returned futures are already completed.
+
+        Parameters
+        ----------
+        download_buckets : typing.Iterable[fsspec.core.OpenFiles]
+            Files to download
+        download_fn : typing.Callable[[fsspec.core.OpenFiles], pd.DataFrame]
+            Function used to download an individual file and return the contents as a pandas DataFrame
+
+        Returns
+        -------
+        typing.List[Future]
+            One future for each file, in the same order as `download_buckets`.
+        """
+        if (self._download_method in POOL_DOWNLOAD_METHODS):
+            executor = self.get_executor()
+            return [executor.submit(download_fn, open_file) for open_file in download_buckets]
+
+        futures = []
+        for df in self.download(download_buckets, download_fn):
+            future = Future()
+            future.set_result(df)
+            futures.append(future)
+
+        return futures
+
+    def iter_download(self,
+                      download_buckets: fsspec.core.OpenFiles,
+                      download_fn: typing.Callable[[fsspec.core.OpenFile], pd.DataFrame],
+                      ordered: bool = True) -> typing.Iterator[pd.DataFrame]:
+        """
+        Download the files in `download_buckets`, yielding each result as it becomes available. Refer to `submit` for
+        how each download method behaves.
+
+        Parameters
+        ----------
+        download_buckets : typing.Iterable[fsspec.core.OpenFiles]
+            Files to download
+        download_fn : typing.Callable[[fsspec.core.OpenFiles], pd.DataFrame]
+            Function used to download an individual file and return the contents as a pandas DataFrame
+        ordered : bool, optional, default = True
+            When True, results are yielded in the order of `download_buckets`, otherwise in the order they complete.
+
+        Returns
+        -------
+        typing.Iterator[pd.DataFrame]
+        """
+        futures = self.submit(download_buckets, download_fn)
+
+        if (not ordered):
+            futures = concurrent.futures.as_completed(futures)
+
+        for future in futures:
+            yield future.result()
 
     def download(self,
                  download_buckets: fsspec.core.OpenFiles,
@@ -159,6 +279,9 @@ class Downloader:
                 dfs = dist.client.map(download_fn, download_buckets)
                 dfs = dist.client.gather(dfs)
 
+        elif (self._download_method in POOL_DOWNLOAD_METHODS):
+            dfs = list(self.get_executor().map(download_fn, download_buckets))
+
         elif (self._download_method in ("multiprocess", "multiprocessing")):
             # Use multiprocessing here since parallel downloads are a pain
             with mp.get_context("spawn").Pool(mp.cpu_count()) as pool:
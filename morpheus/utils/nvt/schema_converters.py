@@ -37,6 +37,7 @@ from morpheus.utils.column_info import CustomColumn
 from morpheus.utils.column_info import DataFrameInputSchema
 from morpheus.utils.column_info import DateTimeColumn
 from morpheus.utils.column_info import DistinctIncrementColumn
+from morpheus.utils.column_info import DistinctIncrementState
 from morpheus.utils.column_info import IncrementColumn
 from morpheus.utils.column_info import RenameColumn
 from morpheus.utils.column_info import StringCatColumn
@@ -273,13 +274,15 @@ def _distinct_increment_column(df: pd.DataFrame,
                                input_column: str,
                                groupby_column: str = "username",
                                period: str = 'D',
-                               timestamp_column: str = "timestamp") -> pd.DataFrame:
+                               timestamp_column: str = "timestamp",
+                               state: DistinctIncrementState = None) -> pd.DataFrame:
 
     output_series = create_increment_col(df=df,
                                          column_name=input_column,
                                          groupby_column=groupby_column,
                                          period=period,
-                                         timestamp_column=timestamp_column)
+                                         timestamp_column=timestamp_column,
+                                         state=state)
 
     return pd.DataFrame({output_column: output_series}, index=output_series.index)
 
@@ -290,9 +293,10 @@ def _nvt_distinct_increment_column(_: ColumnSelector,
                                    input_column: str,
                                    groupby_column: str = "username",
                                    period: str = 'D',
-                                   timestamp_column: str = "timestamp") -> typing.Union[pd.DataFrame, cudf.DataFrame]:
+                                   timestamp_column: str = "timestamp",
+                                   state: DistinctIncrementState = None) -> typing.Union[pd.DataFrame, cudf.DataFrame]:
 
-    return _distinct_increment_column(df, output_column, input_column, groupby_column, period, timestamp_column)
+    return _distinct_increment_column(df, output_column, input_column, groupby_column, period, timestamp_column, state)
 
 
 @sync_df_as_pandas()
@@ -359,7 +363,8 @@ ColumnInfoProcessingMap = {
                              input_column=ci.input_name,
                              groupby_column=ci.groupby_column,
                              period=ci.period,
-                             timestamp_column=ci.timestamp_column),
+                             timestamp_column=ci.timestamp_column,
+                             state=ci.state),
                      dependencies=deps,
                      output_columns=[(ci.name, ci.dtype)],
                      label=(f"[DistinctIncrementColumn] "
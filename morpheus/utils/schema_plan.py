@@ -0,0 +1,264 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import logging
+import typing
+
+import numpy as np
+import pandas as pd
+
+import cudf
+
+from morpheus.utils.column_info import ColumnInfo
+from morpheus.utils.column_info import DataFrameInputSchema
+from morpheus.utils.column_info import DateTimeColumn
+from morpheus.utils.column_info import RenameColumn
+
+logger = logging.getLogger(__name__)
+
+
+class _PlanContext:
+    """
+    Holds the state for a single execution of a `SchemaPlan`. Intermediate results are cached here so that operations
+    sharing an input, such as several columns casting the same source column, only compute it once per batch.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.outputs: typing.Dict[str, pd.Series] = {}
+        self._cache: typing.Dict[typing.Hashable, pd.Series] = {}
+
+    def cached(self, key: typing.Hashable, compute_fn: typing.Callable[[], pd.Series]) -> pd.Series:
+        if (key not in self._cache):
+            self._cache[key] = compute_fn()
+
+        return self._cache[key]
+
+    def empty_series(self, dtype: str) -> pd.Series:
+        return pd.Series(None, index=self.df.index, dtype=dtype)
+
+
+def _cast(series: pd.Series, dtype: str) -> pd.Series:
+    """
+    Casts `series` to `dtype`, returning `series` unchanged when it already has the requested type. Object and string
+    types are always cast since the values themselves may need to be converted.
+    """
+    try:
+        target = np.dtype(dtype)
+    except TypeError:
+        target = None
+
+    if (target is not None and target != np.dtype(object) and series.dtype == target):
+        return series
+
+    return series.astype(dtype)
+
+
+@dataclasses.dataclass
+class _PlanStep:
+    col_info: ColumnInfo
+
+    # Inputs which are produced by another step in the plan rather than read from the incoming DataFrame
+    dependencies: typing.List[str]
+
+    execute: typing.Callable[["_PlanStep", _PlanContext], pd.Series]
+
+
+def _execute_cast(step: _PlanStep, ctx: _PlanContext) -> pd.Series:
+    col_info = step.col_info
+    input_name = col_info.input_name if isinstance(col_info, RenameColumn) else col_info.name
+    dtype = col_info.get_pandas_dtype()
+
+    if (input_name in step.dependencies):
+        return _cast(ctx.outputs[input_name], dtype)
+
+    if (input_name not in ctx.df.columns):
+        return ctx.empty_series(dtype)
+
+    return ctx.cached(("cast", input_name, dtype), lambda: _cast(ctx.df[input_name], dtype))
+
+
+def _execute_datetime(step: _PlanStep, ctx: _PlanContext) -> pd.Series:
+    col_info: DateTimeColumn = step.col_info
+    dtype = col_info.get_pandas_dtype()
+
+    def compute_fn(series: pd.Series):
+        return pd.to_datetime(series, infer_datetime_format=True, utc=True).astype(dtype)
+
+    if (col_info.input_name in step.dependencies):
+        return compute_fn(ctx.outputs[col_info.input_name])
+
+    return ctx.cached(("datetime", col_info.input_name, dtype), lambda: compute_fn(ctx.df[col_info.input_name]))
+
+
+def _execute_generic(step: _PlanStep, ctx: _PlanContext) -> pd.Series:
+    df = ctx.df
+
+    # Only build a new frame when an input needs to be substituted with the output of another step
+    if (len(step.dependencies) > 0):
+        df = df.assign(**{name: ctx.outputs[name] for name in step.dependencies})
+
+    return step.col_info._process_column(df)
+
+
+# Operations with a specialized implementation. Matched on the exact type, any other `ColumnInfo` falls back to calling
+# its `_process_column` method
+_STEP_EXECUTORS: typing.Dict[type, typing.Callable[[_PlanStep, _PlanContext], pd.Series]] = {
+    ColumnInfo: _execute_cast,
+    RenameColumn: _execute_cast,
+    DateTimeColumn: _execute_datetime,
+}
+
+
+def _sort_steps(column_info: typing.List[ColumnInfo],
+                dependencies: typing.Dict[str, typing.List[str]]) -> typing.List[ColumnInfo]:
+    """
+    Topologically sorts `column_info` such that each column is computed after its dependencies, keeping the schema
+    order wherever possible.
+    """
+    remaining = list(column_info)
+    completed: typing.Set[str] = set()
+    ordered = []
+
+    while (len(remaining) > 0):
+        ready = [ci for ci in remaining if all(dep in completed for dep in dependencies[ci.name])]
+
+        if (len(ready) == 0):
+            raise ValueError(f"Circular dependency detected between columns: {[ci.name for ci in remaining]}")
+
+        for col_info in ready:
+            ordered.append(col_info)
+            completed.add(col_info.name)
+            remaining.remove(col_info)
+
+    return ordered
+
+
+class SchemaPlan:
+    """
+    A pandas execution plan compiled from a `DataFrameInputSchema`.
+
+    The dependency graph between the columns of the schema is resolved once when the plan is built. Executing the plan
+    then only runs the column operations, caching casts and date parsing of input columns which are shared between
+    multiple output columns, and skipping casts of columns which already have the requested type. The column operations
+    follow the pandas implementation of each `ColumnInfo`.
+
+    Parameters
+    ----------
+    input_schema : DataFrameInputSchema
+        The schema to compile.
+    """
+
+    def __init__(self, input_schema: DataFrameInputSchema):
+        self._input_schema = input_schema
+        self._signature = SchemaPlan._get_signature(input_schema)
+
+        output_names = {ci.name for ci in input_schema.column_info}
+
+        dependencies: typing.Dict[str, typing.List[str]] = {}
+        for col_info in input_schema.column_info:
+            # An input which shares the name of another column uses the output of that column
+            dependencies[col_info.name] = [
+                name for name in col_info.get_input_column_types().keys()
+                if name != col_info.name and name in output_names
+            ]
+
+        self._steps = [
+            _PlanStep(col_info=col_info,
+                      dependencies=dependencies[col_info.name],
+                      execute=_STEP_EXECUTORS.get(type(col_info), _execute_generic))
+            for col_info in _sort_steps(input_schema.column_info, dependencies)
+        ]
+
+        self._output_columns = list(dict.fromkeys(ci.name for ci in input_schema.column_info))
+
+    @staticmethod
+    def _get_signature(input_schema: DataFrameInputSchema) -> tuple:
+        return (tuple(id(ci) for ci in input_schema.column_info), id(input_schema.row_filter))
+
+    def is_valid_for(self, input_schema: DataFrameInputSchema) -> bool:
+        """
+        Returns `True` if this plan was compiled from `input_schema` and the schema has not been modified since.
+        """
+        return self._input_schema is input_schema and self._signature == SchemaPlan._get_signature(input_schema)
+
+    def execute(self, df_in: typing.Union[pd.DataFrame, cudf.DataFrame]) -> typing.Union[pd.DataFrame, cudf.DataFrame]:
+        """
+        Applies the plan to `df_in`.
+
+        Parameters
+        ----------
+        df_in : typing.Union[pd.DataFrame, cudf.DataFrame]
+            The input DataFrame. cuDF DataFrames are processed on the host and converted back before being returned.
+
+        Returns
+        -------
+        typing.Union[pd.DataFrame, cudf.DataFrame]
+            The processed DataFrame, of the same type as `df_in`.
+        """
+        convert_to_cudf = False
+        if (isinstance(df_in, cudf.DataFrame)):
+            convert_to_cudf = True
+            df_in = df_in.to_pandas()
+
+        if (self._input_schema.prep_dataframe is not None):
+            df_in = self._input_schema.prep_dataframe(df_in)
+
+        # As with the NVTabular workflow, a schema without any columns leaves the input unchanged
+        if (len(self._steps) == 0):
+            return cudf.from_pandas(df_in) if convert_to_cudf else df_in
+
+        ctx = _PlanContext(df_in)
+
+        for step in self._steps:
+            ctx.outputs[step.col_info.name] = step.execute(step, ctx)
+
+        df_result = pd.DataFrame({name: ctx.outputs[name] for name in self._output_columns}, index=df_in.index)
+
+        if (self._input_schema.row_filter is not None):
+            filtered = self._input_schema.row_filter(df_result)
+
+            if (isinstance(filtered, pd.Series) and filtered.dtype == bool):
+                filtered = df_result[filtered]
+            elif (not isinstance(filtered, pd.DataFrame)):
+                raise ValueError(f"Invalid output from row_filter: {filtered.__class__}")
+
+            df_result = filtered
+
+        if (convert_to_cudf):
+            return cudf.from_pandas(df_result)
+
+        return df_result
+
+
+def create_and_attach_schema_plan(input_schema: DataFrameInputSchema) -> DataFrameInputSchema:
+    """
+    Compiles `input_schema` into a `SchemaPlan` and attaches it to the schema. An existing plan is reused unless the
+    `column_info` or `row_filter` of the schema have been changed since it was compiled.
+
+    Parameters
+    ----------
+    input_schema : DataFrameInputSchema
+        Input schema which specifies how the DataFrame should be processed.
+
+    Returns
+    -------
+    DataFrameInputSchema
+        The same `input_schema` with the `schema_plan` attribute set.
+    """
+    if (input_schema.schema_plan is None or not input_schema.schema_plan.is_valid_for(input_schema)):
+        input_schema.schema_plan = SchemaPlan(input_schema)
+
+    return input_schema
@@ -25,6 +25,8 @@ from morpheus.utils.column_info import DataFrameInputSchema
 from morpheus.utils.nvt import register_morpheus_extensions
 from morpheus.utils.nvt.patches import patch_numpy_dtype_registry
 from morpheus.utils.nvt.schema_converters import create_and_attach_nvt_workflow
+from morpheus.utils.schema_plan import SchemaPlan
+from morpheus.utils.schema_plan import create_and_attach_schema_plan
 
 if os.environ.get("MORPHEUS_IN_SPHINX_BUILD") is None:
     # Apply patches to NVT
@@ -44,7 +46,7 @@ logger = logging.getLogger(__name__)
 @typing.overload
 def process_dataframe(
     df_in: pd.DataFrame,
-    input_schema: typing.Union[nvt.Workflow, DataFrameInputSchema],
+    input_schema: typing.Union[nvt.Workflow, DataFrameInputSchema, SchemaPlan],
 ) -> pd.DataFrame:
     ...
 
@@ -52,14 +54,14 @@ def process_dataframe(
 @typing.overload
 def process_dataframe(
     df_in: cudf.DataFrame,
-    input_schema: typing.Union[nvt.Workflow, DataFrameInputSchema],
+    input_schema: typing.Union[nvt.Workflow, DataFrameInputSchema, SchemaPlan],
 ) -> cudf.DataFrame:
     ...
 
 
 def process_dataframe(
     df_in: typing.Union[pd.DataFrame, cudf.DataFrame],
-    input_schema: typing.Union[nvt.Workflow, DataFrameInputSchema],
+    input_schema: typing.Union[nvt.Workflow, DataFrameInputSchema, SchemaPlan],
 ) -> typing.Union[pd.DataFrame, cudf.DataFrame]:
     """
     Applies column transformations to the input dataframe as defined by the `input_schema`.
@@ -71,10 +73,12 @@ def process_dataframe(
     ----------
     df_in : Union[pd.DataFrame, cudf.DataFrame]
         The input DataFrame to process.
-    input_schema : Union[nvt.Workflow, DataFrameInputSchema]
+    input_schema : Union[nvt.Workflow, DataFrameInputSchema, SchemaPlan]
         Defines the transformations to apply to 'df_in'.
         If an instance of nvt.Workflow, it is directly used to transform the dataframe.
-        If an instance of DataFrameInputSchema, it is first converted to an nvt.Workflow,
+        If an instance of SchemaPlan, the plan is executed directly using pandas.
+        If an instance of DataFrameInputSchema with `use_schema_plan` set, it is compiled to a SchemaPlan once and the
+        plan is reused for subsequent calls. Otherwise it is first converted to an nvt.Workflow,
         with JSON columns preprocessed if 'json_preproc' attribute is present.
 
     Returns
@@ -89,6 +93,12 @@ def process_dataframe(
     If 'df_in' is a pandas DataFrame, it is temporarily converted into a cudf DataFrame for the transformation.
     """
 
+    if (isinstance(input_schema, DataFrameInputSchema) and input_schema.use_schema_plan):
+        input_schema = create_and_attach_schema_plan(input_schema).schema_plan
+
+    if (isinstance(input_schema, SchemaPlan)):
+        return input_schema.execute(df_in)
+
     convert_to_pd = False
     if (isinstance(df_in, pd.DataFrame)):
         convert_to_pd = True
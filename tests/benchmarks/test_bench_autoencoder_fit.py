@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.models.dfencoder.autoencoder import AutoEncoder
+
+
+def make_dfp_like_df(num_rows: int) -> pd.DataFrame:
+    """Builds a frame resembling a per-user DFP training window."""
+    rng = np.random.default_rng(42)
+    data = {}
+    for i in range(4):
+        data[f"num_{i}"] = rng.normal(size=num_rows)
+
+    data["bin_0"] = rng.random(num_rows) > 0.5
+
+    for i in range(10):
+        data[f"cat_{i}"] = rng.choice([f"value_{j}" for j in range(50)], size=num_rows).astype(object)
+
+    return pd.DataFrame(data)
+
+
+def fit_autoencoder(df: pd.DataFrame, preencode_data: bool):
+    model = AutoEncoder(encoder_layers=[512, 500],
+                        decoder_layers=[512],
+                        activation='relu',
+                        swap_p=0.2,
+                        lr=0.001,
+                        lr_decay=.99,
+                        batch_size=512,
+                        optimizer='sgd',
+                        scaler='standard',
+                        min_cats=1,
+                        progress_bar=False,
+                        device='cpu',
+                        preencode_data=preencode_data)
+    model.fit(df, epochs=10)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [5000, 50000])
+@pytest.mark.parametrize("preencode_data", [False, True])
+def test_autoencoder_fit(benchmark, num_rows: int, preencode_data: bool):
+    df = make_dfp_like_df(num_rows)
+    benchmark.pedantic(fit_autoencoder, args=(df, preencode_data), rounds=1, iterations=1)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.io.dataframe_cache import DataFrameCache
+
+
+def make_batch_df(num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+
+    return pd.DataFrame({
+        "username": rng.choice([f"user_{i}" for i in range(1000)], size=num_rows),
+        "timestamp": pd.Timestamp("2023-01-01", tz="UTC") + pd.to_timedelta(rng.integers(0, 86400, num_rows), "s"),
+        "appDisplayName": rng.choice([f"app_{i}" for i in range(50)], size=num_rows),
+        "logcount": rng.integers(0, 100, size=num_rows),
+        "score": rng.random(size=num_rows),
+    })
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+def test_pickle_read(benchmark, tmp_path: str, num_rows: int):
+    # Baseline, batches were previously cached as pickle files
+    path = os.path.join(tmp_path, "batch.pkl")
+    make_batch_df(num_rows).to_pickle(path)
+    benchmark(pd.read_pickle, path)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+@pytest.mark.parametrize("columns", [None, ["username", "timestamp"]])
+def test_cache_read(benchmark, tmp_path: str, num_rows: int, file_format: str, columns: list):
+    cache = DataFrameCache(tmp_path, file_format=file_format)
+    cache.put("batch", make_batch_df(num_rows))
+    benchmark(cache.get, "batch", columns=columns)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+def test_cache_write(benchmark, tmp_path: str, num_rows: int, file_format: str):
+    cache = DataFrameCache(tmp_path, file_format=file_format)
+    benchmark(cache.put, "batch", make_batch_df(num_rows))
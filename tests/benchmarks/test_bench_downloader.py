@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from morpheus.utils.downloader import Downloader
+
+
+def download_batches(downloader: Downloader, num_batches: int, batch_size: int):
+    download_buckets = [os.path.join("bucket", f"file_{i}.json") for i in range(batch_size)]
+
+    for _ in range(num_batches):
+        downloader.download(download_buckets, os.path.basename)
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("restore_environ")
+@pytest.mark.parametrize("dl_method", ["single_thread", "multiprocess", "thread_pool", "process_pool"])
+def test_downloader_batches(benchmark, dl_method: str):
+    # Measures the per batch overhead of each method, the multiprocess method starts a new pool for each batch while
+    # the pool methods reuse theirs
+    os.environ.pop('MORPHEUS_FILE_DOWNLOAD_TYPE', None)
+    downloader = Downloader(download_method=dl_method, max_workers=4)
+
+    benchmark(download_batches, downloader, 5, 16)
+
+    downloader.close()
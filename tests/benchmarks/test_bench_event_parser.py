@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.parsers.windows_event_parser import WindowsEventParser
+
+EVENT_TEMPLATE = (
+    r'{{"_raw":"04/01/2019 07:07:21 PM\r\nLogName=Security\r\nEventCode={eventcode}\r\n'
+    r'ComputerName=host{host}.test.com\r\nMessage=An account was successfully logged on.\r\n\r\n'
+    r'Subject:\r\n\tSecurity ID:\t\tNULL SID\r\n\tAccount Name:\t\t-\r\n\tAccount Domain:\t\t-\r\n'
+    r'\tLogon ID:\t\t0x0\r\n\r\nLogon Type:\t\t\t3\r\n\r\nNew Logon:\r\n\tSecurity ID:\t\tTEST.COM\\user{user}\r\n'
+    r'\tAccount Name:\t\tuser{user}$\r\n\tAccount Domain:\t\tTEST.COM\r\n\tLogon ID:\t\t0x9DE8990DE\r\n'
+    r'\tLogon GUID:\t\t{{E53069F0-662E-0C65-F889-AA8D8770D56A}}\r\n\r\nProcess Information:\r\n'
+    r'\tProcess ID:\t\t0x0\r\n\tProcess Name:\t\t-\r\n\r\nNetwork Information:\r\n\tWorkstation Name:\t\r\n'
+    r'\tSource Network Address:\t100.00.{host}.1\r\n\tSource Port:\t\t{port}\r\n\r\n'
+    r'Detailed Authentication Information:\r\n\tLogon Process:\t\tKerberos\r\n'
+    r'\tAuthentication Package:\tKerberos\r\n\tTransited Services:\t-\r\n\tPackage Name (NTLM only):\t-\r\n'
+    r'\tKey Length:\t\t0","id":"c54d7f17-8eb8-4d78-a8f7-{host:012d}"}}')
+
+
+def make_windows_event_lines(num_rows: int, eventcodes: list) -> pd.Series:
+    rng = np.random.default_rng(42)
+    unique_lines = [
+        EVENT_TEMPLATE.format(eventcode=eventcodes[i % len(eventcodes)], host=i % 256, user=i, port=1024 + i)
+        for i in range(1000)
+    ]
+
+    return pd.Series(rng.choice(unique_lines, size=num_rows))
+
+
+def parse_per_column(wep: WindowsEventParser, text: pd.Series) -> pd.DataFrame:
+    """The previous implementation of `WindowsEventParser.parse`, with one regex pass per event code and column."""
+    text = wep.clean_raw_data(text)
+    output_chunks = []
+    for (eventcode, event_regex) in wep._event_regex.items():
+        input_chunk = text[text.str.contains(f"eventcode={eventcode}")]
+        if not input_chunk.empty:
+            parsed = pd.DataFrame({
+                col: input_chunk.str.extract(regex_pattern, expand=True)[0]
+                for (col, regex_pattern) in event_regex.items()
+            })
+            output_chunks.append(parsed.reindex(columns=list(wep.columns), fill_value=""))
+
+    return pd.concat(output_chunks).fillna("")
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [10000, 1000000])
+@pytest.mark.parametrize("parse_fn", [parse_per_column, WindowsEventParser.parse])
+def test_windows_event_parser(benchmark, parse_fn, num_rows: int):
+    wep = WindowsEventParser()
+    text = make_windows_event_lines(num_rows, list(wep._event_regex.keys()))
+    benchmark(parse_fn, wep, text)
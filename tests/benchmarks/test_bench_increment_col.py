@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2022-2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.utils.column_info import create_increment_col
+
+
+def make_dfp_like_df(num_rows: int, num_users: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    offsets = pd.to_timedelta(rng.integers(0, 30 * 24 * 60 * 60, size=num_rows), unit="s")
+
+    return pd.DataFrame({
+        "username": rng.choice([f"user_{i}" for i in range(num_users)], size=num_rows),
+        "timestamp": pd.Timestamp("2023-01-01", tz="UTC") + offsets,
+        "location": rng.choice([f"city_{i}" for i in range(200)], size=num_rows),
+    })
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [10000, 1000000])
+@pytest.mark.parametrize("num_users", [10, 1000])
+def test_create_increment_col(benchmark, num_rows: int, num_users: int):
+    df = make_dfp_like_df(num_rows, num_users)
+    benchmark(create_increment_col, df, "location")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import morpheus.parsers.ip_pandas as ip_pandas
+
+# Regular expressions for the predicates of `morpheus.parsers.ip`, evaluated with pandas as the baseline
+IP_REGEX = r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
+PRIVATE_REGEX = (r"^(?:0|10|127)\.|^169\.254\.|^172\.(?:1[6-9]|2[0-9]|3[01])\.|^192\.168\.|^198\.1[89]\.|"
+                 r"^(?:24[0-9]|25[0-5])\.")
+LOOPBACK_REGEX = r"^127\."
+MULTICAST_REGEX = r"^(?:22[4-9]|23[0-9])\."
+
+
+def make_ips(num_rows: int, num_unique: int) -> pd.Series:
+    rng = np.random.default_rng(42)
+    uniques = rng.integers(0, 2**32, size=num_unique, dtype=np.uint64)
+    octets = [(uniques >> shift) & 0xFF for shift in (24, 16, 8, 0)]
+    unique_strs = pd.Series(octets[0].astype(str)).str.cat([pd.Series(o.astype(str)) for o in octets[1:]], sep=".")
+
+    return pd.Series(rng.choice(unique_strs.to_numpy(), size=num_rows))
+
+
+def classify_regex(ips: pd.Series) -> pd.DataFrame:
+    return pd.DataFrame({
+        "is_ip": ips.str.match(IP_REGEX),
+        "is_private": ips.str.match(PRIVATE_REGEX),
+        "is_loopback": ips.str.match(LOOPBACK_REGEX),
+        "is_multicast": ips.str.match(MULTICAST_REGEX),
+    })
+
+
+def classify_integer(ips: pd.Series) -> pd.DataFrame:
+    parsed = ip_pandas.parse_ips(ips)
+    return pd.DataFrame({
+        "is_ip": ip_pandas.is_ip(parsed),
+        "is_private": ip_pandas.is_private(parsed),
+        "is_loopback": ip_pandas.is_loopback(parsed),
+        "is_multicast": ip_pandas.is_multicast(parsed),
+    })
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [10000, 1000000])
+@pytest.mark.parametrize("num_unique", [1000, 100000])
+@pytest.mark.parametrize("classify_fn", [classify_regex, classify_integer, ip_pandas.classify_all])
+def test_classify_ips(benchmark, classify_fn, num_rows: int, num_unique: int):
+    ips = make_ips(num_rows, num_unique)
+    benchmark(classify_fn, ips)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2022-2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+
+import json
+
+import pandas as pd
+import pytest
+
+from morpheus.utils.column_info import _json_flatten
+
+INPUT_COLUMNS = {
+    "time": "str",
+    "properties.userPrincipalName": "str",
+    "properties.appDisplayName": "str",
+    "properties.deviceDetail.browser": "str",
+    "properties.location.city": "str",
+    "properties.status.failureReason": "str",
+}
+
+
+def make_azure_like_df(num_rows: int) -> pd.DataFrame:
+    records = []
+    for i in range(num_rows):
+        props = {
+            "userPrincipalName":
+                f"user_{i % 100}@domain.com",
+            "appDisplayName":
+                "app",
+            "deviceDetail": {
+                "browser": "Edge", "displayName": "device", "operatingSystem": "Windows", "trustType": "AAD"
+            },
+            "location": {
+                "city": "Austin", "countryOrRegion": "US", "geoCoordinates": {
+                    "latitude": 30.26, "longitude": -97.74
+                }
+            },
+            "status": {
+                "errorCode": 0, "failureReason": "Other."
+            },
+            "conditionalAccessPolicies": [{
+                "id": str(j), "displayName": "policy", "result": "notApplied"
+            } for j in range(10)],
+        }
+        records.append({"time": "2022-08-01T00:00:00Z", "properties": json.dumps(props)})
+
+    return pd.DataFrame(records)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [10000, 100000])
+def test_json_flatten(benchmark, num_rows: int):
+    df = make_azure_like_df(num_rows)
+    benchmark(_json_flatten, df, INPUT_COLUMNS, ["properties"])
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest import mock
+
+import pytest
+
+from morpheus.config import Config
+from morpheus.stages.input.kafka_source_stage import JsonEngine
+from morpheus.stages.input.kafka_source_stage import KafkaSourceStage
+from utils.local_kafka import LocalKafkaConsumer
+
+
+def consume_all(config: Config, payloads: list, json_engine: JsonEngine, async_parse: bool):
+    # The stand-in consumer serves messages from memory, measuring the cost of batch assembly, parsing and commits
+    # without a broker
+    consumer = LocalKafkaConsumer(payloads, num_partitions=4)
+    stage = KafkaSourceStage(config,
+                             bootstrap_servers="localhost:9092",
+                             stop_after=len(payloads),
+                             json_engine=json_engine,
+                             async_parse=async_parse)
+
+    with mock.patch('confluent_kafka.Consumer', new=consumer):
+        for _ in stage._source_generator():
+            pass
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_messages", [100000])
+@pytest.mark.parametrize("json_engine", list(JsonEngine))
+@pytest.mark.parametrize("async_parse", [False, True])
+def test_kafka_source_throughput(benchmark, num_messages: int, json_engine: JsonEngine, async_parse: bool):
+    config = Config()
+    config.pipeline_batch_size = 1024
+
+    payloads = [
+        json.dumps({
+            "timestamp": 1616380971990 + i, "host_ip": f"10.188.40.{i % 255}", "data_len": i % 1500, "data": "x" * 64
+        }).encode() for i in range(num_messages)
+    ]
+
+    benchmark(consume_all, config, payloads, json_engine, async_parse)
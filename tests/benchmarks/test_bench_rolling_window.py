@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import TEST_DIRS
+
+BATCH_ROWS = 100
+
+
+@pytest.fixture(name="cached_user_window", scope="module")
+def cached_user_window_fixture():
+    example_dir = os.path.join(TEST_DIRS.examples_dir, 'digital_fingerprinting/production/morpheus')
+    sys.path.append(example_dir)
+    try:
+        from dfp.utils.cached_user_window import CachedUserWindow
+    finally:
+        sys.path.remove(example_dir)
+
+    return CachedUserWindow
+
+
+def make_batch(batch_idx: int) -> pd.DataFrame:
+    start = batch_idx * BATCH_ROWS
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime(np.arange(start, start + BATCH_ROWS) * 30 + 1683054498, unit='s'),
+        "username": "user@domain.com",
+        "appDisplayName": [f"app_{i % 7}" for i in range(start, start + BATCH_ROWS)],
+        "logcount": np.arange(start, start + BATCH_ROWS),
+    })
+
+
+def hash_window_step(window_df: pd.DataFrame, incoming_df: pd.DataFrame, window_rows: int) -> pd.DataFrame:
+    # Baseline, the previous approach of hashing every appended row and then scanning the hashes of the whole window
+    # to locate the incoming batch
+    incoming_df = incoming_df.copy()
+    incoming_df["_row_hash"] = pd.util.hash_pandas_object(incoming_df, index=False)
+    window_df = pd.concat([window_df, incoming_df]).tail(window_rows)
+
+    incoming_hash = pd.util.hash_pandas_object(incoming_df.drop(columns=["_row_hash"]).iloc[[0, -1]], index=False)
+    first_row_idx = window_df.index[window_df["_row_hash"].values == incoming_hash.iloc[0]][0]
+    last_row_idx = window_df.index[window_df["_row_hash"].values == incoming_hash.iloc[-1]][-1]
+    assert (last_row_idx - first_row_idx) + 1 == len(incoming_df)
+
+    return window_df
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_users, window_rows", [(1, 50000), (100, 5000)])
+def test_rolling_window_row_hash(benchmark, num_users: int, window_rows: int):
+    num_batches = window_rows // BATCH_ROWS
+    windows = {}
+
+    for user_idx in range(num_users):
+        window_df = pd.DataFrame()
+        for batch_idx in range(num_batches):
+            incoming_df = make_batch(batch_idx)
+            incoming_df.index = range(batch_idx * BATCH_ROWS, (batch_idx + 1) * BATCH_ROWS)
+            window_df = hash_window_step(window_df, incoming_df, window_rows)
+
+        windows[user_idx] = window_df
+
+    batches = itertools.count(num_batches)
+
+    def process_batch():
+        batch_idx = next(batches)
+        incoming_df = make_batch(batch_idx)
+        incoming_df.index = range(batch_idx * BATCH_ROWS, (batch_idx + 1) * BATCH_ROWS)
+
+        for user_idx in range(num_users):
+            windows[user_idx] = hash_window_step(windows[user_idx], incoming_df, window_rows)
+
+    benchmark(process_batch)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_users, window_rows", [(1, 50000), (100, 5000)])
+def test_rolling_window_row_range(benchmark, cached_user_window: type, num_users: int, window_rows: int):
+    num_batches = window_rows // BATCH_ROWS
+    windows = {}
+
+    for user_idx in range(num_users):
+        window = cached_user_window(user_id=f"user_{user_idx}", cache_location=None)
+        for batch_idx in range(num_batches):
+            window.append_dataframe(make_batch(batch_idx))
+
+        windows[user_idx] = window
+
+    batches = itertools.count(num_batches)
+
+    def process_batch():
+        incoming_df = make_batch(next(batches))
+
+        for window in windows.values():
+            window.append_dataframe(incoming_df)
+            window.get_train_df(max_history=window_rows)
+
+            # Locating the incoming batch in the window is a lookup of its row id range
+            (first_row_idx, stop_row_idx) = window.last_append_range
+            assert stop_row_idx - first_row_idx == len(incoming_df)
+
+    benchmark(process_batch)
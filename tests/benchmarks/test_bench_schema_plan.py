@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2022-2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+from morpheus.config import Config
+from morpheus.config import ConfigAutoEncoder
+from morpheus.utils.schema_transforms import process_dataframe
+from utils import TEST_DIRS
+
+NUM_ROWS = 10000
+
+
+@pytest.fixture(name="schema_builder", scope="module")
+def schema_builder_fixture():
+    example_dir = os.path.join(TEST_DIRS.examples_dir, 'digital_fingerprinting/production/morpheus')
+    sys.path.append(example_dir)
+    try:
+        from dfp.utils.schema_utils import SchemaBuilder
+    finally:
+        sys.path.remove(example_dir)
+
+    config = Config()
+    config.ae = ConfigAutoEncoder()
+    config.ae.userid_column_name = "username"
+
+    return lambda source: SchemaBuilder(config, source).build_schema()
+
+
+def make_azure_df() -> pd.DataFrame:
+    properties = [{
+        "userPrincipalName": f"user_{i % 100}@domain.com",
+        "appDisplayName": f"app_{i % 7}",
+        "clientAppUsed": "Browser",
+        "deviceDetail": {
+            "browser": "Edge", "displayName": "device", "operatingSystem": "Windows"
+        },
+        "location": {
+            "city": f"city_{i % 9}", "countryOrRegion": "US"
+        },
+        "status": {
+            "failureReason": "Other."
+        },
+    } for i in range(NUM_ROWS)]
+
+    return pd.DataFrame({
+        "time": pd.date_range("2022-08-01", periods=NUM_ROWS, freq="min", tz="UTC").astype(str),
+        "category": "SignInLogs",
+        "properties": [json.dumps(p) for p in properties],
+    })
+
+
+def make_duo_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2022-08-01", periods=NUM_ROWS, freq="min", tz="UTC").astype(str),
+        "user": [json.dumps({"name": f"user_{i % 100}"}) for i in range(NUM_ROWS)],
+        "access_device": [
+            json.dumps({
+                "browser": "Chrome",
+                "os": "Windows",
+                "location": {
+                    "city": f"city_{i % 9}", "state": "TX", "country": "US"
+                }
+            }) for i in range(NUM_ROWS)
+        ],
+        "auth_device": [json.dumps({"name": "device"})] * NUM_ROWS,
+        "application": [json.dumps({"name": "app"})] * NUM_ROWS,
+        "result": ["SUCCESS", "DENIED"] * (NUM_ROWS // 2),
+        "reason": "User approved",
+    })
+
+
+def run_schemas(schema, df: pd.DataFrame):
+    df = process_dataframe(df, schema.source)
+    process_dataframe(df, schema.preprocess)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("source", ["azure", "duo"])
+@pytest.mark.parametrize("use_schema_plan", [False, True])
+def test_process_dataframe(benchmark, schema_builder, source: str, use_schema_plan: bool):
+    schema = schema_builder(source)
+    schema.source.use_schema_plan = use_schema_plan
+    schema.preprocess.use_schema_plan = use_schema_plan
+
+    df = make_azure_df() if source == "azure" else make_duo_df()
+
+    benchmark(run_schemas, schema, df)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pandas as pd
+import pytest
+
+from morpheus.common import FileTypes
+from morpheus.config import CppConfig
+from morpheus.io import serializers
+
+
+def make_df(num_rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "timestamp": [1616380971990 + i for i in range(num_rows)],
+        "host_ip": [f"10.188.40.{i % 255}" for i in range(num_rows)],
+        "data_len": [i % 1500 for i in range(num_rows)],
+        "probs": [(i % 100) / 100.0 for i in range(num_rows)],
+    })
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+def test_df_to_json(benchmark, num_rows: int):
+    # Baseline, serializes into a StringIO then splits it into a list of lines
+    benchmark(serializers.df_to_json, make_df(num_rows))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+def test_df_to_json_bytes(benchmark, num_rows: int):
+    benchmark(serializers.df_to_json_bytes, make_df(num_rows))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+def test_df_to_csv(benchmark, num_rows: int):
+    # Baseline, serializes into a StringIO then splits it into a list of lines
+    benchmark(serializers.df_to_csv, make_df(num_rows), include_header=True)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+def test_df_to_csv_bytes(benchmark, num_rows: int):
+    benchmark(serializers.df_to_csv_bytes, make_df(num_rows), include_header=True)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [1000000])
+@pytest.mark.parametrize("file_type", [FileTypes.CSV, FileTypes.JSON], ids=["csv", "json"])
+def test_write_df_to_file(benchmark, tmp_path, num_rows: int, file_type: FileTypes):
+    CppConfig.set_should_use_cpp(False)
+    out_file = os.path.join(tmp_path, "results.out")
+
+    benchmark(serializers.write_df_to_file, make_df(num_rows), out_file, file_type=file_type, include_header=True)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import typing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import TEST_DIRS
+
+NUM_ROWS = 100000
+
+
+@pytest.fixture(name="user_splitter", scope="module")
+def user_splitter_fixture():
+    example_dir = os.path.join(TEST_DIRS.examples_dir, 'digital_fingerprinting/production/morpheus')
+    sys.path.append(example_dir)
+    try:
+        from dfp.utils.user_splitter import UserSplitter
+    finally:
+        sys.path.remove(example_dir)
+
+    return UserSplitter
+
+
+def make_df(num_users: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    user_ids = np.array([f"user_{i}@domain.com" for i in range(num_users)], dtype=object)
+
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime(np.arange(NUM_ROWS) + 1683054498, unit='s'),
+        "username": user_ids[rng.integers(0, num_users, NUM_ROWS)],
+        "appDisplayName": [f"app_{i % 7}" for i in range(NUM_ROWS)],
+        "logcount": np.arange(NUM_ROWS),
+    })
+
+
+def groupby_split(df: pd.DataFrame, user_index_map: typing.Dict[str, int]) -> typing.List[pd.DataFrame]:
+    # Baseline, the previous approach of grouping the rows, copying the rows of each user into a new DataFrame
+    split_dataframes = {user_id: user_df for (user_id, user_df) in df.groupby("username", sort=False)}
+    output = []
+
+    for user_id in sorted(split_dataframes.keys()):
+        user_df = split_dataframes[user_id]
+
+        current_user_count = user_index_map.get(user_id, 0)
+        user_df.index = range(current_user_count, current_user_count + len(user_df))
+        user_index_map[user_id] = current_user_count + len(user_df)
+
+        output.append(user_df)
+
+    return output
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_users", [10, 1000, 50000])
+def test_split_users_groupby(benchmark, num_users: int):
+    df = make_df(num_users)
+    user_index_map = {}
+
+    benchmark(groupby_split, df, user_index_map)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_users", [10, 1000, 50000])
+def test_split_users_sorted(benchmark, user_splitter: type, num_users: int):
+    df = make_df(num_users)
+    splitter = user_splitter(userid_column_name="username")
+
+    benchmark(splitter.split, df)
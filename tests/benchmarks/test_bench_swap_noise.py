@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.models.dfencoder.dataframe import EncoderDataFrame
+from morpheus.models.dfencoder.dataframe import SwapNoise
+
+
+def values_swap(df: pd.DataFrame, likelihood: float = .15):
+    """The original `EncoderDataFrame.swap` implementation which round-trips through an object array."""
+    tot_rows = len(df)
+    n_rows = int(round(tot_rows * likelihood))
+    n_cols = len(df.columns)
+
+    def gen_indices():
+        column = np.repeat(np.arange(n_cols).reshape(1, -1), repeats=n_rows, axis=0)
+        row = np.random.randint(0, tot_rows, size=(n_rows, n_cols))
+        return row, column
+
+    row, column = gen_indices()
+    new_mat = df.values
+    to_place = new_mat[row, column]
+
+    row, column = gen_indices()
+    new_mat[row, column] = to_place
+
+    dtypes = {col: typ for col, typ in zip(df.columns, df.dtypes)}
+    result = EncoderDataFrame(columns=df.columns, data=new_mat)
+    result = result.astype(dtypes, copy=False)
+
+    return result
+
+
+def make_mixed_df(num_rows: int, num_cols: int) -> EncoderDataFrame:
+    """Builds a frame resembling the output of `AutoEncoder.prepare_df` with numeric, binary and categorical columns."""
+    rng = np.random.default_rng(42)
+    data = {}
+    for i in range(num_cols):
+        col_type = i % 3
+        if col_type == 0:
+            data[f"num_{i}"] = rng.normal(size=num_rows)
+        elif col_type == 1:
+            data[f"bin_{i}"] = rng.random(num_rows) > 0.5
+        else:
+            cats = [f"cat_{j}" for j in range(20)] + ["_other"]
+            data[f"cat_{i}"] = pd.Categorical(rng.choice(cats, size=num_rows), categories=cats)
+
+    return EncoderDataFrame(data)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [10000, 100000])
+def test_values_swap(benchmark, num_rows: int):
+    df = make_mixed_df(num_rows, 50)
+    benchmark(values_swap, df)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [10000, 100000])
+def test_swap_noise(benchmark, num_rows: int):
+    df = make_mixed_df(num_rows, 50)
+    swap_noise = SwapNoise(seed=42)
+    benchmark(swap_noise.swap, df)
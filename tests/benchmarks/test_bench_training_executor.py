@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2022-2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.models.dfencoder.training_executor import TrainingExecutor
+from morpheus.models.dfencoder.training_executor import fit_autoencoder
+
+NUM_USERS = 16
+
+MODEL_KWARGS = {
+    "encoder_layers": [512, 500],
+    "decoder_layers": [512],
+    "activation": 'relu',
+    "swap_p": 0.2,
+    "lr": 0.001,
+    "lr_decay": .99,
+    "batch_size": 512,
+    "optimizer": 'sgd',
+    "scaler": 'standard',
+    "min_cats": 1,
+    "progress_bar": False,
+    "device": 'cpu'
+}
+
+
+def make_user_dfs(num_users: int, num_rows: int) -> dict:
+    rng = np.random.default_rng(42)
+    user_dfs = {}
+    for user in range(num_users):
+        data = {f"num_{i}": rng.normal(size=num_rows) for i in range(4)}
+        for i in range(6):
+            data[f"cat_{i}"] = rng.choice([f"value_{j}" for j in range(20)], size=num_rows).astype(object)
+
+        user_dfs[f"user_{user}"] = pd.DataFrame(data)
+
+    return user_dfs
+
+
+def train_serial(user_dfs: dict):
+    for df in user_dfs.values():
+        fit_autoencoder(MODEL_KWARGS, df, {"epochs": 3})
+
+
+def train_pooled(executor: TrainingExecutor, user_dfs: dict):
+    for (user_id, df) in user_dfs.items():
+        executor.submit(user_id, fit_autoencoder, MODEL_KWARGS, df, {"epochs": 3})
+
+    for result in executor.wait_all():
+        assert result.succeeded
+
+
+@pytest.mark.benchmark
+def test_train_users_serial(benchmark):
+    user_dfs = make_user_dfs(NUM_USERS, 2000)
+    benchmark.pedantic(train_serial, args=(user_dfs, ), rounds=1, iterations=1)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("max_workers", [2, 4])
+def test_train_users_pooled(benchmark, max_workers: int):
+    user_dfs = make_user_dfs(NUM_USERS, 2000)
+    with TrainingExecutor(max_workers=max_workers) as executor:
+        # Start the worker processes outside of the timed region
+        train_pooled(executor, dict(list(user_dfs.items())[:max_workers]))
+        benchmark.pedantic(train_pooled, args=(executor, user_dfs), rounds=1, iterations=1)
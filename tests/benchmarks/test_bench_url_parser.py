@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cudf
+
+import morpheus
+from morpheus.parsers import url_parser
+
+URL_TEMPLATES = [
+    "https://www.site{i}.com/index.html",
+    "http://cdn{i}.static.site{i}.co.uk/img.png",
+    "site{i}.org",
+    "http://mail.site{i}.com.ac/",
+    "ftp://files.site{i}.blogspot.com/",
+    "a{i}-44-13-2.deploy.static.akamaitechnologies.com",
+]
+
+
+def make_urls(num_rows: int, num_unique: int) -> pd.Series:
+    rng = np.random.default_rng(42)
+    unique_urls = [URL_TEMPLATES[i % len(URL_TEMPLATES)].format(i=i) for i in range(num_unique)]
+
+    return pd.Series(rng.choice(unique_urls, size=num_rows))
+
+
+# The previous implementation of `url_parser.parse`, which joins every possible suffix of each hostname against the
+# suffix list on the GPU
+def _load_suffix_df():
+    suffix_list_path = os.path.join(morpheus.DATA_DIR, "public_suffix_list.dat")
+    suffix_df = cudf.io.csv.read_csv(suffix_list_path, names=["suffix"], header=None, dtype=["str"])
+    suffix_df = suffix_df[suffix_df["suffix"].str.contains("^[^//]+$")]
+    return suffix_df
+
+
+def _handle_unknown_suffix(unknown_suffix_df, col_dict):
+    if col_dict["hostname"]:
+        unknown_suffix_df = unknown_suffix_df[["idx", "tld0"]]
+        unknown_suffix_df = unknown_suffix_df.rename(columns={"tld0": "hostname"})
+    else:
+        unknown_suffix_df = unknown_suffix_df[["idx"]]
+
+    if col_dict["subdomain"]:
+        unknown_suffix_df["subdomain"] = ""
+    if col_dict["domain"]:
+        unknown_suffix_df["domain"] = ""
+    if col_dict["suffix"]:
+        unknown_suffix_df["suffix"] = ""
+
+    return unknown_suffix_df
+
+
+def _extract_tld(input_df, suffix_df, col_len, col_dict):
+    tmp_dfs = []
+    # Left join on single column dataframe does not provide expected results hence adding dummy column.
+    suffix_df["dummy"] = ""
+    # Iterating over each tld column starting from tld0 until it finds a match.
+    for i in range(col_len + 1):
+        # Add index to sort the parsed information with respect to input records order.
+        cols_keep = ["idx"]
+        tld_col = "tld" + str(i)
+        suffix_df = suffix_df.rename(columns={suffix_df.columns[0]: tld_col})
+        # Left join input_df with suffix_df on tld column for each iteration.
+        merged_df = input_df.merge(suffix_df, on=tld_col, how="left")
+        if i > 0:
+            col_pos = i - 1
+            # Retrieve records which satisfies join clause.
+            joined_recs_df = merged_df[~merged_df["dummy"].isna()]
+            if not joined_recs_df.empty:
+                if col_dict["hostname"]:
+                    joined_recs_df = joined_recs_df.rename(columns={"tld0": "hostname"})
+                    cols_keep.append("hostname")
+                if col_dict["subdomain"]:
+                    cols_keep.append("subdomain")
+                    joined_recs_df["subdomain"] = ""
+                    if col_pos > 0:
+                        for idx in range(0, col_pos):
+                            joined_recs_df["subdomain"] = joined_recs_df["subdomain"].str.cat(joined_recs_df[idx],
+                                                                                              sep=".")
+                        joined_recs_df["subdomain"] = (joined_recs_df["subdomain"].str.replace(".^",
+                                                                                               "").str.lstrip("."))
+                if col_dict["domain"]:
+                    joined_recs_df = joined_recs_df.rename(columns={col_pos: "domain"})
+                    cols_keep.append("domain")
+                if col_dict["suffix"]:
+                    joined_recs_df = joined_recs_df.rename(columns={tld_col: "suffix"})
+                    cols_keep.append("suffix")
+                joined_recs_df = joined_recs_df[cols_keep]
+                # Concat current iteration result to previous iteration result.
+                tmp_dfs.append(joined_recs_df)
+                # delete not required variable.
+                del joined_recs_df
+                # Assigning unprocessed records to input_df for next stage of processing.
+                if i < col_len:
+                    input_df = merged_df[merged_df["dummy"].isna()]
+                    # Drop unwanted columns.
+                    input_df = input_df.drop(["dummy", tld_col], axis=1)
+                # Handles scenario when some records with last tld column matches to suffix list but not all.
+                else:
+                    merged_df = merged_df[merged_df["dummy"].isna()]
+                    unknown_suffix_df = _handle_unknown_suffix(merged_df, col_dict)
+                    tmp_dfs.append(unknown_suffix_df)
+            # Handles scenario when all records with last tld column doesn't match to suffix list.
+            elif i == col_len and not merged_df.empty:
+                unknown_suffix_df = _handle_unknown_suffix(merged_df, col_dict)
+                tmp_dfs.append(unknown_suffix_df)
+            else:
+                continue
+    # Concat all temporary output dataframes
+    output_df = cudf.concat(tmp_dfs)
+    return output_df
+
+
+def _generate_tld_cols(hostname_split_df, hostnames, col_len):
+    hostname_split_df = hostname_split_df.fillna("")
+    hostname_split_df["tld" + str(col_len)] = hostname_split_df[col_len]
+    # Add all other elements of hostname_split_df
+    for j in range(col_len - 1, 0, -1):
+        hostname_split_df["tld" + str(j)] = (hostname_split_df[j].str.cat(hostname_split_df["tld" + str(j + 1)],
+                                                                          sep=".").str.rstrip("."))
+    # Assign hostname to tld0, to handle received input is just domain name.
+    hostname_split_df["tld0"] = hostnames
+    return hostname_split_df
+
+
+def parse_by_merge(urls, suffix_df, req_cols=None):
+    req_cols = url_parser._verify_req_cols(req_cols, url_parser._ALLOWED_OUTPUT_COLS)
+    col_dict = url_parser._create_col_dict(req_cols, url_parser._ALLOWED_OUTPUT_COLS)
+    hostnames = url_parser._extract_hostnames(urls)
+    url_index = urls.index
+    hostname_split_ser = hostnames.str.findall("([^.]+)")
+    hostname_split_df = hostname_split_ser.to_frame()
+    hostname_split_df = cudf.DataFrame(hostname_split_df[0].to_arrow().to_pylist())
+    col_len = len(hostname_split_df.columns) - 1
+    hostname_split_df = _generate_tld_cols(hostname_split_df, hostnames, col_len)
+    hostname_split_df["idx"] = url_index
+    output_df = _extract_tld(hostname_split_df, suffix_df, col_len, col_dict)
+    output_df = output_df.sort_values("idx", ascending=True)
+    output_df = output_df.drop("idx", axis=1)
+    output_df = output_df.reset_index(drop=True)
+    return output_df
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_unique", [1000, 100000])
+def test_url_parser_merge(benchmark, num_unique: int):
+    urls = cudf.from_pandas(make_urls(1000000, num_unique))
+    benchmark(parse_by_merge, urls, _load_suffix_df())
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_unique", [1000, 100000])
+@pytest.mark.parametrize("use_cudf", [False, True])
+def test_url_parser(benchmark, use_cudf: bool, num_unique: int):
+    urls = make_urls(1000000, num_unique)
+    if (use_cudf):
+        urls = cudf.from_pandas(urls)
+
+    benchmark(url_parser.parse, urls)
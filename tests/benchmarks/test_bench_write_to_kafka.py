@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+from static_message_source import StaticMessageSource
+
+import cudf
+
+from morpheus.config import Config
+from morpheus.io import serializers
+from morpheus.pipeline.linear_pipeline import LinearPipeline
+from morpheus.stages.output.write_to_kafka_stage import WriteToKafkaStage
+from utils.local_kafka import LocalKafkaProducer
+
+
+def make_df(num_rows: int) -> cudf.DataFrame:
+    return cudf.DataFrame({
+        "timestamp": [1616380971990 + i for i in range(num_rows)],
+        "host_ip": [f"10.188.40.{i % 255}" for i in range(num_rows)],
+        "data_len": [i % 1500 for i in range(num_rows)],
+        "probs": [(i % 100) / 100.0 for i in range(num_rows)],
+    })
+
+
+def build_and_run_pipeline(config: Config, df: cudf.DataFrame, pipelined: bool, ack_delay: float):
+    # The local producer acknowledges each message after `ack_delay` seconds, standing in for a broker
+    producer = LocalKafkaProducer(ack_delay=ack_delay)
+
+    with mock.patch('confluent_kafka.Producer', new=producer):
+        pipeline = LinearPipeline(config)
+        pipeline.set_source(StaticMessageSource(config, df))
+        pipeline.add_stage(
+            WriteToKafkaStage(config, bootstrap_servers="localhost:9092", output_topic="bench", pipelined=pipelined))
+        pipeline.build()
+        pipeline.run()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+@pytest.mark.parametrize("ack_delay", [0.0, 0.005])
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_write_to_kafka(benchmark, num_rows: int, ack_delay: float, pipelined: bool):
+    config = Config()
+    config.pipeline_batch_size = 1024
+
+    benchmark(build_and_run_pipeline, config, make_df(num_rows), pipelined, ack_delay)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+def test_df_to_json_lines(benchmark, num_rows: int):
+    # Baseline, records were previously serialized with `df_to_json`
+    benchmark(serializers.df_to_json, make_df(num_rows), strip_newlines=True)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [100000])
+def test_df_to_json_bytes(benchmark, num_rows: int):
+    df = make_df(num_rows)
+    benchmark(lambda: serializers.df_to_json_bytes(df).to_list(strip_newlines=True))
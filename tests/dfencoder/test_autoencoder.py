@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import os
 import typing
 from unittest.mock import patch
@@ -27,6 +28,7 @@ from morpheus.models.dfencoder import ae_module
 from morpheus.models.dfencoder import autoencoder
 from morpheus.models.dfencoder import scalers
 from morpheus.models.dfencoder.dataframe import EncoderDataFrame
+from morpheus.models.dfencoder.dataloader import DatasetFromTensors
 from utils import TEST_DIRS
 from utils.dataset_manager import DatasetManager
 
@@ -442,6 +444,60 @@ def test_build_input_tensor(train_ae: autoencoder.AutoEncoder, train_df: pd.Data
     assert len(tensor) == len(train_df)
 
 
+def test_build_input_tensor_from_targets(train_ae: autoencoder.AutoEncoder, train_df: pd.DataFrame):
+    train_ae.fit(train_df, epochs=1)
+    prepared_df = train_ae.prepare_df(train_df)
+    expected = train_ae.build_input_tensor(prepared_df)
+
+    (num, bin, codes) = train_ae.compute_targets(prepared_df)
+    tensor = train_ae.build_input_tensor_from_targets(num, bin, codes)
+
+    assert torch.equal(tensor, expected)
+
+
+@pytest.mark.parametrize("use_preencode_dir", [False, True])
+def test_auto_encoder_fit_preencode_data(tmp_path, train_df: pd.DataFrame, use_preencode_dir: bool):
+    preencode_dir = str(tmp_path) if use_preencode_dir else None
+    ae = autoencoder.AutoEncoder(min_cats=1, progress_bar=False, preencode_data=True, preencode_dir=preencode_dir)
+    ae.fit(train_df, epochs=2)
+
+    all_feature_names = sorted(NUMERIC_COLS + BIN_COLS + CAT_COLS)
+    assert sorted(ae.feature_loss_stats.keys()) == all_feature_names
+    assert ae.logger.n_epochs == 2
+
+    if use_preencode_dir:
+        assert sorted(os.listdir(tmp_path)) == ["bin.npy", "codes.npy", "num.npy"]
+
+
+def test_dataset_from_tensors(train_ae: autoencoder.AutoEncoder, train_df: pd.DataFrame):
+    train_ae.fit(train_df, epochs=1)
+    prepared_df = train_ae.prepare_df(train_df)
+
+    (num, bin, codes) = DatasetFromTensors.encode_df(train_ae, train_df)
+    assert num.shape == (len(train_df), len(NUMERIC_COLS))
+    assert bin.shape == (len(train_df), len(BIN_COLS))
+    assert codes.shape == (len(train_df), len(CAT_COLS))
+
+    (expected_num, expected_bin, expected_codes) = train_ae.compute_targets(prepared_df)
+    assert torch.equal(num.to(train_ae.device), expected_num)
+    assert torch.equal(bin.to(train_ae.device), expected_bin)
+    for (i, expected_code) in enumerate(expected_codes):
+        assert torch.equal(codes[:, i].to(train_ae.device), expected_code)
+
+    dataset = DatasetFromTensors.get_train_dataset(train_ae, train_df)
+    assert dataset.num_samples == len(train_df)
+    assert len(dataset) == math.ceil(len(train_df) / train_ae.batch_size)
+
+    batches = list(dataset)
+    assert sum(batch['data']['size'] for batch in batches) == len(train_df)
+
+    data = batches[0]['data']
+    assert data['input_swapped'].shape[0] == data['size']
+    assert data['num_target'].shape == (data['size'], len(NUMERIC_COLS))
+    assert data['bin_target'].shape == (data['size'], len(BIN_COLS))
+    assert len(data['cat_target']) == len(CAT_COLS)
+
+
 @pytest.mark.usefixtures("manual_seed")
 def test_auto_encoder_get_results(train_ae: autoencoder.AutoEncoder, train_df: pd.DataFrame):
     train_ae.fit(train_df, epochs=1)
@@ -14,10 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from morpheus.models.dfencoder.dataframe import EncoderDataFrame
+from morpheus.models.dfencoder.dataframe import SwapNoise
 
 
 def test_constructor():
@@ -40,3 +42,72 @@ def test_swap():
     df = EncoderDataFrame(values)
     swapped = df.swap(likelihood=0)
     assert swapped.values.tolist() == values
+
+
+def _make_mixed_df(num_rows: int = 100):
+    rng = np.random.default_rng(0)
+    return EncoderDataFrame({
+        "num": rng.normal(size=num_rows),
+        "int": rng.integers(0, 100, size=num_rows),
+        "bin": rng.random(num_rows) > 0.5,
+        "cat": pd.Categorical(rng.choice(["a", "b", "c", "_other"], size=num_rows)),
+        "str": rng.choice(["x", "y", "z"], size=num_rows).astype(object),
+    })
+
+
+@pytest.mark.usefixtures("manual_seed")
+def test_swap_matches_values_swap():
+    df = _make_mixed_df()
+
+    # Re-implementation of the original `df.values` based swap, both draw random rows from the global random state
+    values = df.values
+    n_rows = int(round(len(df) * .15))
+    columns = np.repeat(np.arange(len(df.columns)).reshape(1, -1), repeats=n_rows, axis=0)
+
+    np.random.seed(7)
+    to_place = values[np.random.randint(0, len(df), size=(n_rows, len(df.columns))), columns]
+    values[np.random.randint(0, len(df), size=(n_rows, len(df.columns))), columns] = to_place
+    expected = pd.DataFrame(values, columns=df.columns).astype(dict(df.dtypes))
+
+    np.random.seed(7)
+    swapped = df.swap()
+
+    pd.testing.assert_frame_equal(swapped, expected, check_frame_type=False)
+
+
+def test_swap_noise_preserves_input_and_dtypes():
+    df = _make_mixed_df()
+    orig = df.copy()
+
+    swapped = SwapNoise(seed=1).swap(df, likelihood=0.5)
+
+    assert isinstance(swapped, EncoderDataFrame)
+    pd.testing.assert_frame_equal(df, orig)
+    assert swapped.dtypes.to_dict() == df.dtypes.to_dict()
+    assert swapped["cat"].cat.categories.tolist() == df["cat"].cat.categories.tolist()
+    pd.testing.assert_index_equal(swapped.index, df.index)
+    assert not swapped.equals(df)
+
+    # Swapping only moves values within a column
+    for col in df.columns:
+        assert set(swapped[col]) <= set(df[col])
+
+
+def test_swap_noise_seed():
+    df = _make_mixed_df()
+
+    swap_noise = SwapNoise(seed=5)
+    first = swap_noise.swap(df)
+    second = swap_noise.swap(df)
+
+    # Buffers are re-used between calls, previously returned frames must not be modified
+    pd.testing.assert_frame_equal(first, SwapNoise(seed=5).swap(df))
+    assert not first.equals(second)
+
+
+def test_swap_noise_likelihood():
+    df = _make_mixed_df()
+
+    swap_noise = SwapNoise(likelihood=0)
+    pd.testing.assert_frame_equal(swap_noise.swap(df), df)
+    pd.testing.assert_frame_equal(df.swap(likelihood=0, swap_noise=swap_noise), df)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2022-2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+
+import math
+import operator
+
+import pytest
+
+from morpheus.models.dfencoder.training_executor import TrainingExecutor
+
+
+def test_constructor_errors():
+    with pytest.raises(ValueError):
+        TrainingExecutor(max_workers=0)
+
+    with pytest.raises(ValueError):
+        TrainingExecutor(max_workers=1, max_in_flight=0)
+
+
+def test_wait_all():
+    with TrainingExecutor(max_workers=2, max_in_flight=2) as executor:
+        for i in range(5):
+            executor.submit(f"user_{i}", operator.mul, i, 3, context=i)
+
+        # submit blocks once two jobs are pending
+        assert executor.queue_depth <= 2
+
+        results = list(executor.wait_all())
+
+        assert executor.queue_depth == 0
+        assert executor.completed_count == 5
+        assert executor.failed_count == 0
+        assert executor.users_per_second > 0
+
+    assert sorted(r.user_id for r in results) == [f"user_{i}" for i in range(5)]
+    for result in results:
+        assert result.succeeded
+        assert result.result == result.context * 3
+        assert result.train_time >= 0
+
+
+def test_failed_job():
+    with TrainingExecutor(max_workers=1) as executor:
+        executor.submit("bad_user", math.sqrt, -1)
+        executor.submit("good_user", math.sqrt, 4)
+
+        results = {r.user_id: r for r in executor.wait_all()}
+
+        assert executor.completed_count == 2
+        assert executor.failed_count == 1
+
+    assert not results["bad_user"].succeeded
+    assert isinstance(results["bad_user"].error, ValueError)
+    assert results["good_user"].succeeded
+    assert results["good_user"].result == 2.0
+
+
+def test_on_result():
+    emitted = []
+
+    with TrainingExecutor(max_workers=2, on_result=emitted.append) as executor:
+        for i in range(4):
+            executor.submit(f"user_{i}", operator.mul, i, 2, context=i)
+        executor.submit("bad_user", math.sqrt, -1)
+
+        # Results are handed to the callback as they complete, rather than being collected
+        assert list(executor.wait_all()) == []
+        assert executor.queue_depth == 0
+
+    # Failed jobs are handed to the callback as well
+    assert sorted(r.user_id for r in emitted) == ["bad_user"] + [f"user_{i}" for i in range(4)]
+    for result in emitted:
+        if (result.user_id == "bad_user"):
+            assert isinstance(result.error, ValueError)
+        else:
+            assert result.result == result.context * 2
+
+
+def test_on_result_error():
+
+    def on_result(result):
+        raise RuntimeError("unittest")
+
+    with TrainingExecutor(max_workers=1, on_result=on_result) as executor:
+        executor.submit("user_0", operator.mul, 1, 2)
+
+        # Errors raised by the callback are logged rather than stopping the executor
+        assert list(executor.wait_all()) == []
+        assert executor.completed_count == 1
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import typing
+
+import pandas as pd
+import pytest
+
+
+def _make_batch(start: int, num_rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime([1683054498 + i * 30 for i in range(start, start + num_rows)], unit='s'),
+        'v': range(start, start + num_rows),
+    })
+
+
+def _build_window(tmp_path, num_batches: int = 4, rows: int = 10):
+    from dfp.utils.cached_user_window import CachedUserWindow
+
+    window = CachedUserWindow(user_id='test_user', cache_location=os.path.join(tmp_path, 'test_user'))
+    for i in range(num_batches):
+        assert window.append_dataframe(_make_batch(i * rows, rows))
+
+    return window
+
+
+def test_append_dataframe(tmp_path):
+    window = _build_window(tmp_path)
+
+    assert window.count == 40
+    assert window.total_count == 40
+    assert window.batch_count == 4
+    assert [segment.num_rows for segment in window.segments] == [10] * 4
+    assert [segment.start_row for segment in window.segments] == [0, 10, 20, 30]
+    assert window.min_epoch == _make_batch(0, 1)['timestamp'].iloc[0]
+    assert window.max_epoch == _make_batch(39, 1)['timestamp'].iloc[0]
+
+    assert window.last_append_range == (30, 40)
+    assert '_row_hash' not in window.get_train_df(max_history=None).columns
+
+    # Rows already in the window are filtered out, rows preceding the window are rejected
+    assert window.append_dataframe(_make_batch(35, 10))
+    assert window.count == 45
+    assert window.last_append_range == (40, 45)
+    assert window.append_dataframe(_make_batch(30, 10))
+    assert window.last_append_range == (45, 45)
+    assert not window.append_dataframe(_make_batch(-5, 10))
+
+
+def test_get_train_df(tmp_path):
+    window = _build_window(tmp_path)
+
+    train_df = window.get_train_df(max_history=None)
+    assert train_df['v'].tolist() == list(range(40))
+    assert train_df.index.tolist() == list(range(40))
+    assert train_df['_batch_id'].tolist() == [i // 10 + 1 for i in range(40)]
+    assert window.last_train_count == 40
+    assert window.pending_batch_count == 0
+
+    # Modifying the returned DataFrame doesn't modify the window
+    train_df['v'] = -1
+    assert window.get_train_df(max_history=None)['v'].tolist() == list(range(40))
+
+
+@pytest.mark.parametrize("max_history, expected_start", [(15, 40), (25, 35), ("900s", 29)])
+def test_get_train_df_max_history(tmp_path, max_history, expected_start: int):
+    window = _build_window(tmp_path)
+    window.get_train_df(max_history=None)
+
+    # Rows which have not been trained on are always kept
+    window.append_dataframe(_make_batch(40, 20))
+
+    train_df = window.get_train_df(max_history=max_history)
+    assert train_df['v'].tolist() == list(range(expected_start, 60))
+    assert window.count == len(train_df)
+    assert window.min_epoch == train_df['timestamp'].min()
+
+    # The trained segments are merged
+    assert [segment.start_row for segment in window.segments] == [expected_start]
+
+
+def test_merge_segments(tmp_path):
+    window = _build_window(tmp_path, num_batches=7)
+    window.get_train_df(max_history=None)
+
+    # Each segment is larger than the segments following it
+    assert [segment.num_rows for segment in window.segments] == [40, 20, 10]
+
+    window.append_dataframe(_make_batch(70, 10))
+    window.get_train_df(max_history=None)
+    assert [segment.num_rows for segment in window.segments] == [80]
+
+
+def test_save_load(tmp_path):
+    from dfp.utils.cached_user_window import CachedUserWindow
+
+    window = _build_window(tmp_path)
+    window.get_train_df(max_history=None)
+    window.save()
+
+    cache_location = os.path.join(tmp_path, 'test_user')
+    assert sorted(os.listdir(cache_location)) == ['segment-0000000000.arrow', 'window.json']
+
+    # Only new segments are written, and trimming the front of a segment keeps using its file
+    window.append_dataframe(_make_batch(40, 10))
+    window.get_train_df(max_history=35)
+    window.save()
+    assert [segment.start_row for segment in window.segments] == [15, 40]
+    assert sorted(os.listdir(cache_location)) == ['segment-0000000000.arrow', 'segment-0000000001.arrow', 'window.json']
+
+    loaded = CachedUserWindow.load(cache_location)
+    assert loaded.user_id == 'test_user'
+    assert loaded.total_count == window.total_count
+    assert loaded.count == window.count
+    assert loaded.max_epoch == window.max_epoch
+    assert loaded.last_train_epoch == window.last_train_epoch
+
+    pd.testing.assert_frame_equal(loaded.get_train_df(max_history=None), window.get_train_df(max_history=None))
+
+    # Segments which are no longer referenced are removed
+    loaded.append_dataframe(_make_batch(50, 10))
+    window.append_dataframe(_make_batch(50, 10))
+    pd.testing.assert_frame_equal(loaded.get_train_df(max_history=10), window.get_train_df(max_history=10))
+
+    loaded.save()
+    assert sorted(os.listdir(cache_location)) == ['segment-0000000002.arrow', 'window.json']
+
+
+def _make_minutes_batch(minutes: typing.List[int], start: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime([1683054498 + m * 60 for m in minutes], unit='s'),
+        'v': range(start, start + len(minutes)),
+    })
+
+
+def test_save_load_duration_trim(tmp_path):
+    from dfp.utils.cached_user_window import CachedUserWindow
+
+    cache_location = os.path.join(tmp_path, 'test_user')
+    window = CachedUserWindow(user_id='test_user', cache_location=cache_location)
+
+    # Timestamps out of order, so that trimming by duration keeps rows with non-contiguous row ids
+    window.append_dataframe(_make_minutes_batch([0, 100, 1, 101, 102, 103], 0))
+    window.get_train_df(max_history=None)
+    window.append_dataframe(_make_minutes_batch([104], 6))
+
+    train_df = window.get_train_df(max_history="60min")
+    assert train_df.index.tolist() == [1, 3, 4, 5, 6]
+
+    window.save()
+
+    loaded = CachedUserWindow.load(cache_location)
+    pd.testing.assert_frame_equal(loaded.get_train_df(max_history=None), train_df)
+
+    # Trimming the front of the segment saved after the duration trim keeps rows which are contiguous in its file
+    window.append_dataframe(_make_minutes_batch([105], 7))
+    train_df = window.get_train_df(max_history=5)
+    assert train_df.index.tolist() == [3, 4, 5, 6, 7]
+    assert train_df['v'].tolist() == [3, 4, 5, 6, 7]
+
+    window.save()
+
+    loaded = CachedUserWindow.load(cache_location)
+    assert loaded.count == 5
+    pd.testing.assert_frame_equal(loaded.get_train_df(max_history=None), train_df)
+
+
+def test_flush(tmp_path):
+    window = _build_window(tmp_path)
+    window.save()
+    window.flush()
+    window.save()
+
+    assert window.count == 0
+    assert window.total_count == 0
+    assert len(window.get_train_df(max_history=None)) == 0
+    assert os.listdir(os.path.join(tmp_path, 'test_user')) == ['window.json']
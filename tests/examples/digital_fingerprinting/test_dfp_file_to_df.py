@@ -95,11 +95,13 @@ def test_constructor(config: Config):
     assert not stage._filter_null
     assert stage._parser_kwargs == {'test': 'this'}
     assert stage._cache_dir.startswith('/test/path/cache')
+    assert not stage._prefetch
 
 
 # pylint: disable=redefined-outer-name
 @pytest.mark.usefixtures("restore_environ")
-@pytest.mark.parametrize('dl_type', ["single_thread", "multiprocess", "multiprocessing", "dask", "dask_thread"])
+@pytest.mark.parametrize('dl_type',
+                         ["single_thread", "multiprocess", "multiprocessing", "dask", "dask_thread", "thread_pool"])
 @pytest.mark.parametrize('use_convert_to_dataframe', [True, False])
 @mock.patch('multiprocessing.get_context')
 @mock.patch('dask.distributed.Client')
@@ -182,7 +184,7 @@ def test_get_or_create_dataframe_from_s3_batch_cache_miss(mock_proc_df: mock.Mag
         mock_mp_gc.assert_not_called()
         mock_mp_pool.map.assert_not_called()
 
-    if dl_type == "single_thread":
+    if dl_type in ("single_thread", "thread_pool"):
         mock_obf_to_df.assert_called_once()
     else:
         mock_obf_to_df.assert_not_called()
@@ -198,9 +200,9 @@ def test_get_or_create_dataframe_from_s3_batch_cache_miss(mock_proc_df: mock.Mag
 
     dataset_pandas.assert_df_equal(output_df, expected_df)
 
-    expected_cache_file_path = os.path.join(stage._cache_dir, "batches", f"{expected_hash}.pkl")
+    expected_cache_file_path = os.path.join(stage._cache_dir, "batches", f"{expected_hash}.arrow")
     assert os.path.exists(expected_cache_file_path)
-    dataset_pandas.assert_df_equal(pd.read_pickle(expected_cache_file_path),
+    dataset_pandas.assert_df_equal(pd.read_feather(expected_cache_file_path),
                                    expected_df[dataset_pandas['filter_probs.csv'].columns])
 
 
@@ -243,7 +245,7 @@ def test_get_or_create_dataframe_from_s3_batch_cache_hit(mock_obf_to_df: mock.Ma
 
     expected_cache_dir = os.path.join(tmp_path, "file_cache", "batches")
     os.makedirs(expected_cache_dir)
-    dataset_pandas['filter_probs.csv'].to_pickle(os.path.join(expected_cache_dir, f"{hash_data}.pkl"))
+    dataset_pandas['filter_probs.csv'].to_feather(os.path.join(expected_cache_dir, f"{hash_data}.arrow"))
 
     expected_df = dataset_pandas['filter_probs.csv']
     expected_df['batch_count'] = 1
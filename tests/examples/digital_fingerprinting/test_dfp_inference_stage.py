@@ -51,7 +51,8 @@ def test_constructor(config: Config, mock_mlflow_client: mock.MagicMock, mock_mo
     assert stage._model_manager is mock_model_manager
 
     mock_mlflow_client.assert_called_once()
-    mock_model_manager.assert_called_once_with(model_name_formatter="test_model_name-{user_id}-{user_md5}")
+    mock_model_manager.assert_called_once_with(model_name_formatter="test_model_name-{user_id}-{user_md5}",
+                                               registry=None)
 
 
 def test_get_model(config: Config, mock_mlflow_client: mock.MagicMock, mock_model_manager: mock.MagicMock):
@@ -68,6 +69,19 @@ def test_get_model(config: Config, mock_mlflow_client: mock.MagicMock, mock_mode
                                                                fallback_user_ids=[config.ae.fallback_username])
 
 
+def test_prefetch_models(config: Config, mock_model_manager: mock.MagicMock):
+    from dfp.stages.dfp_inference_stage import DFPInferenceStage
+
+    stage = DFPInferenceStage(config)
+    stage.prefetch_models(["user1", "user2"])
+
+    mock_model_manager.prefetch.assert_called_once_with(["user1", "user2"],
+                                                        fallback_user_ids=[config.ae.fallback_username])
+
+    stage.stop()
+    mock_model_manager.close.assert_called_once()
+
+
 @pytest.mark.usefixtures("reset_loglevel")
 @pytest.mark.parametrize('morpheus_log_level',
                          [logging.CRITICAL, logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG])
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import os
+import typing
 from unittest import mock
 
 import pandas as pd
@@ -28,7 +29,11 @@ def build_mock_user_cache(user_id: str = 'test_user',
                           train_df: pd.DataFrame = None,
                           count: int = 10,
                           total_count: int = 20,
-                          last_train_count: int = 10) -> mock.MagicMock:
+                          last_train_count: int = 10,
+                          last_append_range: typing.Tuple[int, int] = None) -> mock.MagicMock:
+    if (last_append_range is None):
+        last_append_range = (0, 20)
+
     mock_cache = mock.MagicMock()
     mock_cache.user_id = user_id
     mock_cache.append_dataframe.return_value = True
@@ -36,6 +41,8 @@ def build_mock_user_cache(user_id: str = 'test_user',
     mock_cache.count = count
     mock_cache.total_count = total_count
     mock_cache.last_train_count = last_train_count
+    mock_cache.memory_bytes = 0
+    mock_cache.last_append_range = last_append_range
 
     return mock_cache
 
@@ -49,7 +56,7 @@ def test_constructor(config: Config):
     assert stage._min_increment == 7
     assert stage._max_history == 100
     assert stage._cache_dir.startswith('/test/path/cache')
-    assert stage._user_cache_map == {}
+    assert len(stage._user_windows) == 0
 
 
 def test_get_user_cache_hit(config: Config):
@@ -58,7 +65,7 @@ def test_get_user_cache_hit(config: Config):
     stage = DFPRollingWindowStage(config, min_history=5, min_increment=7, max_history=100, cache_dir='/test/path/cache')
 
     mock_cache = build_mock_user_cache()
-    stage._user_cache_map['test_user'] = mock_cache
+    stage._user_windows.add(mock_cache)
 
     with stage._get_user_cache('test_user') as user_cache:
         assert user_cache is mock_cache
@@ -74,7 +81,7 @@ def test_get_user_cache_miss(config: Config):
     with stage._get_user_cache('test_user') as results:
         assert isinstance(results, CachedUserWindow)
         assert results.user_id == 'test_user'
-        assert results.cache_location == os.path.join(stage._cache_dir, 'test_user.pkl')
+        assert results.cache_location == os.path.join(stage._cache_dir, 'test_user')
         assert results.timestamp_column == 'test_timestamp_col'
 
     with stage._get_user_cache('test_user') as results2:
@@ -91,7 +98,7 @@ def test_build_window_no_new(
 
     mock_cache = build_mock_user_cache()
     mock_cache.append_dataframe.return_value = False
-    stage._user_cache_map[dfp_message_meta.user_id] = mock_cache
+    stage._user_windows.add(mock_cache)
     stage._build_window(dfp_message_meta) is None
 
 
@@ -104,7 +111,7 @@ def test_build_window_not_enough_data(
     stage = DFPRollingWindowStage(config, min_history=5, min_increment=7, max_history=100, cache_dir='/test/path/cache')
 
     mock_cache = build_mock_user_cache(count=3)
-    stage._user_cache_map[dfp_message_meta.user_id] = mock_cache
+    stage._user_windows.add(mock_cache)
     stage._build_window(dfp_message_meta) is None
 
 
@@ -117,7 +124,7 @@ def test_build_window_min_increment(
     stage = DFPRollingWindowStage(config, min_history=5, min_increment=7, max_history=100, cache_dir='/test/path/cache')
 
     mock_cache = build_mock_user_cache(count=5, total_count=30, last_train_count=25)
-    stage._user_cache_map[dfp_message_meta.user_id] = mock_cache
+    stage._user_windows.add(mock_cache)
     stage._build_window(dfp_message_meta) is None
 
 
@@ -130,11 +137,10 @@ def test_build_window_invalid(
     stage = DFPRollingWindowStage(config, min_history=5, min_increment=7, max_history=100, cache_dir='/test/path/cache')
 
     train_df = dfp_message_meta.copy_dataframe()
-    # exact values not important so long as they don't match the actual hash
-    train_df['_row_hash'] = [-1 for _ in range(len(train_df))]
 
-    mock_cache = build_mock_user_cache(train_df=train_df)
-    stage._user_cache_map[dfp_message_meta.user_id] = mock_cache
+    # The appended rows are not in the window
+    mock_cache = build_mock_user_cache(train_df=train_df, last_append_range=(len(train_df), len(train_df) * 2))
+    stage._user_windows.add(mock_cache)
 
     with pytest.raises(RuntimeError):
         stage._build_window(dfp_message_meta)
@@ -150,10 +156,10 @@ def test_build_window_overlap(
 
     # Create an overlap
     train_df = dfp_message_meta.copy_dataframe()[-5:]
-    train_df['_row_hash'] = pd.util.hash_pandas_object(train_df, index=False)
 
-    mock_cache = build_mock_user_cache(train_df=train_df)
-    stage._user_cache_map[dfp_message_meta.user_id] = mock_cache
+    # Only the last 5 rows of the incoming data were appended to the window
+    mock_cache = build_mock_user_cache(train_df=train_df, last_append_range=(train_df.index[0], train_df.index[-1] + 1))
+    stage._user_windows.add(mock_cache)
 
     with pytest.raises(RuntimeError):
         stage._build_window(dfp_message_meta)
@@ -170,12 +176,10 @@ def test_build_window(
 
     stage = DFPRollingWindowStage(config, min_history=5, min_increment=7, max_history=100, cache_dir='/test/path/cache')
 
-    # Create an overlap
     train_df = dfp_message_meta.copy_dataframe()
-    train_df['_row_hash'] = pd.util.hash_pandas_object(train_df, index=False)
 
-    mock_cache = build_mock_user_cache(train_df=train_df)
-    stage._user_cache_map[dfp_message_meta.user_id] = mock_cache
+    mock_cache = build_mock_user_cache(train_df=train_df, last_append_range=(0, len(train_df)))
+    stage._user_windows.add(mock_cache)
 
     # on_data is a thin wrapper around _build_window, results should be the same
     if use_on_data:
@@ -191,3 +195,22 @@ def test_build_window(
     dataset_pandas.assert_df_equal(msg.get_meta(), train_df)
     dataset_pandas.assert_df_equal(msg.meta.get_df(), train_df)
     dataset_pandas.assert_df_equal(msg.get_meta_dataframe(), train_df)
+
+
+def test_build_window_user_cache(
+        config: Config,
+        dfp_message_meta: "DFPMessageMeta",  # noqa: F821
+        dataset_pandas: DatasetManager):
+    from dfp.messages.multi_dfp_message import MultiDFPMessage
+    from dfp.stages.dfp_rolling_window_stage import DFPRollingWindowStage
+
+    stage = DFPRollingWindowStage(config, min_history=5, min_increment=7, max_history=100, cache_dir='/test/path/cache')
+
+    msg = stage._build_window(dfp_message_meta)
+    assert isinstance(msg, MultiDFPMessage)
+    assert msg.mess_count == len(dataset_pandas['filter_probs.csv'])
+    dataset_pandas.assert_df_equal(msg.get_meta_dataframe().drop(columns=['_batch_id']),
+                                   dfp_message_meta.copy_dataframe())
+
+    # Repeating the batch adds no new rows
+    assert stage._build_window(dfp_message_meta) is None
@@ -17,6 +17,7 @@ import json
 import os
 import typing
 
+import pandas as pd
 import pytest
 
 from morpheus.config import Config
@@ -34,7 +35,7 @@ def test_constructor(config: Config):
     assert stage._include_individual
     assert stage._skip_users == []
     assert stage._only_users == []
-    assert stage._user_index_map == {}
+    assert stage._splitter.num_users == 0
 
     stage = DFPSplitUsersStage(config,
                                include_generic=True,
@@ -46,7 +47,7 @@ def test_constructor(config: Config):
     assert not stage._include_individual
     assert stage._skip_users == ['a', 'b']
     assert stage._only_users == ['c', 'd']
-    assert stage._user_index_map == {}
+    assert stage._splitter.num_users == 0
 
 
 @pytest.mark.parametrize('include_generic', [True, False])
@@ -113,6 +114,22 @@ def test_extract_users(config: Config,
             assert msg.df.iloc[0].to_dict() == expected_data[msg.user_id][0]
 
 
+def test_extract_users_on_users_split(config: Config):
+    from dfp.stages.dfp_split_users_stage import DFPSplitUsersStage
+    config.ae.userid_column_name = "username"
+
+    users_split = []
+    stage = DFPSplitUsersStage(config,
+                               include_generic=False,
+                               include_individual=True,
+                               on_users_split=users_split.append)
+
+    results = stage.extract_users(pd.DataFrame({'username': ['b', 'a', 'b'], 'timestamp': [1, 2, 3]}))
+
+    assert users_split == [['a', 'b']]
+    assert [msg.user_id for msg in results] == ['a', 'b']
+
+
 def test_extract_users_none_to_empty(config: Config):
     from dfp.stages.dfp_split_users_stage import DFPSplitUsersStage
 
@@ -35,6 +35,21 @@ def test_constructor(config: Config):
     assert stage._validation_size == 0.5
 
 
+def test_constructor_num_workers(config: Config):
+    from dfp.stages.dfp_training import DFPTraining
+
+    stage = DFPTraining(config)
+    assert stage._num_workers == 0
+    assert stage._max_in_flight is None
+
+    stage = DFPTraining(config, num_workers=4, max_in_flight=6)
+    assert stage._num_workers == 4
+    assert stage._max_in_flight == 6
+
+    with pytest.raises(ValueError):
+        DFPTraining(config, num_workers=-1)
+
+
 @pytest.mark.parametrize('validation_size', [-1, -0.2, 1, 5])
 def test_constructor_bad_validation_size(config: Config, validation_size: float):
     from dfp.stages.dfp_training import DFPTraining
@@ -100,3 +115,36 @@ def test_on_data(mock_train_test_split: mock.MagicMock,
 
     # The stage shouldn't be modifying the dataframe
     dataset_pandas.assert_compare_df(results.get_meta(), dataset_pandas[input_file])
+
+
+def test_build_output_message(config: Config, dataset_pandas: DatasetManager):
+    from dfp.messages.multi_dfp_message import DFPMessageMeta
+    from dfp.messages.multi_dfp_message import MultiDFPMessage
+    from dfp.stages.dfp_training import DFPTraining
+
+    from morpheus.models.dfencoder import TrainingExecutor
+    from morpheus.models.dfencoder import TrainingResult
+
+    df = dataset_pandas[os.path.join(TEST_DIRS.validation_data_dir, "dfp-cloudtrail-role-g-validation-data-input.csv")]
+    messages = [MultiDFPMessage(meta=DFPMessageMeta(df, f'user-{i}')) for i in range(3)]
+
+    mock_models = [mock.MagicMock() for _ in range(3)]
+    results = [
+        TrainingResult(user_id='user-0', result=mock_models[0], context=messages[0], train_time=1.0),
+        TrainingResult(user_id='user-1', context=messages[1], error=RuntimeError("unittest")),
+        TrainingResult(user_id='user-2', result=mock_models[2], context=messages[2], train_time=1.0),
+    ]
+
+    stage = DFPTraining(config, num_workers=2)
+    with TrainingExecutor(max_workers=2) as executor:
+        output_messages = [stage._build_output_message(executor, result) for result in results]
+
+    # No message is emitted for the failed user
+    assert output_messages[1] is None
+    output_messages = [output_messages[0], output_messages[2]]
+    for (output_message, i) in zip(output_messages, [0, 2]):
+        assert isinstance(output_message, MultiAEMessage)
+        assert output_message.meta is messages[i].meta
+        assert output_message.mess_offset == messages[i].mess_offset
+        assert output_message.mess_count == messages[i].mess_count
+        assert output_message.model is mock_models[i]
@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+import torch
+
+
+@pytest.fixture(name="registry")
+def registry_fixture(tmp_path):
+    from dfp.utils.model_registry import FileModelRegistry
+
+    registry = FileModelRegistry(os.path.join(tmp_path, 'models'))
+
+    for user_id in ('user1', 'user2', 'generic_user'):
+        registry.register_model(f'dfp-{user_id}', torch.nn.Linear(2, 2))
+
+    yield registry
+
+
+@pytest.fixture(name="model_manager")
+def model_manager_fixture(registry):
+    from dfp.utils.model_cache import ModelManager
+
+    model_manager = ModelManager(model_name_formatter="dfp-{user_id}", registry=registry)
+    yield model_manager
+    model_manager.close()
+
+
+def test_file_model_registry(registry):
+    assert registry.list_models() == {'dfp-user1', 'dfp-user2', 'dfp-generic_user'}
+    assert registry.get_latest_version('dfp-missing') is None
+
+    model = torch.nn.Linear(3, 3)
+    model_version = registry.register_model('dfp-user1', model)
+    assert model_version.reg_model_version == '2'
+    assert registry.get_latest_version('dfp-user1') == model_version
+
+    loaded = registry.load_model(model_version)
+    assert isinstance(loaded, torch.nn.Linear)
+    assert torch.equal(loaded.weight, model.weight)
+
+
+def test_load_user_model(model_manager):
+    model_cache = model_manager.load_user_model(None, user_id='user1', fallback_user_ids=['generic_user'])
+    assert model_cache.reg_model_name == 'dfp-user1'
+    assert model_cache.reg_model_version == '1'
+    assert not model_cache.is_loaded
+
+    model = model_cache.load_model()
+    assert isinstance(model, torch.nn.Linear)
+    assert model_cache.is_loaded
+    assert model_cache.load_model() is model
+
+    # Cached models are returned without querying the registry
+    with mock.patch.object(model_manager.registry, 'get_latest_version') as mock_get_latest_version:
+        assert model_manager.load_user_model(None, user_id='user1') is model_cache
+        mock_get_latest_version.assert_not_called()
+
+    # Users without a model use the fallback model, or None when there is no fallback
+    fallback_cache = model_manager.load_user_model(None, user_id='user3', fallback_user_ids=['generic_user'])
+    assert fallback_cache.reg_model_name == 'dfp-generic_user'
+    assert model_manager.load_user_model(None, user_id='user3') is None
+
+
+def test_lru_eviction(registry):
+    from dfp.utils.model_cache import ModelManager
+
+    model_manager = ModelManager(model_name_formatter="dfp-{user_id}", registry=registry, cache_size_max=2)
+
+    try:
+        user1_cache = model_manager.load_user_model(None, user_id='user1')
+        model_manager.load_user_model(None, user_id='user2')
+
+        # Using user1 makes user2 the least recently used
+        assert model_manager.load_user_model(None, user_id='user1') is user1_cache
+        model_manager.load_user_model(None, user_id='generic_user')
+
+        assert list(model_manager._model_cache.keys()) == ['dfp-user1', 'dfp-generic_user']
+    finally:
+        model_manager.close()
+
+
+def test_new_version(registry):
+    from dfp.utils.model_cache import ModelManager
+
+    model_manager = ModelManager(model_name_formatter="dfp-{user_id}", registry=registry, cache_timeout_sec=0)
+
+    try:
+        model_cache = model_manager.load_user_model(None, user_id='user1')
+        model = model_cache.load_model()
+
+        # An unchanged model keeps the downloaded model
+        assert model_manager.load_user_model(None, user_id='user1') is model_cache
+
+        registry.register_model('dfp-user1', torch.nn.Linear(2, 2))
+
+        new_cache = model_manager.load_user_model(None, user_id='user1')
+        assert new_cache.reg_model_version == '2'
+        assert new_cache.load_model() is not model
+    finally:
+        model_manager.close()
+
+
+def test_refresh_models(registry):
+    from dfp.utils.model_cache import ModelManager
+
+    model_manager = ModelManager(model_name_formatter="dfp-{user_id}", registry=registry, cache_timeout_sec=0.05)
+
+    try:
+        assert model_manager.load_user_model(None, user_id='user3') is None
+
+        updated = model_manager.existing_models_updated
+        registry.register_model('dfp-user3', torch.nn.Linear(2, 2))
+
+        # The list of models is refreshed in the background
+        deadline = time.time() + 5
+        while (model_manager.existing_models_updated == updated and time.time() < deadline):
+            time.sleep(0.01)
+
+        assert model_manager.load_user_model(None, user_id='user3').reg_model_name == 'dfp-user3'
+    finally:
+        model_manager.close()
+
+
+def test_prefetch(model_manager):
+    futures = model_manager.prefetch(['user1', 'user3'], fallback_user_ids=['generic_user'])
+    (user1_cache, user3_cache) = [future.result(timeout=10) for future in futures]
+
+    assert user1_cache.reg_model_name == 'dfp-user1'
+    assert user3_cache.reg_model_name == 'dfp-generic_user'
+    assert user1_cache.is_loaded and user3_cache.is_loaded
+
+    # Prefetched models are used without downloading them again
+    with mock.patch.object(model_manager.registry, 'load_model') as mock_load_model:
+        assert model_manager.load_user_model(None, user_id='user1') is user1_cache
+        user1_cache.load_model()
+        mock_load_model.assert_not_called()
+
+
+def test_prefetch_error(model_manager):
+    with mock.patch.object(model_manager.registry, 'load_model', side_effect=RuntimeError("test error")):
+        (future, ) = model_manager.prefetch(['user1'])
+        assert future.result(timeout=10) is None
+
+    assert model_manager.load_user_model(None, user_id='user1').load_model() is not None
+
+
+def test_concurrent_loads(model_manager):
+    # Users with different models don't wait on each other, while concurrent loads of the same model download once
+    load_started = threading.Barrier(2, timeout=10)
+    loads = []
+
+    def load_model(model_version):
+        loads.append(model_version.reg_model_name)
+        if (model_version.reg_model_name != 'dfp-generic_user'):
+            load_started.wait()
+
+        return torch.nn.Linear(2, 2)
+
+    with mock.patch.object(model_manager.registry, 'load_model', side_effect=load_model):
+        futures = model_manager.prefetch(['user1', 'user2', 'user3', 'user4'], fallback_user_ids=['generic_user'])
+        results = [future.result(timeout=10) for future in futures]
+
+    model_names = [model_cache.reg_model_name for model_cache in results]
+    assert model_names == ['dfp-user1', 'dfp-user2', 'dfp-generic_user', 'dfp-generic_user']
+    assert sorted(loads) == ['dfp-generic_user', 'dfp-user1', 'dfp-user2']
+
+
+def test_prefetch_after_close(model_manager):
+    model_manager.close()
+
+    # Users split after the pipeline stopped aren't prefetched, rather than failing to submit to the stopped executor
+    assert model_manager.prefetch(['user1', 'user2']) == []
+
+
+def test_prefetch_size_max(registry):
+    from dfp.utils.model_cache import ModelManager
+
+    with pytest.raises(ValueError):
+        ModelManager(model_name_formatter="dfp-{user_id}", registry=registry, cache_size_max=2, prefetch_size_max=2)
+
+    model_manager = ModelManager(model_name_formatter="dfp-{user_id}",
+                                 registry=registry,
+                                 cache_size_max=3,
+                                 prefetch_size_max=2)
+
+    load_released = threading.Event()
+
+    def load_model(model_version):
+        load_released.wait(timeout=10)
+        return torch.nn.Linear(2, 2)
+
+    try:
+        with mock.patch.object(model_manager.registry, 'load_model', side_effect=load_model):
+            # Only two users are prefetched at once, so prefetched models aren't evicted before they are used
+            futures = model_manager.prefetch(['user1', 'user2', 'generic_user'])
+            assert len(futures) == 2
+
+            load_released.set()
+            assert [future.result(timeout=10).reg_model_name for future in futures] == ['dfp-user1', 'dfp-user2']
+
+        assert not model_manager.load_user_model(None, user_id='generic_user').is_loaded
+    finally:
+        model_manager.close()
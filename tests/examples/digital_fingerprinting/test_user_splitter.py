@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _make_df(user_ids) -> pd.DataFrame:
+    return pd.DataFrame({'username': user_ids, 'v': range(len(user_ids))}, index=range(100, 100 + len(user_ids)))
+
+
+def _to_dict(output) -> dict:
+    return {user_id: (user_df.index.tolist(), user_df['v'].tolist()) for (user_id, user_df) in output}
+
+
+def test_split():
+    from dfp.utils.user_splitter import UserSplitter
+
+    splitter = UserSplitter(userid_column_name='username')
+    df = _make_df(['c', 'a', 'b', 'a', None, 'c', 'a'])
+
+    output = splitter.split(df)
+
+    # Users are sorted by id, rows without a user id are dropped and rows keep their relative order
+    assert [user_id for (user_id, _) in output] == ['a', 'b', 'c']
+    assert _to_dict(output) == {'a': ([0, 1, 2], [1, 3, 6]), 'b': ([0], [2]), 'c': ([0, 1], [0, 5])}
+    assert splitter.num_users == 3
+
+    # Indexes continue from the previous rows of each user
+    output = splitter.split(_make_df(['d', 'a']))
+    assert _to_dict(output) == {'a': ([3], [1]), 'd': ([0], [0])}
+    assert splitter.get_user_count('a') == 4
+    assert splitter.get_user_count('d') == 1
+    assert splitter.get_user_count('e') == 0
+
+    # The caller's DataFrame isn't modified
+    assert df.index.tolist() == list(range(100, 107))
+
+
+def test_split_shares_memory():
+    from dfp.utils.user_splitter import UserSplitter
+
+    splitter = UserSplitter(userid_column_name='username')
+    output = splitter.split(_make_df(['b', 'a', 'b', 'a']))
+
+    (a_df, b_df) = (user_df for (_, user_df) in output)
+
+    # The users are adjacent slices of the same sorted rows
+    assert np.byte_bounds(a_df['v'].values)[1] == np.byte_bounds(b_df['v'].values)[0]
+
+
+@pytest.mark.parametrize("fallback_username, expected_users", [("generic_user", ['a', 'b', 'generic_user']),
+                                                               ("aa", ['a', 'aa', 'b']), ("b", ['a', 'b'])])
+def test_split_generic(fallback_username: str, expected_users):
+    from dfp.utils.user_splitter import UserSplitter
+
+    splitter = UserSplitter(userid_column_name='username', fallback_username=fallback_username, include_generic=True)
+
+    for _ in range(2):
+        output = _to_dict(splitter.split(_make_df(['b', 'a', 'b'])))
+        assert list(output.keys()) == expected_users
+
+    # A user with the same id as the generic user takes its place
+    assert output['b'] == ([2, 3], [0, 2])
+
+    if (fallback_username != 'b'):
+        assert output[fallback_username] == ([3, 4, 5], [0, 1, 2])
+
+
+def test_split_filter_users():
+    from dfp.utils.user_splitter import UserSplitter
+
+    splitter = UserSplitter(userid_column_name='username',
+                            include_generic=True,
+                            include_individual=False,
+                            skip_users=['b'],
+                            only_users=['a', 'b'])
+
+    output = _to_dict(splitter.split(_make_df(['b', 'a', 'c', 'a'])))
+    assert output == {'generic_user': ([0, 1], [1, 3])}
+
+    splitter = UserSplitter(userid_column_name='username', include_generic=True, skip_users=['generic_user'])
+    assert list(_to_dict(splitter.split(_make_df(['b', 'a']))).keys()) == ['a', 'b']
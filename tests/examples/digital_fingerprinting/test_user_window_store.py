@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pandas as pd
+import pytest
+
+
+def _make_batch(start: int, num_rows: int = 100) -> pd.DataFrame:
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime([1683054498 + i * 30 for i in range(start, start + num_rows)], unit='s'),
+        'v': range(start, start + num_rows),
+    })
+
+
+def _append(store, user_id: str, start: int):
+    with store.get_window(user_id) as window:
+        assert window.append_dataframe(_make_batch(start))
+
+    return window
+
+
+def test_unbounded(tmp_path):
+    from dfp.utils.user_window_store import UserWindowStore
+
+    store = UserWindowStore(os.path.join(tmp_path, 'windows'))
+
+    windows = [_append(store, f'user{i}', 0) for i in range(5)]
+
+    assert len(store) == 5
+    assert 'user0' in store
+    assert store.get('user0') is windows[0]
+
+    stats = store.stats
+    assert stats.resident_users == 5
+    assert stats.spilled_users == 0
+    assert stats.spills == 0
+    assert stats.memory_bytes == sum(window.memory_bytes for window in windows)
+    assert not os.path.exists(os.path.join(tmp_path, 'windows'))
+
+
+def test_spill_and_reload(tmp_path):
+    from dfp.utils.user_window_store import UserWindowStore
+
+    store = UserWindowStore(os.path.join(tmp_path, 'windows'))
+    window_bytes = _append(store, 'probe', 0).memory_bytes
+    store.remove('probe')
+
+    # Room for two windows of a single batch each
+    store = UserWindowStore(os.path.join(tmp_path, 'windows'), memory_budget_bytes=int(window_bytes * 2.5))
+
+    for user_id in ('user0', 'user1', 'user2'):
+        _append(store, user_id, 0)
+
+    # The least recently used window is spilled
+    stats = store.stats
+    assert stats.resident_users == 2
+    assert stats.spilled_users == 1
+    assert stats.spills == 1
+    assert stats.bytes_spilled == window_bytes
+    assert stats.memory_bytes <= stats.memory_budget_bytes
+    assert os.path.exists(store.get_cache_location('user0'))
+
+    # The next batch for a spilled user reloads the window, spilling the least recently used window
+    window = _append(store, 'user0', 100)
+    assert window.count == 200
+    assert window.get_train_df(max_history=None)['v'].tolist() == list(range(200))
+
+    stats = store.stats
+    assert stats.reloads == 1
+    assert stats.bytes_reloaded > 0
+    assert stats.spills == 3
+    assert stats.resident_users == 1
+    assert stats.spilled_users == 2
+    assert len(store) == 3
+
+
+def test_window_over_budget(tmp_path):
+    from dfp.utils.user_window_store import UserWindowStore
+
+    store = UserWindowStore(os.path.join(tmp_path, 'windows'), memory_budget_bytes=1)
+
+    # A window exceeding the budget on its own is spilled once released
+    _append(store, 'user0', 0)
+    assert store.stats.resident_users == 0
+    assert store.stats.spilled_users == 1
+
+    assert store.get('user0').count == 100
+
+
+def test_invalid_budget(tmp_path):
+    from dfp.utils.user_window_store import UserWindowStore
+
+    with pytest.raises(ValueError):
+        UserWindowStore(os.path.join(tmp_path, 'windows'), memory_budget_bytes=-1)
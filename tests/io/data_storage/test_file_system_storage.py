@@ -21,10 +21,13 @@ import shutil
 import tempfile
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from morpheus.io.data_storage import FileSystemStorage
+from morpheus.io.data_storage.file_system import read_dataframe
 from morpheus.io.data_storage.file_system import row_count_from_file
+from morpheus.io.data_storage.file_system import write_arrow
 
 
 # Fixtures
@@ -162,3 +165,65 @@ def test_row_count_from_file_invalid_file_format():
     # Test that an error is raised when an unsupported file format is used
     with pytest.raises(ValueError):
         row_count_from_file('test_data.txt')
+
+
+@pytest.mark.parametrize("file_format", ['parquet', 'csv', 'arrow'])
+@pytest.mark.parametrize("row_range", [None, (0, 10), (5, 25), (18, 40), (35, None), (50, 60), (3, 3)])
+def test_read_dataframe_row_range(tmp_path, file_format, row_range):
+    df = pd.DataFrame({'a': range(40), 'b': [f"v{i}" for i in range(40)]})
+    filepath = os.path.join(tmp_path, f"test_data.{file_format}")
+
+    if (file_format == 'parquet'):
+        # Use several row groups, so ranges span row group boundaries
+        df.to_parquet(filepath, index=False, row_group_size=8)
+    elif (file_format == 'arrow'):
+        write_arrow(df, filepath)
+    else:
+        df.to_csv(filepath, index=False)
+
+    expected = df if row_range is None else df.iloc[row_range[0]:row_range[1]].reset_index(drop=True)
+
+    # Column types can't be inferred from an empty CSV
+    check_dtype = (file_format == 'parquet' or len(expected) > 0)
+
+    loaded = read_dataframe(filepath, file_format, row_range=row_range)
+    pd.testing.assert_frame_equal(loaded, expected, check_dtype=check_dtype, check_index_type=False)
+
+    loaded = read_dataframe(filepath, file_format, columns=['b'], row_range=row_range)
+    pd.testing.assert_frame_equal(loaded, expected[['b']], check_dtype=check_dtype, check_index_type=False)
+
+
+def test_read_dataframe_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        read_dataframe(os.path.join(tmp_path, "test_data.csv"), 'csv', row_range=(5, 2))
+
+
+def test_arrow(tmp_path):
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': [4.0, 5.0, 6.0], 'c': ['x', 'y', 'z']})
+    filepath = os.path.join(tmp_path, "test_data.arrow")
+
+    storage = FileSystemStorage(file_path=filepath, file_format='arrow')
+    storage.store(df)
+
+    assert storage.num_rows == 3
+    assert row_count_from_file(filepath) == 3
+    pd.testing.assert_frame_equal(storage.load(), df)
+    pd.testing.assert_frame_equal(storage.load(columns=['c']), df[['c']])
+
+    wrapped = FileSystemStorage(file_path="unused.arrow", file_format='arrow')
+    wrapped.store(filepath)
+    assert wrapped.owner is False
+    assert wrapped.num_rows == 3
+
+    storage.delete()
+    assert not os.path.exists(filepath)
+
+
+def test_row_count_arrow_without_metadata(tmp_path):
+    filepath = os.path.join(tmp_path, "test_data.arrow")
+    table = pa.Table.from_pandas(pd.DataFrame({'a': range(10)}), preserve_index=False)
+
+    with pa.ipc.new_file(filepath, table.schema) as writer:
+        writer.write_table(table, max_chunksize=3)
+
+    assert row_count_from_file(filepath, 'arrow') == 10
@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Disable redefined-outer-name, it doesn't detect fixture name usage correctly and reports errors that are not errors.
+# pylint: disable=redefined-outer-name
+
+import os
+
+import pandas as pd
+import pytest
+
+from morpheus.io.data_storage import HybridStorage
+from morpheus.io.data_storage import SpillManager
+
+
+# Fixtures
+@pytest.fixture
+def data():
+    return pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6], 'c': ['x', 'y', 'z']})
+
+
+def _make_storage(tmp_path, name: str, file_format: str, spill_manager: SpillManager) -> HybridStorage:
+    return HybridStorage(file_path=os.path.join(tmp_path, f"{name}.{file_format}"),
+                         file_format=file_format,
+                         spill_manager=spill_manager)
+
+
+# Tests
+@pytest.mark.parametrize("file_format", ['parquet', 'csv'])
+def test_store_load(tmp_path, data, file_format):
+    spill_manager = SpillManager()
+    storage = _make_storage(tmp_path, "test_data", file_format, spill_manager)
+    storage.store(data)
+
+    assert storage.num_rows == 3
+    assert storage.owner is True
+    assert storage.in_memory
+    assert storage.memory_bytes > 0
+    assert not os.path.exists(storage.backing_source)
+
+    pd.testing.assert_frame_equal(storage.load(), data)
+    pd.testing.assert_frame_equal(storage.load(columns=['c', 'a']), data[['c', 'a']])
+
+    # Loads return a copy, leaving the stored data unchanged
+    storage.load()['a'] = 0
+    pd.testing.assert_frame_equal(storage.load(), data)
+
+    stats = spill_manager.stats
+    assert stats.num_in_memory == 1
+    assert stats.spills == 0
+    assert stats.memory_bytes == storage.memory_bytes
+
+    storage.delete()
+    assert spill_manager.stats.num_in_memory == 0
+    assert spill_manager.stats.memory_bytes == 0
+
+
+@pytest.mark.parametrize("file_format", ['parquet', 'csv'])
+def test_spill_lru(tmp_path, data, file_format):
+    record_bytes = int(data.memory_usage(deep=True).sum())
+    spill_manager = SpillManager(memory_budget_bytes=2 * record_bytes)
+
+    storages = [_make_storage(tmp_path, f"test_data_{i}", file_format, spill_manager) for i in range(3)]
+    storages[0].store(data)
+    storages[1].store(data)
+
+    # Touching the first record makes the second the least recently used
+    storages[0].load()
+    storages[2].store(data)
+
+    assert [s.in_memory for s in storages] == [True, False, True]
+    assert os.path.exists(storages[1].backing_source)
+
+    stats = spill_manager.stats
+    assert stats.spills == 1
+    assert stats.bytes_spilled == record_bytes
+    assert stats.num_in_memory == 2
+    assert stats.num_spilled == 1
+
+    # Projected loads of a spilled record are read from disk without reloading it
+    pd.testing.assert_frame_equal(storages[1].load(columns=['b']), data[['b']])
+    assert not storages[1].in_memory
+
+    # Full loads reload the record, spilling the least recently used record in its place
+    pd.testing.assert_frame_equal(storages[1].load(), data)
+    assert [s.in_memory for s in storages] == [False, True, True]
+
+    stats = spill_manager.stats
+    assert stats.reloads == 1
+    assert stats.bytes_reloaded == record_bytes
+    assert stats.spills == 2
+
+    for storage in storages:
+        storage.delete()
+        assert not os.path.exists(storage.backing_source)
+
+    stats = spill_manager.stats
+    assert stats.num_in_memory == 0
+    assert stats.num_spilled == 0
+    assert stats.memory_bytes == 0
+
+
+def test_record_over_budget(tmp_path, data):
+    spill_manager = SpillManager(memory_budget_bytes=1)
+    storage = _make_storage(tmp_path, "test_data", "parquet", spill_manager)
+    storage.store(data)
+
+    assert not storage.in_memory
+    pd.testing.assert_frame_equal(storage.load(), data)
+    assert not storage.in_memory
+
+
+@pytest.mark.parametrize("file_format", ['parquet', 'csv'])
+def test_store_from_file(tmp_path, data, file_format):
+    source_path = os.path.join(tmp_path, f"source.{file_format}")
+    if (file_format == 'parquet'):
+        data.to_parquet(source_path, index=False)
+    else:
+        data.to_csv(source_path, index=False)
+
+    spill_manager = SpillManager()
+
+    wrapped = _make_storage(tmp_path, "wrapped", file_format, spill_manager)
+    wrapped.store(source_path)
+    assert wrapped.owner is False
+    assert wrapped.backing_source == source_path
+    assert wrapped.num_rows == 3
+    assert not wrapped.in_memory
+    pd.testing.assert_frame_equal(wrapped.load(), data)
+
+    copied = _make_storage(tmp_path, "copied", file_format, spill_manager)
+    copied.store(source_path, copy_from_source=True)
+    assert copied.owner is True
+    assert copied.in_memory
+    pd.testing.assert_frame_equal(copied.load(), data)
+
+    wrapped.delete()
+    copied.delete()
+    assert os.path.exists(source_path)
+
+
+def test_load_deleted(tmp_path, data):
+    storage = _make_storage(tmp_path, "test_data", "parquet", SpillManager())
+    storage.store(data)
+    storage.delete()
+
+    with pytest.raises(ValueError):
+        storage.load()
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        SpillManager(memory_budget_bytes=-1)
+
+
+def test_invalid_format(tmp_path):
+    with pytest.raises(NotImplementedError):
+        _make_storage(tmp_path, "test_data", "json", SpillManager())
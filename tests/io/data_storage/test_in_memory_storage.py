@@ -53,3 +53,27 @@ def test_in_memory_storage_delete():
     storage.delete()
     with pytest.raises(ValueError):
         storage.load()
+
+
+def test_in_memory_storage_arrow():
+    # Test that a DataFrame can be stored and loaded using the Arrow IPC format
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    storage = InMemoryStorage('arrow')
+    storage.store(df)
+    assert storage.num_rows == 3
+    assert storage.load().equals(df)
+    assert storage.load(columns=['b'], row_range=(1, 3)).equals(pd.DataFrame({'b': ['y', 'z']}))
+    storage.delete()
+    with pytest.raises(ValueError):
+        storage.load()
+
+
+def test_in_memory_storage_arrow_delete_loaded():
+    # Test that the buffer can be deleted while DataFrames loaded from it, which are views of the buffer, are alive
+    storage = InMemoryStorage('arrow')
+    storage.store(pd.DataFrame({'a': [1, 2, 3], 'b': [4.0, 5.0, 6.0]}))
+    loaded_df = storage.load()
+    storage.delete()
+    assert loaded_df['a'].tolist() == [1, 2, 3]
+    with pytest.raises(ValueError):
+        storage.load()
@@ -82,7 +82,7 @@ def test_memory_storage(storage_type, file_format, dataframe_fixture_data):
     assert sid in data_manager
 
 
-@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
 def test_filesystem_storage_type(storage_type):
     data_manager = DataManager(storage_type=storage_type)
     assert (len(data_manager) == 0)
@@ -95,8 +95,8 @@ def test_invalid_storage_type(storage_type):
         data_manager = DataManager(storage_type=storage_type)  # noqa pylint: disable=unused-variable
 
 
-@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
-@pytest.mark.parametrize("file_format", ['parquet', 'csv'])
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
+@pytest.mark.parametrize("file_format", ['parquet', 'csv', 'arrow'])
 def test_add_remove_source(storage_type, file_format):
     data_manager = DataManager(storage_type=storage_type, file_format=file_format)
     new_source = pd.DataFrame({'a': [9, 10], 'b': [11, 12]})
@@ -155,7 +155,7 @@ def test_large_fileset_filesystem_storage(storage_type, file_format):
         assert (not os.path.exists(file_path))
 
 
-@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
 @pytest.mark.parametrize("file_format", ['parquet', 'csv'])
 def test_load_cudf_dataframe(storage_type, file_format, dataframe_fixture_data):
     test_cudf_dataframe = dataframe_fixture_data["test_cudf_dataframe"]
@@ -167,8 +167,8 @@ def test_load_cudf_dataframe(storage_type, file_format, dataframe_fixture_data):
     pd.testing.assert_frame_equal(loaded_df, test_cudf_dataframe.to_pandas())
 
 
-@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
-@pytest.mark.parametrize("file_format", ['parquet', 'csv'])
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
+@pytest.mark.parametrize("file_format", ['parquet', 'csv', 'arrow'])
 def test_load_pd_dataframe(storage_type, file_format, dataframe_fixture_data):
     test_pd_dataframe = dataframe_fixture_data["test_pd_dataframe"]
     data_manager = DataManager(storage_type=storage_type, file_format=file_format)
@@ -178,8 +178,8 @@ def test_load_pd_dataframe(storage_type, file_format, dataframe_fixture_data):
     pd.testing.assert_frame_equal(loaded_df, test_pd_dataframe)
 
 
-@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
-@pytest.mark.parametrize("file_format", ['parquet', 'csv'])
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
+@pytest.mark.parametrize("file_format", ['parquet', 'csv', 'arrow'])
 def test_load(storage_type, file_format, dataframe_fixture_data):
     test_cudf_dataframe = dataframe_fixture_data["test_cudf_dataframe"]
     data_manager = DataManager(storage_type=storage_type, file_format=file_format)
@@ -189,7 +189,7 @@ def test_load(storage_type, file_format, dataframe_fixture_data):
     pd.testing.assert_frame_equal(loaded_df, test_cudf_dataframe.to_pandas())
 
 
-@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
 @pytest.mark.parametrize("file_format", ['parquet', 'csv'])
 def test_load_non_existent_source_id(storage_type, file_format):
     data_manager = DataManager(storage_type=storage_type, file_format=file_format)
@@ -201,8 +201,8 @@ def test_load_non_existent_source_id(storage_type, file_format):
         pass
 
 
-@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
-@pytest.mark.parametrize("file_format", ['parquet', 'csv'])
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
+@pytest.mark.parametrize("file_format", ['parquet', 'csv', 'arrow'])
 def test_get_num_rows(storage_type, file_format, dataframe_fixture_data):
     test_pd_dataframe = dataframe_fixture_data["test_pd_dataframe"]
     data_manager = DataManager(storage_type=storage_type, file_format=file_format)
@@ -211,7 +211,7 @@ def test_get_num_rows(storage_type, file_format, dataframe_fixture_data):
     assert (num_rows == len(test_pd_dataframe))
 
 
-@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
 @pytest.mark.parametrize("file_format", ['parquet', 'csv'])
 def test_source_property(storage_type, file_format, dataframe_fixture_data):
     test_cudf_dataframe = dataframe_fixture_data["test_cudf_dataframe"]
@@ -229,7 +229,7 @@ def test_source_property(storage_type, file_format, dataframe_fixture_data):
             assert (isinstance(value.data, pd.DataFrame))
 
 
-@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
 @pytest.mark.parametrize("file_format", ['parquet', 'csv'])
 def test_store_from_existing_file_path(storage_type, file_format, dataframe_fixture_data):
     test_parquet_filepath = dataframe_fixture_data["test_parquet_filepath"]
@@ -248,5 +248,116 @@ def test_store_from_existing_file_path(storage_type, file_format, dataframe_fixt
     assert (loaded_df.equals(test_cudf_dataframe.to_pandas()))
 
 
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
+@pytest.mark.parametrize("file_format", ['parquet', 'csv', 'arrow'])
+def test_load_columns(storage_type, file_format):
+    data_manager = DataManager(storage_type=storage_type, file_format=file_format)
+    sid = data_manager.store(pd.DataFrame({'a': [1, 2], 'b': [3, 4], 'c': [5, 6]}))
+
+    loaded_df = data_manager.load(sid, columns=['c', 'a'])
+    pd.testing.assert_frame_equal(loaded_df[['c', 'a']], pd.DataFrame({'c': [5, 6], 'a': [1, 2]}))
+    assert 'b' not in loaded_df.columns
+
+
+@pytest.mark.parametrize("file_format", ['parquet', 'csv', 'arrow'])
+def test_hybrid_storage_spills(file_format):
+    dfs = [pd.DataFrame({'a': range(i * 100, (i + 1) * 100)}) for i in range(4)]
+    record_bytes = int(dfs[0].memory_usage(deep=True).sum())
+
+    data_manager = DataManager(storage_type='hybrid', file_format=file_format, memory_budget_bytes=2 * record_bytes)
+    sids = [data_manager.store(df) for df in dfs]
+
+    stats = data_manager.spill_stats
+    assert stats.num_in_memory == 2
+    assert stats.num_spilled == 2
+    assert stats.spills == 2
+    assert stats.memory_bytes <= 2 * record_bytes
+    assert len(os.listdir(data_manager._storage_dir)) == 2
+
+    # The least recently used records are spilled first, and reloaded on demand
+    assert not data_manager.get_record(sids[0])._storage.in_memory
+    pd.testing.assert_frame_equal(data_manager.load(sids[0]), dfs[0])
+    assert data_manager.get_record(sids[0])._storage.in_memory
+
+    stats = data_manager.spill_stats
+    assert stats.reloads == 1
+    assert stats.num_in_memory == 2
+    assert data_manager.num_rows == 400
+
+    for (sid, df) in zip(sids, dfs):
+        pd.testing.assert_frame_equal(data_manager.load(sid), df)
+
+    data_manager.remove(sids[0])
+    assert data_manager.spill_stats.num_in_memory + data_manager.spill_stats.num_spilled == 3
+
+
+def test_memory_budget_requires_hybrid():
+    with pytest.raises(ValueError):
+        DataManager(storage_type='in_memory', memory_budget_bytes=100)
+
+    assert DataManager(storage_type='filesystem').spill_stats is None
+
+
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
+@pytest.mark.parametrize("file_format", ['parquet', 'csv', 'arrow'])
+def test_load_many(storage_type, file_format):
+    dfs = [pd.DataFrame({'a': range(i * 10, (i + 1) * 10), 'b': range(i, i + 10)}) for i in range(5)]
+    data_manager = DataManager(storage_type=storage_type, file_format=file_format)
+    sids = [data_manager.store(df) for df in dfs]
+
+    expected = pd.concat(dfs, ignore_index=True)
+    pd.testing.assert_frame_equal(data_manager.load_all(), expected)
+    pd.testing.assert_frame_equal(data_manager.load_all(max_workers=1), expected)
+
+    # Sources are returned in the requested order
+    pd.testing.assert_frame_equal(data_manager.load_many([sids[3], sids[1]], columns=['b']),
+                                  pd.concat([dfs[3], dfs[1]], ignore_index=True)[['b']])
+
+    # Row ranges span the concatenated sources
+    pd.testing.assert_frame_equal(data_manager.load_all(row_range=(15, 32)),
+                                  expected.iloc[15:32].reset_index(drop=True))
+    pd.testing.assert_frame_equal(data_manager.load_all(columns=['a'], row_range=(42, None)),
+                                  expected[['a']].iloc[42:].reset_index(drop=True))
+
+    chunks = data_manager.load_all(row_range=(5, 25), lazy=True)
+    assert not isinstance(chunks, pd.DataFrame)
+    assert [len(chunk) for chunk in chunks] == [5, 10, 5]
+
+    assert len(data_manager.load_all(row_range=(100, 200))) == 0
+    assert len(data_manager.load_many([])) == 0
+
+
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem', 'hybrid'])
+def test_load_many_invalid(storage_type):
+    data_manager = DataManager(storage_type=storage_type)
+    sid = data_manager.store(pd.DataFrame({'a': [1, 2]}))
+
+    with pytest.raises(KeyError):
+        data_manager.load_many([sid, uuid.uuid4()], lazy=True)
+
+    with pytest.raises(ValueError):
+        data_manager.load_all(row_range=(2, 1))
+
+
 if __name__ == '__main__':
     unittest.main()
+
+
+@pytest.mark.parametrize("storage_type", ['in_memory', 'filesystem'])
+def test_load_arrow_read_only(storage_type):
+    data_manager = DataManager(storage_type=storage_type, file_format='arrow')
+    sid = data_manager.store(pd.DataFrame({'a': [1, 2], 'b': [3.0, 4.0]}))
+
+    # Arrow sources are loaded without copying, the columns are read-only views of the source
+    loaded_df = data_manager.load(sid)
+    with pytest.raises(ValueError):
+        loaded_df.iloc[0, 0] = 10
+
+    loaded_df = loaded_df.copy()
+    loaded_df.iloc[0, 0] = 10
+    assert loaded_df['a'].tolist() == [10, 2]
+
+    # Loaded frames remain valid after the source is removed
+    loaded_df = data_manager.load(sid)
+    data_manager.remove(sid)
+    assert loaded_df['a'].tolist() == [1, 2]
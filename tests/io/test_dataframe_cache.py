@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.io.dataframe_cache import DataFrameCache
+
+
+def _make_df(num_rows: int = 100, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "a": rng.integers(0, 100, size=num_rows),
+        "b": rng.random(size=num_rows),
+        "c": [f"value_{i}" for i in rng.integers(0, 10, size=num_rows)],
+    })
+
+
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+def test_round_trip(tmp_path: str, file_format: str):
+    cache = DataFrameCache(os.path.join(tmp_path, "cache"), file_format=file_format)
+    df = _make_df()
+
+    assert cache.get("key") is None
+    assert cache.put("key", df)
+    assert "key" in cache
+    assert os.path.exists(os.path.join(tmp_path, "cache", f"key.{file_format}"))
+
+    pd.testing.assert_frame_equal(cache.get("key"), df)
+    pd.testing.assert_frame_equal(cache.get("key", columns=["b"]), df[["b"]])
+
+    stats = cache.stats
+    assert stats.hits == 2
+    assert stats.misses == 1
+    assert stats.bytes_written == cache.total_bytes
+    assert stats.bytes_read > 0
+
+
+def test_invalid_args(tmp_path: str):
+    with pytest.raises(ValueError):
+        DataFrameCache(tmp_path, file_format="pickle")
+
+    with pytest.raises(ValueError):
+        DataFrameCache(tmp_path, max_size_bytes=-1)
+
+
+def test_dir_created_lazily(tmp_path: str):
+    cache_dir = os.path.join(tmp_path, "cache")
+    cache = DataFrameCache(cache_dir)
+
+    assert cache.get("key") is None
+    assert not os.path.exists(cache_dir)
+
+    cache.put("key", _make_df())
+    assert os.listdir(cache_dir) == ["key.arrow"]
+
+
+def test_eviction(tmp_path: str):
+    cache = DataFrameCache(tmp_path)
+    cache.put("0", _make_df())
+    entry_size = cache.total_bytes
+
+    # Room for three entries
+    cache = DataFrameCache(tmp_path, max_size_bytes=entry_size * 3 + entry_size // 2)
+    cache.put("1", _make_df())
+    cache.put("2", _make_df())
+
+    # Touching "0" makes "1" the least recently used entry
+    assert cache.get("0") is not None
+    cache.put("3", _make_df())
+
+    assert "1" not in cache
+    assert all(key in cache for key in ("0", "2", "3"))
+    assert cache.total_bytes <= cache.max_size_bytes
+
+    stats = cache.stats
+    assert stats.evictions == 1
+    assert stats.bytes_evicted == entry_size
+
+
+def test_evicts_other_files(tmp_path: str):
+    # Entries written by earlier versions in a different format count towards the size and are evicted first
+    legacy_file = os.path.join(tmp_path, "legacy.pkl")
+    _make_df().to_pickle(legacy_file)
+
+    cache = DataFrameCache(tmp_path, max_size_bytes=1)
+    cache.put("key", _make_df())
+
+    assert not os.path.exists(legacy_file)
+
+    # The newest entry is kept even if it exceeds the limit on its own
+    assert "key" in cache
+
+
+def test_corrupt_entry(tmp_path: str):
+    with open(os.path.join(tmp_path, "key.arrow"), "wb") as fh:
+        fh.write(b"not an arrow file")
+
+    cache = DataFrameCache(tmp_path)
+    assert cache.get("key") is None
+    assert "key" not in cache
+    assert cache.stats.misses == 1
+
+
+def test_remove_clear(tmp_path: str):
+    cache = DataFrameCache(tmp_path)
+    for key in ("a", "b", "c"):
+        cache.put(key, _make_df())
+
+    cache.remove("a")
+    assert "a" not in cache
+    assert "b" in cache
+
+    cache.clear()
+    assert os.listdir(tmp_path) == []
+    assert cache.total_bytes == 0
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import os
+import time
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from morpheus.common import FileTypes
+from morpheus.io.rotating_file_writer import RotatingFileWriter
+from morpheus.io.rotating_file_writer import strip_compression_extension
+
+
+def _make_dfs(num_dfs: int, rows: int = 10):
+    return [
+        pd.DataFrame({
+            'a': range(i * rows, (i + 1) * rows), 'b': [f"v{j}" for j in range(i * rows, (i + 1) * rows)]
+        }) for i in range(num_dfs)
+    ]
+
+
+def _read(path: str, file_type: FileTypes) -> pd.DataFrame:
+    if (file_type == FileTypes.PARQUET):
+        return pd.read_parquet(path)
+
+    if (file_type == FileTypes.JSON):
+        return pd.read_json(path, lines=True)
+
+    return pd.read_csv(path, index_col=0).reset_index(drop=True)
+
+
+def test_strip_compression_extension():
+    assert strip_compression_extension("out.jsonlines.gz") == "out.jsonlines"
+    assert strip_compression_extension("out.csv.zst") == "out.csv"
+    assert strip_compression_extension("out.csv") == "out.csv"
+
+
+@pytest.mark.parametrize("file_type, ext", [(FileTypes.CSV, "csv"), (FileTypes.JSON, "jsonlines"),
+                                            (FileTypes.PARQUET, "parquet")])
+def test_write(tmp_path, file_type, ext):
+    filename = os.path.join(tmp_path, f"out.{ext}")
+    dfs = _make_dfs(5)
+
+    with RotatingFileWriter(filename, file_type, queue_size=2) as writer:
+        for df in dfs:
+            writer.write(df)
+
+    assert writer.file_paths == [filename]
+    pd.testing.assert_frame_equal(_read(filename, file_type), pd.concat(dfs, ignore_index=True))
+
+
+@pytest.mark.parametrize("file_type, ext", [(FileTypes.CSV, "csv"), (FileTypes.JSON, "jsonlines")])
+def test_rotate_by_size(tmp_path, file_type, ext):
+    filename = os.path.join(tmp_path, f"out.{ext}")
+    dfs = _make_dfs(6)
+
+    with RotatingFileWriter(filename, file_type, max_file_bytes=1) as writer:
+        for df in dfs:
+            writer.write(df)
+
+    assert writer.file_paths == [os.path.join(tmp_path, f"out.{i:05d}.{ext}") for i in range(6)]
+
+    # Each file is readable on its own, including a header for CSV files
+    for (path, df) in zip(writer.file_paths, dfs):
+        pd.testing.assert_frame_equal(_read(path, file_type), df.reset_index(drop=True))
+
+
+def test_rotate_by_age(tmp_path):
+    filename = os.path.join(tmp_path, "out.jsonlines")
+    dfs = _make_dfs(2)
+
+    with RotatingFileWriter(filename, FileTypes.JSON, max_file_age_sec=0.05) as writer:
+        writer.write(dfs[0])
+        time.sleep(0.3)
+
+        # The first file is closed by age, even though no more data has arrived
+        assert len(writer.file_paths) == 1
+        pd.testing.assert_frame_equal(_read(writer.file_paths[0], FileTypes.JSON), dfs[0])
+
+        writer.write(dfs[1])
+
+    assert len(writer.file_paths) == 2
+    pd.testing.assert_frame_equal(_read(writer.file_paths[1], FileTypes.JSON), dfs[1])
+
+
+def test_gzip(tmp_path):
+    filename = os.path.join(tmp_path, "out.csv")
+    dfs = _make_dfs(3)
+
+    with RotatingFileWriter(filename, FileTypes.CSV, compression="gzip") as writer:
+        for df in dfs:
+            writer.write(df)
+
+    assert writer.file_paths == [filename + ".gz"]
+
+    with gzip.open(writer.file_paths[0], "rb") as in_file:
+        pd.testing.assert_frame_equal(
+            pd.read_csv(in_file, index_col=0).reset_index(drop=True), pd.concat(dfs, ignore_index=True))
+
+
+@pytest.mark.parametrize("row_group_rows, expected_row_groups", [(1, 5), (25, 2), (1000, 1)])
+def test_parquet_row_groups(tmp_path, row_group_rows, expected_row_groups):
+    filename = os.path.join(tmp_path, "out.parquet")
+    dfs = _make_dfs(5)
+
+    with RotatingFileWriter(filename, FileTypes.PARQUET, compression="gzip", row_group_rows=row_group_rows) as writer:
+        for df in dfs:
+            writer.write(df)
+
+    # Parquet files are compressed internally, and keep their extension
+    assert writer.file_paths == [filename]
+
+    parquet_file = pq.ParquetFile(filename)
+    assert parquet_file.num_row_groups == expected_row_groups
+    assert parquet_file.metadata.row_group(0).column(0).compression == "GZIP"
+    pd.testing.assert_frame_equal(parquet_file.read().to_pandas(), pd.concat(dfs, ignore_index=True))
+
+
+def test_invalid_args(tmp_path):
+    filename = os.path.join(tmp_path, "out.csv")
+
+    with pytest.raises(ValueError):
+        RotatingFileWriter(filename, FileTypes.CSV, compression="lz4")
+
+    with pytest.raises(ValueError):
+        RotatingFileWriter(filename, FileTypes.CSV, max_file_bytes=0)
+
+    with pytest.raises(NotImplementedError):
+        RotatingFileWriter(filename, FileTypes.Auto)
+
+
+def test_writer_error(tmp_path):
+    filename = os.path.join(tmp_path, "out.csv")
+
+    writer = RotatingFileWriter(filename, FileTypes.CSV)
+    writer.write("not a dataframe")
+
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+    with pytest.raises(RuntimeError):
+        writer.write(_make_dfs(1)[0])
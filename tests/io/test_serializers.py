@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+
+import pandas as pd
+import pytest
+
+import cudf
+
+from morpheus.common import FileTypes
+from morpheus.io import serializers
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'he said "hi"\nbye', 'z'], 'c': [0.5, None, 1.5]})
+
+
+@pytest.mark.parametrize("include_header", [False, True])
+@pytest.mark.parametrize("include_index_col", [False, True])
+def test_df_to_csv_bytes(df, include_header, include_index_col):
+    records = serializers.df_to_csv_bytes(df, include_header=include_header, include_index_col=include_index_col)
+    lines = serializers.df_to_csv(df, include_header=include_header, include_index_col=include_index_col)
+
+    assert bytes(records.buffer) == "".join(lines).encode("utf-8")
+    assert len(records) == 3
+
+    # Quoted newlines don't split a record
+    expected_header = df.iloc[:0].to_csv(index=include_index_col) if include_header else ""
+    assert bytes(records.header) == expected_header.encode("utf-8")
+    assert b"".join(bytes(record) for record in records) == bytes(records.buffer)[len(expected_header):]
+    assert records.to_list(strip_newlines=True)[1].endswith(b'"he said ""hi""\nbye",')
+
+
+def test_df_to_json_bytes(df):
+    records = serializers.df_to_json_bytes(df)
+    lines = serializers.df_to_json(df)
+
+    assert records.to_list() == [line.encode("utf-8") for line in lines]
+    assert records.to_list(strip_newlines=True) == [line.rstrip("\n").encode("utf-8") for line in lines]
+    assert records[-1].tobytes() == lines[-1].encode("utf-8")
+    assert isinstance(records[0], memoryview)
+
+    with pytest.raises(IndexError):
+        records[3]  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize("num_rows", [0, 1, 20])
+def test_df_to_json_bytes_records(df_type, num_rows: int):
+    df = pd.DataFrame({'v': range(num_rows), 's': [f"value\n{i}" for i in range(num_rows)]})
+    if (df_type == "cudf"):
+        df = cudf.from_pandas(df)
+
+    records = serializers.df_to_json_bytes(df).to_list(strip_newlines=True)
+
+    # Newlines embedded in values are escaped and do not split a record
+    assert [json.loads(record) for record in records] == [{'v': i, 's': f"value\n{i}"} for i in range(num_rows)]
+
+
+def test_empty(df):
+    assert len(serializers.df_to_json_bytes(df.iloc[:0])) == 0
+
+    records = serializers.df_to_csv_bytes(df.iloc[:0], include_header=True, include_index_col=False)
+    assert len(records) == 0
+    assert bytes(records.buffer) == b"a,b,c\n"
+
+
+def test_whitespace_records():
+    # Records containing only whitespace are kept, only the empty record after the final newline is dropped
+    records = serializers.df_to_csv_bytes(pd.DataFrame({'x': [' ', 'a', ' ']}), include_index_col=False)
+    assert records.to_list() == [b" \n", b"a\n", b" \n"]
+
+
+@pytest.mark.parametrize("file_type", [FileTypes.CSV, FileTypes.JSON])
+@pytest.mark.parametrize("chunk_rows", [1, 2, 100])
+def test_df_to_stream_chunks(df, file_type, chunk_rows):
+    stream = io.BytesIO()
+    serializers.df_to_stream_chunks(df, stream, file_type, include_header=True, chunk_rows=chunk_rows)
+
+    expected = io.StringIO()
+    if (file_type == FileTypes.CSV):
+        serializers.df_to_stream_csv(df, expected, include_header=True)
+    else:
+        serializers.df_to_stream_json(df, expected)
+
+    assert stream.getvalue() == expected.getvalue().encode("utf-8")
+
+
+def test_df_to_parquet(df):
+    data = serializers.df_to_parquet(df)
+
+    assert isinstance(data, bytes)
+    pd.testing.assert_frame_equal(pd.read_parquet(io.BytesIO(data)), df)
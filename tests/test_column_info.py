@@ -17,6 +17,8 @@
 import io
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 
@@ -30,9 +32,13 @@ from morpheus.utils.column_info import ColumnInfo
 from morpheus.utils.column_info import CustomColumn
 from morpheus.utils.column_info import DataFrameInputSchema
 from morpheus.utils.column_info import DateTimeColumn
+from morpheus.utils.column_info import DistinctIncrementColumn
+from morpheus.utils.column_info import DistinctIncrementState
 from morpheus.utils.column_info import RenameColumn
 from morpheus.utils.column_info import StringCatColumn
 from morpheus.utils.column_info import StringJoinColumn
+from morpheus.utils.column_info import _json_flatten
+from morpheus.utils.column_info import create_increment_col
 from morpheus.utils.nvt.schema_converters import create_and_attach_nvt_workflow
 from morpheus.utils.schema_transforms import process_dataframe
 from utils import TEST_DIRS
@@ -324,3 +330,135 @@ def test_type_cast():
 
         assert actutal.dtype == np.dtype('O')
         assert actutal.equals(expected)
+
+
+def _expected_json_flatten(df: pd.DataFrame, input_columns: dict[str, str], json_col: str, preserve: bool):
+    normalized = pd.json_normalize(df[json_col].apply(lambda x: x if isinstance(x, dict) else json.loads(x)))
+    normalized.rename(columns=lambda x: json_col + "." + x, inplace=True)
+    normalized.set_index(df.index, inplace=True)
+
+    cols_to_keep = list(df.columns) if preserve else [c for c in df.columns if c != json_col]
+
+    expected = pd.concat([df[cols_to_keep], normalized], axis=1)
+
+    return expected.reindex(columns=input_columns.keys(), fill_value=None).astype(input_columns)
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("preserve", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 4, 10000])
+@pytest.mark.parametrize("as_str", [False, True])
+def test_json_flatten(preserve: bool, chunk_size: int, as_str: bool):
+    records = []
+    for i in range(10):
+        props = {
+            "userPrincipalName": f"user_{i % 3}",
+            "deviceDetail": {
+                "browser": "Edge" if i % 3 else None, "displayName": "device"
+            },
+            "location": {
+                "city": "Austin"
+            } if i % 4 else {},
+            "isInteractive": bool(i % 2),
+            "a.b": {
+                "c": i
+            },
+            "unused": list(range(3)),
+        }
+
+        if (i % 5 == 0):
+            del props["userPrincipalName"]
+
+        records.append({"time": f"2023-01-01T00:00:{i:02d}Z", "properties": json.dumps(props) if as_str else props})
+
+    df = pd.DataFrame(records, index=range(100, 110))
+
+    input_columns = {
+        "time": "str",
+        "properties": "str",
+        "properties.userPrincipalName": "str",
+        "properties.deviceDetail.browser": "str",
+        "properties.deviceDetail": "str",
+        "properties.location.city": "str",
+        "properties.isInteractive": "bool",
+        "properties.a.b.c": "float",
+        "properties.missing": "str",
+    }
+
+    preserve_re = re.compile("(properties)") if preserve else None
+
+    expected = _expected_json_flatten(df, input_columns, "properties", preserve)
+
+    actual = _json_flatten(df, input_columns, ["properties"], preserve_re, chunk_size=chunk_size)
+    pd.testing.assert_frame_equal(actual, expected)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        actual = _json_flatten(df, input_columns, ["properties"], preserve_re, chunk_size=chunk_size, executor=executor)
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def _create_increment_df():
+    timestamps = [
+        "2023-01-01 00:00",
+        "2023-01-01 01:00",
+        "2023-01-01 02:00",
+        "2023-01-01 03:00",
+        "2023-01-01 04:00",
+        "2023-01-01 05:00",
+        "2023-01-02 00:00",
+        "2023-01-02 01:00",
+    ]
+
+    return pd.DataFrame(
+        {
+            "username": ["a", "b", "a", "a", "b", "a", "a", "a"],
+            "timestamp": pd.to_datetime(timestamps, utc=True),
+            "location": ["x", "x", "y", "x", None, "z", "x", "x"],
+        },
+        index=[10, 3, 7, 1, 5, 2, 8, 6])
+
+
+@pytest.mark.use_python
+def test_create_increment_col():
+    df = _create_increment_df()
+
+    actual = create_increment_col(df, "location")
+
+    expected = pd.Series([1, 1, 2, 2, 2, 3, 1, 1], index=df.index)
+
+    pd.testing.assert_series_equal(actual, expected, check_names=False)
+
+
+@pytest.mark.use_python
+def test_create_increment_col_null_group():
+    df = _create_increment_df()
+    df.loc[7, "username"] = None
+
+    # Rows without a group are skipped, as with groupby
+    expected = pd.Series([1, 1, 1, 2, 2, 1, 1], index=df.index.drop(7))
+
+    actual = create_increment_col(df, "location")
+    pd.testing.assert_series_equal(actual, expected, check_names=False)
+
+    actual = DistinctIncrementColumn(name="locincrement", dtype="int", input_name="location")._process_column(df)
+    pd.testing.assert_series_equal(actual, expected, check_names=False)
+
+
+@pytest.mark.use_python
+def test_distinct_increment_column_state():
+    df = _create_increment_df()
+
+    expected = DistinctIncrementColumn(name="locincrement", dtype="int", input_name="location")._process_column(df)
+
+    col_info = DistinctIncrementColumn(name="locincrement",
+                                       dtype="int",
+                                       input_name="location",
+                                       state=DistinctIncrementState())
+
+    # Processing the rows in batches should continue counting from the previous batches
+    actual = pd.concat([col_info._process_column(df.iloc[:3]), col_info._process_column(df.iloc[3:])])
+
+    pd.testing.assert_series_equal(actual, expected)
+
+    col_info.state.clear()
+    assert len(col_info.state) == 0
@@ -47,7 +47,7 @@ def dask_cuda(fail_missing: bool):
 
 @pytest.mark.usefixtures("restore_environ")
 @pytest.mark.parametrize('use_env', [True, False])
-@pytest.mark.parametrize('dl_method', ["single_thread", "multiprocess", "multiprocessing", "dask", "dask_thread"])
+@pytest.mark.parametrize('dl_method', list(DOWNLOAD_METHODS_MAP.keys()))
 def test_constructor_download_type(use_env: bool, dl_method: str):
     kwargs = {}
     if use_env:
@@ -87,6 +87,25 @@ def test_constructor_invalid_dltype(use_env: bool):
         Downloader(**kwargs)
 
 
+@pytest.mark.usefixtures("restore_environ")
+@pytest.mark.parametrize('use_env', [True, False])
+def test_constructor_max_workers(use_env: bool):
+    kwargs = {}
+    if use_env:
+        os.environ['MORPHEUS_FILE_DOWNLOAD_WORKERS'] = "3"
+    else:
+        kwargs['max_workers'] = 3
+
+    downloader = Downloader(**kwargs)
+    assert downloader.max_workers == 3
+
+
+@pytest.mark.parametrize('max_workers', [0, -1])
+def test_constructor_invalid_max_workers(max_workers: int):
+    with pytest.raises(ValueError):
+        Downloader(max_workers=max_workers)
+
+
 @pytest.mark.usefixtures("restore_environ")
 @pytest.mark.parametrize("dl_method", ["dask", "dask_thread"])
 @mock.patch('dask.config')
@@ -190,3 +209,50 @@ def test_download(mock_dask_cluster: mock.MagicMock,
         mock_dask_cluster.assert_not_called()
         mock_dask_client.assert_not_called()
         mock_dask_config.assert_not_called()
+
+
+@pytest.mark.usefixtures("restore_environ")
+@pytest.mark.parametrize('dl_method', ["thread_pool", "process_pool"])
+def test_download_executor(dl_method: str):
+    downloader = Downloader(download_method=dl_method, max_workers=2)
+    download_buckets = [os.path.join("bucket", f"file_{i}.json") for i in range(10)]
+    expected = [os.path.basename(bucket) for bucket in download_buckets]
+
+    # Results from the module level function are picklable, allowing the process pool to be used
+    assert downloader.download(download_buckets, os.path.basename) == expected
+
+    # The executor is created once and reused between calls
+    executor = downloader.get_executor()
+    assert downloader.download(download_buckets, os.path.basename) == expected
+    assert downloader.get_executor() is executor
+
+    futures = downloader.submit(download_buckets, os.path.basename)
+    assert [future.result() for future in futures] == expected
+
+    assert list(downloader.iter_download(download_buckets, os.path.basename)) == expected
+    assert sorted(downloader.iter_download(download_buckets, os.path.basename, ordered=False)) == sorted(expected)
+
+    downloader.close()
+    assert downloader.get_executor() is not executor
+    downloader.close()
+
+
+@pytest.mark.usefixtures("restore_environ")
+@pytest.mark.parametrize('dl_method', ["single_thread", "multiprocess", "dask"])
+def test_get_executor_invalid(dl_method: str):
+    downloader = Downloader(download_method=dl_method)
+    with pytest.raises(RuntimeError):
+        downloader.get_executor()
+
+
+@pytest.mark.usefixtures("restore_environ")
+def test_submit_single_thread():
+    downloader = Downloader(download_method="single_thread")
+    download_fn = mock.MagicMock(side_effect=lambda bucket: bucket * 2)
+
+    futures = downloader.submit([1, 2, 3], download_fn)
+
+    # Methods without an executor complete the downloads before returning
+    download_fn.assert_has_calls([mock.call(1), mock.call(2), mock.call(3)])
+    assert all(future.done() for future in futures)
+    assert [future.result() for future in futures] == [2, 4, 6]
@@ -18,11 +18,14 @@ import filecmp
 import os
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from morpheus.common import FileTypes
 from morpheus.config import CppConfig
+from morpheus.io.deserializers import iter_files_to_df
 from morpheus.io.deserializers import read_file_to_df
+from morpheus.io.deserializers import read_files_to_df
 from morpheus.io.serializers import write_df_to_file
 from morpheus.messages import MessageMeta
 from morpheus.messages import MultiMessage
@@ -261,3 +264,146 @@ def test_file_rw_serialize_deserialize_multi_segment_pipe(tmp_path, config, outp
     # Somehow 0.7 ends up being 0.7000000000000001
     output_data = np.around(output_data, 2)
     assert output_data.tolist() == input_data.tolist()
+
+
+def _write_split_files(tmp_path, input_type: str, num_files: int = 3, rows_per_file: int = 10) -> pd.DataFrame:
+    dfs = []
+    for i in range(num_files):
+        df = pd.DataFrame({
+            'v1': np.arange(i * rows_per_file, (i + 1) * rows_per_file),
+            'v2': np.linspace(0, 1, rows_per_file),
+            'data': [f"row {j}" for j in range(rows_per_file)]
+        })
+        file_name = os.path.join(tmp_path, f"part_{i}.{input_type}")
+
+        if (input_type == "csv"):
+            df.to_csv(file_name, index=False)
+        elif (input_type == "jsonlines"):
+            df.to_json(file_name, orient="records", lines=True)
+        else:
+            df.to_parquet(file_name, index=False)
+
+        dfs.append(df)
+
+    return pd.concat(dfs, ignore_index=True)
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("input_type", ["csv", "jsonlines", "parquet"])
+def test_read_files_to_df(tmp_path, input_type):
+    expected = _write_split_files(tmp_path, input_type)
+    pattern = os.path.join(tmp_path, f"part_*.{input_type}")
+
+    df = read_files_to_df(pattern, max_workers=2)
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+
+    df = read_files_to_df(pattern, columns=['data', 'v1'], dtypes={'v1': 'float64'})
+    pd.testing.assert_frame_equal(df, expected[['data', 'v1']].astype({'v1': 'float64'}), check_index_type=False)
+
+    files = [os.path.join(tmp_path, f"part_{i}.{input_type}") for i in (2, 0)]
+    df = read_files_to_df(files)
+    assert df['v1'].tolist() == list(range(20, 30)) + list(range(0, 10))
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("input_type", ["csv", "jsonlines", "parquet"])
+def test_iter_files_to_df_chunks(tmp_path, input_type, df_type):
+    expected = _write_split_files(tmp_path, input_type)
+
+    chunks = list(
+        iter_files_to_df(os.path.join(tmp_path, f"part_*.{input_type}"), df_type=df_type, chunk_rows=4, max_workers=2))
+
+    # Chunks don't span files, and the index continues across chunks
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2] * 3
+    if (df_type == "cudf"):
+        chunks = [chunk.to_pandas() for chunk in chunks]
+
+    df = pd.concat(chunks)
+    assert df.index.tolist() == list(range(30))
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+
+
+@pytest.mark.use_python
+def test_iter_files_to_df_chunks_json_dtypes(tmp_path, df_type):
+    file_name = os.path.join(tmp_path, "events.jsonlines")
+    pd.DataFrame({
+        'timestamp': [1616380971990, 1616380971991],
+        'created_at': ["2021-03-22T02:42:51", "2021-03-22T02:42:52"],
+        'v1': [1, 2]
+    }).to_json(file_name, orient="records", lines=True)
+
+    expected = read_file_to_df(file_name, df_type="cudf").to_pandas()
+
+    # Columns which look like dates are read with the same types as when reading the whole file
+    chunks = list(iter_files_to_df(file_name, df_type=df_type, chunk_rows=1))
+    if (df_type == "cudf"):
+        chunks = [chunk.to_pandas() for chunk in chunks]
+
+    df = pd.concat(chunks)
+    assert df.dtypes.to_dict() == expected.dtypes.to_dict()
+    assert df['timestamp'].tolist() == [1616380971990, 1616380971991]
+
+
+def test_read_files_to_df_no_match(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_files_to_df(os.path.join(tmp_path, "*.csv"))
+
+
+@pytest.mark.slow
+@pytest.mark.use_python
+@pytest.mark.parametrize("input_type", ["csv", "jsonlines", "parquet"])
+@pytest.mark.parametrize("repeat", [1, 2], ids=["repeat1", "repeat2"])
+def test_file_rw_chunked_pipe(tmp_path, config, input_type, repeat: int):
+    input_file = os.path.join(TEST_DIRS.tests_data_dir, 'filter_probs.{}'.format(input_type))
+    validation_file = os.path.join(TEST_DIRS.tests_data_dir, "filter_probs.csv")
+    out_file = os.path.join(tmp_path, 'results.csv')
+
+    pipe = LinearPipeline(config)
+    pipe.set_source(FileSourceStage(config, filename=input_file, repeat=repeat, chunk_rows=3))
+    pipe.add_stage(WriteToFileStage(config, filename=out_file, overwrite=False))
+    pipe.run()
+
+    assert_path_exists(out_file)
+
+    validation_data = np.loadtxt(validation_file, delimiter=",", skiprows=1)
+    validation_data = np.tile(validation_data, (repeat, 1))
+
+    # The output data will contain an additional id column that we will need to slice off
+    output_data = np.loadtxt(out_file, delimiter=",", skiprows=1)
+    assert output_data[:, 0].tolist() == list(range(len(validation_data)))
+    output_data = output_data[:, 1:]
+
+    # Somehow 0.7 ends up being 0.7000000000000001
+    output_data = np.around(output_data, 2)
+    assert output_data.tolist() == validation_data.tolist()
+
+
+@pytest.mark.slow
+@pytest.mark.use_python
+@pytest.mark.parametrize("output_type", ["csv", "jsonlines", "parquet"])
+def test_file_rw_background_writer_pipe(tmp_path, config, output_type):
+    input_file = os.path.join(TEST_DIRS.tests_data_dir, "filter_probs.csv")
+    out_file = os.path.join(tmp_path, 'results.{}'.format(output_type))
+
+    # Rotate after every message, each file holding one chunk of the input
+    pipe = LinearPipeline(config)
+    pipe.set_source(FileSourceStage(config, filename=input_file, chunk_rows=4))
+    pipe.add_stage(WriteToFileStage(config, filename=out_file, overwrite=False, compression="gzip", max_file_bytes=1))
+    pipe.run()
+
+    input_df = read_file_to_df(input_file, df_type='pandas')
+    num_files = -(-len(input_df) // 4)
+
+    output_dfs = []
+    for i in range(num_files):
+        if (output_type == "parquet"):
+            output_dfs.append(pd.read_parquet(os.path.join(tmp_path, f'results.{i:05d}.parquet')))
+        else:
+            output_path = os.path.join(tmp_path, f'results.{i:05d}.{output_type}.gz')
+            file_type = FileTypes.CSV if output_type == "csv" else FileTypes.JSON
+            output_dfs.append(read_file_to_df(output_path, file_type=file_type, df_type='pandas'))
+
+    output_df = pd.concat(output_dfs, ignore_index=True)
+    output_df = output_df[input_df.columns]
+
+    assert np.around(output_df.values, 2).tolist() == np.around(input_df.values, 2).tolist()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ipaddress
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import morpheus.parsers.ip as ip
+import morpheus.parsers.ip_pandas as ip_pandas
+
+PREDICATES = [
+    "is_reserved",
+    "is_loopback",
+    "is_link_local",
+    "is_unspecified",
+    "is_multicast",
+    "is_private",
+    "is_global",
+]
+
+ADDRESSES = [
+    "5.79.97.178",
+    "127.0.0.1",
+    "10.1.2.3",
+    "100.64.0.1",
+    "169.254.10.10",
+    "172.31.255.255",
+    "192.168.0.1",
+    "224.0.0.1",
+    "240.0.0.0",
+    "255.255.255.255",
+    "0.0.0.0",
+    "8.8.8.8",
+    "::",
+    "::1",
+    "fe80::1",
+    "ff02::1",
+    "fc00::1",
+    "2001:db8::1",
+    "2001:4860:4860::8888",
+    "2607:f8b0:4005:80a::200e",
+]
+
+
+def test_parse_ips():
+    parsed = ip_pandas.parse_ips(pd.Series(["1.2.3.4", "::1", "not an ip", None, "1.2.3.4"], index=[5, 6, 7, 8, 9]))
+
+    np.testing.assert_array_equal(parsed.version, [4, 6, 0, 0, 4])
+    np.testing.assert_array_equal(parsed.ipv4, [0x01020304, 0, 0, 0, 0x01020304])
+    np.testing.assert_array_equal(parsed.ipv6_hi, [0, 0, 0, 0, 0])
+    np.testing.assert_array_equal(parsed.ipv6_lo, [0, 1, 0, 0, 0])
+    assert parsed.index.tolist() == [5, 6, 7, 8, 9]
+
+
+def test_ip_to_int():
+    actual = ip_pandas.ip_to_int(pd.Series(["5.79.97.178", "94.130.74.45"]))
+    pd.testing.assert_series_equal(actual, pd.Series([89088434, 1585596973]))
+
+
+def test_int_to_ip():
+    actual = ip_pandas.int_to_ip(pd.Series([89088434, 1585596973]))
+    pd.testing.assert_series_equal(actual, pd.Series(["5.79.97.178", "94.130.74.45"]))
+
+
+def test_is_ip():
+    input = pd.Series(["5.79.97.178", "1.2.3.4", "5", "5.79", "5.79.97", "5.79.97.178.100", "256.1.1.1", "::1", None])
+    actual = ip_pandas.is_ip(input)
+    pd.testing.assert_series_equal(actual, pd.Series([True, True, False, False, False, False, False, True, False]))
+
+    pd.testing.assert_series_equal(ip_pandas.is_ipv4(input),
+                                   pd.Series([True, True, False, False, False, False, False, False, False]))
+    pd.testing.assert_series_equal(ip_pandas.is_ipv6(input),
+                                   pd.Series([False, False, False, False, False, False, False, True, False]))
+
+
+@pytest.mark.parametrize("predicate", PREDICATES)
+def test_predicates_match_ipaddress(predicate: str):
+    input = pd.Series(ADDRESSES)
+    expected = pd.Series([getattr(ipaddress.ip_address(addr), predicate) for addr in ADDRESSES])
+
+    pd.testing.assert_series_equal(getattr(ip_pandas, predicate)(input), expected)
+
+
+def test_classify_all():
+    input = pd.Series(ADDRESSES + ["invalid"], index=range(10, 10 + len(ADDRESSES) + 1))
+    parsed = ip_pandas.parse_ips(input)
+
+    df = ip_pandas.classify_all(input)
+    assert df.index.equals(input.index)
+
+    for predicate in ["is_ip", "is_ipv4", "is_ipv6"] + PREDICATES:
+        pd.testing.assert_series_equal(df[predicate], getattr(ip_pandas, predicate)(parsed), check_names=False)
+
+    assert not df.loc[10 + len(ADDRESSES)].any()
+
+
+def test_netmask():
+    actual = ip_pandas.netmask(pd.Series(["5.79.97.178", "94.130.74.45", "2001:db8::1"]), 17)
+    expected = pd.Series(["255.255.128.0", "255.255.128.0", "ffff:8000::"], name="net_mask")
+    pd.testing.assert_series_equal(actual, expected)
+
+
+def test_hostmask():
+    actual = ip_pandas.hostmask(pd.Series(["5.79.97.178", "94.130.74.45"]), 17)
+    expected = pd.Series(["0.0.127.255", "0.0.127.255"], name="hostmask")
+    pd.testing.assert_series_equal(actual, expected)
+
+
+def test_mask():
+    input_ips = pd.Series(["5.79.97.178", "94.130.74.45", "2001:db8:1234::1"])
+    input_masks = pd.Series(["255.255.128.0", "255.255.128.0", "ffff:ffff::"])
+    expected = pd.Series(["5.79.0.0", "94.130.0.0", "2001:db8::"], name="mask")
+    pd.testing.assert_series_equal(ip_pandas.mask(input_ips, input_masks), expected)
+
+
+def test_ip_dispatches_pandas():
+    input = pd.Series(["127.0.0.1", "::1", "5.79.97.178"])
+    actual = ip.is_loopback(input)
+
+    assert isinstance(actual, pd.Series)
+    pd.testing.assert_series_equal(actual, pd.Series([True, True, False]))
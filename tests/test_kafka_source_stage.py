@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+import cudf
+
+from morpheus.config import Config
+from morpheus.stages.input.kafka_source_stage import JsonEngine
+from morpheus.stages.input.kafka_source_stage import KafkaSourceStage
+from utils.local_kafka import LocalKafkaConsumer
+
+
+def _make_payloads(num_records: int):
+    return [json.dumps({'v': i, 's': f"value_{i}"}).encode() for i in range(num_records)]
+
+
+def _run_source(stage: KafkaSourceStage, consumer: LocalKafkaConsumer) -> pd.DataFrame:
+    with mock.patch('confluent_kafka.Consumer', new=consumer):
+        metas = list(stage._source_generator())
+
+    assert consumer.closed
+
+    return pd.concat([meta.copy_dataframe().to_pandas() for meta in metas], ignore_index=True)
+
+
+@pytest.mark.parametrize('json_engine', list(JsonEngine))
+@pytest.mark.parametrize('async_parse', [False, True])
+def test_source_generator(config: Config, json_engine: JsonEngine, async_parse: bool):
+    config.pipeline_batch_size = 16
+    num_records = 100
+
+    consumer = LocalKafkaConsumer(_make_payloads(num_records))
+    stage = KafkaSourceStage(config,
+                             bootstrap_servers="localhost:9092",
+                             stop_after=num_records,
+                             json_engine=json_engine,
+                             async_parse=async_parse)
+
+    df = _run_source(stage, consumer)
+
+    expected_df = pd.DataFrame({'v': range(num_records), 's': [f"value_{i}" for i in range(num_records)]})
+    pd.testing.assert_frame_equal(df, expected_df, check_dtype=False)
+
+
+@pytest.mark.parametrize('num_partitions', [1, 3])
+def test_commit_last_offsets(config: Config, num_partitions: int):
+    config.pipeline_batch_size = 10
+    num_records = 30
+
+    consumer = LocalKafkaConsumer(_make_payloads(num_records), num_partitions=num_partitions)
+    stage = KafkaSourceStage(config, bootstrap_servers="localhost:9092", stop_after=num_records)
+
+    _run_source(stage, consumer)
+
+    # A single commit per batch, containing the offset after the last message of each partition in the batch
+    assert len(consumer.commits) == num_records // config.pipeline_batch_size
+    for (batch_num, offsets) in enumerate(consumer.commits):
+        batch_msgs = consumer.messages[batch_num * 10:(batch_num + 1) * 10]
+        expected = {(msg.topic(), msg.partition()): msg.offset() + 1 for msg in batch_msgs}
+        assert {(tp.topic, tp.partition): tp.offset for tp in offsets} == expected
+
+
+def test_disable_commit(config: Config):
+    consumer = LocalKafkaConsumer(_make_payloads(10))
+    stage = KafkaSourceStage(config, bootstrap_servers="localhost:9092", stop_after=10, disable_commit=True)
+
+    _run_source(stage, consumer)
+    assert consumer.commits == []
+
+
+def test_invalid_payload(config: Config):
+    stage = KafkaSourceStage(config, bootstrap_servers="localhost:9092")
+    (buffer, _) = stage._assemble_batch(LocalKafkaConsumer([b'{"v": 1}', b'not json']).messages)
+
+    assert stage._parse_batch(buffer) is None
+    assert stage._parse_batch(b"") is None
+
+
+def test_assemble_batch(config: Config):
+    stage = KafkaSourceStage(config, bootstrap_servers="localhost:9092")
+    consumer = LocalKafkaConsumer([b'{"v": 1}', None, b'{"v": 2}'], num_partitions=2)
+
+    (buffer, offsets) = stage._assemble_batch(consumer.messages)
+
+    # Messages without a payload are skipped, but still committed
+    assert buffer == b'{"v": 1}\n{"v": 2}'
+    assert sorted((tp.partition, tp.offset) for tp in offsets) == [(0, 2), (1, 1)]
+
+    df = stage._parse_batch(buffer)
+    assert isinstance(df, cudf.DataFrame)
+    assert df.to_pandas()['v'].tolist() == [1, 2]
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pandas as pd
+import pytest
+
 import cudf
 
 from morpheus.parsers.splunk_notable_parser import SplunkNotableParser
@@ -269,3 +272,15 @@ def test_splunk_notable_parser():
     assert test_output_df7["message_username"][0] == ""
     assert test_output_df7["message_hostname"][0] == ""
     assert test_output_df7["message_description"][0] == ""
+
+
+@pytest.mark.parametrize("test_data",
+                         [TEST_DATA1, TEST_DATA2, TEST_DATA3, TEST_DATA4, TEST_DATA5, TEST_DATA6, TEST_DATA7])
+def test_splunk_notable_parser_pandas(test_data: str):
+    snp = SplunkNotableParser()
+
+    expected_df = snp.parse(cudf.Series([test_data])).to_pandas()
+    actual_df = snp.parse(pd.Series([test_data]))
+
+    assert isinstance(actual_df, pd.DataFrame)
+    pd.testing.assert_frame_equal(actual_df, expected_df, check_like=True)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pandas as pd
 import pytest
 
 from cudf import DataFrame
@@ -159,3 +160,23 @@ def test_parse_invalid_req_cols(input_df):
     with pytest.raises(ValueError) as actual_error:
         url_parser.parse(input_df["url"], req_cols={"test"})
         assert actual_error == expected_error
+
+
+@pytest.mark.parametrize("input_df", [input_df])
+@pytest.mark.parametrize("req_cols", [None, {"domain", "suffix"}, {"hostname"}])
+def test_parse_pandas(input_df, req_cols):
+    expected_output_df = url_parser.parse(input_df["url"], req_cols=req_cols).to_pandas()
+    output_df = url_parser.parse(input_df["url"].to_pandas(), req_cols=req_cols)
+
+    assert isinstance(output_df, pd.DataFrame)
+    pd.testing.assert_frame_equal(output_df, expected_output_df)
+
+
+def test_parse_pandas_unknown_suffix():
+    urls = pd.Series(["http://www.google.com", "host.invalidsuffix", "localhost", None, "http://www.google.com"])
+    output_df = url_parser.parse(urls)
+
+    assert output_df["hostname"].isna().tolist() == [False, False, True, True, False]
+    assert output_df["domain"].tolist() == ["google", "", "", "", "google"]
+    assert output_df["suffix"].tolist() == ["com", "", "", "", "com"]
+    assert output_df["subdomain"].tolist() == ["www", "", "", "", "www"]
@@ -14,6 +14,7 @@
 
 import os
 
+import pandas as pd
 import pytest
 
 import cudf
@@ -636,6 +637,24 @@ def test_windows_event_parser():
         validate_func(parsed_rec)
 
 
+def test_windows_event_parser_pandas():
+    wep = WindowsEventParser()
+
+    with open(os.path.join(TEST_DIRS.tests_data_dir, 'windows_event_logs.txt'), encoding='UTF-8') as fh:
+        test_logs = fh.readlines()
+
+    test_output_df = wep.parse(pd.Series(test_logs))
+    assert isinstance(test_output_df, pd.DataFrame)
+
+    for parsed_rec in test_output_df.to_records():
+        eventcode = parsed_rec["eventcode"]
+        validate_func = VALIDATE_DICT.get(eventcode, unknown_record_type)
+        validate_func(parsed_rec)
+
+    expected_df = wep.parse(cudf.Series(test_logs)).to_pandas()
+    pd.testing.assert_frame_equal(test_output_df, expected_df, check_like=True)
+
+
 def test2_windows_event_parser():
     wep = WindowsEventParser(interested_eventcodes=["5156"])
     with open(os.path.join(TEST_DIRS.tests_data_dir, 'windows_event_logs.txt'), encoding='UTF-8') as fh:
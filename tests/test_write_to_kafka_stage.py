@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+import cudf
+
+from morpheus.io import serializers
+from morpheus.pipeline import LinearPipeline
+from morpheus.stages.input.in_memory_source_stage import InMemorySourceStage
+from morpheus.stages.output.write_to_kafka_stage import WriteToKafkaStage
+from utils.local_kafka import LocalKafkaProducer
+
+
+def _make_df(num_rows: int) -> pd.DataFrame:
+    return pd.DataFrame({'v': range(num_rows), 's': [f"value\n{i}" for i in range(num_rows)]})
+
+
+@pytest.mark.parametrize('pipelined', [False, True])
+@pytest.mark.parametrize('max_outstanding_bytes', [None, 512])
+def test_write_to_kafka_stage(config, pipelined: bool, max_outstanding_bytes: int):
+    input_dfs = [cudf.from_pandas(_make_df(50)), cudf.from_pandas(_make_df(30))]
+    producer = LocalKafkaProducer(ack_delay=0.001, queue_limit=25)
+
+    with mock.patch('confluent_kafka.Producer', new=producer):
+        pipe = LinearPipeline(config)
+        pipe.set_source(InMemorySourceStage(config, input_dfs))
+        stage = pipe.add_stage(
+            WriteToKafkaStage(config,
+                              bootstrap_servers="localhost:9092",
+                              output_topic="test_output",
+                              pipelined=pipelined,
+                              max_outstanding_bytes=max_outstanding_bytes))
+        pipe.run()
+
+    values = [msg.value() for msg in producer.delivered]
+    expected = []
+    for df in input_dfs:
+        expected.extend(serializers.df_to_json_bytes(df).to_list(strip_newlines=True))
+
+    assert values == expected
+    assert len(producer) == 0
+
+    if max_outstanding_bytes is not None:
+        assert producer.max_outstanding_bytes <= max_outstanding_bytes
+
+    stats = stage.stats
+    assert stats.messages_produced == stats.messages_delivered == len(expected)
+    assert stats.bytes_produced == stats.bytes_delivered == sum(len(value) for value in expected)
+    assert stats.delivery_errors == 0
+    assert stats.max_latency_sec >= stats.mean_latency_sec > 0
+    assert stats.throughput_bytes_per_sec > 0
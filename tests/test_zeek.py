@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+
 import numpy as np
+import pandas as pd
+import pytest
 
 import cudf
 
@@ -96,3 +100,98 @@ def test_parse_log_file(tmpdir):
     assert parsed["resp_pkts"].equals(actual["resp_pkts"])
     assert parsed["resp_ip_bytes"].equals(actual["resp_ip_bytes"])
     assert parsed["tunnel_parents"].equals(actual["tunnel_parents"])
+
+
+HEADER = ("#separator \\x09\n"
+          "#set_separator\t,\n"
+          "#empty_field\t(empty)\n"
+          "#unset_field\t-\n"
+          "#path\tconn\n"
+          "#open\t2015-01-24-16-49-04\n"
+          "#fields\tts\tuid\tid.orig_p\tservice\tduration\torig_bytes\tlocal_orig\ttunnel_parents\n"
+          "#types\ttime\tstring\tport\tstring\tinterval\tcount\tbool\tset[string]\n")
+ROWS = [
+    "1421927450.370337\tCFlyqZgM1g71BYPB6\t7177\thttp\t0.214392\t194\tF\t(empty)\n",
+    "1421927658.777193\tCnKVxKIj403JsAK5k\t24809\t-\t-\t-\tT\t(empty)\n",
+]
+FOOTER = "#close\t2015-01-24-16-50-35\n"
+
+
+def _write_log(path, content: str, compress: bool = False):
+    open_fn = gzip.open if compress else open
+    with open_fn(path, "wt", encoding='UTF-8') as fh:
+        fh.write(content)
+
+    return str(path)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_iter_chunks(tmp_path, df_type: str, compress: bool):
+    filepath = _write_log(tmp_path / "conn.log", HEADER + "".join(ROWS * 5) + FOOTER, compress=compress)
+
+    chunks = list(zeek.iter_chunks(filepath, chunk_rows=4, df_type=df_type))
+
+    assert [len(df) for df in chunks] == [4, 4, 2]
+    for df in chunks:
+        assert isinstance(df, cudf.DataFrame if df_type == "cudf" else pd.DataFrame)
+
+    df = pd.concat([df.to_pandas() if df_type == "cudf" else df for df in chunks])
+    assert df.index.tolist() == list(range(10))
+    assert df.columns.tolist() == [
+        "ts", "uid", "id.orig_p", "service", "duration", "orig_bytes", "local_orig", "tunnel_parents"
+    ]
+    assert df["uid"].tolist() == ["CFlyqZgM1g71BYPB6", "CnKVxKIj403JsAK5k"] * 5
+    assert df["id.orig_p"].tolist() == [7177, 24809] * 5
+    assert df["local_orig"].tolist() == [False, True] * 5
+    assert df["tunnel_parents"].tolist() == ["(empty)"] * 10
+
+    # Unset fields are read as nulls
+    assert df["service"].isna().tolist() == [False, True] * 5
+    assert df["duration"].isna().tolist() == [False, True] * 5
+    assert df["orig_bytes"].isna().tolist() == [False, True] * 5
+
+
+def test_iter_chunks_concatenated_logs(tmp_path):
+    second_header = HEADER.replace("\ttunnel_parents", "\tparents")
+    filepath = _write_log(tmp_path / "conn.log.gz",
+                          HEADER + "".join(ROWS) + FOOTER + second_header + "".join(ROWS) + FOOTER,
+                          compress=True)
+
+    reader = zeek.ZeekLogReader(filepath, chunk_rows=10, df_type="pandas")
+    chunks = list(reader)
+
+    assert [len(df) for df in chunks] == [2, 2]
+    assert chunks[0].columns[-1] == "tunnel_parents"
+    assert chunks[1].columns[-1] == "parents"
+    assert chunks[1].index.tolist() == [2, 3]
+    assert reader.header.path == "conn"
+    assert reader.header.separator == "\t"
+
+
+def test_iter_chunks_missing_fields(tmp_path):
+    filepath = _write_log(tmp_path / "conn.log", "#separator \\x09\n" + "".join(ROWS))
+
+    with pytest.raises(ValueError):
+        list(zeek.iter_chunks(filepath, df_type="pandas"))
+
+
+def test_parse_header_only(tmp_path, df_type: str):
+    filepath = _write_log(tmp_path / "conn.log", HEADER + FOOTER)
+
+    df = zeek.parse(filepath, df_type=df_type)
+    assert len(df) == 0
+    assert list(df.columns)[:2] == ["ts", "uid"]
+
+
+def test_parse_unset_fields(tmp_path, df_type: str):
+    filepath = _write_log(tmp_path / "conn.log", HEADER + "".join(ROWS) + FOOTER)
+
+    df = zeek.parse(filepath, df_type=df_type)
+    if (df_type == "cudf"):
+        df = df.to_pandas()
+
+    # Unset fields are read as nulls rather than the literal "-", including in string columns
+    assert df["service"].isna().tolist() == [False, True]
+    assert df["duration"].isna().tolist() == [False, True]
+    assert df["orig_bytes"].isna().tolist() == [False, True]
+    assert "-" not in df["service"].tolist()
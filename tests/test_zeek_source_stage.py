@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+
+import pytest
+
+from morpheus.config import Config
+from morpheus.messages import MessageMeta
+from morpheus.pipeline import LinearPipeline
+from morpheus.stages.input.zeek_source_stage import ZeekSourceStage
+from morpheus.stages.output.in_memory_sink_stage import InMemorySinkStage
+
+HEADER = ("#separator \\x09\n"
+          "#unset_field\t-\n"
+          "#path\tconn\n"
+          "#fields\tts\tuid\tid.orig_p\torig_bytes\n"
+          "#types\ttime\tstring\tport\tcount\n")
+FOOTER = "#close\t2015-01-24-16-50-35\n"
+
+
+def _write_log(path, num_rows: int, start: int = 0, compress: bool = False) -> str:
+    rows = "".join(f"{1421927450.0 + i}\tC{i}\t{1024 + i}\t{i}\n" for i in range(start, start + num_rows))
+
+    open_fn = gzip.open if compress else open
+    with open_fn(path, "wt", encoding='UTF-8') as fh:
+        fh.write(HEADER + rows + FOOTER)
+
+    return str(path)
+
+
+def test_constructor(config: Config):
+    config.pipeline_batch_size = 7
+
+    stage = ZeekSourceStage(config, filenames="conn.log")
+    assert stage.name == "from-zeek"
+    assert stage._filenames == ["conn.log"]
+    assert stage._chunk_rows == 7
+    assert not stage.supports_cpp_node()
+
+    with pytest.raises(ValueError):
+        ZeekSourceStage(config, filenames=["conn.log"], chunk_rows=0)
+
+
+@pytest.mark.use_python
+def test_zeek_source_pipe(config: Config, tmp_path):
+    filenames = [
+        _write_log(tmp_path / "conn.log", num_rows=10),
+        _write_log(tmp_path / "conn.1.log.gz", num_rows=5, start=10, compress=True),
+    ]
+
+    pipe = LinearPipeline(config)
+    pipe.set_source(ZeekSourceStage(config, filenames=filenames, chunk_rows=4))
+    sink_stage = pipe.add_stage(InMemorySinkStage(config))
+    pipe.run()
+
+    messages = sink_stage.get_messages()
+    assert all(isinstance(msg, MessageMeta) for msg in messages)
+    assert [msg.count for msg in messages] == [4, 4, 2, 4, 1]
+
+    uids = []
+    index = []
+    for msg in messages:
+        df = msg.copy_dataframe().to_pandas()
+        uids.extend(df["uid"].tolist())
+        index.extend(df.index.tolist())
+
+    assert uids == [f"C{i}" for i in range(15)]
+    assert index == list(range(15))
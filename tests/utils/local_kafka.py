@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+In-process stand-ins for `confluent_kafka.Consumer` and `confluent_kafka.Producer`, allowing the Kafka stages to be
+exercised and benchmarked without a broker.
+"""
+
+import time
+import typing
+
+
+class LocalKafkaMessage:
+    """Implements the subset of the `confluent_kafka.Message` interface used by `KafkaSourceStage`."""
+
+    def __init__(self, topic: str, partition: int, offset: int, value: bytes, error=None):
+        self._topic = topic
+        self._partition = partition
+        self._offset = offset
+        self._value = value
+        self._error = error
+
+    def topic(self) -> str:
+        return self._topic
+
+    def partition(self) -> int:
+        return self._partition
+
+    def offset(self) -> int:
+        return self._offset
+
+    def value(self) -> bytes:
+        return self._value
+
+    def error(self):
+        return self._error
+
+
+class LocalKafkaConsumer:
+    """
+    Serves pre-built messages from `poll`, cycling through `num_partitions` partitions, and records the offsets passed
+    to `commit`. Once all messages have been served `poll` returns None, as a real consumer does when it times out.
+    """
+
+    def __init__(self, payloads: typing.List[bytes], topic: str = "test_topic", num_partitions: int = 1):
+        self.messages = [
+            LocalKafkaMessage(topic, i % num_partitions, i // num_partitions, payload)
+            for (i, payload) in enumerate(payloads)
+        ]
+        self.commits: typing.List[typing.List] = []
+        self.subscribed_topics: typing.List[str] = []
+        self.closed = False
+        self._position = 0
+
+    def __call__(self, *args, **kwargs) -> "LocalKafkaConsumer":
+        # Allows an instance to be used in place of the `confluent_kafka.Consumer` class
+        return self
+
+    def subscribe(self, topics: typing.List[str]):
+        self.subscribed_topics = list(topics)
+
+    def poll(self, timeout: float = None) -> typing.Optional[LocalKafkaMessage]:
+        if (self._position >= len(self.messages)):
+            return None
+
+        msg = self.messages[self._position]
+        self._position += 1
+
+        return msg
+
+    def commit(self, message: LocalKafkaMessage = None, offsets: typing.List = None, asynchronous: bool = True):
+        self.commits.append(list(offsets) if offsets is not None else [message])
+
+    def close(self):
+        self.closed = True
+
+
+class LocalKafkaProducer:
+    """
+    Queues produced messages, delivering them to their callbacks from `poll` and `flush` once `ack_delay` seconds have
+    passed, emulating the time taken by a broker to acknowledge a message. When `queue_limit` messages are awaiting
+    delivery, `produce` raises `BufferError` as a real producer does when its queue is full.
+    """
+
+    def __init__(self, ack_delay: float = 0.0, queue_limit: int = None):
+        self.ack_delay = ack_delay
+        self.queue_limit = queue_limit
+        self.delivered: typing.List[LocalKafkaMessage] = []
+        self.max_outstanding_bytes = 0
+        self._queue: typing.List[typing.Tuple[float, LocalKafkaMessage, typing.Callable]] = []
+        self._outstanding_bytes = 0
+
+    def __call__(self, *args, **kwargs) -> "LocalKafkaProducer":
+        # Allows an instance to be used in place of the `confluent_kafka.Producer` class
+        return self
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def produce(self, topic: str, value: typing.Union[bytes, str] = None, callback: typing.Callable = None, **kwargs):
+        if (self.queue_limit is not None and len(self._queue) >= self.queue_limit):
+            raise BufferError("Local queue full")
+
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+
+        msg = LocalKafkaMessage(topic, 0, len(self.delivered) + len(self._queue), value)
+        self._queue.append((time.perf_counter(), msg, callback))
+
+        self._outstanding_bytes += len(value)
+        self.max_outstanding_bytes = max(self.max_outstanding_bytes, self._outstanding_bytes)
+
+    def _deliver_ready(self) -> int:
+        now = time.perf_counter()
+        num_ready = 0
+        while (num_ready < len(self._queue) and now - self._queue[num_ready][0] >= self.ack_delay):
+            num_ready += 1
+
+        ready = self._queue[:num_ready]
+        del self._queue[:num_ready]
+
+        for (_, msg, callback) in ready:
+            self._outstanding_bytes -= len(msg.value())
+            self.delivered.append(msg)
+            if callback is not None:
+                callback(None, msg)
+
+        return num_ready
+
+    def poll(self, timeout: float = None) -> int:
+        num_delivered = self._deliver_ready()
+
+        if (num_delivered == 0 and len(self._queue) > 0 and timeout is not None and timeout != 0):
+            wait_time = self.ack_delay - (time.perf_counter() - self._queue[0][0])
+            if timeout > 0:
+                wait_time = min(wait_time, timeout)
+
+            time.sleep(max(wait_time, 0))
+            num_delivered = self._deliver_ready()
+
+        return num_delivered
+
+    def flush(self, timeout: float = None) -> int:
+        while len(self._queue) > 0:
+            self.poll(-1)
+
+        return 0
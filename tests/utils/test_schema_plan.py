@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2022-2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+
+import pandas as pd
+import pytest
+
+from morpheus.utils.column_info import BoolColumn
+from morpheus.utils.column_info import ColumnInfo
+from morpheus.utils.column_info import DataFrameInputSchema
+from morpheus.utils.column_info import DateTimeColumn
+from morpheus.utils.column_info import IncrementColumn
+from morpheus.utils.column_info import RenameColumn
+from morpheus.utils.column_info import StringCatColumn
+from morpheus.utils.schema_plan import SchemaPlan
+from morpheus.utils.schema_plan import create_and_attach_schema_plan
+from morpheus.utils.schema_transforms import process_dataframe
+
+
+def _create_test_dataframe():
+    df = pd.DataFrame({
+        "access_device": [
+            '{"browser": "Chrome", "os": "Windows", "location": {"city": "New York", "state": "NY", "country": "USA"}}',
+            '{"browser": "Firefox", "os": "Linux", "location": '
+            '{"city": "San Francisco", "state": "CA", "country": "USA"}}',
+            '{"browser": "Chrome", "os": "Windows", "location": {"city": "New York", "state": "NY", "country": "USA"}}',
+        ],
+        "user": ['{"name": "John Doe"}', '{"name": "Jane Smith"}', '{"name": "John Doe"}'],
+        "time": ["2021-01-01T00:00:00Z", "2021-01-01T12:00:00Z", "2021-01-01T18:00:00Z"],
+        "result": ["SUCCESS", "denied", "SUCCESS"],
+        "reason": ["Authorized", "Unauthorized", "Authorized"]
+    })
+
+    # Offset the index to ensure it is preserved
+    df.index += 5
+
+    return df
+
+
+def _create_schema(**kwargs) -> DataFrameInputSchema:
+    return DataFrameInputSchema(
+        json_columns=["access_device", "user"],
+        column_info=[
+            DateTimeColumn(name="timestamp", dtype="datetime64[ns]", input_name="time"),
+            RenameColumn(name="username", dtype="str", input_name="user.name"),
+            RenameColumn(name="accessdeviceos", dtype="str", input_name="access_device.os"),
+            StringCatColumn(name="location",
+                            dtype="str",
+                            input_columns=["access_device.location.city", "access_device.location.state"],
+                            sep=", "),
+            BoolColumn(name="result",
+                       dtype="bool",
+                       input_name="result",
+                       true_values=["success", "SUCCESS"],
+                       false_values=["denied", "Denied", "DENIED", "FRAUD"]),
+            ColumnInfo(name="reason", dtype="str"),
+            # Depends on the output of the `timestamp` column
+            IncrementColumn(name="logcount", dtype="int", input_name="timestamp", groupby_column="username"),
+        ],
+        **kwargs)
+
+
+def test_schema_plan():
+    schema = _create_schema()
+    df = _create_test_dataframe()
+
+    output_df = SchemaPlan(schema).execute(df)
+
+    expected_df = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(["2021-01-01 00:00:00", "2021-01-01 12:00:00", "2021-01-01 18:00:00"]),
+            "username": ["John Doe", "Jane Smith", "John Doe"],
+            "accessdeviceos": ["Windows", "Linux", "Windows"],
+            "location": ["New York, NY", "San Francisco, CA", "New York, NY"],
+            "result": [True, False, True],
+            "reason": ["Authorized", "Unauthorized", "Authorized"],
+            "logcount": [0, 0, 1],
+        },
+        index=df.index)
+
+    pd.testing.assert_frame_equal(output_df, expected_df)
+
+
+def test_schema_plan_row_filter():
+    # pylint: disable=singleton-comparison
+    schema = _create_schema(row_filter=lambda df: df["result"] == True, use_schema_plan=True)  # noqa E712
+    df = _create_test_dataframe()
+
+    output_df = process_dataframe(df, schema)
+
+    assert list(output_df.index) == [5, 7]
+    assert output_df["result"].all()
+
+
+def test_schema_plan_cached():
+    schema = _create_schema(use_schema_plan=True)
+    df = _create_test_dataframe()
+
+    process_dataframe(df, schema)
+    plan = schema.schema_plan
+    assert plan is not None
+
+    process_dataframe(df, schema)
+    assert schema.schema_plan is plan
+
+    # Modifying the schema should invalidate the plan
+    schema.column_info.append(ColumnInfo(name="extra", dtype="str"))
+    output_df = process_dataframe(df, schema)
+    assert schema.schema_plan is not plan
+    assert "extra" in output_df.columns
+
+
+def test_schema_plan_circular_dependency():
+    schema = DataFrameInputSchema(column_info=[
+        RenameColumn(name="a", dtype="str", input_name="b"),
+        RenameColumn(name="b", dtype="str", input_name="a"),
+    ])
+
+    with pytest.raises(ValueError):
+        create_and_attach_schema_plan(schema)
+
+
+def test_schema_plan_empty_schema():
+    schema = DataFrameInputSchema(column_info=[], use_schema_plan=True)
+    df = _create_test_dataframe()
+
+    # As with the NVTabular workflow, the input is returned unchanged
+    output_df = process_dataframe(df, schema)
+    pd.testing.assert_frame_equal(output_df, _create_test_dataframe())